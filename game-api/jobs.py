@@ -0,0 +1,207 @@
+"""
+Simulation Jobs
+
+Runs long simulations (seasons, playoffs, games) in a bounded thread pool
+so API handlers return immediately with a job id. Jobs report progress,
+can be cancelled between games, and keep their result until evicted.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+class JobRejected(Exception):
+    """Job can't be accepted (queue full or resource already busy)."""
+
+
+@dataclass
+class Job:
+    """A submitted simulation and its progress."""
+    job_id: str
+    kind: str
+    resource: Optional[str] = None  # e.g. season id; one active job per resource
+    status: JobStatus = JobStatus.QUEUED
+    completed: int = 0
+    total: int = 0
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def report(self, completed: int, total: int):
+        """Record progress; raises JobCancelled if cancellation was requested."""
+        self.completed = completed
+        self.total = total
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def to_dict(self) -> Dict:
+        """Convert job status to dictionary (without the result)."""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "resource": self.resource,
+            "status": self.status.value,
+            "progress": {
+                "completed": self.completed,
+                "total": self.total,
+                "fraction": round(self.completed / self.total, 4) if self.total else 0.0
+            },
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class JobManager:
+    """
+    Bounded executor for simulation jobs.
+
+    At most `max_workers` jobs run at once and at most `max_pending` are
+    queued or running; further submissions are rejected instead of piling
+    up. Finished jobs are kept (oldest evicted first) up to `max_history`.
+    Synchronous requests claim resources with hold(), so a job and a
+    request never work on the same resource at once.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, max_history: int = 100):
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sim-job")
+        self._jobs: Dict[str, Job] = {}
+        self._held: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[[Job], Any], resource: Optional[str] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Job type label (season, playoffs, game)
+            fn: Callable taking the Job (for progress and cancellation) and returning the result
+            resource: Optional resource id; only one unfinished job per resource
+
+        Raises:
+            JobRejected: If the queue is full or the resource is busy
+        """
+        with self._lock:
+            active = [j for j in self._jobs.values() if not j.is_finished]
+            if len(active) >= self.max_pending:
+                raise JobRejected(f"Too many pending jobs (limit {self.max_pending})")
+            if resource is not None:
+                self._check_free(resource, active)
+
+            job = Job(job_id=f"job_{uuid.uuid4().hex[:12]}", kind=kind, resource=resource)
+            self._jobs[job.job_id] = job
+            self._evict_finished()
+
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def _check_free(self, resource: str, active: List[Job]):
+        """Raise JobRejected if a job or a synchronous request holds the resource (call with the lock held)."""
+        busy = next((j for j in active if j.resource == resource), None)
+        if busy:
+            raise JobRejected(f"{resource} already has an active job ({busy.job_id})")
+        if resource in self._held:
+            raise JobRejected(f"{resource} is in use by another request")
+
+    @contextmanager
+    def hold(self, resource: str) -> Iterator[None]:
+        """
+        Claim a resource for synchronous work; jobs for it are rejected until released.
+
+        Raises:
+            JobRejected: If a job or another request already holds the resource
+        """
+        with self._lock:
+            self._check_free(resource, [j for j in self._jobs.values() if not j.is_finished])
+            self._held.add(resource)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._held.discard(resource)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]):
+        if job.cancel_requested:
+            self._finish(job, JobStatus.CANCELLED)
+            return
+
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = fn(job)
+            self._finish(job, JobStatus.COMPLETED)
+        except JobCancelled:
+            self._finish(job, JobStatus.CANCELLED)
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, JobStatus.FAILED)
+
+    @staticmethod
+    def _finish(job: Job, status: JobStatus):
+        job.finished_at = time.time()
+        job.status = status
+
+    def _evict_finished(self):
+        finished = [j for j in self._jobs.values() if j.is_finished]
+        for job in sorted(finished, key=lambda j: j.created_at)[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job.job_id]
+
+    def active_job(self, resource: str) -> Optional[Job]:
+        """Unfinished job holding a resource, if any."""
+        with self._lock:
+            return next((j for j in self._jobs.values() if j.resource == resource and not j.is_finished), None)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; queued jobs never start, running ones stop at the next progress report."""
+        job = self._jobs.get(job_id)
+        if job and not job.is_finished:
+            job._cancel.set()
+        return job
+
+    def shutdown(self):
+        for job in self._jobs.values():
+            job._cancel.set()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,254 @@
+"""
+Live Games
+
+Streams a game to any number of viewers while it is being simulated.
+
+Each live game runs one simulation on its own thread. The engine's event
+callback appends every GameEvent to the game's log, and viewers follow
+the log with their own cursor. A viewer reads its next events only after
+the previous send finished, so a slow client lags behind without blocking
+the simulation or other viewers, and nothing is buffered per viewer (a
+game's log is a few hundred events). Viewers can join late or reconnect
+from any index and still get the whole game.
+
+An optional speed paces the simulation: game seconds per wall-clock
+second (1.0 = real time, 60.0 = a 20-minute period in 20 seconds).
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+
+class LiveStatus(str, Enum):
+    """Live game lifecycle states."""
+    LIVE = "live"
+    FINAL = "final"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+class LiveGameCancelled(Exception):
+    """Raised inside the simulation when the live game was cancelled."""
+
+
+class LiveGameRejected(Exception):
+    """Too many live games are already running."""
+
+
+@dataclass
+class LiveGame:
+    """One simulation and the event log its viewers follow."""
+    game_id: str
+    home_team: str
+    away_team: str
+    seed: Optional[int] = None
+    speed: Optional[float] = None
+    status: LiveStatus = LiveStatus.LIVE
+    events: List[Dict] = field(default_factory=list)
+    result: Any = None
+    error: Optional[str] = None
+    viewers: int = 0
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = field(default_factory=list, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status != LiveStatus.LIVE
+
+    # Producer side (simulation thread)
+
+    def publish(self, event) -> None:
+        """Event callback: append a GameEvent to the log and wake viewers."""
+        if self._cancel.is_set():
+            raise LiveGameCancelled()
+        with self._lock:
+            self.events.append(event.to_dict())
+        self._wake()
+
+    def pace(self, game, seconds: int) -> None:
+        """Tick callback: wait out `seconds` of game clock at the game's speed."""
+        if self.speed:
+            cancelled = self._cancel.wait(seconds / self.speed)
+        else:
+            cancelled = self._cancel.is_set()
+        if cancelled:
+            raise LiveGameCancelled()
+
+    def finish(self, status: LiveStatus, result: Any = None, error: Optional[str] = None) -> None:
+        """Close the log; viewers drain what's left and then get the final message."""
+        with self._lock:
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            self.status = status
+        self._wake()
+
+    def _wake(self) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+    # Viewer side (event loop)
+
+    async def _wait(self, index: int, timeout: float) -> None:
+        """Wait until event `index` exists or the game is over (or timeout)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if index < len(self.events) or self.is_finished:
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    async def follow(self, start: int = 0, heartbeat: float = 15.0) -> AsyncIterator[Optional[Tuple[int, Dict]]]:
+        """
+        Yield (index, event) from `start` until the game is over.
+
+        Yields None when nothing happened for `heartbeat` seconds, so the
+        caller can keep the connection alive.
+        """
+        index = max(0, start)
+        with self._lock:
+            self.viewers += 1
+        try:
+            while True:
+                await self._wait(index, heartbeat)
+                with self._lock:
+                    batch = self.events[index:]
+                    done = self.is_finished
+                if not batch and not done:
+                    yield None
+                for event in batch:
+                    yield index, event
+                    index += 1
+                if done and index >= len(self.events):
+                    return
+        finally:
+            with self._lock:
+                self.viewers -= 1
+
+    def final_message(self) -> Dict:
+        """Closing message for viewers: status plus result or error."""
+        return {"status": self.status.value, "result": self.result, "error": self.error}
+
+    def to_dict(self) -> Dict:
+        """Convert live game status to dictionary (without events)."""
+        return {
+            "game_id": self.game_id,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "seed": self.seed,
+            "speed": self.speed,
+            "status": self.status.value,
+            "events": len(self.events),
+            "viewers": self.viewers,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at
+        }
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class LiveGameManager:
+    """
+    Runs live games, one thread each.
+
+    At most `max_live` games run at once (paced games can take as long as
+    a real game); finished games stay available for replay until evicted,
+    oldest first, beyond `max_history`.
+    """
+
+    def __init__(self, max_live: int = 16, max_history: int = 50):
+        self.max_live = max_live
+        self.max_history = max_history
+        self._games: Dict[str, LiveGame] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        home_team: str,
+        away_team: str,
+        run: Callable[[LiveGame], Any],
+        seed: Optional[int] = None,
+        speed: Optional[float] = None
+    ) -> LiveGame:
+        """
+        Start a live game.
+
+        Args:
+            home_team: Home team code
+            away_team: Away team code
+            run: Plays the game using live.publish / live.pace as the event and
+                tick callbacks and returns the final result
+            seed: Optional game seed
+            speed: Game seconds per wall-clock second (None = as fast as possible)
+
+        Raises:
+            LiveGameRejected: If max_live games are already running
+        """
+        with self._lock:
+            running = sum(1 for g in self._games.values() if not g.is_finished)
+            if running >= self.max_live:
+                raise LiveGameRejected(f"Too many live games (limit {self.max_live})")
+            live = LiveGame(
+                game_id=f"live_{uuid.uuid4().hex[:12]}",
+                home_team=home_team,
+                away_team=away_team,
+                seed=seed,
+                speed=speed
+            )
+            self._games[live.game_id] = live
+            self._evict_finished()
+
+        threading.Thread(target=self._run, args=(live, run), name=live.game_id, daemon=True).start()
+        return live
+
+    @staticmethod
+    def _run(live: LiveGame, run: Callable[[LiveGame], Any]):
+        try:
+            live.finish(LiveStatus.FINAL, result=run(live))
+        except LiveGameCancelled:
+            live.finish(LiveStatus.CANCELLED)
+        except Exception as e:
+            live.finish(LiveStatus.FAILED, error=str(e))
+
+    def _evict_finished(self):
+        finished = [g for g in self._games.values() if g.is_finished]
+        for live in sorted(finished, key=lambda g: g.created_at)[:max(0, len(finished) - self.max_history)]:
+            del self._games[live.game_id]
+
+    def get(self, game_id: str) -> Optional[LiveGame]:
+        return self._games.get(game_id)
+
+    def list(self) -> List[LiveGame]:
+        with self._lock:
+            return sorted(self._games.values(), key=lambda g: g.created_at, reverse=True)
+
+    def cancel(self, game_id: str) -> Optional[LiveGame]:
+        """Stop a live game at its next event or play."""
+        live = self._games.get(game_id)
+        if live and not live.is_finished:
+            live._cancel.set()
+        return live
+
+    def shutdown(self):
+        for live in self._games.values():
+            live._cancel.set()
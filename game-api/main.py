@@ -5,10 +5,13 @@ REST API for NHL game and season simulation.
 Provides endpoints for the web UI.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+from contextlib import ExitStack, contextmanager
+import json
 import sys
 from pathlib import Path
 
@@ -18,10 +21,14 @@ sys.path.insert(0, str(game_engine_path))
 
 from simulator import NHLSimulator
 from season_simulator import SeasonSimulator, TeamRecord
+from season_monte_carlo import SeasonMonteCarlo
 from playoff_simulator import PlayoffSimulator, PlayoffBracket
 from gm_career import GMCareerManager, GMCareer
 from nhl_loader import load_all_teams
 from nhl_data import NHL_TEAMS, NHLTeam
+from prediction_cache import get_prediction_cache
+from jobs import JobManager, JobRejected, JobStatus
+from live import LiveGameManager, LiveGameRejected
 
 # Initialize
 app = FastAPI(title="NHL Simulation API", version="1.0.0")
@@ -37,10 +44,23 @@ app.add_middleware(
 
 # Load teams on startup
 load_all_teams()
-game_simulator = NHLSimulator(verbose=False)
+game_simulator = NHLSimulator(verbose=False)  # reentrant: shared by all request threads
 active_seasons: Dict[str, SeasonSimulator] = {}
 active_playoffs: Dict[str, PlayoffSimulator] = {}
 gm_manager = GMCareerManager()
+job_manager = JobManager(max_workers=2, max_pending=16)
+
+# Season odds replications: answered inline up to the first, as a job up to the second
+MAX_SYNC_ODDS_REPLICATIONS = 200
+MAX_JOB_ODDS_REPLICATIONS = 20000
+live_manager = LiveGameManager(max_live=16)
+
+
+@app.on_event("shutdown")
+def stop_jobs():
+    """Cancel running simulation jobs and live games so shutdown doesn't wait for them."""
+    job_manager.shutdown()
+    live_manager.shutdown()
 
 
 # Models
@@ -95,6 +115,7 @@ class SeasonStandings(BaseModel):
     wins: int
     losses: int
     otl: int
+    regulation_wins: int
     points: int
     goals_for: int
     goals_against: int
@@ -102,6 +123,22 @@ class SeasonStandings(BaseModel):
     points_percentage: float
 
 
+class PlayoffGameResult(BaseModel):
+    winner: str
+    home_score: Optional[int] = None  # default: 1-0 to the winner
+    away_score: Optional[int] = None
+    overtime: bool = False
+
+
+class WhatIfGame(BaseModel):
+    series_id: str
+    winner: str
+
+
+class WhatIfRequest(BaseModel):
+    results: List[WhatIfGame]  # hypothetical games, in order
+
+
 # Endpoints
 @app.get("/")
 def root():
@@ -113,7 +150,10 @@ def root():
             "simulate_game": "/game/simulate",
             "season_create": "/season/create",
             "season_simulate": "/season/{season_id}/simulate",
-            "season_standings": "/season/{season_id}/standings"
+            "season_standings": "/season/{season_id}/standings",
+            "season_odds": "/season/{season_id}/odds",
+            "prediction_cache": "/cache/predictions",
+            "jobs": "/jobs"
         }
     }
 
@@ -138,14 +178,19 @@ def get_teams():
 
 
 @app.post("/game/simulate", response_model=GameResult)
-def simulate_game(home_team: str, away_team: str):
-    """Simulate a single game with full player attribution."""
+def simulate_game(home_team: str, away_team: str, seed: Optional[int] = None):
+    """Simulate a single game with full player attribution (same seed, same game)."""
     if home_team not in NHL_TEAMS:
         raise HTTPException(status_code=404, detail=f"Team {home_team} not found")
     if away_team not in NHL_TEAMS:
         raise HTTPException(status_code=404, detail=f"Team {away_team} not found")
     
-    game = game_simulator.simulate_game(away_team, home_team)
+    game = game_simulator.simulate_game(away_team, home_team, seed=seed)
+    return _build_game_result(game, home_team, away_team)
+
+
+def _build_game_result(game, home_team: str, away_team: str) -> GameResult:
+    """Convert a finished GameState into the API's GameResult."""
     winner = game.get_winner()
     
     # Extract period-by-period scoring
@@ -192,33 +237,41 @@ def simulate_game(home_team: str, away_team: str):
 
 
 @app.post("/season/create")
-def create_season(season_year: str = "2024-25"):
-    """Create a new season."""
+def create_season(season_year: str = "2024-25", seed: Optional[int] = None):
+    """Create a new season (the returned seed replays its schedule and games)."""
     season_id = f"season_{len(active_seasons) + 1}"
-    active_seasons[season_id] = SeasonSimulator(season_year=season_year, verbose=False)
+    active_seasons[season_id] = SeasonSimulator(season_year=season_year, verbose=False, seed=seed)
     
     return {
         "season_id": season_id,
         "season_year": season_year,
+        "seed": active_seasons[season_id].seed,
         "total_games": len(active_seasons[season_id].schedule),
         "status": "created"
     }
 
 
 @app.post("/season/{season_id}/simulate")
-def simulate_season(season_id: str, num_games: int = 10):
-    """Simulate games in a season."""
+def simulate_season(season_id: str, num_games: int = 10, workers: int = 1):
+    """Simulate games in a season (workers > 1 spreads games across processes)."""
     if season_id not in active_seasons:
         raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
+    if workers < 1:
+        raise HTTPException(status_code=400, detail="workers must be at least 1")
     
-    season = active_seasons[season_id]
-    season.simulate_season(num_games=num_games)
-    
+    with _hold(season_id):
+        season = active_seasons[season_id]
+        season.simulate_season(num_games=num_games, workers=workers)
+        return _season_progress(season_id, season, num_games)
+
+
+def _season_progress(season_id: str, season: SeasonSimulator, games_simulated: int) -> Dict:
+    """Summary of how far a season has been played."""
     games_played = sum(1 for g in season.schedule if g.played)
     
     return {
         "season_id": season_id,
-        "games_simulated": num_games,
+        "games_simulated": games_simulated,
         "total_games_played": games_played,
         "total_games": len(season.schedule),
         "status": "in_progress" if games_played < len(season.schedule) else "complete"
@@ -226,38 +279,54 @@ def simulate_season(season_id: str, num_games: int = 10):
 
 
 @app.get("/season/{season_id}/standings", response_model=List[SeasonStandings])
-def get_season_standings(season_id: str, conference: Optional[str] = None):
-    """Get season standings."""
+def get_season_standings(season_id: str, conference: Optional[str] = None, division: Optional[str] = None):
+    """Get season standings, best first (NHL tiebreakers applied)."""
     if season_id not in active_seasons:
         raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
     
     season = active_seasons[season_id]
-    standings = []
-    
-    for code, record in season.records.items():
-        team = NHL_TEAMS[code]
-        
-        if conference and team.conference != conference:
-            continue
-        
-        standings.append(SeasonStandings(
-            team_code=code,
+    if division:
+        records = season.standings.division(division)
+    elif conference:
+        records = season.standings.conference(conference)
+    else:
+        records = season.standings.league()
+    
+    return [
+        SeasonStandings(
+            team_code=record.team_code,
             team_name=record.team_name,
             games_played=record.games_played,
             wins=record.wins,
             losses=record.losses,
             otl=record.otl,
+            regulation_wins=record.regulation_wins,
             points=record.points,
             goals_for=record.goals_for,
             goals_against=record.goals_against,
             goal_differential=record.goal_differential,
             points_percentage=record.points_percentage
-        ))
+        )
+        for record in records
+    ]
+
+
+@app.get("/season/{season_id}/head-to-head")
+def get_head_to_head(season_id: str, team: str, opponent: str):
+    """A team's record against one opponent this season."""
+    if season_id not in active_seasons:
+        raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
     
-    # Sort by points, then goal differential
-    standings.sort(key=lambda s: (s.points, s.goal_differential), reverse=True)
+    season = active_seasons[season_id]
+    for code in (team, opponent):
+        if code not in season.records:
+            raise HTTPException(status_code=404, detail=f"Team {code} not found")
     
-    return standings
+    return {
+        "team": team,
+        "opponent": opponent,
+        **season.standings.head_to_head(team, opponent).to_dict()
+    }
 
 
 @app.get("/season/{season_id}/games")
@@ -286,43 +355,124 @@ def get_season_games(season_id: str, played_only: bool = False):
     return {"season_id": season_id, "games": games}
 
 
+@app.get("/season/{season_id}/odds")
+def get_season_odds(season_id: str, replications: int = 100, seed: Optional[int] = None):
+    """
+    Project playoff, division, Presidents' Trophy and Cup odds from the remaining schedule.
+
+    Kept small enough to answer inline; larger runs go through
+    POST /jobs/season/{season_id}/odds.
+    """
+    if season_id not in active_seasons:
+        raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
+    if not 1 <= replications <= MAX_SYNC_ODDS_REPLICATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"replications must be between 1 and {MAX_SYNC_ODDS_REPLICATIONS} "
+                   f"(use POST /jobs/season/{season_id}/odds for more)"
+        )
+    with _hold(season_id):
+        return _season_odds(season_id, active_seasons[season_id], replications, seed)
+
+
+def _season_odds(season_id: str, season: SeasonSimulator, replications: int, seed: Optional[int],
+                 progress_callback=None) -> Dict:
+    """Run the season Monte Carlo and build the odds response."""
+    odds = SeasonMonteCarlo(season).run(
+        replications=replications, seed=seed, progress_callback=progress_callback
+    )
+
+    return {
+        "season_id": season_id,
+        "replications": replications,
+        "games_remaining": sum(1 for g in season.schedule if not g.played),
+        "teams": [team.to_dict() for team in odds]
+    }
+
+
 # Playoff Endpoints
 @app.post("/season/{season_id}/playoffs/generate")
-def generate_playoffs(season_id: str):
-    """Generate playoff bracket from season standings."""
+def generate_playoffs(season_id: str, seed: Optional[int] = None):
+    """Generate playoff bracket from season standings (the returned seed replays its games)."""
     if season_id not in active_seasons:
         raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
     
     season = active_seasons[season_id]
-    
-    # Get standings with conference info
-    standings = []
-    for code, record in season.records.items():
-        team = NHL_TEAMS[code]
-        standings.append({
-            "team_code": code,
-            "team_name": record.team_name,
-            "points": record.points,
-            "goal_differential": record.goal_differential,
-            "conference": team.conference
-        })
-    
-    # Create playoff simulator and generate bracket
-    playoff_sim = PlayoffSimulator(season_year=season.season_year, verbose=False)
-    bracket = playoff_sim.generate_bracket(standings)
-    
-    # Store playoff simulator
     playoff_id = f"playoff_{season_id}"
+    with _hold(season_id, playoff_id):
+        # Get standings with conference info, in tiebreaker order
+        standings = []
+        for conference in season.standings.conferences:
+            for rank, record in enumerate(season.standings.conference(conference), 1):
+                standings.append({
+                    "team_code": record.team_code,
+                    "team_name": record.team_name,
+                    "points": record.points,
+                    "goal_differential": record.goal_differential,
+                    "conference": conference,
+                    "conference_rank": rank
+                })
+        
+        # Create playoff simulator and generate bracket
+        playoff_sim = PlayoffSimulator(season_year=season.season_year, verbose=False, seed=seed)
+        bracket = playoff_sim.generate_bracket(standings)
+        
+        # Store playoff simulator
+        active_playoffs[playoff_id] = playoff_sim
+        
+        return {
+            "playoff_id": playoff_id,
+            "season_id": season_id,
+            "seed": playoff_sim.seed,
+            "bracket": bracket.to_dict(),
+            "status": "generated"
+        }
+
+
+@app.post("/playoffs/load")
+def load_playoffs(bracket: Dict, seed: Optional[int] = None):
+    """Continue playoffs from a saved bracket (the /bracket response format), partly played or not."""
+    playoff_sim = PlayoffSimulator(season_year=bracket.get("season_year", "2024-25"), verbose=False, seed=seed)
+    try:
+        playoff_sim.load_bracket(bracket)
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid bracket: {e}")
+    
+    playoff_id = f"playoff_loaded_{len(active_playoffs) + 1}"
     active_playoffs[playoff_id] = playoff_sim
     
     return {
         "playoff_id": playoff_id,
-        "season_id": season_id,
-        "bracket": bracket.to_dict(),
-        "status": "generated"
+        "seed": playoff_sim.seed,
+        "bracket": playoff_sim.bracket.to_dict(),
+        "status": "completed" if playoff_sim.bracket.champion else "in_progress"
     }
 
 
+@app.post("/playoffs/{playoff_id}/series/{series_id}/games")
+def record_playoff_game(playoff_id: str, series_id: str, game: PlayoffGameResult):
+    """Record the next game of a series played outside the simulator."""
+    if playoff_id not in active_playoffs:
+        raise HTTPException(status_code=404, detail=f"Playoffs {playoff_id} not found")
+    
+    playoff_sim = active_playoffs[playoff_id]
+    
+    if not playoff_sim.bracket:
+        raise HTTPException(status_code=400, detail="No bracket generated")
+    with _hold(playoff_id):
+        try:
+            series = playoff_sim.record_game(series_id, game.winner, game.home_score, game.away_score, game.overtime)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return {
+            "playoff_id": playoff_id,
+            "series": series.to_dict(),
+            "champion": playoff_sim.bracket.champion,
+            "status": "completed" if playoff_sim.bracket.champion else "in_progress"
+        }
+
+
 @app.post("/playoffs/{playoff_id}/simulate/round")
 def simulate_playoff_round(playoff_id: str, round_number: int):
     """Simulate a specific playoff round."""
@@ -338,21 +488,22 @@ def simulate_playoff_round(playoff_id: str, round_number: int):
     if round_number < 1 or round_number > 4:
         raise HTTPException(status_code=400, detail="Round must be 1-4")
     
-    from playoff_simulator import Round
-    round_enum = Round(round_number)
-    
-    # Simulate the round
-    success = playoff_sim.simulate_round(round_enum)
-    
-    if not success:
-        raise HTTPException(status_code=400, detail=f"No series to simulate in round {round_number}")
-    
-    return {
-        "playoff_id": playoff_id,
-        "round": round_number,
-        "bracket": playoff_sim.bracket.to_dict(),
-        "status": "completed" if playoff_sim.bracket.champion else "in_progress"
-    }
+    with _hold(playoff_id):
+        from playoff_simulator import Round
+        round_enum = Round(round_number)
+        
+        # Simulate the round
+        success = playoff_sim.simulate_round(round_enum)
+        
+        if not success:
+            raise HTTPException(status_code=400, detail=f"No series to simulate in round {round_number}")
+        
+        return {
+            "playoff_id": playoff_id,
+            "round": round_number,
+            "bracket": playoff_sim.bracket.to_dict(),
+            "status": "completed" if playoff_sim.bracket.champion else "in_progress"
+        }
 
 
 @app.post("/playoffs/{playoff_id}/simulate/all")
@@ -365,10 +516,14 @@ def simulate_all_playoffs(playoff_id: str):
     
     if not playoff_sim.bracket:
         raise HTTPException(status_code=400, detail="No bracket generated")
-    
-    # Simulate all remaining rounds
-    bracket = playoff_sim.simulate_playoffs()
-    
+    with _hold(playoff_id):
+        # Simulate all remaining rounds
+        bracket = playoff_sim.simulate_playoffs()
+        return _playoffs_result(playoff_id, bracket)
+
+
+def _playoffs_result(playoff_id: str, bracket: PlayoffBracket) -> Dict:
+    """Response for a fully simulated bracket."""
     return {
         "playoff_id": playoff_id,
         "bracket": bracket.to_dict(),
@@ -396,6 +551,71 @@ def get_playoff_bracket(playoff_id: str):
     }
 
 
+@app.get("/playoffs/{playoff_id}/odds")
+def get_playoff_odds(playoff_id: str):
+    """Exact round-by-round advancement odds and series result distributions from the current bracket."""
+    if playoff_id not in active_playoffs:
+        raise HTTPException(status_code=404, detail=f"Playoffs {playoff_id} not found")
+
+    playoff_sim = active_playoffs[playoff_id]
+
+    if not playoff_sim.bracket:
+        raise HTTPException(status_code=404, detail="No bracket generated")
+    with _hold(playoff_id):
+        odds = playoff_sim.advancement_odds()
+        series = []
+        for s in playoff_sim.bracket.get_active_series():
+            outcomes = playoff_sim.series_odds(
+                s.higher_seed, s.lower_seed,
+                higher_seed_wins=s.higher_seed_wins, lower_seed_wins=s.lower_seed_wins
+            )
+            series.append({
+                "series_id": s.series_id,
+                "higher_seed": s.higher_seed,
+                "lower_seed": s.lower_seed,
+                "higher_seed_wins": s.higher_seed_wins,
+                "lower_seed_wins": s.lower_seed_wins,
+                "outcomes": [
+                    {"higher_seed_wins": h, "lower_seed_wins": l, "probability": round(p, 4)}
+                    for (h, l), p in outcomes.items()
+                ]
+            })
+
+        return {
+            "playoff_id": playoff_id,
+            "champion": playoff_sim.bracket.champion,
+            "teams": [team.to_dict() for team in odds],
+            "series": series
+        }
+
+
+@app.post("/playoffs/{playoff_id}/what-if")
+def get_playoff_what_if(playoff_id: str, request: WhatIfRequest):
+    """Advancement odds if the given games go a certain way; the bracket itself is unchanged."""
+    if playoff_id not in active_playoffs:
+        raise HTTPException(status_code=404, detail=f"Playoffs {playoff_id} not found")
+
+    playoff_sim = active_playoffs[playoff_id]
+
+    if not playoff_sim.bracket:
+        raise HTTPException(status_code=404, detail="No bracket generated")
+    with _hold(playoff_id):
+        current = {o.team_code: o for o in playoff_sim.advancement_odds()}
+        try:
+            odds = playoff_sim.what_if([(r.series_id, r.winner) for r in request.results])
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return {
+            "playoff_id": playoff_id,
+            "results": [r.dict() for r in request.results],
+            "teams": [
+                {**team.to_dict(), "cup_prob_change": round(team.cup_prob - current[team.team_code].cup_prob, 4)}
+                for team in odds
+            ]
+        }
+
+
 # Player Stats Endpoints
 @app.get("/season/{season_id}/stats/leaders")
 def get_league_leaders(
@@ -529,6 +749,249 @@ def list_gm_careers():
     return {"careers": careers}
 
 
+# Simulation Job Endpoints
+@contextmanager
+def _hold(*resources: str):
+    """Claim seasons/brackets for a synchronous request (409 if a job or another request has one)."""
+    with ExitStack() as stack:
+        for resource in resources:
+            try:
+                stack.enter_context(job_manager.hold(resource))
+            except JobRejected as e:
+                raise HTTPException(status_code=409, detail=str(e))
+        yield
+
+
+def _submit_job(kind: str, fn, resource: Optional[str] = None) -> Dict:
+    try:
+        job = job_manager.submit(kind, fn, resource=resource)
+    except JobRejected as e:
+        raise HTTPException(status_code=429 if resource is None else 409, detail=str(e))
+    return job.to_dict()
+
+
+@app.post("/jobs/season/{season_id}/simulate", status_code=202)
+def submit_season_job(season_id: str, num_games: Optional[int] = None, workers: int = 1):
+    """Simulate season games in the background (num_games=None plays the rest of the season)."""
+    if season_id not in active_seasons:
+        raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
+    if workers < 1:
+        raise HTTPException(status_code=400, detail="workers must be at least 1")
+    
+    season = active_seasons[season_id]
+    
+    def run(job):
+        season.simulate_season(num_games=num_games, workers=workers, progress_callback=job.report)
+        return _season_progress(season_id, season, job.completed)
+    
+    return _submit_job("season", run, resource=season_id)
+
+
+@app.post("/jobs/season/{season_id}/odds", status_code=202)
+def submit_season_odds_job(season_id: str, replications: int = 1000, seed: Optional[int] = None):
+    """Project season odds in the background (progress counts replications)."""
+    if season_id not in active_seasons:
+        raise HTTPException(status_code=404, detail=f"Season {season_id} not found")
+    if not 1 <= replications <= MAX_JOB_ODDS_REPLICATIONS:
+        raise HTTPException(
+            status_code=400, detail=f"replications must be between 1 and {MAX_JOB_ODDS_REPLICATIONS}"
+        )
+    
+    season = active_seasons[season_id]
+    
+    def run(job):
+        return _season_odds(season_id, season, replications, seed, progress_callback=job.report)
+    
+    return _submit_job("season_odds", run, resource=season_id)
+
+
+@app.post("/jobs/playoffs/{playoff_id}/simulate", status_code=202)
+def submit_playoffs_job(playoff_id: str):
+    """Simulate the rest of the playoffs in the background."""
+    if playoff_id not in active_playoffs:
+        raise HTTPException(status_code=404, detail=f"Playoffs {playoff_id} not found")
+    
+    playoff_sim = active_playoffs[playoff_id]
+    if not playoff_sim.bracket:
+        raise HTTPException(status_code=400, detail="No bracket generated")
+    
+    def run(job):
+        bracket = playoff_sim.simulate_playoffs(progress_callback=job.report)
+        return _playoffs_result(playoff_id, bracket)
+    
+    return _submit_job("playoffs", run, resource=playoff_id)
+
+
+@app.post("/jobs/game/simulate", status_code=202)
+def submit_game_job(home_team: str, away_team: str, seed: Optional[int] = None):
+    """Simulate a single game in the background."""
+    if home_team not in NHL_TEAMS:
+        raise HTTPException(status_code=404, detail=f"Team {home_team} not found")
+    if away_team not in NHL_TEAMS:
+        raise HTTPException(status_code=404, detail=f"Team {away_team} not found")
+    
+    def run(job):
+        job.report(0, 1)
+        game = game_simulator.simulate_game(away_team, home_team, seed=seed)
+        job.report(1, 1)
+        return _build_game_result(game, home_team, away_team).dict()
+    
+    return _submit_job("game", run)
+
+
+@app.get("/jobs")
+def list_jobs():
+    """List recent simulation jobs."""
+    return {"jobs": [job.to_dict() for job in job_manager.list()]}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """Job status and progress (games or series completed out of total)."""
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
+
+
+@app.get("/jobs/{job_id}/result")
+def get_job_result(job_id: str):
+    """Result of a completed job."""
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=500, detail=f"Job failed: {job.error}")
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.value}")
+    return {"job_id": job_id, "result": job.result}
+
+
+@app.delete("/jobs/{job_id}")
+def cancel_job(job_id: str):
+    """Cancel a job; a running simulation stops after its current game or series."""
+    job = job_manager.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
+
+
+# Live Game Endpoints
+@app.post("/live/games", status_code=201)
+def start_live_game(home_team: str, away_team: str, seed: Optional[int] = None, speed: Optional[float] = None):
+    """
+    Start a live game; viewers follow it on /live/games/{game_id}/events (SSE)
+    or /live/games/{game_id}/ws (WebSocket).
+    
+    speed is game seconds per wall-clock second (1 = real time, 60 = a period
+    in 20 seconds); omit it to simulate as fast as possible.
+    """
+    if home_team not in NHL_TEAMS:
+        raise HTTPException(status_code=404, detail=f"Team {home_team} not found")
+    if away_team not in NHL_TEAMS:
+        raise HTTPException(status_code=404, detail=f"Team {away_team} not found")
+    if speed is not None and speed <= 0:
+        raise HTTPException(status_code=400, detail="speed must be positive")
+    
+    def run(live):
+        game = game_simulator.simulate_game(
+            away_team, home_team, seed=seed, event_callback=live.publish, tick_callback=live.pace
+        )
+        return _build_game_result(game, home_team, away_team).dict()
+    
+    try:
+        live = live_manager.start(home_team, away_team, run, seed=seed, speed=speed)
+    except LiveGameRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return live.to_dict()
+
+
+@app.get("/live/games")
+def list_live_games():
+    """List live and recently finished games."""
+    return {"games": [live.to_dict() for live in live_manager.list()]}
+
+
+def _get_live_game(game_id: str):
+    live = live_manager.get(game_id)
+    if not live:
+        raise HTTPException(status_code=404, detail=f"Live game {game_id} not found")
+    return live
+
+
+@app.get("/live/games/{game_id}")
+def get_live_game(game_id: str):
+    """Live game status (event count, viewers, final state)."""
+    return _get_live_game(game_id).to_dict()
+
+
+@app.get("/live/games/{game_id}/events")
+async def stream_live_game(game_id: str, from_index: int = 0, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-Sent Events: one `game_event` per GameEvent (id = event index),
+    then a `final` message with the game result. Reconnecting clients
+    resume after Last-Event-ID.
+    """
+    live = _get_live_game(game_id)
+    if last_event_id is not None and last_event_id.isdigit():
+        from_index = int(last_event_id) + 1
+    
+    async def event_stream():
+        async for item in live.follow(from_index):
+            if item is None:
+                yield ": keepalive\n\n"
+                continue
+            index, event = item
+            yield f"id: {index}\nevent: game_event\ndata: {json.dumps(event)}\n\n"
+        yield f"event: final\ndata: {json.dumps(live.final_message())}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.websocket("/live/games/{game_id}/ws")
+async def watch_live_game(websocket: WebSocket, game_id: str, from_index: int = 0):
+    """
+    WebSocket feed: {"type": "event", "index", "event"} messages, then
+    {"type": "final", "status", "result", "error"} before closing.
+    """
+    live = live_manager.get(game_id)
+    if not live:
+        await websocket.close(code=4404)
+        return
+    
+    await websocket.accept()
+    try:
+        async for item in live.follow(from_index):
+            if item is None:
+                await websocket.send_json({"type": "keepalive"})
+                continue
+            index, event = item
+            await websocket.send_json({"type": "event", "index": index, "event": event})
+        await websocket.send_json({"type": "final", **live.final_message()})
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+
+@app.delete("/live/games/{game_id}")
+def cancel_live_game(game_id: str):
+    """Stop a live game; viewers get a final message with status cancelled."""
+    live = live_manager.cancel(game_id)
+    if not live:
+        raise HTTPException(status_code=404, detail=f"Live game {game_id} not found")
+    return live.to_dict()
+
+
+@app.get("/cache/predictions")
+def get_prediction_cache_stats():
+    """Pre-game prediction cache counters."""
+    return get_prediction_cache().stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     print("Starting NHL Simulation API...")
@@ -0,0 +1,283 @@
+"""
+Test Simulation Jobs
+
+Checks the job lifecycle (progress, result, cancellation), admission limits,
+history eviction, and that synchronous endpoints and jobs never work on the
+same season or bracket at once.
+"""
+
+import sys
+import io
+import threading
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from jobs import Job, JobCancelled, JobManager, JobRejected, JobStatus
+
+
+def _wait(job, timeout: float = 10.0):
+    deadline = time.time() + timeout
+    while not job.is_finished:
+        assert time.time() < deadline, f"{job.job_id} still {job.status.value}"
+        time.sleep(0.01)
+
+
+def _blocking(gate: threading.Event, started: threading.Event = None):
+    """Job body that reports progress until the gate opens."""
+    def run(job):
+        if started:
+            started.set()
+        step = 0
+        while not gate.is_set():
+            job.report(step, 100)
+            step = min(step + 1, 99)
+            time.sleep(0.01)
+        job.report(100, 100)
+        return "done"
+    return run
+
+
+def test_submit_progress_result():
+    """A job moves queued → running → completed with progress and a result."""
+    manager = JobManager(max_workers=1)
+    gate, started = threading.Event(), threading.Event()
+    job = manager.submit("test", _blocking(gate, started), resource="season_1")
+
+    assert started.wait(5)
+    assert job.status == JobStatus.RUNNING
+    time.sleep(0.05)
+    progress = job.to_dict()["progress"]
+    assert progress["total"] == 100 and 0 <= progress["completed"] < 100
+
+    gate.set()
+    _wait(job)
+    assert job.status == JobStatus.COMPLETED
+    assert job.result == "done"
+    assert job.to_dict()["progress"]["fraction"] == 1.0
+    assert manager.get(job.job_id) is job
+    assert manager.active_job("season_1") is None
+
+    failing = manager.submit("test", lambda job: 1 / 0)
+    _wait(failing)
+    assert failing.status == JobStatus.FAILED and "division" in failing.error
+    manager.shutdown()
+    print("✅ Jobs report progress and keep their result")
+    return True
+
+
+def test_cancel():
+    """Cancelling stops a running job at its next report and a queued one before it starts."""
+    manager = JobManager(max_workers=1)
+    gate, started = threading.Event(), threading.Event()
+    running = manager.submit("test", _blocking(gate, started))
+    queued_ran = threading.Event()
+    queued = manager.submit("test", lambda job: queued_ran.set())
+    assert started.wait(5)
+
+    manager.cancel(queued.job_id)
+    manager.cancel(running.job_id)
+    _wait(running)
+    _wait(queued)
+    assert running.status == JobStatus.CANCELLED and running.result is None
+    assert queued.status == JobStatus.CANCELLED and not queued_ran.is_set()
+
+    job = Job(job_id="job_test", kind="test")
+    job._cancel.set()
+    try:
+        job.report(1, 1)
+    except JobCancelled:
+        pass
+    else:
+        raise AssertionError("report() ignored a cancellation request")
+    manager.shutdown()
+    print("✅ Cancelled jobs stop with JobCancelled")
+    return True
+
+
+def test_rejections():
+    """Submissions past max_pending, or for a busy resource, are rejected."""
+    manager = JobManager(max_workers=1, max_pending=2)
+    gate = threading.Event()
+    first = manager.submit("test", _blocking(gate), resource="season_1")
+
+    try:
+        manager.submit("test", _blocking(gate), resource="season_1")
+    except JobRejected as e:
+        assert first.job_id in str(e)
+    else:
+        raise AssertionError("accepted a second job for a busy resource")
+
+    second = manager.submit("test", _blocking(gate), resource="season_2")
+    try:
+        manager.submit("test", _blocking(gate))
+    except JobRejected as e:
+        assert "limit 2" in str(e)
+    else:
+        raise AssertionError("accepted a job past max_pending")
+
+    gate.set()
+    _wait(first)
+    _wait(second)
+    again = manager.submit("test", lambda job: "again", resource="season_1")
+    _wait(again)
+    assert again.result == "again"
+    manager.shutdown()
+    print("✅ Full queues and busy resources reject new jobs")
+    return True
+
+
+def test_history_eviction():
+    """Only the newest max_history finished jobs are kept; unfinished ones never go."""
+    manager = JobManager(max_workers=1, max_history=2)
+    finished = []
+    for i in range(4):
+        job = manager.submit("test", lambda job, i=i: i)
+        _wait(job)
+        finished.append(job)
+        time.sleep(0.001)
+
+    gate = threading.Event()
+    running = manager.submit("test", _blocking(gate))
+    kept = [job.job_id for job in manager.list()]
+    assert running.job_id in kept
+    assert [manager.get(job.job_id) is not None for job in finished] == [False, False, True, True]
+
+    gate.set()
+    _wait(running)
+    manager.shutdown()
+    print("✅ Old finished jobs are evicted")
+    return True
+
+
+def test_hold():
+    """A held resource rejects jobs and other holders until it is released."""
+    manager = JobManager(max_workers=1)
+    with manager.hold("season_1"):
+        try:
+            manager.submit("test", lambda job: None, resource="season_1")
+        except JobRejected as e:
+            assert "in use" in str(e)
+        else:
+            raise AssertionError("accepted a job for a held resource")
+        try:
+            with manager.hold("season_1"):
+                pass
+        except JobRejected:
+            pass
+        else:
+            raise AssertionError("held the same resource twice")
+        other = manager.submit("test", lambda job: "other", resource="season_2")
+        _wait(other)
+
+    gate = threading.Event()
+    job = manager.submit("test", _blocking(gate), resource="season_1")
+    try:
+        with manager.hold("season_1"):
+            pass
+    except JobRejected as e:
+        assert job.job_id in str(e)
+    else:
+        raise AssertionError("held a resource a job is using")
+    gate.set()
+    _wait(job)
+    with manager.hold("season_1"):
+        pass
+    manager.shutdown()
+    print("✅ Held resources reject jobs until released")
+    return True
+
+
+def test_sync_request_holds_season():
+    """A job submitted while a synchronous season simulation runs is rejected with 409."""
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    season_id = client.post("/season/create", params={"seed": 3}).json()["season_id"]
+    season = main.active_seasons[season_id]
+
+    responses = {}
+    thread = threading.Thread(
+        target=lambda: responses.update(sync=client.post(f"/season/{season_id}/simulate", params={"num_games": 1400}))
+    )
+    thread.start()
+    deadline = time.time() + 30
+    while not any(game.played for game in season.schedule):
+        assert thread.is_alive() and time.time() < deadline, "synchronous simulation never started"
+        time.sleep(0.005)
+
+    response = client.post(f"/jobs/season/{season_id}/simulate")
+    assert response.status_code == 409, response.status_code
+    assert "in use" in response.json()["detail"]
+    assert client.get(f"/season/{season_id}/odds", params={"replications": 1}).status_code == 409
+    assert thread.is_alive(), "synchronous simulation finished before the checks ran"
+
+    thread.join()
+    assert responses["sync"].status_code == 200
+    assert client.get(f"/season/{season_id}/odds", params={"replications": 1}).status_code == 200
+    print("✅ Synchronous requests hold their season against jobs")
+    return True
+
+
+def test_api_guards():
+    """Synchronous season and playoff endpoints answer 409 while a job holds the resource."""
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    season_id = client.post("/season/create", params={"seed": 7}).json()["season_id"]
+    response = client.post(f"/season/{season_id}/simulate", params={"num_games": 1400})
+    assert response.status_code == 200
+    playoff_id = client.post(f"/season/{season_id}/playoffs/generate").json()["playoff_id"]
+    what_if = {"results": [{"series_id": "E1", "winner": "XXX"}]}
+
+    gate = threading.Event()
+    for resource, requests in [
+        (season_id, [
+            ("post", f"/season/{season_id}/simulate", {}),
+            ("get", f"/season/{season_id}/odds", {}),
+            ("post", f"/season/{season_id}/playoffs/generate", {}),
+        ]),
+        (playoff_id, [
+            ("post", f"/season/{season_id}/playoffs/generate", {}),
+            ("post", f"/playoffs/{playoff_id}/simulate/all", {}),
+            ("get", f"/playoffs/{playoff_id}/odds", {}),
+            ("post", f"/playoffs/{playoff_id}/what-if", {"json": what_if}),
+        ]),
+    ]:
+        job = main.job_manager.submit("test", _blocking(gate), resource=resource)
+        for method, url, kwargs in requests:
+            response = getattr(client, method)(url, **kwargs)
+            assert response.status_code == 409, (url, response.status_code)
+            assert job.job_id in response.json()["detail"]
+
+        status = client.get(f"/jobs/{job.job_id}").json()
+        assert status["resource"] == resource and status["status"] == "running"
+        assert client.get(f"/jobs/{job.job_id}/result").status_code == 409
+        client.delete(f"/jobs/{job.job_id}")
+        _wait(job)
+        assert client.get(f"/jobs/{job.job_id}").json()["status"] == "cancelled"
+
+    assert client.get(f"/playoffs/{playoff_id}/odds").status_code == 200
+    assert client.post(f"/season/{season_id}/playoffs/generate").status_code == 200
+    print("✅ Synchronous endpoints refuse resources held by a job")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (
+        test_submit_progress_result()
+        and test_cancel()
+        and test_rejections()
+        and test_history_eviction()
+        and test_hold()
+        and test_sync_request_holds_season()
+        and test_api_guards()
+    )
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,166 @@
+"""
+Test Live Games
+
+Checks the live game feeds through the API: SSE order and the final
+message, resuming from Last-Event-ID or from_index, the WebSocket feed,
+cancelling a paced game, and the max_live limit.
+"""
+
+import sys
+import io
+import json
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import main
+
+client = TestClient(main.app)
+
+
+def _start(**params) -> dict:
+    response = client.post("/live/games", params={"home_team": "TOR", "away_team": "MTL", **params})
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _wait(game_id: str, timeout: float = 30.0) -> dict:
+    deadline = time.time() + timeout
+    while True:
+        status = client.get(f"/live/games/{game_id}").json()
+        if status["status"] != "live":
+            return status
+        assert time.time() < deadline, f"{game_id} still live"
+        time.sleep(0.02)
+
+
+def _read_sse(game_id: str, **kwargs) -> list:
+    """Parse an SSE response into (id, event, data) messages."""
+    response = client.get(f"/live/games/{game_id}/events", **kwargs)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = []
+    for block in response.text.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if line and not line.startswith(":"))
+        if fields:
+            messages.append((fields.get("id"), fields.get("event"), json.loads(fields["data"])))
+    return messages
+
+
+def test_sse_stream():
+    """A viewer gets every event in order, then the final result, whether it joins live or late."""
+    live = _start(seed=42, speed=3000)
+    assert live["status"] == "live"
+    during = _read_sse(live["game_id"])
+    status = _wait(live["game_id"])
+    after = _read_sse(live["game_id"])
+    assert status["status"] == "final" and status["viewers"] == 0
+
+    for messages in (during, after):
+        *events, final = messages
+        assert [int(i) for i, _, _ in events] == list(range(status["events"]))
+        assert all(kind == "game_event" for _, kind, _ in events)
+        assert final[1] == "final" and final[2]["status"] == "final"
+    assert during == after
+
+    result = after[-1][2]["result"]
+    expected = main.simulate_game("TOR", "MTL", seed=42)
+    assert (result["home_score"], result["away_score"]) == (expected.home_score, expected.away_score)
+    assert client.get("/live/games/live_missing/events").status_code == 404
+    print(f"✅ SSE feed delivers {status['events']} events in order, then the final result")
+    return True
+
+
+def test_resume():
+    """Reconnecting viewers resume after Last-Event-ID, or from from_index."""
+    live = _start(seed=7)
+    total = _wait(live["game_id"])["events"]
+    full = _read_sse(live["game_id"])
+
+    resumed = _read_sse(live["game_id"], headers={"Last-Event-ID": "9"})
+    assert resumed[0][0] == "10" and resumed == full[10:]
+    assert _read_sse(live["game_id"], params={"from_index": 5}) == full[5:]
+    assert _read_sse(live["game_id"], params={"from_index": total}) == full[-1:]
+    print("✅ SSE viewers resume from Last-Event-ID and from_index")
+    return True
+
+
+def test_websocket():
+    """The WebSocket feed sends indexed events and a final message before closing."""
+    live = _start(seed=11, speed=3000)
+    messages = []
+    with client.websocket_connect(f"/live/games/{live['game_id']}/ws?from_index=3") as ws:
+        while True:
+            message = ws.receive_json()
+            messages.append(message)
+            if message["type"] == "final":
+                break
+    total = _wait(live["game_id"])["events"]
+
+    *events, final = messages
+    assert [m["index"] for m in events if m["type"] == "event"] == list(range(3, total))
+    assert all(m["type"] in ("event", "keepalive") for m in events)
+    assert final["status"] == "final" and final["result"]["home_team"] == "TOR"
+    assert [m["event"] for m in events if m["type"] == "event"] == [
+        data for _, _, data in _read_sse(live["game_id"], params={"from_index": 3})[:-1]
+    ]
+
+    try:
+        with client.websocket_connect("/live/games/live_missing/ws") as ws:
+            ws.receive_json()
+    except WebSocketDisconnect as e:
+        assert e.code == 4404
+    else:
+        raise AssertionError("WebSocket accepted an unknown game")
+    print("✅ WebSocket feed delivers indexed events, then the final result")
+    return True
+
+
+def test_cancel():
+    """Deleting a paced game ends it as cancelled, and viewers get that final status."""
+    live = _start(seed=3, speed=1)
+    time.sleep(0.2)
+    assert client.get(f"/live/games/{live['game_id']}").json()["status"] == "live"
+
+    assert client.delete(f"/live/games/{live['game_id']}").status_code == 200
+    status = _wait(live["game_id"], timeout=5)
+    assert status["status"] == "cancelled"
+    final = _read_sse(live["game_id"])[-1]
+    assert final[1] == "final" and final[2] == {"status": "cancelled", "result": None, "error": None}
+    assert client.delete("/live/games/live_missing").status_code == 404
+    print("✅ Cancelled live games end with status cancelled")
+    return True
+
+
+def test_max_live():
+    """Starting a game past max_live is rejected with 429."""
+    manager = main.live_manager
+    limit = manager.max_live
+    manager.max_live = 1
+    try:
+        live = _start(speed=1)
+        response = client.post("/live/games", params={"home_team": "TOR", "away_team": "MTL"})
+        assert response.status_code == 429
+        assert "limit 1" in response.json()["detail"]
+        client.delete(f"/live/games/{live['game_id']}")
+        _wait(live["game_id"], timeout=5)
+        client.delete(f"/live/games/{_start(speed=1)['game_id']}")
+    finally:
+        manager.max_live = limit
+    assert client.post("/live/games", params={"home_team": "TOR", "away_team": "XXX"}).status_code == 404
+    assert client.post("/live/games", params={"home_team": "TOR", "away_team": "MTL", "speed": 0}).status_code == 400
+    print("✅ Live games past max_live are rejected")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_sse_stream() and test_resume() and test_websocket() and test_cancel() and test_max_live()
+    sys.exit(0 if ok else 1)
@@ -6,9 +6,15 @@ from .game_state import (
     GameEvent,
     GamePeriod,
     EventType,
-    StrengthSituation
+    StrengthSituation,
+    DecisionContext,
+    GameSnapshot
 )
 from .simulator import NHLSimulator
+from .batch_simulator import BatchSimulator, MatchupSummary
+from .season_monte_carlo import SeasonMonteCarlo, TeamOdds
+from .bracket_monte_carlo import BracketMonteCarlo
+from .win_probability import WinProbability, WinProbabilityTracker, estimate_win_probability
 
 __all__ = [
     'GameState',
@@ -17,6 +23,16 @@ __all__ = [
     'GamePeriod',
     'EventType',
     'StrengthSituation',
-    'NHLSimulator'
+    'DecisionContext',
+    'GameSnapshot',
+    'NHLSimulator',
+    'BatchSimulator',
+    'MatchupSummary',
+    'SeasonMonteCarlo',
+    'TeamOdds',
+    'BracketMonteCarlo',
+    'WinProbability',
+    'WinProbabilityTracker',
+    'estimate_win_probability'
 ]
 
@@ -0,0 +1,812 @@
+"""
+Batch Monte Carlo Simulator
+
+Runs thousands of replications of a single matchup in one call.
+
+Each replication follows the same rules as NHLSimulator (clock, penalties,
+goalie pulls, overtime and shootout), but team data and the pre-game ML
+prediction are resolved once per batch and no GameState event log is built.
+
+Large batches run through a NumPy engine that advances every game in
+lockstep, one play per step; small batches use a scalar loop that is also
+the reference implementation for cross-validation.
+
+Both engines can also start from a GameSnapshot of a game in progress
+(simulate_from), which is how in-game win probabilities are estimated.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from decision_provider import LOCAL_PULL_THRESHOLDS
+from game_state import GameSnapshot, MAX_ACTIVE_PENALTIES, MAX_PENALTIES_PER_TEAM
+from matchup_context import MatchupContext, EMPTY_NET_GOAL_PROB, POWER_PLAY_BOOST
+from rng_streams import GameRandom
+from simulator import NHLSimulator
+
+
+# Strength situation codes (mirror StrengthSituation in game_state)
+EVEN = 0
+PP_MAJOR = 1
+SH_MAJOR = 2
+FOUR_ON_FOUR = 3
+THREE_ON_THREE = 4
+
+# Cumulative event weights: shot, faceoff, hit, blocked_shot, penalty, (nothing)
+EVEN_EVENT_CUTOFFS = (0.35, 0.55, 0.70, 0.80, 0.83)
+EVEN_EVENT_TOTAL = 1.00
+SPECIAL_TEAMS_EVENT_CUTOFFS = (0.45, 0.65, 0.80, 0.90, 0.91)
+SPECIAL_TEAMS_EVENT_TOTAL = 1.08
+
+PENALTY_SECONDS = 120
+SHOOTOUT_GOAL_PROB = 0.33
+
+# Game outcome codes
+REGULATION = 3
+OVERTIME = 4
+SHOOTOUT = 5
+
+# Batches smaller than this use the scalar loop (NumPy overhead dominates)
+VECTORIZE_MIN_GAMES = 200
+
+
+def _strength(home_penalties: int, away_penalties: int, home_pulled: bool, away_pulled: bool) -> int:
+    """Strength situation code, matching GameState._update_strength_situation."""
+    home_skaters = 5 - home_penalties + home_pulled
+    away_skaters = 5 - away_penalties + away_pulled
+
+    if home_skaters == 5 and away_skaters == 4:
+        return PP_MAJOR
+    if home_skaters == 4 and away_skaters == 5:
+        return SH_MAJOR
+    if home_skaters == 4 and away_skaters == 4:
+        return FOUR_ON_FOUR
+    if home_skaters == 3 and away_skaters == 3:
+        return THREE_ON_THREE
+    return EVEN  # 5v5 and fallback
+
+
+def _build_strength_table() -> np.ndarray:
+    """Strength code indexed by [home_penalties, away_penalties, home_pulled, away_pulled]."""
+    table = np.zeros((MAX_PENALTIES_PER_TEAM + 1, MAX_PENALTIES_PER_TEAM + 1, 2, 2), dtype=np.int8)
+    for hp in range(MAX_PENALTIES_PER_TEAM + 1):
+        for ap in range(MAX_PENALTIES_PER_TEAM + 1):
+            for h_pull in (0, 1):
+                for a_pull in (0, 1):
+                    table[hp, ap, h_pull, a_pull] = _strength(hp, ap, bool(h_pull), bool(a_pull))
+    return table
+
+
+STRENGTH_TABLE = _build_strength_table()
+
+
+def _resume_point(start: GameSnapshot) -> Tuple[int, int, int]:
+    """
+    (period, clock, outcome) to continue an unfinished snapshot from.
+
+    A snapshot taken as a period's clock ran out resumes at the next period.
+    outcome is REGULATION or OVERTIME if that period end decided the game,
+    otherwise 0 (period is SHOOTOUT when only the shootout is left).
+    """
+    period, clock = start.period, start.time_remaining
+    if period >= SHOOTOUT or clock > 0:
+        return period, clock, 0
+    if period < 3:
+        return period + 1, 1200, 0
+    if start.score[0] != start.score[1]:
+        return period, 0, period
+    return (OVERTIME, 300, 0) if period == 3 else (SHOOTOUT, 0, 0)
+
+
+def _start_queued_penalties(
+    pen_team: np.ndarray,
+    pen_clock: np.ndarray,
+    pen_order: np.ndarray,
+    pen_queue: np.ndarray,
+    order: int
+):
+    """Vectorized engine: start waiting penalties in place for teams below MAX_PENALTIES_PER_TEAM."""
+    while True:
+        started = False
+        for side in (0, 1):
+            active = (pen_team == side).sum(axis=1)
+            rows = np.nonzero((pen_queue[:, side] > 0) & (active < MAX_PENALTIES_PER_TEAM))[0]
+            if rows.size:
+                slot = (pen_team[rows] < 0).argmax(axis=1)
+                pen_team[rows, slot] = side
+                pen_clock[rows, slot] = PENALTY_SECONDS
+                pen_order[rows, slot] = order
+                pen_queue[rows, side] -= 1
+                started = True
+        if not started:
+            return
+
+
+def _start_stacked(penalty_teams: List[int], penalty_clocks: List[int], queue: List[int]) -> List[int]:
+    """Scalar loop: start waiting penalties in place; returns the sides still waiting."""
+    waiting = []
+    for side in queue:
+        if penalty_teams.count(side) < MAX_PENALTIES_PER_TEAM:
+            penalty_teams.append(side)
+            penalty_clocks.append(PENALTY_SECONDS)
+        else:
+            waiting.append(side)
+    return waiting
+
+
+def _pull_mask(deficit: np.ndarray, clock: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """Vectorized goalie pull rule (thresholds ends with a 0 entry for larger deficits)."""
+    return clock < thresholds[np.clip(deficit, 0, len(thresholds) - 1)]
+
+
+@dataclass
+class BatchOutcome:
+    """Per-game results from the vectorized engine (one entry per game)."""
+    home_score: np.ndarray
+    away_score: np.ndarray
+    home_shots: np.ndarray
+    away_shots: np.ndarray
+    outcome: np.ndarray  # REGULATION, OVERTIME or SHOOTOUT
+
+    # One entry per goal (shootout winners excluded)
+    goal_game: np.ndarray
+    goal_side: np.ndarray  # 0 = home, 1 = away
+    goal_power_play: np.ndarray
+
+
+def simulate_games_vectorized(
+    home_event_prob: np.ndarray,
+    goal_prob: np.ndarray,
+    rng: np.random.Generator,
+    pull_seconds: Sequence[int] = LOCAL_PULL_THRESHOLDS,
+    start: Optional[GameSnapshot] = None
+) -> BatchOutcome:
+    """
+    Simulate many games at once, advancing all of them one play per step.
+
+    Args:
+        home_event_prob: Per-game probability that a play belongs to the home team, shape (n,)
+        goal_prob: Per-game base goal probability per shot, shape (n, 2) as (home, away)
+        rng: NumPy random generator
+        pull_seconds: Goalie pull table from DecisionProvider.pull_thresholds()
+        start: Unfinished game to continue every game from (default: puck drop);
+            only goals scored after it are recorded
+
+    Returns:
+        BatchOutcome with final scores, shots, outcome codes and goal records
+    """
+    home_event_prob = np.asarray(home_event_prob, dtype=float)
+    goal_prob = np.asarray(goal_prob, dtype=float)
+    pull_table = np.array(tuple(pull_seconds) + (0,), dtype=np.int32)
+    n = len(home_event_prob)
+
+    final_score = np.zeros((n, 2), dtype=np.int32)
+    final_shots = np.zeros((n, 2), dtype=np.int32)
+    final_outcome = np.zeros(n, dtype=np.int8)
+    goal_games: List[np.ndarray] = []
+    goal_sides: List[np.ndarray] = []
+    goal_pps: List[np.ndarray] = []
+
+    # Live state, compacted as games finish (game[i] = original index of row i)
+    game = np.arange(n)
+    event_prob = home_event_prob
+    base_prob = goal_prob
+    period = np.ones(n, dtype=np.int8)
+    clock = np.full(n, 1200, dtype=np.int32)
+    score = np.zeros((n, 2), dtype=np.int32)
+    shots = np.zeros((n, 2), dtype=np.int32)
+    pulled = np.zeros((n, 2), dtype=bool)
+    pen_team = np.full((n, MAX_ACTIVE_PENALTIES), -1, dtype=np.int8)
+    pen_clock = np.zeros((n, MAX_ACTIVE_PENALTIES), dtype=np.int32)
+    pen_order = np.zeros((n, MAX_ACTIVE_PENALTIES), dtype=np.int32)
+    pen_queue = np.zeros((n, 2), dtype=np.int32)  # stacked penalties waiting, per side
+
+    if start is not None:
+        start_period, start_clock, decided = _resume_point(start)
+        period[:], clock[:] = start_period, start_clock
+        score[:], shots[:], pulled[:] = start.score, start.shots, start.goalie_pulled
+        slot = 0
+        for side, left in start.penalties:
+            if (pen_team[0] == side).sum() < MAX_PENALTIES_PER_TEAM:
+                pen_team[:, slot], pen_clock[:, slot] = side, left
+                pen_order[:, slot] = slot - len(start.penalties)  # called before step 1, oldest first
+                slot += 1
+            else:
+                pen_queue[:, side] += 1
+        for side, _ in start.queued_penalties:
+            pen_queue[:, side] += 1
+        if decided or start_period == SHOOTOUT:
+            final_score[:], final_shots[:] = score, shots
+            final_outcome[:] = decided or SHOOTOUT
+            game = game[:0]
+
+    step = 0
+    while game.size:
+        step += 1
+        m = game.size
+        rows = np.arange(m)
+        u = rng.random((4, m))
+
+        # Advance clock 10-60 seconds and expire penalties
+        elapsed = 10 + (u[0] * 51).astype(np.int32)
+        np.maximum(clock - elapsed, 0, out=clock)
+        pen_clock -= elapsed[:, None]
+        pen_team[pen_clock <= 0] = -1
+        if pen_queue.any():
+            _start_queued_penalties(pen_team, pen_clock, pen_order, pen_queue, 2 * step)
+
+        home_pen = (pen_team == 0).sum(axis=1)
+        away_pen = (pen_team == 1).sum(axis=1)
+        strength = STRENGTH_TABLE[home_pen, away_pen, pulled[:, 0].astype(np.int8), pulled[:, 1].astype(np.int8)]
+
+        # Goalie pull decisions (trailing team, late in 3rd or OT)
+        late = (period >= 3) & (clock <= 300)
+        if late.any():
+            deficit = score[:, 1] - score[:, 0]
+            pulled[:, 0] |= late & _pull_mask(deficit, clock, pull_table)
+            pulled[:, 1] |= late & _pull_mask(-deficit, clock, pull_table)
+
+        # Event type and team
+        even = strength == EVEN
+        roll = u[1] * np.where(even, EVEN_EVENT_TOTAL, SPECIAL_TEAMS_EVENT_TOTAL)
+        is_shot = roll < np.where(even, EVEN_EVENT_CUTOFFS[0], SPECIAL_TEAMS_EVENT_CUTOFFS[0])
+        is_penalty = (
+            (roll >= np.where(even, EVEN_EVENT_CUTOFFS[3], SPECIAL_TEAMS_EVENT_CUTOFFS[3]))
+            & (roll < np.where(even, EVEN_EVENT_CUTOFFS[4], SPECIAL_TEAMS_EVENT_CUTOFFS[4]))
+        )
+        side = (u[2] >= event_prob).astype(np.int8)
+
+        # Shots on goal
+        shot_rows = rows[is_shot]
+        if shot_rows.size:
+            shot_side = side[shot_rows]
+            shots[shot_rows, shot_side] += 1
+            prob = base_prob[shot_rows, shot_side]
+
+            power_play = strength[shot_rows] == PP_MAJOR
+            if power_play.any():
+                pp_rows = shot_rows[power_play]
+                order = np.where(pen_team[pp_rows] >= 0, pen_order[pp_rows], np.iinfo(np.int32).max)
+                first_team = pen_team[pp_rows, order.argmin(axis=1)]
+                boosted = first_team != shot_side[power_play]
+                prob[power_play] = np.where(boosted, prob[power_play] * POWER_PLAY_BOOST, prob[power_play])
+
+            prob[pulled[shot_rows, 1 - shot_side]] = EMPTY_NET_GOAL_PROB
+
+            scored = u[3][shot_rows] < prob
+            if scored.any():
+                goal_rows = shot_rows[scored]
+                score[goal_rows, shot_side[scored]] += 1
+                goal_games.append(game[goal_rows])
+                goal_sides.append(shot_side[scored])
+                goal_pps.append(power_play[scored])
+
+        # Penalties (first free slot, or queued behind the team's running penalties)
+        penalty_rows = rows[is_penalty]
+        if penalty_rows.size:
+            penalty_side = side[penalty_rows]
+            stacked = (pen_team[penalty_rows] == penalty_side[:, None]).sum(axis=1) >= MAX_PENALTIES_PER_TEAM
+            pen_queue[penalty_rows[stacked], penalty_side[stacked]] += 1
+            penalty_rows = penalty_rows[~stacked]
+            slot = (pen_team[penalty_rows] < 0).argmax(axis=1)
+            pen_team[penalty_rows, slot] = side[penalty_rows]
+            pen_clock[penalty_rows, slot] = PENALTY_SECONDS
+            pen_order[penalty_rows, slot] = 2 * step + 1
+
+        # End of period
+        ended = clock == 0
+        if not ended.any():
+            continue
+
+        tied = score[:, 0] == score[:, 1]
+        decided = ended & ((period == 3) | (period == OVERTIME)) & ~tied
+        to_shootout = ended & (period == OVERTIME) & tied
+        to_overtime = ended & (period == 3) & tied
+        next_period = ended & (period < 3)
+
+        period[next_period] += 1
+        clock[next_period] = 1200
+        period[to_overtime] = OVERTIME
+        clock[to_overtime] = 300
+
+        done = decided | to_shootout
+        if done.any():
+            finished = game[done]
+            final_score[finished] = score[done]
+            final_shots[finished] = shots[done]
+            final_outcome[finished] = np.where(to_shootout[done], SHOOTOUT, period[done])
+
+            keep = ~done
+            game, event_prob, base_prob = game[keep], event_prob[keep], base_prob[keep]
+            period, clock, score, shots, pulled = period[keep], clock[keep], score[keep], shots[keep], pulled[keep]
+            pen_team, pen_clock, pen_order = pen_team[keep], pen_clock[keep], pen_order[keep]
+            pen_queue = pen_queue[keep]
+
+    _shootout_vectorized(final_score, final_outcome == SHOOTOUT, rng)
+
+    return BatchOutcome(
+        home_score=final_score[:, 0],
+        away_score=final_score[:, 1],
+        home_shots=final_shots[:, 0],
+        away_shots=final_shots[:, 1],
+        outcome=final_outcome,
+        goal_game=np.concatenate(goal_games) if goal_games else np.zeros(0, dtype=np.int64),
+        goal_side=np.concatenate(goal_sides) if goal_sides else np.zeros(0, dtype=np.int8),
+        goal_power_play=np.concatenate(goal_pps) if goal_pps else np.zeros(0, dtype=bool),
+    )
+
+
+def _shootout_vectorized(score: np.ndarray, in_shootout: np.ndarray, rng: np.random.Generator):
+    """Decide shootouts in place: 3 rounds, then sudden death (away shoots first)."""
+    games = np.nonzero(in_shootout)[0]
+    if not games.size:
+        return
+
+    rounds = rng.random((games.size, 3, 2)) < SHOOTOUT_GOAL_PROB  # [:, :, 0] = away
+    away_goals = rounds[:, :, 0].sum(axis=1)
+    home_goals = rounds[:, :, 1].sum(axis=1)
+
+    tied = away_goals == home_goals
+    while tied.any():
+        idx = np.nonzero(tied)[0]
+        u = rng.random((2, idx.size))
+        away_goals[idx] += u[0] < SHOOTOUT_GOAL_PROB
+        still_tied = away_goals[idx] == home_goals[idx]
+        home_goals[idx] += still_tied & (u[1] < SHOOTOUT_GOAL_PROB)
+        tied = away_goals == home_goals
+
+    home_won = home_goals > away_goals
+    score[games[home_won], 0] += 1
+    score[games[~home_won], 1] += 1
+
+
+@dataclass
+class MatchupSummary:
+    """Aggregated results of many replications of one matchup."""
+    home_team: str
+    away_team: str
+    games: int = 0
+    home_wins: int = 0
+    away_wins: int = 0
+    regulation_games: int = 0
+    overtime_games: int = 0
+    shootout_games: int = 0
+    home_goals_total: int = 0
+    away_goals_total: int = 0
+    home_shots_total: int = 0
+    away_shots_total: int = 0
+
+    # (home_score, away_score) -> count
+    score_counts: Counter = field(default_factory=Counter)
+
+    # player_id -> goals scored across all replications
+    player_goals: Counter = field(default_factory=Counter)
+    player_names: Dict[int, str] = field(default_factory=dict)
+    player_teams: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def home_win_prob(self) -> float:
+        """Probability the home team wins."""
+        return self.home_wins / self.games if self.games else 0.0
+
+    @property
+    def away_win_prob(self) -> float:
+        """Probability the away team wins."""
+        return self.away_wins / self.games if self.games else 0.0
+
+    @property
+    def overtime_prob(self) -> float:
+        """Probability the game is decided in overtime."""
+        return self.overtime_games / self.games if self.games else 0.0
+
+    @property
+    def shootout_prob(self) -> float:
+        """Probability the game goes to a shootout."""
+        return self.shootout_games / self.games if self.games else 0.0
+
+    @property
+    def avg_home_goals(self) -> float:
+        """Average home goals per game."""
+        return self.home_goals_total / self.games if self.games else 0.0
+
+    @property
+    def avg_away_goals(self) -> float:
+        """Average away goals per game."""
+        return self.away_goals_total / self.games if self.games else 0.0
+
+    @property
+    def avg_home_shots(self) -> float:
+        """Average home shots on goal per game."""
+        return self.home_shots_total / self.games if self.games else 0.0
+
+    @property
+    def avg_away_shots(self) -> float:
+        """Average away shots on goal per game."""
+        return self.away_shots_total / self.games if self.games else 0.0
+
+    def score_distribution(self) -> Dict[Tuple[int, int], float]:
+        """Probability of each (home_score, away_score) final."""
+        return {score: count / self.games for score, count in self.score_counts.most_common()}
+
+    def goal_rates(self) -> Dict[int, float]:
+        """Goals per game for each player who scored."""
+        return {pid: goals / self.games for pid, goals in self.player_goals.most_common()}
+
+    def to_dict(self, top_scores: int = 10, top_players: int = 10) -> Dict:
+        """Convert summary to dictionary."""
+        return {
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "games": self.games,
+            "home_win_prob": round(self.home_win_prob, 4),
+            "away_win_prob": round(self.away_win_prob, 4),
+            "overtime_prob": round(self.overtime_prob, 4),
+            "shootout_prob": round(self.shootout_prob, 4),
+            "avg_home_goals": round(self.avg_home_goals, 3),
+            "avg_away_goals": round(self.avg_away_goals, 3),
+            "avg_home_shots": round(self.avg_home_shots, 2),
+            "avg_away_shots": round(self.avg_away_shots, 2),
+            "score_distribution": [
+                {"home_score": h, "away_score": a, "probability": round(count / self.games, 4)}
+                for (h, a), count in self.score_counts.most_common(top_scores)
+            ],
+            "player_goal_rates": [
+                {
+                    "player_id": pid,
+                    "player_name": self.player_names.get(pid),
+                    "team_code": self.player_teams.get(pid),
+                    "goals_per_game": round(goals / self.games, 4)
+                }
+                for pid, goals in self.player_goals.most_common(top_players)
+            ]
+        }
+
+
+class BatchSimulator:
+    """
+    Runs many replications of one matchup without per-game overhead.
+
+    Uses the owning NHLSimulator's settings (home ice advantage, API URL)
+    so results are statistically equivalent to calling simulate_game
+    repeatedly, but the ML prediction is fetched once per batch and no
+    event log, descriptions or period scores are built.
+    """
+
+    def __init__(self, simulator: Optional[NHLSimulator] = None):
+        """
+        Initialize batch simulator.
+
+        Args:
+            simulator: NHLSimulator whose settings to use (defaults to a quiet one)
+        """
+        self.simulator = simulator or NHLSimulator(verbose=False)
+
+        # Compiled matchups reused by simulate_from and the Monte Carlo drivers
+        self._matchups: Dict[Tuple[str, str], MatchupContext] = {}
+
+    def simulate_matchup(
+        self,
+        home_team_code: str,
+        away_team_code: str,
+        n: int = 10000,
+        seed: Optional[int] = None,
+        vectorized: Optional[bool] = None
+    ) -> MatchupSummary:
+        """
+        Simulate N replications of a matchup.
+
+        Args:
+            home_team_code: Home team abbreviation (e.g., "TOR")
+            away_team_code: Away team abbreviation (e.g., "MTL")
+            n: Number of replications
+            seed: Optional seed for reproducible runs
+            vectorized: Force the NumPy (True) or scalar (False) engine;
+                None picks NumPy for batches of VECTORIZE_MIN_GAMES or more
+
+        Returns:
+            MatchupSummary with outcome probabilities and distributions
+        """
+        constants = self.compile_matchup(home_team_code, away_team_code)
+        summary = self._new_summary(constants, home_team_code, away_team_code)
+
+        if vectorized is None:
+            vectorized = n >= VECTORIZE_MIN_GAMES
+
+        if vectorized:
+            self._run_vectorized(constants, n, np.random.default_rng(seed), summary)
+        else:
+            self._run_scalar(constants, n, GameRandom(seed), summary)
+
+        return summary
+
+    def simulate_from(
+        self,
+        start: GameSnapshot,
+        n: int = 2000,
+        seed: Optional[int] = None,
+        vectorized: Optional[bool] = None
+    ) -> MatchupSummary:
+        """
+        Simulate N continuations of a game in progress.
+
+        Args:
+            start: Snapshot of the game (GameState.snapshot())
+            n: Number of continuations
+            seed: Optional seed for reproducible runs
+            vectorized: Force the NumPy (True) or scalar (False) engine;
+                None picks NumPy for batches of VECTORIZE_MIN_GAMES or more
+
+        Returns:
+            MatchupSummary of final results (player goal rates count only
+            goals scored after the snapshot)
+        """
+        key = (start.home_team, start.away_team)
+        constants = self.matchup(*key)
+        summary = self._new_summary(constants, *key)
+
+        if start.finished:
+            self._fold_games(
+                summary, n, start.score[0], start.score[1], start.shots[0], start.shots[1],
+                min(start.period, SHOOTOUT)
+            )
+            return summary
+
+        if vectorized is None:
+            vectorized = n >= VECTORIZE_MIN_GAMES
+
+        if vectorized:
+            self._run_vectorized(constants, n, np.random.default_rng(seed), summary, start)
+        else:
+            self._run_scalar(constants, n, GameRandom(seed), summary, start)
+
+        return summary
+
+    @staticmethod
+    def _new_summary(m: MatchupContext, home_team_code: str, away_team_code: str) -> MatchupSummary:
+        """Empty summary with both rosters' names and teams."""
+        summary = MatchupSummary(home_team=home_team_code, away_team=away_team_code)
+        for table, code in zip(m.shooters, (home_team_code, away_team_code)):
+            if table:
+                for player in table.forwards + table.defensemen:
+                    summary.player_names[player.id] = player.name
+                    summary.player_teams[player.id] = code
+        return summary
+
+    @staticmethod
+    def _fold_games(
+        summary: MatchupSummary,
+        count: int,
+        home_score: int,
+        away_score: int,
+        home_shots: int,
+        away_shots: int,
+        outcome: int
+    ):
+        """Add `count` games with the same final to the summary."""
+        summary.games += count
+        summary.home_goals_total += home_score * count
+        summary.away_goals_total += away_score * count
+        summary.home_shots_total += home_shots * count
+        summary.away_shots_total += away_shots * count
+        summary.score_counts[(home_score, away_score)] += count
+
+        if home_score > away_score:
+            summary.home_wins += count
+        else:
+            summary.away_wins += count
+
+        if outcome == REGULATION:
+            summary.regulation_games += count
+        elif outcome == OVERTIME:
+            summary.overtime_games += count
+        else:
+            summary.shootout_games += count
+
+    def _run_vectorized(
+        self,
+        m: MatchupContext,
+        n: int,
+        rng: np.random.Generator,
+        summary: MatchupSummary,
+        start: Optional[GameSnapshot] = None
+    ):
+        """Play N games with the NumPy engine and fold them into the summary."""
+        result = simulate_games_vectorized(
+            np.full(n, m.home_event_prob),
+            np.tile(np.array(m.goal_prob, dtype=float), (n, 1)),
+            rng,
+            m.pull_seconds,
+            start
+        )
+
+        home, away = result.home_score, result.away_score
+        summary.games += n
+        summary.home_goals_total += int(home.sum())
+        summary.away_goals_total += int(away.sum())
+        summary.home_shots_total += int(result.home_shots.sum())
+        summary.away_shots_total += int(result.away_shots.sum())
+        summary.home_wins += int((home > away).sum())
+        summary.away_wins += int((home < away).sum())
+        summary.regulation_games += int((result.outcome == REGULATION).sum())
+        summary.overtime_games += int((result.outcome == OVERTIME).sum())
+        summary.shootout_games += int((result.outcome == SHOOTOUT).sum())
+
+        scores, counts = np.unique(np.stack([home, away], axis=1), axis=0, return_counts=True)
+        for (h, a), count in zip(scores.tolist(), counts.tolist()):
+            summary.score_counts[(h, a)] += count
+
+        # Shooters are independent of whether a shot goes in, so they can be
+        # drawn after the fact for goals only
+        for side, table in enumerate(m.shooters):
+            if not table:
+                continue
+            mask = result.goal_side == side
+            if mask.any():
+                ids, counts = np.unique(
+                    table.select_shooters(rng, result.goal_power_play[mask]), return_counts=True
+                )
+                for player_id, count in zip(ids.tolist(), counts.tolist()):
+                    summary.player_goals[player_id] += count
+
+    def _run_scalar(
+        self,
+        m: MatchupContext,
+        n: int,
+        rng: GameRandom,
+        summary: MatchupSummary,
+        start: Optional[GameSnapshot] = None
+    ):
+        """Play N games one at a time with the scalar loop."""
+        player_goals = summary.player_goals
+
+        for _ in range(n):
+            home_score, away_score, outcome, shots, scorers = self.play_game(m, rng, start)
+            self._fold_games(summary, 1, home_score, away_score, shots[0], shots[1], outcome)
+
+            for player_id in scorers:
+                player_goals[player_id] += 1
+
+    def compile_matchup(self, home_team_code: str, away_team_code: str) -> MatchupContext:
+        """Resolve teams, the ML prediction and shooter tables once per batch."""
+        return self.simulator._prepare_matchup(home_team_code, away_team_code).matchup
+
+    def matchup(self, home_team_code: str, away_team_code: str) -> MatchupContext:
+        """Compiled matchup, cached for callers that play the same pairs many times."""
+        key = (home_team_code, away_team_code)
+        constants = self._matchups.get(key)
+        if constants is None:
+            constants = self._matchups[key] = self.compile_matchup(*key)
+        return constants
+
+    def play_game(
+        self,
+        m: MatchupContext,
+        rng: GameRandom,
+        start: Optional[GameSnapshot] = None
+    ) -> Tuple[int, int, int, List[int], List[int]]:
+        """
+        Play one game and return (home_score, away_score, outcome, shots, scorer_ids).
+
+        Draws that cannot affect the result (faceoff winners, hits, shot types
+        and shooters on saves) are skipped. With `start`, the game continues
+        from an unfinished snapshot and scorer_ids covers later goals only.
+        """
+        rand = rng.random
+        pull_seconds = m.pull_seconds
+        home_event_prob = m.home_event_prob
+        goal_prob = m.goal_prob
+        power_play_goal_prob = m.power_play_goal_prob
+        shooters = m.shooters
+
+        score = [0, 0]  # home, away
+        shots = [0, 0]
+        pulled = [False, False]
+        penalty_teams: List[int] = []  # 0 = home, 1 = away (in order called)
+        penalty_clocks: List[int] = []
+        penalty_queue: List[int] = []  # sides of stacked penalties waiting to start
+        scorers: List[int] = []
+        period, clock = 1, 1200
+
+        if start is not None:
+            score, shots, pulled = list(start.score), list(start.shots), list(start.goalie_pulled)
+            for side, left in start.penalties:
+                if penalty_teams.count(side) < MAX_PENALTIES_PER_TEAM:
+                    penalty_teams.append(side)
+                    penalty_clocks.append(left)
+                else:
+                    penalty_queue.append(side)
+            penalty_queue += [side for side, _ in start.queued_penalties]
+            penalty_queue = _start_stacked(penalty_teams, penalty_clocks, penalty_queue)
+            period, clock = start.period, start.time_remaining
+
+        while period < SHOOTOUT:
+            while clock > 0:
+                elapsed = 10 + int(rand() * 51)  # uniform 10-60, like randint(10, 60)
+                clock = clock - elapsed if clock > elapsed else 0
+
+                # Expire penalties and work out the strength situation
+                if penalty_clocks:
+                    kept = [i for i, left in enumerate(penalty_clocks) if left > elapsed]
+                    penalty_teams = [penalty_teams[i] for i in kept]
+                    penalty_clocks = [penalty_clocks[i] - elapsed for i in kept]
+                    if penalty_queue:
+                        penalty_queue = _start_stacked(penalty_teams, penalty_clocks, penalty_queue)
+                if penalty_teams or pulled[0] or pulled[1]:
+                    away_penalties = sum(penalty_teams)
+                    strength = _strength(
+                        len(penalty_teams) - away_penalties, away_penalties, pulled[0], pulled[1]
+                    )
+                else:
+                    strength = EVEN
+
+                # Goalie pull decisions (trailing team, late in 3rd or OT)
+                if period >= 3 and clock <= 300:
+                    for side in (0, 1):
+                        deficit = score[1 - side] - score[side]
+                        if (0 < deficit < len(pull_seconds) and not pulled[side]
+                                and clock < pull_seconds[deficit]):
+                            pulled[side] = True
+
+                # Event type
+                if strength == EVEN:
+                    cutoffs = EVEN_EVENT_CUTOFFS
+                    roll = rand() * EVEN_EVENT_TOTAL
+                else:
+                    cutoffs = SPECIAL_TEAMS_EVENT_CUTOFFS
+                    roll = rand() * SPECIAL_TEAMS_EVENT_TOTAL
+
+                if roll < cutoffs[0]:
+                    # Shot on goal
+                    side = 0 if rand() < home_event_prob else 1
+                    shots[side] += 1
+                    if pulled[1 - side]:
+                        prob = EMPTY_NET_GOAL_PROB
+                    elif strength == PP_MAJOR and penalty_teams[0] != side:
+                        prob = power_play_goal_prob[side]
+                    else:
+                        prob = goal_prob[side]
+
+                    if rand() < prob:
+                        score[side] += 1
+                        table = shooters[side]
+                        if table:
+                            scorers.append(table.select_shooter(rand, strength == PP_MAJOR).id)
+
+                elif cutoffs[3] <= roll < cutoffs[4]:
+                    # Penalty
+                    side = 0 if rand() < home_event_prob else 1
+                    if penalty_teams.count(side) < MAX_PENALTIES_PER_TEAM:
+                        penalty_teams.append(side)
+                        penalty_clocks.append(PENALTY_SECONDS)
+                    else:
+                        penalty_queue.append(side)
+
+            # End of period
+            if period == 3 or period == OVERTIME:
+                if score[0] != score[1]:
+                    return score[0], score[1], period, shots, scorers
+            period += 1
+            clock = 1200 if period <= 3 else 300
+
+        # Shootout: 3 rounds, then sudden death (away shoots first)
+        home_goals = away_goals = 0
+        for _ in range(3):
+            if rand() < SHOOTOUT_GOAL_PROB:
+                away_goals += 1
+            if rand() < SHOOTOUT_GOAL_PROB:
+                home_goals += 1
+        while home_goals == away_goals:
+            if rand() < SHOOTOUT_GOAL_PROB:
+                away_goals += 1
+            if home_goals == away_goals and rand() < SHOOTOUT_GOAL_PROB:
+                home_goals += 1
+
+        if home_goals > away_goals:
+            score[0] += 1
+        else:
+            score[1] += 1
+
+        return score[0], score[1], SHOOTOUT, shots, scorers
@@ -0,0 +1,240 @@
+"""
+Bracket Monte Carlo
+
+Plays a playoff bracket many times to estimate each team's odds of
+reaching every round and winning the Stanley Cup.
+
+Replications run through PlayoffSimulator.simulate_playoffs and
+_advance_winners, so they follow the real bracket rules, but each one
+plays on a clone of the starting bracket (series already decided count as
+they stand) and every game goes through the batch engine's scalar loop
+with no event log. Brackets are played in fixed-size chunks, each with a
+stream derived from the run's root seed, so results are the same whether
+the chunks run in one process or across a pool.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from batch_simulator import BatchSimulator, OVERTIME
+from nhl_data import NHL_TEAMS, NHLTeam
+from playoff_simulator import (
+    AdvancementOdds, GameWinProbability, MonteCarloPlayoffs, PlayoffBracket, PlayoffSimulator,
+    SeriesStatus
+)
+from rng_streams import GameRandom, derive_seed, new_seed
+from simulator import NHLSimulator
+
+
+# Brackets per chunk (the unit of work and of seeding)
+BRACKETS_PER_CHUNK = 250
+
+# Series wins per team by round: [first round, second round, conference finals, Cup finals]
+RoundCounts = Dict[str, List[int]]
+
+
+# Per-process driver for parallel bracket workers
+_worker_monte_carlo: Optional["BracketMonteCarlo"] = None
+
+
+def _init_bracket_worker(
+    teams: Dict[str, NHLTeam],
+    api_url: str,
+    home_ice_advantage: float,
+    bracket: PlayoffBracket,
+    win_probs: Optional[Dict[Tuple[str, str], float]]
+):
+    """Process pool initializer: install the parent's team data and a private driver."""
+    global _worker_monte_carlo
+    NHL_TEAMS.clear()
+    NHL_TEAMS.update(teams)
+    playoffs = PlayoffSimulator(season_year=bracket.season_year, verbose=False, seed=0)
+    playoffs.game_simulator = NHLSimulator(
+        api_url=api_url,
+        verbose=False,
+        home_ice_advantage=home_ice_advantage
+    )
+    playoffs.bracket = bracket
+    win_prob = (lambda home, away: win_probs[(home, away)]) if win_probs is not None else None
+    _worker_monte_carlo = BracketMonteCarlo(playoffs, win_prob=win_prob)
+
+
+def _play_bracket_chunk(task: Tuple[int, int, int]) -> RoundCounts:
+    """Play (chunk_index, brackets, root_seed) in a worker process."""
+    return _worker_monte_carlo._play_chunk(*task)
+
+
+class BracketMonteCarlo:
+    """
+    Bracket-level Monte Carlo driver.
+
+    Built on a PlayoffSimulator whose bracket has been generated (and
+    possibly partly played); the bracket is cloned once, and later changes
+    to the simulator's bracket do not affect the driver.
+    """
+
+    def __init__(
+        self,
+        playoffs: PlayoffSimulator,
+        batch: Optional[BatchSimulator] = None,
+        win_prob: Optional[GameWinProbability] = None
+    ):
+        """
+        Initialize the driver.
+
+        Args:
+            playoffs: Simulator holding the starting bracket
+            batch: Batch engine to play games with (defaults to one on playoffs.game_simulator)
+            win_prob: Optional P(home team wins) per game; each game is then
+                a single draw (recorded 1-0) instead of a simulated game
+        """
+        if not playoffs.bracket:
+            raise ValueError("No bracket generated. Call generate_bracket() first.")
+        self.template = playoffs.bracket.clone()
+        self.batch = batch or BatchSimulator(playoffs.game_simulator)
+
+        # Conference and seed of each team, from first-round positions
+        self.seeds: Dict[str, Tuple[str, int]] = {}
+        for conference, first_round in (
+            ("Eastern", self.template.eastern_conference[:4]),
+            ("Western", self.template.western_conference[:4]),
+        ):
+            for position, series in enumerate(first_round):
+                self.seeds[series.higher_seed] = (conference, position + 1)
+                self.seeds[series.lower_seed] = (conference, 8 - position)
+
+        pairs = [(home, away) for home in self.seeds for away in self.seeds if home != away]
+        self._win_probs: Optional[Dict[Tuple[str, str], float]] = None
+        if win_prob is not None:
+            self._win_probs = {pair: win_prob(*pair) for pair in pairs}
+        else:
+            self.batch.simulator.prefetch_predictions(pairs)
+
+        # An unplayed bracket is reset in place between replications instead of cloned;
+        # judged by series scores, since loaded series may come without game logs
+        self._fresh = (
+            len(self.template.eastern_conference) == 4
+            and len(self.template.western_conference) == 4
+            and self.template.stanley_cup_finals is None
+            and all(
+                s.games_played == 0 and s.status == SeriesStatus.NOT_STARTED
+                for s in self.template.get_all_series()
+            )
+        )
+        self._playoffs = MonteCarloPlayoffs(self.template.season_year, self._play_game)
+        self._playoffs.bracket = self.template.clone()
+        self._rng = GameRandom(0)
+
+    def _play_game(self, home: str, away: str) -> Tuple[int, int, bool]:
+        """One game as (home_score, away_score, overtime) from the current chunk's stream."""
+        if self._win_probs is not None:
+            if self._rng.random() < self._win_probs[(home, away)]:
+                return 1, 0, False
+            return 0, 1, False
+        home_score, away_score, outcome, _, _ = self.batch.play_game(self.batch.matchup(home, away), self._rng)
+        return home_score, away_score, outcome >= OVERTIME
+
+    def _play_chunk(self, chunk_index: int, brackets: int, root_seed: int) -> RoundCounts:
+        """Play `brackets` replications on chunk `chunk_index`'s stream and count series wins."""
+        self._rng = GameRandom(derive_seed(root_seed, chunk_index))
+        counts: RoundCounts = {team: [0, 0, 0, 0] for team in self.seeds}
+
+        for _ in range(brackets):
+            if self._fresh:
+                self._playoffs.bracket.reset()
+            else:
+                self._playoffs.bracket = self.template.clone()
+            for series in self._playoffs.simulate_playoffs().get_all_series():
+                counts[series.winner][series.round.value - 1] += 1
+        return counts
+
+    def run(
+        self,
+        brackets: int = 10000,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[AdvancementOdds]:
+        """
+        Play the bracket many times and aggregate per-team odds.
+
+        Args:
+            brackets: Number of replications
+            seed: Optional seed for reproducible runs (the same for any worker count)
+            workers: Worker processes to spread chunks across (1 = serial)
+            progress_callback: Called with (brackets_done, brackets) after each chunk
+
+        Returns:
+            AdvancementOdds for all 16 teams, most likely champion first
+        """
+        root = seed if seed is not None else new_seed()
+        tasks = [
+            (index, min(BRACKETS_PER_CHUNK, brackets - start), root)
+            for index, start in enumerate(range(0, brackets, BRACKETS_PER_CHUNK))
+        ]
+
+        totals: RoundCounts = {team: [0, 0, 0, 0] for team in self.seeds}
+        done = 0
+
+        def fold(task: Tuple[int, int, int], counts: RoundCounts):
+            nonlocal done
+            for team, wins in counts.items():
+                total = totals[team]
+                for i, count in enumerate(wins):
+                    total[i] += count
+            done += task[1]
+            if progress_callback:
+                progress_callback(done, brackets)
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(tasks)),
+                initializer=_init_bracket_worker,
+                initargs=(
+                    dict(NHL_TEAMS), self.batch.simulator.api_url,
+                    self.batch.simulator.home_ice_advantage, self.template, self._win_probs
+                )
+            ) as pool:
+                try:
+                    # A few chunks per worker keeps them busy without much IPC overhead
+                    chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+                    for task, counts in zip(tasks, pool.map(_play_bracket_chunk, tasks, chunksize=chunksize)):
+                        fold(task, counts)
+                except BaseException:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise
+        else:
+            for task in tasks:
+                fold(task, self._play_chunk(*task))
+
+        odds = [
+            AdvancementOdds(team, conference, seed_number, *(count / brackets for count in totals[team]))
+            for team, (conference, seed_number) in self.seeds.items()
+        ]
+        return sorted(odds, key=lambda o: o.cup_prob, reverse=True)
+
+
+if __name__ == "__main__":
+    """Play the bracket seeded by team strength."""
+    import time
+
+    from nhl_loader import load_all_teams
+
+    load_all_teams()
+    standings = [
+        {"team_code": code, "team_name": team.full_name, "points": round(team.overall_strength),
+         "goal_differential": 0, "conference": team.conference}
+        for code, team in NHL_TEAMS.items()
+    ]
+    playoffs = PlayoffSimulator(verbose=False, seed=1)
+    playoffs.generate_bracket(standings)
+
+    start = time.perf_counter()
+    odds = BracketMonteCarlo(playoffs).run(brackets=2000, seed=1)
+    print(f"2,000 brackets in {time.perf_counter() - start:.1f}s\n")
+
+    print(f"{'Team':<6}{'Seed':>6}{'R2%':>7}{'CF%':>7}{'SCF%':>7}{'CUP%':>7}")
+    for o in odds:
+        print(f"{o.team_code:<6}{o.conference[0] + str(o.seed):>6}{o.second_round_prob:>7.1%}"
+              f"{o.conference_finals_prob:>7.1%}{o.cup_finals_prob:>7.1%}{o.cup_prob:>7.1%}")
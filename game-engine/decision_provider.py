@@ -0,0 +1,150 @@
+"""
+Decision Providers
+
+Strategic in-game decisions (currently goalie pulls) behind a small
+interface, so the simulator can decide in-process by default and only
+talk to the Intelligence Service when asked to.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from game_state import DecisionContext
+
+
+# Goalie pull rule from PuckcastClient._recommend_pull_goalie:
+# trailing by 1-2 with under 2 minutes left
+PULL_GOALIE_MAX_DEFICIT = 2
+PULL_GOALIE_SECONDS = 120
+CONFIDENT_PULL_SECONDS = 90
+
+# Minimum confidence before the simulator acts on a recommendation
+MIN_CONFIDENCE = 0.5
+
+
+class DecisionProvider(ABC):
+    """
+    Interface for strategic decisions made during a simulated game.
+
+    Implementations return the same shape as the Intelligence Service's
+    /recommend-decision endpoint: recommendation, confidence and reasoning.
+    """
+
+    # Recent events to include in each DecisionContext (0 = none)
+    recent_events: int = 0
+
+    @abstractmethod
+    def recommend_decision(self, decision_type: str, context: DecisionContext) -> Dict:
+        """
+        Recommend a decision for one team.
+
+        Args:
+            decision_type: Type of decision ('pull_goalie', ...)
+            context: Compact game context from the deciding team's side
+
+        Returns:
+            Dictionary with recommendation, confidence and reasoning
+        """
+
+    def pull_thresholds(self) -> Tuple[int, ...]:
+        """
+        Goalie pull rule as a lookup table for the batch engines.
+
+        Entry i is the clock (seconds) below which a team trailing by i pulls
+        its goalie; deficits past the end of the table never pull.
+        """
+        return LOCAL_PULL_THRESHOLDS
+
+    def close(self):
+        """Release any resources held by the provider."""
+
+
+class LocalDecisionProvider(DecisionProvider):
+    """In-process port of PuckcastClient.recommend_decision (no network calls)."""
+
+    def recommend_decision(self, decision_type: str, context: DecisionContext) -> Dict:
+        if decision_type == 'pull_goalie':
+            return self._recommend_pull_goalie(context.score_diff, context.time_remaining)
+
+        return {
+            'recommendation': None,
+            'confidence': 0.5,
+            'reasoning': 'Default recommendation'
+        }
+
+    @staticmethod
+    def _recommend_pull_goalie(score_diff: int, time_remaining: int) -> Dict:
+        """Recommend whether to pull goalie (score_diff from the deciding team's side)."""
+        should_pull = -PULL_GOALIE_MAX_DEFICIT <= score_diff <= -1 and time_remaining < PULL_GOALIE_SECONDS
+
+        return {
+            'recommendation': 'pull_goalie' if should_pull else 'keep_goalie',
+            'confidence': 0.9 if abs(score_diff) == 1 and time_remaining < CONFIDENT_PULL_SECONDS else 0.6,
+            'reasoning': f'Score diff: {score_diff}, Time: {time_remaining / 60:.1f}min'
+        }
+
+
+LOCAL_PULL_THRESHOLDS: Tuple[int, ...] = tuple(
+    PULL_GOALIE_SECONDS if deficit >= 1 else 0
+    for deficit in range(PULL_GOALIE_MAX_DEFICIT + 1)
+)
+
+
+class RemoteDecisionProvider(DecisionProvider):
+    """
+    Asks the Intelligence Service's /recommend-decision endpoint.
+
+    Opt-in: every decision is a blocking HTTP round trip. Requests carry
+    only the compact DecisionContext, so their size doesn't grow with the
+    game. Any failure falls back to the local provider.
+    """
+
+    def __init__(
+        self,
+        api_url: str = "http://localhost:8000",
+        timeout: float = 2.0,
+        fallback: Optional[DecisionProvider] = None,
+        verbose: bool = False,
+        recent_events: int = 0
+    ):
+        """
+        Initialize remote provider.
+
+        Args:
+            api_url: URL of the Intelligence Service API
+            timeout: Request timeout in seconds
+            fallback: Provider used when the service can't answer (default: local)
+            verbose: Print a note when falling back
+            recent_events: Number of recent events to send with each request
+        """
+        self.api_url = api_url
+        self.fallback = fallback or LocalDecisionProvider()
+        self.verbose = verbose
+        self.recent_events = recent_events
+        self.client = httpx.Client(timeout=timeout)
+
+    def recommend_decision(self, decision_type: str, context: DecisionContext) -> Dict:
+        try:
+            response = self.client.post(
+                f"{self.api_url}/recommend-decision",
+                json={
+                    "decision_type": decision_type,
+                    "context": context.to_dict()
+                }
+            )
+            if response.status_code == 200:
+                return response.json()
+
+        except Exception as e:
+            if self.verbose:
+                print(f"[AI] API unavailable, using fallback logic: {e}")
+
+        return self.fallback.recommend_decision(decision_type, context)
+
+    def pull_thresholds(self) -> Tuple[int, ...]:
+        return self.fallback.pull_thresholds()
+
+    def close(self):
+        self.client.close()
@@ -10,7 +10,10 @@ from pathlib import Path
 # Add game-engine to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from simulator import NHLSimulator
+from simulator import NHLSimulator, realtime_pacer
+
+# Game seconds per wall-clock second (about 0.05 s per play, for readability)
+DEMO_SPEED = 700.0
 
 
 def main():
@@ -70,7 +73,8 @@ def main():
                     home_team_code=game['home_code'],
                     home_team_name=game['home_name'],
                     away_team_code=game['away_code'],
-                    away_team_name=game['away_name']
+                    away_team_name=game['away_name'],
+                    tick_callback=realtime_pacer(DEMO_SPEED)
                 )
                 results.append(result)
                 input("\nPress Enter to continue to next game...")
@@ -96,7 +100,8 @@ def main():
                 home_team_code=home_code,
                 home_team_name=home_name,
                 away_team_code=away_code,
-                away_team_name=away_name
+                away_team_name=away_name,
+                tick_callback=realtime_pacer(DEMO_SPEED)
             )
         
         elif 1 <= choice <= len(games):
@@ -106,7 +111,8 @@ def main():
                 home_team_code=game['home_code'],
                 home_team_name=game['home_name'],
                 away_team_code=game['away_code'],
-                away_team_name=game['away_name']
+                away_team_name=game['away_name'],
+                tick_callback=realtime_pacer(DEMO_SPEED)
             )
         else:
             print("Invalid choice!")
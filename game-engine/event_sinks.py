@@ -0,0 +1,266 @@
+"""
+Event Sinks
+
+Where a game's play-by-play goes: console, a JSONL file, or nowhere.
+
+The simulator reports four things to its sink: the pre-game preview,
+every logged GameEvent, plays that aren't logged (saves, hits, shootout
+attempts) and the finished game. Sinks never draw from the game's random
+stream and never sleep, so results are the same whatever sink is
+attached. Console and JSONL sinks buffer lines and write them in batches
+(at period ends, game end, or when the buffer fills) instead of on every
+play. Sinks may be shared by games running on different threads.
+"""
+
+import json
+import random
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, IO, List, Optional
+
+from game_state import GameState, GameEvent, EventType, GamePeriod
+
+# Unlogged play kinds passed to EventSink.play
+SAVE = "save"
+HIT = "hit"
+SHOOTOUT_GOAL = "shootout_goal"
+SHOOTOUT_MISS = "shootout_miss"
+
+
+class EventSink:
+    """Base sink: every hook is a no-op; override the ones you need."""
+
+    # False skips play() calls entirely (saves and hits are the busiest hook)
+    wants_plays = True
+
+    def game_start(self, preview: Dict) -> None:
+        """Before puck drop; preview has game_id, team codes/names, strengths and the ML prediction."""
+
+    def event(self, game: GameState, event: GameEvent) -> None:
+        """A GameEvent was logged."""
+
+    def play(self, game: GameState, kind: str, team: str, detail: str = "") -> None:
+        """An unlogged play (SAVE, HIT, SHOOTOUT_GOAL, SHOOTOUT_MISS) by `team`."""
+
+    def game_end(self, game: GameState) -> None:
+        """The game is over."""
+
+    def close(self) -> None:
+        """Write anything still buffered and release resources."""
+
+
+class NullEventSink(EventSink):
+    """Discards everything."""
+    wants_plays = False
+
+
+def _clock(period: int, time_remaining: int) -> str:
+    return f"[{period}P {time_remaining // 60:02d}:{time_remaining % 60:02d}]"
+
+
+def _team_name(game: GameState, code: str) -> str:
+    if code == game.home_team.code:
+        return game.home_team.name
+    return game.away_team.name if code == game.away_team.code else code
+
+
+class _BufferedSink(EventSink, ABC):
+    """Collects output lines and writes them in batches (subclasses provide _write)."""
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = max(1, buffer_size)
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+
+    def _emit(self, *lines: str) -> None:
+        with self._lock:
+            self._lines.extend(lines)
+            if len(self._lines) >= self.buffer_size:
+                self._write_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_locked()
+
+    def _write_locked(self) -> None:
+        if self._lines:
+            lines, self._lines = self._lines, []
+            self._write(lines)
+
+    @abstractmethod
+    def _write(self, lines: List[str]) -> None:
+        """Write a batch of lines (called with the buffer lock held)."""
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ConsoleEventSink(_BufferedSink):
+    """
+    Human-readable play-by-play (what verbose=True prints).
+
+    Prints a sample of saves and hits, picked with the sink's own random
+    stream. Output is flushed at each period end, at game end and every
+    `buffer_size` lines; use buffer_size=1 for line-by-line output.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        buffer_size: int = 64,
+        save_share: float = 0.15,
+        hit_share: float = 0.10
+    ):
+        super().__init__(buffer_size)
+        self.stream = stream
+        self.save_share = save_share
+        self.hit_share = hit_share
+        self._sampler = random.Random()
+
+    def _write(self, lines: List[str]) -> None:
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+
+    def game_start(self, preview: Dict) -> None:
+        lines = [f"\n{'='*70}", f"SIMULATING: {preview['away_name']} @ {preview['home_name']}"]
+        if preview.get("home_strength") is not None and preview.get("away_strength") is not None:
+            lines += [
+                f"Home Strength: {preview['home_strength']:.1f}/100",
+                f"Away Strength: {preview['away_strength']:.1f}/100",
+                f"Home Ice Advantage: {(preview['home_ice_advantage'] - 1) * 100:.0f}%",
+            ]
+        prediction = preview.get("ml_prediction")
+        if prediction:
+            lines += [
+                f"\n🤖 ML PREDICTION:",
+                f"   Home Win: {prediction['home_win_prob']*100:.1f}%",
+                f"   Expected Score: {prediction['expected_goals_home']:.1f} - {prediction['expected_goals_away']:.1f}",
+                f"   Confidence: {prediction['confidence']*100:.0f}%",
+            ]
+        lines.append(f"{'='*70}\n")
+        self._emit(*lines)
+
+    def event(self, game: GameState, event: GameEvent) -> None:
+        clock = _clock(event.period.value, event.time_remaining)
+        if event.event_type == EventType.PERIOD_START:
+            if event.period == GamePeriod.SHOOTOUT:
+                self._emit("\n--- SHOOTOUT ---\n")
+            else:
+                self._emit(f"\n--- Period {event.period.value} ---\n")
+        elif event.event_type == EventType.PERIOD_END:
+            self.flush()
+        elif event.event_type == EventType.GOAL:
+            line = f"{clock} GOAL! "
+            if event.player_name:
+                line += event.player_name
+                assists = [a for a in (event.primary_assist, event.secondary_assist) if a]
+                if assists:
+                    line += f" ({', '.join(assists)})"
+            else:
+                line += _team_name(game, event.team)
+            line += f"! ({event.home_score}-{event.away_score})"
+            if event.is_power_play:
+                line += " - PP"
+            if event.is_empty_net:
+                line += " - EN"
+            self._emit(line)
+        elif event.event_type == EventType.PENALTY:
+            self._emit(f"{clock} PENALTY: {_team_name(game, event.team)} - {event.description}")
+        elif event.event_type == EventType.GOALIE_PULL:
+            self._emit(f"\n{clock} ** AI DECISION: {_team_name(game, event.team)} pulls goalie! **\n")
+
+    def play(self, game: GameState, kind: str, team: str, detail: str = "") -> None:
+        clock = _clock(game.period.value, game.time_remaining)
+        if kind == SAVE:
+            if self._sampler.random() < self.save_share:
+                self._emit(f"{clock} Save by {detail or _team_name(game, team)}")
+        elif kind == HIT:
+            if self._sampler.random() < self.hit_share:
+                self._emit(f"{clock} Big hit by {_team_name(game, team)}!")
+        elif kind == SHOOTOUT_GOAL:
+            self._emit(f"{detail}: {_team_name(game, team)} SCORES!")
+        elif kind == SHOOTOUT_MISS:
+            self._emit(f"{detail}: {_team_name(game, team)} - Save")
+
+    def game_end(self, game: GameState) -> None:
+        winner = game.get_winner()
+        away, home = game.away_team, game.home_team
+        self._emit(
+            f"\n{'='*70}",
+            "FINAL SCORE",
+            f"{'='*70}",
+            f"{away.name}: {away.score}",
+            f"{home.name}: {home.score}",
+            f"\nWinner: {winner.name}",
+            f"{'='*70}\n",
+            "GAME STATS",
+            f"{'='*70}",
+            f"{'Stat':<25} {away.code:>10} {home.code:>10}",
+            f"{'-'*70}",
+            f"{'Shots':<25} {away.shots:>10} {home.shots:>10}",
+            f"{'Shot Attempts':<25} {away.shot_attempts:>10} {home.shot_attempts:>10}",
+            f"{'Hits':<25} {away.hits:>10} {home.hits:>10}",
+            f"{'Blocked Shots':<25} {away.blocked_shots:>10} {home.blocked_shots:>10}",
+            f"{'Faceoff Wins':<25} {away.faceoffs_won:>10} {home.faceoffs_won:>10}",
+            f"{'Penalties':<25} {away.penalties:>10} {home.penalties:>10}",
+            f"{'PP Goals/Opps':<25} {away.power_play_goals}/{away.power_play_opportunities:>9} {home.power_play_goals}/{home.power_play_opportunities:>9}",
+            f"{'Expected Goals':<25} {away.expected_goals:>10.2f} {home.expected_goals:>10.2f}",
+            f"{'='*70}\n",
+            f"Total Events: {game.event_count}",
+            f"Game Duration: {game.period.value} period(s)",
+            "",
+        )
+        self.flush()
+
+
+class JsonlEventSink(_BufferedSink):
+    """
+    One JSON object per line: game_start, event, play and game_end records,
+    each tagged with the game id. Appends to `path`; written every
+    `buffer_size` lines and at each game end.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 512, include_plays: bool = True):
+        super().__init__(buffer_size)
+        self.path = path
+        self.wants_plays = include_plays
+        self._file: Optional[IO[str]] = None
+
+    def _write(self, lines: List[str]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+
+    def _record(self, record: Dict) -> None:
+        self._emit(json.dumps(record, default=str))
+
+    def game_start(self, preview: Dict) -> None:
+        self._record({"type": "game_start", **preview})
+
+    def event(self, game: GameState, event: GameEvent) -> None:
+        self._record({"type": "event", "game_id": game.game_id, **event.to_dict()})
+
+    def play(self, game: GameState, kind: str, team: str, detail: str = "") -> None:
+        self._record({
+            "type": "play",
+            "game_id": game.game_id,
+            "kind": kind,
+            "team": team,
+            "detail": detail,
+            "period": game.period.value,
+            "time_remaining": game.time_remaining
+        })
+
+    def game_end(self, game: GameState) -> None:
+        self._record({"type": "game_end", **game.to_dict()})
+        self.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._write_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -4,8 +4,10 @@ Game State Management
 Tracks all game state including score, time, players, and events.
 """
 
+import time
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from enum import Enum
 from datetime import datetime
 
@@ -48,7 +50,7 @@ class StrengthSituation(Enum):
     THREE_ON_THREE = "3v3"
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """Represents a single game event."""
     event_type: EventType
@@ -111,7 +113,7 @@ class GameEvent:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamState:
     """Represents a team's current state."""
     code: str  # Team abbreviation (e.g., "TOR")
@@ -166,35 +168,328 @@ class PeriodScore:
     goals: List[Dict] = field(default_factory=list)  # Detailed goal info
 
 
+@dataclass(frozen=True)
+class DecisionContext:
+    """Compact, fixed-size view of the game for strategic decision requests."""
+    team: str  # Deciding team code
+    is_home: bool
+    period: int
+    time_remaining: int  # seconds remaining in period
+    home_score: int
+    away_score: int
+    strength: str  # StrengthSituation value
+    home_goalie_pulled: bool
+    away_goalie_pulled: bool
+    recent_events: Tuple[Dict, ...] = ()  # Optional window of compact events
+    
+    @property
+    def score_diff(self) -> int:
+        """Score differential from the deciding team's side."""
+        diff = self.home_score - self.away_score
+        return diff if self.is_home else -diff
+    
+    def to_dict(self) -> Dict:
+        """Convert context to dictionary for API calls."""
+        data = {
+            "team": self.team,
+            "is_home": self.is_home,
+            "period": self.period,
+            "time_remaining": self.time_remaining,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "strength": self.strength,
+            "home_goalie_pulled": self.home_goalie_pulled,
+            "away_goalie_pulled": self.away_goalie_pulled
+        }
+        if self.recent_events:
+            data["recent_events"] = list(self.recent_events)
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class GameSnapshot:
+    """
+    Compact copy of the state a continuation needs (no event log or names).
+    
+    Pairs are (home, away); penalties are (side, seconds left), oldest
+    first, and queued_penalties are (side, seconds) still waiting to start.
+    """
+    home_team: str
+    away_team: str
+    period: int
+    time_remaining: int
+    score: Tuple[int, int]
+    shots: Tuple[int, int]
+    goalie_pulled: Tuple[bool, bool]
+    penalties: Tuple[Tuple[int, int], ...] = ()
+    queued_penalties: Tuple[Tuple[int, int], ...] = ()
+    finished: bool = False
+    
+    def to_dict(self) -> Dict:
+        """Convert snapshot to dictionary."""
+        return {
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "period": self.period,
+            "time_remaining": self.time_remaining,
+            "home_score": self.score[0],
+            "away_score": self.score[1],
+            "home_shots": self.shots[0],
+            "away_shots": self.shots[1],
+            "home_goalie_pulled": self.goalie_pulled[0],
+            "away_goalie_pulled": self.goalie_pulled[1],
+            "penalties": [{"side": side, "time_remaining": left} for side, left in self.penalties],
+            "queued_penalties": [{"side": side, "duration": seconds} for side, seconds in self.queued_penalties],
+            "finished": self.finished
+        }
+
+
 @dataclass
+class GameResult:
+    """Final outcome of a game played in results-only mode."""
+    home_team: TeamState  # Final team totals
+    away_team: TeamState
+    final_period: GamePeriod  # OVERTIME or SHOOTOUT if not decided in regulation
+    goals: List[Dict] = field(default_factory=list)  # Goal attributions, in order
+    
+    @classmethod
+    def from_game(cls, game: "GameState") -> "GameResult":
+        """Take the result of a finished game."""
+        return cls(
+            home_team=game.home_team,
+            away_team=game.away_team,
+            final_period=game.period,
+            goals=game.goals
+        )
+    
+    @property
+    def overtime(self) -> bool:
+        """Decided in overtime or a shootout."""
+        return self.final_period.value > 3
+    
+    @property
+    def shootout(self) -> bool:
+        """Decided in a shootout."""
+        return self.final_period == GamePeriod.SHOOTOUT
+    
+    def get_winner(self) -> TeamState:
+        """Get winning team."""
+        return self.home_team if self.home_team.score > self.away_team.score else self.away_team
+    
+    def to_dict(self) -> Dict:
+        """Convert result to dictionary."""
+        return {
+            "home_team": self.home_team.to_dict(),
+            "away_team": self.away_team.to_dict(),
+            "winner": self.get_winner().code,
+            "final_period": self.final_period.value,
+            "overtime": self.overtime,
+            "shootout": self.shootout,
+            "goals": self.goals
+        }
+
+
+# Event log records: flat int array, EVENT_FIELDS values per event
+EVENT_FIELDS = 6  # event code, period, time remaining, team side, home score, away score
+EVENT_TYPES = tuple(EventType)
+EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+PERIODS = {period.value: period for period in GamePeriod}
+
+HOME_SIDE = 0
+AWAY_SIDE = 1
+OTHER_SIDE = -1  # event team is neither club (team code kept in the event detail)
+
+# Penalties a team serves at once; later ones wait until one expires (stacked
+# penalties), so a team never drops below three skaters
+MAX_PENALTIES_PER_TEAM = 2
+
+# Penalty slots per game
+MAX_ACTIVE_PENALTIES = 2 * MAX_PENALTIES_PER_TEAM
+
+
+def _strength_for(home_penalties: int, away_penalties: int, home_pulled: bool, away_pulled: bool) -> StrengthSituation:
+    """Strength situation from penalty counts and pulled goalies."""
+    home_skaters = 5 - home_penalties + (1 if home_pulled else 0)
+    away_skaters = 5 - away_penalties + (1 if away_pulled else 0)
+    
+    if home_skaters == 5 and away_skaters == 5:
+        return StrengthSituation.EVEN
+    elif home_skaters == 5 and away_skaters == 4:
+        return StrengthSituation.PP_MAJOR
+    elif home_skaters == 4 and away_skaters == 5:
+        return StrengthSituation.SH_MAJOR
+    elif home_skaters == 4 and away_skaters == 4:
+        return StrengthSituation.FOUR_ON_FOUR
+    elif home_skaters == 3 and away_skaters == 3:
+        return StrengthSituation.THREE_ON_THREE
+    return StrengthSituation.EVEN  # Fallback
+
+
+# STRENGTH_TABLE[home_penalties][away_penalties][home_pulled][away_pulled]
+STRENGTH_TABLE = tuple(
+    tuple(
+        tuple(
+            tuple(_strength_for(hp, ap, bool(h_pull), bool(a_pull)) for a_pull in (0, 1))
+            for h_pull in (0, 1)
+        )
+        for ap in range(MAX_ACTIVE_PENALTIES + 1)
+    )
+    for hp in range(MAX_ACTIVE_PENALTIES + 1)
+)
+
+
+@dataclass(slots=True)
 class GameState:
-    """Represents the complete game state."""
+    """
+    Represents the complete game state.
+    
+    The event log is a flat integer array (see EVENT_FIELDS) with optional
+    per-event details, and penalties live in fixed slots; `events`,
+    `active_penalties` and `to_dict()` build the dataclass/dict views on
+    demand.
+    """
     game_id: str
     home_team: TeamState
     away_team: TeamState
     period: GamePeriod = GamePeriod.FIRST
     time_remaining: int = 1200  # 20 minutes = 1200 seconds
-    events: List[GameEvent] = field(default_factory=list)
     strength_situation: StrengthSituation = StrengthSituation.EVEN
     
-    # Penalty tracking
-    active_penalties: List[Dict] = field(default_factory=list)
-    
     # Period-by-period scoring
     period_scores: Dict[int, PeriodScore] = field(default_factory=dict)
     
+    # Every goal in order, with player attribution (kept in both modes)
+    goals: List[Dict] = field(default_factory=list)
+    
+    # Results-only mode (False): no event log, descriptions or period scores
+    record_events: bool = True
+    
+    # Called with (game, event) as each GameEvent is logged (sinks, live streaming)
+    event_listener: Optional[Callable[["GameState", GameEvent], None]] = field(default=None, repr=False, compare=False)
+    
+    # Set once the game has ended
+    finished: bool = field(default=False, init=False)
+    
+    # Event log: EVENT_FIELDS ints per event, wall-clock times, sparse details
+    _log: array = field(default_factory=lambda: array('i'), init=False, repr=False)
+    _log_times: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _log_details: Dict[int, Dict] = field(default_factory=dict, init=False, repr=False)
+    _event_views: List[GameEvent] = field(default_factory=list, init=False, repr=False)
+    
+    # Penalty slots (oldest first): side, seconds left, description
+    _penalty_sides: List[int] = field(default_factory=lambda: [0] * MAX_ACTIVE_PENALTIES, init=False, repr=False)
+    _penalty_clocks: List[int] = field(default_factory=lambda: [0] * MAX_ACTIVE_PENALTIES, init=False, repr=False)
+    _penalty_descriptions: List[str] = field(default_factory=lambda: [""] * MAX_ACTIVE_PENALTIES, init=False, repr=False)
+    _penalty_count: int = field(default=0, init=False, repr=False)
+    _penalties_by_side: List[int] = field(default_factory=lambda: [0, 0], init=False, repr=False)
+    _queued_penalties: List[Tuple[int, int, str]] = field(default_factory=list, init=False, repr=False)  # side, seconds, description
+    
     def __post_init__(self):
         """Initialize game start event and period scoring."""
+        if not self.record_events:
+            return
+        
         # Initialize period scores for regulation periods
         for period in [1, 2, 3]:
             self.period_scores[period] = PeriodScore(period=period)
         
-        self.add_event(
-            EventType.PERIOD_START,
-            self.home_team.code,
-            f"Period {self.period.value} begins"
+        self._record(EventType.PERIOD_START, HOME_SIDE)
+    
+    def _side(self, team: str) -> int:
+        """HOME_SIDE / AWAY_SIDE for a team code."""
+        if team == self.home_team.code:
+            return HOME_SIDE
+        return AWAY_SIDE if team == self.away_team.code else OTHER_SIDE
+    
+    def _record(self, event_type: EventType, side: int, detail: Optional[Dict] = None):
+        """Append an event record (no-op in results-only mode)."""
+        if not self.record_events:
+            return
+        if detail:
+            self._log_details[len(self._log_times)] = detail
+        self._log.extend((
+            EVENT_CODES[event_type], self.period.value, self.time_remaining,
+            side, self.home_team.score, self.away_team.score
+        ))
+        self._log_times.append(time.time())
+        if self.event_listener is not None:
+            self.event_listener(self, self.last_event())
+    
+    @property
+    def event_count(self) -> int:
+        """Number of logged events."""
+        return len(self._log_times)
+    
+    @property
+    def events(self) -> List[GameEvent]:
+        """Event log as GameEvent views (built once per event, on first access)."""
+        views = self._event_views
+        for index in range(len(views), len(self._log_times)):
+            views.append(self._event_view(index))
+        return views
+    
+    def last_event(self) -> Optional[GameEvent]:
+        """Most recent event as a GameEvent view."""
+        return self.events[-1] if self._log_times else None
+    
+    def _event_view(self, index: int) -> GameEvent:
+        """Build the GameEvent for one log record."""
+        base = index * EVENT_FIELDS
+        code, period, time_remaining, side, home_score, away_score = self._log[base:base + EVENT_FIELDS]
+        event_type = EVENT_TYPES[code]
+        detail = dict(self._log_details.get(index, ()))
+        
+        if side == OTHER_SIDE:
+            team = detail.pop("team")
+        else:
+            team = (self.home_team if side == HOME_SIDE else self.away_team).code
+        description = detail.pop("description", None)
+        if description is None:
+            description = self._describe(event_type, period, side, home_score, away_score, detail)
+        
+        return GameEvent(
+            event_type=event_type,
+            period=PERIODS[period],
+            time_remaining=time_remaining,
+            team=team,
+            description=description,
+            home_score=home_score,
+            away_score=away_score,
+            timestamp=datetime.fromtimestamp(self._log_times[index]),
+            **detail
         )
     
+    def _describe(self, event_type: EventType, period: int, side: int,
+                  home_score: int, away_score: int, detail: Dict) -> str:
+        """Description text for events logged without one."""
+        if event_type == EventType.PERIOD_START:
+            if period == GamePeriod.OVERTIME.value:
+                return "Overtime begins (3v3)"
+            if period == GamePeriod.SHOOTOUT.value:
+                return "Shootout begins"
+            return f"Period {period} begins"
+        if event_type == EventType.PERIOD_END:
+            return f"Period {period} ends"
+        if event_type == EventType.GAME_END:
+            return f"FINAL: {self.away_team.name} {away_score} - {home_score} {self.home_team.name}"
+        if event_type == EventType.GOAL:
+            description = "GOAL! "
+            scorer_name = detail.get("player_name")
+            if scorer_name:
+                description += scorer_name
+                assists = [a for a in (detail.get("primary_assist"), detail.get("secondary_assist")) if a]
+                if assists:
+                    description += f" ({', '.join(assists)})"
+            else:
+                team_state = self.home_team if side == HOME_SIDE else self.away_team
+                description += f"{team_state.name} scores"
+            if detail.get("is_power_play"):
+                description += " - PP"
+            if detail.get("is_empty_net"):
+                description += " - EN"
+            return description
+        return ""
+    
     def add_event(
         self, 
         event_type: EventType, 
@@ -211,30 +506,33 @@ class GameState:
         is_power_play: bool = False,
         is_empty_net: bool = False,
         shot_type: Optional[str] = None
-    ) -> GameEvent:
-        """Add an event to the game log with optional player attribution."""
-        event = GameEvent(
-            event_type=event_type,
-            period=self.period,
-            time_remaining=self.time_remaining,
-            team=team,
-            description=description,
-            home_score=self.home_team.score,
-            away_score=self.away_team.score,
-            player_name=player_name,
-            player_id=player_id,
-            primary_assist=primary_assist,
-            primary_assist_id=primary_assist_id,
-            secondary_assist=secondary_assist,
-            secondary_assist_id=secondary_assist_id,
-            goalie_name=goalie_name,
-            goalie_id=goalie_id,
-            is_power_play=is_power_play,
-            is_empty_net=is_empty_net,
-            shot_type=shot_type
-        )
-        self.events.append(event)
-        return event
+    ) -> Optional[GameEvent]:
+        """Add an event to the game log with optional player attribution (no-op in results-only mode)."""
+        if not self.record_events:
+            return None
+        
+        detail = {
+            key: value for key, value in (
+                ("description", description),
+                ("player_name", player_name),
+                ("player_id", player_id),
+                ("primary_assist", primary_assist),
+                ("primary_assist_id", primary_assist_id),
+                ("secondary_assist", secondary_assist),
+                ("secondary_assist_id", secondary_assist_id),
+                ("goalie_name", goalie_name),
+                ("goalie_id", goalie_id),
+                ("is_power_play", is_power_play),
+                ("is_empty_net", is_empty_net),
+                ("shot_type", shot_type),
+            )
+            if value is not None and value is not False
+        }
+        side = self._side(team)
+        if side == OTHER_SIDE:
+            detail["team"] = team
+        self._record(event_type, side, detail)
+        return self.last_event()
     
     def advance_time(self, seconds: int):
         """Advance game clock."""
@@ -245,58 +543,87 @@ class GameState:
     
     def _update_penalties(self, seconds: int):
         """Update penalty timers and remove expired penalties."""
-        updated_penalties = []
-        for penalty in self.active_penalties:
-            penalty['time_remaining'] -= seconds
-            if penalty['time_remaining'] > 0:
-                updated_penalties.append(penalty)
+        count = self._penalty_count
+        if count:
+            sides = self._penalty_sides
+            clocks = self._penalty_clocks
+            descriptions = self._penalty_descriptions
+            kept = 0
+            for i in range(count):
+                left = clocks[i] - seconds
+                if left > 0:
+                    sides[kept] = sides[i]
+                    clocks[kept] = left
+                    descriptions[kept] = descriptions[i]
+                    kept += 1
+                else:
+                    self._penalties_by_side[sides[i]] -= 1
+            self._penalty_count = kept
+            
+            if self._queued_penalties:
+                self._start_queued_penalties()
         
-        self.active_penalties = updated_penalties
         self._update_strength_situation()
     
+    def _start_queued_penalties(self):
+        """Start waiting penalties, in the order called, for teams with a free slot."""
+        waiting = []
+        for side, seconds, description in self._queued_penalties:
+            if self._penalties_by_side[side] < MAX_PENALTIES_PER_TEAM:
+                self._start_penalty(side, seconds, description)
+            else:
+                waiting.append((side, seconds, description))
+        self._queued_penalties = waiting
+    
+    def _start_penalty(self, side: int, seconds: int, description: str):
+        """Put a penalty in the next slot."""
+        count = self._penalty_count
+        self._penalty_sides[count] = side
+        self._penalty_clocks[count] = seconds
+        self._penalty_descriptions[count] = description
+        self._penalty_count = count + 1
+        self._penalties_by_side[side] += 1
+    
     def _update_strength_situation(self):
-        """Calculate current strength situation based on active penalties."""
-        home_penalties = sum(1 for p in self.active_penalties if p['team'] == self.home_team.code)
-        away_penalties = sum(1 for p in self.active_penalties if p['team'] == self.away_team.code)
-        
-        home_skaters = 5 - home_penalties
-        away_skaters = 5 - away_penalties
-        
-        # Handle goalie pull
-        if self.home_team.goalie_pulled:
-            home_skaters += 1
-        if self.away_team.goalie_pulled:
-            away_skaters += 1
-        
-        # Determine situation
-        if home_skaters == 5 and away_skaters == 5:
-            self.strength_situation = StrengthSituation.EVEN
-        elif home_skaters == 5 and away_skaters == 4:
-            self.strength_situation = StrengthSituation.PP_MAJOR
-        elif home_skaters == 4 and away_skaters == 5:
-            self.strength_situation = StrengthSituation.SH_MAJOR
-        elif home_skaters == 4 and away_skaters == 4:
-            self.strength_situation = StrengthSituation.FOUR_ON_FOUR
-        elif home_skaters == 3 and away_skaters == 3:
-            self.strength_situation = StrengthSituation.THREE_ON_THREE
-        else:
-            self.strength_situation = StrengthSituation.EVEN  # Fallback
+        """Look up the strength situation for active penalties and pulled goalies."""
+        home_penalties, away_penalties = self._penalties_by_side
+        self.strength_situation = STRENGTH_TABLE[home_penalties][away_penalties][
+            self.home_team.goalie_pulled][self.away_team.goalie_pulled]
+    
+    @property
+    def active_penalties(self) -> List[Dict]:
+        """Active penalties, oldest first, as dicts (team, time_remaining, description)."""
+        sides = (self.home_team.code, self.away_team.code)
+        return [
+            {
+                'team': sides[self._penalty_sides[i]],
+                'time_remaining': self._penalty_clocks[i],
+                'description': self._penalty_descriptions[i]
+            }
+            for i in range(self._penalty_count)
+        ]
+    
+    def oldest_penalty_team(self) -> Optional[str]:
+        """Team serving the longest-running active penalty."""
+        if not self._penalty_count:
+            return None
+        return (self.home_team if self._penalty_sides[0] == HOME_SIDE else self.away_team).code
     
     def add_penalty(self, team: str, minutes: int, description: str):
-        """Add a penalty."""
-        penalty = {
-            'team': team,
-            'time_remaining': minutes * 60,
-            'description': description
-        }
-        self.active_penalties.append(penalty)
-        
-        team_state = self.home_team if team == self.home_team.code else self.away_team
+        """Add a penalty (queued if the team already serves MAX_PENALTIES_PER_TEAM)."""
+        is_home = team == self.home_team.code
+        team_state = self.home_team if is_home else self.away_team
         team_state.penalties += 1
         team_state.penalty_minutes += minutes
         
+        side = HOME_SIDE if is_home else AWAY_SIDE
+        if self._penalties_by_side[side] < MAX_PENALTIES_PER_TEAM:
+            self._start_penalty(side, minutes * 60, description)
+        else:
+            self._queued_penalties.append((side, minutes * 60, description))
+        
         self._update_strength_situation()
-        self.add_event(EventType.PENALTY, team, description)
+        self._record(EventType.PENALTY, self._side(team), {"description": description})
     
     def score_goal(
         self, 
@@ -312,46 +639,45 @@ class GameState:
         shot_type: Optional[str] = None
     ):
         """Record a goal with player attribution."""
-        team_state = self.home_team if team == self.home_team.code else self.away_team
+        is_home = (team == self.home_team.code)
+        team_state = self.home_team if is_home else self.away_team
         team_state.score += 1
         
         if is_power_play:
             team_state.power_play_goals += 1
         
-        # Build description
-        description = f"GOAL! "
-        if scorer_name:
-            description += f"{scorer_name}"
-            if primary_assist or secondary_assist:
-                assists = []
-                if primary_assist:
-                    assists.append(primary_assist)
-                if secondary_assist:
-                    assists.append(secondary_assist)
-                description += f" ({', '.join(assists)})"
-        else:
-            description += f"{team_state.name} scores"
+        goal = {
+            "team": team,
+            "period": self.period.value,
+            "scorer": scorer_name,
+            "scorer_id": scorer_id,
+            "primary_assist": primary_assist,
+            "primary_assist_id": primary_assist_id,
+            "secondary_assist": secondary_assist,
+            "secondary_assist_id": secondary_assist_id,
+            "is_power_play": is_power_play,
+            "is_empty_net": is_empty_net
+        }
+        self.goals.append(goal)
         
-        if is_power_play:
-            description += " - PP"
-        if is_empty_net:
-            description += " - EN"
+        if not self.record_events:
+            return
         
-        # Add event
-        self.add_event(
-            EventType.GOAL, 
-            team, 
-            description,
-            player_name=scorer_name,
-            player_id=scorer_id,
-            primary_assist=primary_assist,
-            primary_assist_id=primary_assist_id,
-            secondary_assist=secondary_assist,
-            secondary_assist_id=secondary_assist_id,
-            is_power_play=is_power_play,
-            is_empty_net=is_empty_net,
-            shot_type=shot_type
-        )
+        # Log the goal; the description is built when the event is viewed
+        self._record(EventType.GOAL, HOME_SIDE if is_home else AWAY_SIDE, {
+            key: value for key, value in (
+                ("player_name", scorer_name),
+                ("player_id", scorer_id),
+                ("primary_assist", primary_assist),
+                ("primary_assist_id", primary_assist_id),
+                ("secondary_assist", secondary_assist),
+                ("secondary_assist_id", secondary_assist_id),
+                ("is_power_play", is_power_play),
+                ("is_empty_net", is_empty_net),
+                ("shot_type", shot_type),
+            )
+            if value is not None and value is not False
+        })
         
         # Track period scoring
         period_num = self.period.value
@@ -360,7 +686,6 @@ class GameState:
                 self.period_scores[period_num] = PeriodScore(period=period_num)
             
             period_score = self.period_scores[period_num]
-            is_home = (team == self.home_team.code)
             
             if is_home:
                 period_score.home_goals += 1
@@ -386,22 +711,14 @@ class GameState:
         Returns True if game continues, False if game is over.
         """
         # End current period
-        self.add_event(
-            EventType.PERIOD_END,
-            self.home_team.code,
-            f"Period {self.period.value} ends"
-        )
+        self._record(EventType.PERIOD_END, HOME_SIDE)
         
         # Check if game is tied after regulation
         if self.period == GamePeriod.THIRD:
             if self.home_team.score == self.away_team.score:
                 self.period = GamePeriod.OVERTIME
                 self.time_remaining = 300  # 5 minute OT
-                self.add_event(
-                    EventType.PERIOD_START,
-                    self.home_team.code,
-                    "Overtime begins (3v3)"
-                )
+                self._record(EventType.PERIOD_START, HOME_SIDE)
                 self.strength_situation = StrengthSituation.THREE_ON_THREE
                 return True
             else:
@@ -413,11 +730,7 @@ class GameState:
         elif self.period == GamePeriod.OVERTIME:
             if self.home_team.score == self.away_team.score:
                 self.period = GamePeriod.SHOOTOUT
-                self.add_event(
-                    EventType.PERIOD_START,
-                    self.home_team.code,
-                    "Shootout begins"
-                )
+                self._record(EventType.PERIOD_START, HOME_SIDE)
                 return True
             else:
                 self._end_game()
@@ -431,25 +744,18 @@ class GameState:
         
         # Reset time and start new period
         self.time_remaining = 1200
-        self.add_event(
-            EventType.PERIOD_START,
-            self.home_team.code,
-            f"Period {self.period.value} begins"
-        )
+        self._record(EventType.PERIOD_START, HOME_SIDE)
         return True
     
     def _end_game(self):
         """End the game."""
-        winner = self.home_team if self.home_team.score > self.away_team.score else self.away_team
-        self.add_event(
-            EventType.GAME_END,
-            winner.code,
-            f"FINAL: {self.away_team.name} {self.away_team.score} - {self.home_team.score} {self.home_team.name}"
-        )
+        self.finished = True
+        winner_side = HOME_SIDE if self.home_team.score > self.away_team.score else AWAY_SIDE
+        self._record(EventType.GAME_END, winner_side)
     
     def is_game_over(self) -> bool:
         """Check if game is over."""
-        return len(self.events) > 0 and self.events[-1].event_type == EventType.GAME_END
+        return self.finished
     
     def get_winner(self) -> Optional[TeamState]:
         """Get winning team."""
@@ -457,6 +763,57 @@ class GameState:
             return None
         return self.home_team if self.home_team.score > self.away_team.score else self.away_team
     
+    def snapshot(self) -> GameSnapshot:
+        """Compact copy of the current state, e.g. to fork continuations from."""
+        home, away = self.home_team, self.away_team
+        return GameSnapshot(
+            home_team=home.code,
+            away_team=away.code,
+            period=self.period.value,
+            time_remaining=self.time_remaining,
+            score=(home.score, away.score),
+            shots=(home.shots, away.shots),
+            goalie_pulled=(home.goalie_pulled, away.goalie_pulled),
+            penalties=tuple(zip(self._penalty_sides[:self._penalty_count],
+                                self._penalty_clocks[:self._penalty_count])),
+            queued_penalties=tuple((side, seconds) for side, seconds, _ in self._queued_penalties),
+            finished=self.finished
+        )
+    
+    def decision_context(self, team: TeamState, recent_events: int = 0) -> DecisionContext:
+        """
+        Build a compact decision context for one team.
+        
+        Args:
+            team: Team making the decision
+            recent_events: Number of most recent events to include (0 = none)
+        """
+        window = []
+        if recent_events > 0:
+            codes = (self.home_team.code, self.away_team.code)
+            count = len(self._log_times)
+            for index in range(max(0, count - recent_events), count):
+                base = index * EVENT_FIELDS
+                side = self._log[base + 3]
+                window.append({
+                    "event_type": EVENT_TYPES[self._log[base]].value,
+                    "period": self._log[base + 1],
+                    "time_remaining": self._log[base + 2],
+                    "team": codes[side] if side != OTHER_SIDE else self._log_details[index]["team"]
+                })
+        return DecisionContext(
+            team=team.code,
+            is_home=team is self.home_team,
+            period=self.period.value,
+            time_remaining=self.time_remaining,
+            home_score=self.home_team.score,
+            away_score=self.away_team.score,
+            strength=self.strength_situation.value,
+            home_goalie_pulled=self.home_team.goalie_pulled,
+            away_goalie_pulled=self.away_team.goalie_pulled,
+            recent_events=tuple(window)
+        )
+    
     def to_dict(self) -> Dict:
         """Convert game state to dictionary for API calls."""
         return {
@@ -467,7 +824,7 @@ class GameState:
             "away_team": self.away_team.to_dict(),
             "strength_situation": self.strength_situation.value,
             "active_penalties": self.active_penalties,
-            "total_events": len(self.events),
+            "total_events": self.event_count,
             "period_scores": {
                 period: {
                     "period": ps.period,
@@ -144,26 +144,37 @@ class GMCareerManager:
             raise ValueError(f"Invalid team code: {team_code}")
         
         team = NHL_TEAMS[team_code]
-        roster = []
-        
-        for player in team.players:
-            roster.append({
-                "player_id": player.player_id,
-                "name": player.name,
-                "position": player.position,
-                "overall_rating": player.overall,
-                "offensive_rating": player.offensive,
-                "defensive_rating": player.defensive
-            })
+        roster = [self._player_dict(player) for player in team.roster.get_all_players()]
         
         return sorted(roster, key=lambda p: p['overall_rating'], reverse=True)
     
+    @staticmethod
+    def _player_dict(player: Player) -> Dict:
+        """
+        Player data for the GM roster views.
+        
+        Players carry a single skill rating, so the offensive and defensive
+        ratings report the same value.
+        """
+        return {
+            "player_id": player.id,
+            "name": player.name,
+            "position": player.position.value,
+            "overall_rating": player.rating,
+            "offensive_rating": player.rating,
+            "defensive_rating": player.rating
+        }
+    
     def update_player_rating(self, team_code: str, player_id: int, 
                             overall: Optional[int] = None,
                             offensive: Optional[int] = None,
                             defensive: Optional[int] = None) -> Dict:
         """
-        Update a player's ratings.
+        Update a player's rating.
+        
+        Players carry a single skill rating. `overall` sets it; without it,
+        `offensive` sets a forward's rating and `defensive` a defenseman's or
+        goalie's (the ratings each feeds into team strength).
         
         Args:
             team_code: Team code
@@ -181,31 +192,25 @@ class GMCareerManager:
         team = NHL_TEAMS[team_code]
         player = None
         
-        for p in team.players:
-            if p.player_id == player_id:
+        for p in team.roster.get_all_players():
+            if p.id == player_id:
                 player = p
                 break
         
         if not player:
             raise ValueError(f"Player {player_id} not found on team {team_code}")
         
-        # Update ratings
-        if overall is not None:
-            player.overall = max(0, min(100, overall))
-        if offensive is not None:
-            player.offensive = max(0, min(100, offensive))
-        if defensive is not None:
-            player.defensive = max(0, min(100, defensive))
+        # Update rating
+        rating = overall
+        if rating is None:
+            rating = offensive if player.is_forward() else defensive
+        if rating is not None:
+            player.rating = max(0, min(100, rating))
+            
+            # Strength ratings depend on player ratings
+            team.invalidate_ratings()
         
-        return {
-            "player_id": player.player_id,
-            "name": player.name,
-            "position": player.position,
-            "overall_rating": player.overall,
-            "offensive_rating": player.offensive,
-            "defensive_rating": player.defensive,
-            "updated": True
-        }
+        return {**self._player_dict(player), "updated": True}
     
     def get_career_summary(self, career_id: str) -> Dict:
         """Get comprehensive career summary."""
@@ -225,7 +230,7 @@ class GMCareerManager:
                 "conference": team.conference,
                 "division": team.division,
                 "overall_strength": team.overall_strength,
-                "roster_size": len(team.players)
+                "roster_size": len(team.roster.get_all_players())
             },
             "achievements": {
                 "seasons_played": career.seasons_completed,
@@ -0,0 +1,69 @@
+"""
+Matchup Context
+
+Per-game constants for one matchup, compiled once at puck drop.
+
+Everything the play loop needs that depends only on the two teams (event
+share, goal probabilities by strength state, shooter/assist tables and
+starting goalies) is resolved here, so the loop does index lookups
+instead of re-deriving ratings and comparing team codes on every shot.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from decision_provider import LOCAL_PULL_THRESHOLDS
+from nhl_data import NHLTeam, Player
+from sampling_tables import TeamSamplingTables
+
+# Goal probability multiplier on a major power play, and the flat rate on an empty net
+POWER_PLAY_BOOST = 1.8
+EMPTY_NET_GOAL_PROB = 0.35
+
+HOME = 0
+AWAY = 1
+
+
+@dataclass(frozen=True)
+class MatchupContext:
+    """Immutable per-game constants; pairs are indexed (home, away)."""
+    home_code: str
+    away_code: str
+    teams: Tuple[Optional[NHLTeam], Optional[NHLTeam]]
+    home_event_prob: float
+    goal_prob: Tuple[float, float]  # per shot by the side, at even strength
+    power_play_goal_prob: Tuple[float, float]  # per shot by the side on a major power play
+    shooters: Tuple[Optional[TeamSamplingTables], Optional[TeamSamplingTables]]
+    goalies: Tuple[Optional[Player], Optional[Player]]  # starting goalie of each side
+    pull_seconds: Tuple[int, ...] = LOCAL_PULL_THRESHOLDS
+
+    @classmethod
+    def build(
+        cls,
+        home_code: str,
+        away_code: str,
+        teams: Tuple[Optional[NHLTeam], Optional[NHLTeam]],
+        home_event_prob: float,
+        goal_prob: Tuple[float, float],
+        shooters: Tuple[Optional[TeamSamplingTables], Optional[TeamSamplingTables]],
+        pull_seconds: Tuple[int, ...] = LOCAL_PULL_THRESHOLDS
+    ) -> "MatchupContext":
+        """Derive the strength-state tables and goalies from the base values."""
+        return cls(
+            home_code=home_code,
+            away_code=away_code,
+            teams=teams,
+            home_event_prob=home_event_prob,
+            goal_prob=goal_prob,
+            power_play_goal_prob=(goal_prob[HOME] * POWER_PLAY_BOOST, goal_prob[AWAY] * POWER_PLAY_BOOST),
+            shooters=shooters,
+            goalies=tuple(
+                team.roster.get_starting_goalie() if team and team.roster else None
+                for team in teams
+            ),
+            pull_seconds=pull_seconds,
+        )
+
+    def side(self, team_code: str) -> int:
+        """HOME or AWAY for a team code."""
+        return HOME if team_code == self.home_code else AWAY
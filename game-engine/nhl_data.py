@@ -156,6 +156,10 @@ class NHLTeam:
     # Team identity
     abbreviation: str = ""
     
+    # Cached strength ratings (see ratings / invalidate_ratings)
+    _ratings: Optional["TeamRatings"] = field(default=None, init=False, repr=False, compare=False)
+    ratings_version: int = field(default=0, init=False, repr=False, compare=False)  # bumped on each invalidation
+    
     def __post_init__(self):
         """Set abbreviation if not provided."""
         if not self.abbreviation:
@@ -166,45 +170,97 @@ class NHLTeam:
         """Get full team name."""
         return f"{self.city} {self.name}"
     
+    @property
+    def ratings(self) -> "TeamRatings":
+        """
+        Cached strength ratings.
+        
+        Computed on first use; call invalidate_ratings() after changing
+        the roster, player ratings or team stats.
+        """
+        ratings = self._ratings
+        if ratings is None:
+            ratings = self._ratings = TeamRatings.from_team(self)
+        return ratings
+    
+    def invalidate_ratings(self):
+        """
+        Drop the cached ratings so they are recomputed on next use.
+        
+        Also bumps ratings_version, which results memoized elsewhere
+        (e.g. playoff odds) compare to notice the change.
+        """
+        self._ratings = None
+        self.ratings_version += 1
+    
     @property
     def offensive_strength(self) -> float:
+        """Overall offensive strength (0-100), from the cached ratings."""
+        return self.ratings.offensive
+    
+    @property
+    def defensive_strength(self) -> float:
+        """Overall defensive strength (0-100), from the cached ratings."""
+        return self.ratings.defensive
+    
+    @property
+    def overall_strength(self) -> float:
+        """Overall team strength (0-100), from the cached ratings."""
+        return self.ratings.overall
+
+
+@dataclass(frozen=True)
+class TeamRatings:
+    """Snapshot of a team's strength ratings (0-100)."""
+    offensive: float
+    defensive: float
+    overall: float
+    
+    @classmethod
+    def from_team(cls, team: NHLTeam) -> "TeamRatings":
+        """Compute ratings from the team's current roster and stats."""
+        offensive = cls._offensive_strength(team)
+        defensive = cls._defensive_strength(team)
+        return cls(
+            offensive=offensive,
+            defensive=defensive,
+            overall=offensive * 0.5 + defensive * 0.5
+        )
+    
+    @staticmethod
+    def _offensive_strength(team: NHLTeam) -> float:
         """
         Calculate overall offensive strength (0-100).
         Combines goals, shots, xG%, and top player ratings.
         """
         # Team stats component (70%)
-        goals_normalized = min(self.stats.goals_per_game / 4.0, 1.0) * 100
-        xg_normalized = self.stats.xGF_pct
+        goals_normalized = min(team.stats.goals_per_game / 4.0, 1.0) * 100
+        xg_normalized = team.stats.xGF_pct
         
         # Top player component (30%)
-        top_forwards = self.roster.get_top_line_forwards()
+        top_forwards = team.roster.get_top_line_forwards()
         avg_forward_rating = sum(p.rating for p in top_forwards) / len(top_forwards) if top_forwards else 75
         
         return (goals_normalized * 0.4 + xg_normalized * 0.3 + avg_forward_rating * 0.3)
     
-    @property
-    def defensive_strength(self) -> float:
+    @staticmethod
+    def _defensive_strength(team: NHLTeam) -> float:
         """
         Calculate overall defensive strength (0-100).
         Combines goals against, goalie performance, and defensive ratings.
         """
         # Goals against (inverse - lower is better)
-        ga_normalized = max(0, 100 - (self.stats.goals_against_per_game / 4.0) * 100)
+        ga_normalized = max(0, 100 - (team.stats.goals_against_per_game / 4.0) * 100)
         
         # Goalie performance
-        goalie = self.roster.get_starting_goalie()
+        goalie = team.roster.get_starting_goalie()
         goalie_rating = goalie.rating if goalie else 75
         
         # Defensive corps
-        top_dmen = self.roster.get_top_defensemen()
+        top_dmen = team.roster.get_top_defensemen()
         avg_dman_rating = sum(p.rating for p in top_dmen) / len(top_dmen) if top_dmen else 75
         
         return (ga_normalized * 0.4 + goalie_rating * 0.3 + avg_dman_rating * 0.3)
-    
-    @property
-    def overall_strength(self) -> float:
-        """Calculate overall team strength (0-100)."""
-        return (self.offensive_strength * 0.5 + self.defensive_strength * 0.5)
 
 
 # NHL Team Database - Current 2024-25 Season Data
@@ -2,11 +2,19 @@
 Player Stats Tracker
 
 Tracks individual player statistics across games and seasons.
+
+League leaders come from indexes kept in leader order as stats are
+recorded: one per stat category and games-played threshold, built the
+first time it is queried. Players enter an index when they cross its
+threshold, so a leaders query reads the top of a list instead of
+filtering and sorting every tracked player.
 """
 
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 
 @dataclass
@@ -81,9 +89,80 @@ class PlayerSeasonStats:
         }
 
 
+# Leader categories: stat -> (sort key, goalies only); higher keys lead.
+# Other stat names rank by points.
+LEADER_STATS: Dict[str, Tuple[Callable[[PlayerSeasonStats], Tuple], bool]] = {
+    "goals": (lambda p: (p.goals, p.points), False),
+    "assists": (lambda p: (p.assists, p.points), False),
+    "points": (lambda p: (p.points, p.goals), False),
+    "goals_per_game": (lambda p: (p.goals_per_game, p.goals), False),
+    "assists_per_game": (lambda p: (p.assists_per_game, p.assists), False),
+    "points_per_game": (lambda p: (p.points_per_game, p.points), False),
+    "save_percentage": (lambda p: (p.save_percentage,), True),
+    "wins": (lambda p: (p.wins, p.save_percentage), True),
+}
+
+# Leader indexes kept at once (one per stat and min_games queried; least recently used dropped)
+LEADER_INDEX_LIMIT = 32
+
+
+class LeaderIndex:
+    """
+    Qualified players for one stat and games-played threshold, in leader order.
+
+    Entries are (negated sort key, tracking order, player id), so ties keep
+    the order players were first tracked in, as a stable sort would.
+    """
+
+    def __init__(self, stat: str, min_games: int, players: Iterable[Tuple[PlayerSeasonStats, int]]):
+        """
+        Build the index.
+
+        Args:
+            stat: Category in LEADER_STATS
+            min_games: Minimum games played to qualify
+            players: (stats, tracking order) for every tracked player
+        """
+        self.stat = stat
+        self.min_games = min_games
+        self._key, self._goalies_only = LEADER_STATS[stat]
+        self._entry_of: Dict[int, Tuple] = {}
+        for stats, order in players:
+            entry = self._entry(stats, order)
+            if entry is not None:
+                self._entry_of[stats.player_id] = entry
+        self._entries: List[Tuple] = sorted(self._entry_of.values())
+
+    def _entry(self, stats: PlayerSeasonStats, order: int) -> Optional[Tuple]:
+        """Sort entry for a player, or None if they don't qualify."""
+        if stats.games_played < self.min_games or (self._goalies_only and stats.position != "G"):
+            return None
+        return (tuple(-value for value in self._key(stats)), order, stats.player_id)
+
+    def update(self, stats: PlayerSeasonStats, order: int):
+        """Insert, move or drop a player after their stats change."""
+        old = self._entry_of.get(stats.player_id)
+        new = self._entry(stats, order)
+        if new == old:
+            return
+        if old is not None:
+            del self._entries[bisect_left(self._entries, old)]
+            del self._entry_of[stats.player_id]
+        if new is not None:
+            insort(self._entries, new)
+            self._entry_of[stats.player_id] = new
+
+    def top(self, limit: int) -> List[int]:
+        """Player ids of the first `limit` leaders."""
+        return [player_id for _, _, player_id in self._entries[:max(limit, 0)]]
+
+
 class PlayerStatsTracker:
     """
     Tracks player statistics across games and seasons.
+    
+    Record stats through the record_* methods, which keep the league
+    leader indexes current.
     """
     
     def __init__(self, season_year: str = "2024-25"):
@@ -91,6 +170,11 @@ class PlayerStatsTracker:
         self.season_year = season_year
         self.player_stats: Dict[int, PlayerSeasonStats] = {}
         self.team_rosters: Dict[str, List[int]] = defaultdict(list)
+        
+        # Leader indexes by (stat, min_games), most recently queried last
+        self._order: Dict[int, int] = {}  # player id -> tracking order
+        self._leader_indexes: "OrderedDict[Tuple[str, int], LeaderIndex]" = OrderedDict()
+        self._lock = threading.Lock()
     
     def get_or_create_player_stats(
         self, 
@@ -101,15 +185,26 @@ class PlayerStatsTracker:
     ) -> PlayerSeasonStats:
         """Get existing stats or create new entry for player."""
         if player_id not in self.player_stats:
-            self.player_stats[player_id] = PlayerSeasonStats(
+            stats = PlayerSeasonStats(
                 player_id=player_id,
                 player_name=player_name,
                 team_code=team_code,
                 position=position
             )
-            self.team_rosters[team_code].append(player_id)
+            with self._lock:
+                self.player_stats[player_id] = stats
+                self.team_rosters[team_code].append(player_id)
+                self._order[player_id] = len(self._order)
+            self._reindex(stats)
         return self.player_stats[player_id]
     
+    def _reindex(self, *players: PlayerSeasonStats):
+        """Insert, move or drop changed players in every leader index."""
+        with self._lock:
+            for index in self._leader_indexes.values():
+                for stats in players:
+                    index.update(stats, self._order[stats.player_id])
+    
     def record_goal(
         self, 
         scorer_id: int, 
@@ -126,6 +221,7 @@ class PlayerStatsTracker:
         scorer_stats = self.get_or_create_player_stats(scorer_id, scorer_name, team_code, position)
         scorer_stats.goals += 1
         scorer_stats.points += 1
+        changed = [scorer_stats]
         
         # Record primary assist
         if primary_assist_id and primary_assist_name:
@@ -134,6 +230,7 @@ class PlayerStatsTracker:
             )
             assist_stats.assists += 1
             assist_stats.points += 1
+            changed.append(assist_stats)
         
         # Record secondary assist
         if secondary_assist_id and secondary_assist_name:
@@ -142,11 +239,36 @@ class PlayerStatsTracker:
             )
             assist_stats.assists += 1
             assist_stats.points += 1
+            changed.append(assist_stats)
+        
+        self._reindex(*changed)
     
     def record_game_participation(self, player_id: int, player_name: str, team_code: str, position: str):
         """Record that a player participated in a game."""
         stats = self.get_or_create_player_stats(player_id, player_name, team_code, position)
         stats.games_played += 1
+        self._reindex(stats)
+    
+    def record_goalie_decision(
+        self,
+        player_id: int,
+        player_name: str,
+        team_code: str,
+        won: bool,
+        saves: int,
+        goals_against: int
+    ):
+        """Record a goalie's result, saves and goals against for one game."""
+        stats = self.get_or_create_player_stats(player_id, player_name, team_code, "G")
+        if won:
+            stats.wins += 1
+        else:
+            stats.losses += 1
+        stats.saves += saves
+        stats.goals_against += goals_against
+        if goals_against == 0:
+            stats.shutouts += 1
+        self._reindex(stats)
     
     def get_league_leaders(
         self, 
@@ -157,37 +279,33 @@ class PlayerStatsTracker:
         """
         Get league leaders for a specific stat.
         
+        The first query for a stat and min_games builds its index; later
+        queries only read the top `limit` entries.
+        
         Args:
-            stat: Stat to sort by (goals, assists, points, etc.)
+            stat: Stat to sort by (a LEADER_STATS category; others rank by points)
             limit: Number of players to return
             min_games: Minimum games played to qualify
             
         Returns:
             List of PlayerSeasonStats sorted by the stat
         """
-        # Filter players by min games
-        qualified = [p for p in self.player_stats.values() if p.games_played >= min_games]
-        
-        # Sort by stat
-        if stat == "goals":
-            qualified.sort(key=lambda p: (p.goals, p.points), reverse=True)
-        elif stat == "assists":
-            qualified.sort(key=lambda p: (p.assists, p.points), reverse=True)
-        elif stat == "points":
-            qualified.sort(key=lambda p: (p.points, p.goals), reverse=True)
-        elif stat == "goals_per_game":
-            qualified.sort(key=lambda p: (p.goals_per_game, p.goals), reverse=True)
-        elif stat == "save_percentage":
-            # Filter goalies
-            qualified = [p for p in qualified if p.position == "G"]
-            qualified.sort(key=lambda p: p.save_percentage, reverse=True)
-        elif stat == "wins":
-            qualified = [p for p in qualified if p.position == "G"]
-            qualified.sort(key=lambda p: (p.wins, p.save_percentage), reverse=True)
-        else:
-            qualified.sort(key=lambda p: p.points, reverse=True)
+        stat = stat if stat in LEADER_STATS else "points"
+        key = (stat, min_games)
         
-        return qualified[:limit]
+        with self._lock:
+            index = self._leader_indexes.get(key)
+            if index is None:
+                index = LeaderIndex(
+                    stat, min_games,
+                    ((stats, self._order[player_id]) for player_id, stats in self.player_stats.items())
+                )
+                self._leader_indexes[key] = index
+                if len(self._leader_indexes) > LEADER_INDEX_LIMIT:
+                    self._leader_indexes.popitem(last=False)
+            else:
+                self._leader_indexes.move_to_end(key)
+            return [self.player_stats[player_id] for player_id in index.top(limit)]
     
     def get_team_stats(self, team_code: str) -> List[PlayerSeasonStats]:
         """Get all player stats for a specific team."""
@@ -2,15 +2,144 @@
 NHL Playoff Simulator
 
 Handles playoff bracket generation, seeding, and best-of-7 series simulation.
+
+Besides playing series game by game, the simulator can compute series and
+bracket odds exactly: given per-game win probabilities at each rink, a
+dynamic program over series scores gives the distribution of series
+results (4-0 ... 3-4), and folding those up the bracket gives every
+team's probability of reaching each round.
+
+A bracket can also be loaded in any state (series partly played, rounds
+decided) and played on from there, and what_if prices hypothetical game
+results, recomputing only the series they affect.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from typing import Callable, List, Dict, Optional, Sequence, Tuple, Union
 from enum import Enum
-import random
 
-from nhl_data import NHLTeam, get_team
+from nhl_data import NHL_TEAMS, NHLTeam, get_team
 from simulator import NHLSimulator
+from batch_simulator import BatchSimulator
+from rng_streams import derive_seed, new_seed, GAME_STREAM
+
+
+# Series in a 16-team bracket (8 + 4 + 2 + 1)
+TOTAL_SERIES = 15
+
+# Games 1-7 hosted by the higher seed (2-2-1-1-1 format)
+HIGHER_SEED_HOME = (True, True, False, False, True, False, True)
+
+# P(home team wins) for one game: (home_team, away_team) -> probability
+GameWinProbability = Callable[[str, str], float]
+
+# Batch replications per (home, away) matchup behind the default bracket odds
+ODDS_GAMES_PER_MATCHUP = 1000
+
+# Cached series-winner distributions kept for advancement_odds / what_if
+ODDS_CACHE_SIZE = 4096
+
+# Distribution of a series winner: team -> probability
+WinnerDistribution = Dict[str, float]
+
+
+def series_outcome_probabilities(
+    p_home: float,
+    p_away: float,
+    higher_seed_wins: int = 0,
+    lower_seed_wins: int = 0
+) -> Dict[Tuple[int, int], float]:
+    """
+    Exact distribution of a best-of-7 series result by dynamic programming.
+    
+    Args:
+        p_home: Probability the higher seed wins a game on its own ice
+        p_away: Probability the higher seed wins a game on the road
+        higher_seed_wins: Games already won by the higher seed
+        lower_seed_wins: Games already won by the lower seed
+        
+    Returns:
+        {(higher_seed_wins, lower_seed_wins): probability} for each reachable
+        final result, from 4-0 to 3-4
+    """
+    game_probs = [p_home if home else p_away for home in HIGHER_SEED_HOME]
+    finals: Dict[Tuple[int, int], float] = {}
+    
+    # Every state in `states` has played the same number of games
+    states = {(higher_seed_wins, lower_seed_wins): 1.0}
+    while states:
+        next_states: Dict[Tuple[int, int], float] = defaultdict(float)
+        for (higher, lower), prob in states.items():
+            if higher == 4 or lower == 4:
+                finals[(higher, lower)] = prob
+                continue
+            p = game_probs[higher + lower]
+            next_states[(higher + 1, lower)] += prob * p
+            next_states[(higher, lower + 1)] += prob * (1 - p)
+        states = next_states
+    
+    return dict(sorted(finals.items(), key=lambda item: (-item[0][0], item[0][1])))
+
+
+def series_win_probability(
+    p_home: float,
+    p_away: float,
+    higher_seed_wins: int = 0,
+    lower_seed_wins: int = 0
+) -> float:
+    """Probability the higher seed wins the series (see series_outcome_probabilities)."""
+    outcomes = series_outcome_probabilities(p_home, p_away, higher_seed_wins, lower_seed_wins)
+    return sum(prob for (higher, _), prob in outcomes.items() if higher == 4)
+
+
+def batch_win_probability(
+    batch: Optional[BatchSimulator] = None,
+    games: int = 2000,
+    seed: Optional[int] = None
+) -> GameWinProbability:
+    """
+    Per-game win probabilities from the batch engine, memoized per matchup.
+    
+    Args:
+        batch: Batch engine to play matchups with (default: a quiet one)
+        games: Replications per (home, away) matchup
+        seed: Optional seed; each matchup's stream is derived from it
+    """
+    batch = batch or BatchSimulator()
+    cache: Dict[Tuple[str, str], float] = {}
+    
+    def win_prob(home_team: str, away_team: str) -> float:
+        key = (home_team, away_team)
+        if key not in cache:
+            matchup_seed = None if seed is None else derive_seed(
+                seed, GAME_STREAM, zlib.crc32(f"{home_team}@{away_team}".encode())
+            )
+            cache[key] = batch.simulate_matchup(home_team, away_team, games, seed=matchup_seed).home_win_prob
+        return cache[key]
+    return win_prob
+
+
+def prediction_win_probability(
+    simulator: NHLSimulator,
+    fallback: Optional[GameWinProbability] = None
+) -> GameWinProbability:
+    """
+    Per-game win probabilities from pre-game ML predictions.
+    
+    Predictions come through the simulator's prediction cache (prefetch
+    them with simulator.prefetch_predictions); matchups without one use
+    `fallback` (default: the batch engine on the same simulator).
+    """
+    fallback = fallback or batch_win_probability(BatchSimulator(simulator))
+    
+    def win_prob(home_team: str, away_team: str) -> float:
+        prediction = simulator._get_pregame_prediction(get_team(home_team), get_team(away_team))
+        if prediction and prediction.get('home_win_prob') is not None:
+            return prediction['home_win_prob']
+        return fallback(home_team, away_team)
+    return win_prob
 
 
 class SeriesStatus(Enum):
@@ -49,6 +178,19 @@ class PlayoffGame:
             "winner": self.winner,
             "overtime": self.overtime
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PlayoffGame":
+        """Rebuild a game from to_dict() output."""
+        return cls(
+            game_number=data["game_number"],
+            home_team=data["home_team"],
+            away_team=data["away_team"],
+            home_score=data["home_score"],
+            away_score=data["away_score"],
+            winner=data["winner"],
+            overtime=data.get("overtime", False)
+        )
 
 
 @dataclass
@@ -71,19 +213,15 @@ class PlayoffSeries:
     
     @property
     def games_played(self) -> int:
-        """Number of games played in series."""
-        return len(self.games)
+        """Number of games played in series (game logs are optional for loaded series)."""
+        return self.higher_seed_wins + self.lower_seed_wins
     
     def get_next_home_team(self) -> str:
         """Determine home team for next game (2-2-1-1-1 format)."""
-        game_num = self.games_played + 1
-        
-        # Games 1, 2, 5, 7 at higher seed (home)
-        if game_num in [1, 2, 5, 7]:
+        # Games 1, 2, 5, 7 at higher seed (home); games 3, 4, 6 at lower seed
+        if HIGHER_SEED_HOME[self.games_played]:
             return self.higher_seed
-        # Games 3, 4, 6 at lower seed
-        else:
-            return self.lower_seed
+        return self.lower_seed
     
     def add_game_result(self, winner: str, home_score: int, away_score: int, home_team: str, away_team: str, overtime: bool = False):
         """Add a game result to the series."""
@@ -111,6 +249,18 @@ class PlayoffSeries:
         else:
             self.status = SeriesStatus.IN_PROGRESS
     
+    def clone(self) -> "PlayoffSeries":
+        """Copy of the series as it stands (played games are shared, not copied)."""
+        return replace(self, games=list(self.games))
+    
+    def reset(self):
+        """Clear all results, back to not started."""
+        self.higher_seed_wins = 0
+        self.lower_seed_wins = 0
+        self.games = []
+        self.status = SeriesStatus.NOT_STARTED
+        self.winner = None
+    
     def to_dict(self) -> Dict:
         """Convert series to dictionary."""
         return {
@@ -125,6 +275,35 @@ class PlayoffSeries:
             "winner": self.winner,
             "games": [g.to_dict() for g in self.games]
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PlayoffSeries":
+        """
+        Rebuild a series from to_dict() output.
+        
+        Only the teams and series score are required; status and winner
+        follow from the score, and the game log may be omitted.
+        """
+        series = cls(
+            series_id=data["series_id"],
+            round=Round(data["round"]),
+            higher_seed=data["higher_seed"],
+            lower_seed=data["lower_seed"],
+            higher_seed_wins=data.get("higher_seed_wins", 0),
+            lower_seed_wins=data.get("lower_seed_wins", 0),
+            games=[PlayoffGame.from_dict(g) for g in data.get("games", [])]
+        )
+        wins = (series.higher_seed_wins, series.lower_seed_wins)
+        if max(wins) > 4 or min(wins) < 0 or wins == (4, 4):
+            raise ValueError(f"Invalid score {wins[0]}-{wins[1]} in series {series.series_id}")
+        if series.games and len(series.games) != series.games_played:
+            raise ValueError(f"Series {series.series_id} lists {len(series.games)} games for a {wins[0]}-{wins[1]} score")
+        if series.is_complete:
+            series.winner = series.higher_seed if series.higher_seed_wins == 4 else series.lower_seed
+            series.status = SeriesStatus.COMPLETED
+        elif series.games_played:
+            series.status = SeriesStatus.IN_PROGRESS
+        return series
 
 
 @dataclass
@@ -147,6 +326,25 @@ class PlayoffBracket:
         """Get series that are in progress or not started."""
         return [s for s in self.get_all_series() if s.status != SeriesStatus.COMPLETED]
     
+    def clone(self) -> "PlayoffBracket":
+        """Copy of the bracket as it stands, safe to play on without touching this one."""
+        return PlayoffBracket(
+            season_year=self.season_year,
+            eastern_conference=[s.clone() for s in self.eastern_conference],
+            western_conference=[s.clone() for s in self.western_conference],
+            stanley_cup_finals=self.stanley_cup_finals.clone() if self.stanley_cup_finals else None,
+            champion=self.champion
+        )
+    
+    def reset(self):
+        """Clear all results, back to the unplayed first round."""
+        for conference in (self.eastern_conference, self.western_conference):
+            del conference[4:]
+            for series in conference:
+                series.reset()
+        self.stanley_cup_finals = None
+        self.champion = None
+    
     def to_dict(self) -> Dict:
         """Convert bracket to dictionary."""
         return {
@@ -156,6 +354,46 @@ class PlayoffBracket:
             "stanley_cup_finals": self.stanley_cup_finals.to_dict() if self.stanley_cup_finals else None,
             "champion": self.champion
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PlayoffBracket":
+        """Rebuild a bracket from to_dict() output (the champion follows from the Final)."""
+        finals = data.get("stanley_cup_finals")
+        bracket = cls(
+            season_year=data.get("season_year", "2024-25"),
+            eastern_conference=[PlayoffSeries.from_dict(s) for s in data["eastern_conference"]],
+            western_conference=[PlayoffSeries.from_dict(s) for s in data["western_conference"]],
+            stanley_cup_finals=PlayoffSeries.from_dict(finals) if finals else None
+        )
+        if len(bracket.eastern_conference) < 4 or len(bracket.western_conference) < 4:
+            raise ValueError("Each conference needs its four first-round series")
+        if bracket.stanley_cup_finals:
+            bracket.champion = bracket.stanley_cup_finals.winner
+        return bracket
+
+
+@dataclass
+class AdvancementOdds:
+    """Probability that a playoff team wins each round."""
+    team_code: str
+    conference: str
+    seed: int  # Conference seed, 1-8
+    second_round_prob: float  # Wins the first round
+    conference_finals_prob: float
+    cup_finals_prob: float
+    cup_prob: float
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "team_code": self.team_code,
+            "conference": self.conference,
+            "seed": self.seed,
+            "second_round_prob": round(self.second_round_prob, 4),
+            "conference_finals_prob": round(self.conference_finals_prob, 4),
+            "cup_finals_prob": round(self.cup_finals_prob, 4),
+            "cup_prob": round(self.cup_prob, 4)
+        }
 
 
 class PlayoffSimulator:
@@ -165,19 +403,35 @@ class PlayoffSimulator:
     Handles playoff bracket generation, seeding, and series simulation.
     """
     
-    def __init__(self, season_year: str = "2024-25", verbose: bool = True):
-        """Initialize playoff simulator."""
+    def __init__(self, season_year: str = "2024-25", verbose: bool = True, seed: Optional[int] = None):
+        """
+        Initialize playoff simulator.
+        
+        Args:
+            season_year: Season year (e.g., "2024-25")
+            verbose: Print progress
+            seed: Root seed for game streams (None = fresh entropy, kept in
+                self.seed). Each game's stream is keyed by series id and game
+                number, so series replay identically in any order.
+        """
         self.season_year = season_year
         self.verbose = verbose
+        self.seed = seed if seed is not None else new_seed()
         self.game_simulator = NHLSimulator(verbose=False)  # Use quiet mode for bulk simulation
         self.bracket: Optional[PlayoffBracket] = None
+        self._odds_win_prob: Optional[GameWinProbability] = None  # memoized default for advancement_odds
+        self._odds_ratings: Optional[Tuple] = None  # (team, ratings_version) pairs it was built from
+        self._winners_cache: Dict[Tuple, WinnerDistribution] = {}  # series-winner distributions by subtree state
+        self._series_win_cache: Dict[Tuple, float] = {}  # P(higher seed wins) by matchup and series score
     
     def generate_bracket(self, standings: List[Dict]) -> PlayoffBracket:
         """
         Generate playoff bracket from regular season standings.
         
         Args:
-            standings: List of team records with points
+            standings: List of team records with points; when every entry has
+                a 'conference_rank' (tiebreakers applied, e.g. from Standings),
+                teams are seeded by it
             
         Returns:
             PlayoffBracket with seeded matchups
@@ -186,9 +440,13 @@ class PlayoffSimulator:
         eastern_teams = [s for s in standings if s['conference'] == 'Eastern']
         western_teams = [s for s in standings if s['conference'] == 'Western']
         
-        # Sort by points (already sorted, but ensure)
-        eastern_teams.sort(key=lambda x: (x['points'], x['goal_differential']), reverse=True)
-        western_teams.sort(key=lambda x: (x['points'], x['goal_differential']), reverse=True)
+        # Sort by conference rank, else by points (already sorted, but ensure)
+        if all('conference_rank' in s for s in standings):
+            eastern_teams.sort(key=lambda x: x['conference_rank'])
+            western_teams.sort(key=lambda x: x['conference_rank'])
+        else:
+            eastern_teams.sort(key=lambda x: (x['points'], x['goal_differential']), reverse=True)
+            western_teams.sort(key=lambda x: (x['points'], x['goal_differential']), reverse=True)
         
         # Take top 8 from each conference
         eastern_playoff = eastern_teams[:8]
@@ -239,20 +497,303 @@ class PlayoffSimulator:
             lower_seed=lower_seed
         )
     
-    def simulate_game(self, home_team: str, away_team: str) -> Dict:
+    def game_seed(self, series: PlayoffSeries, game_number: int) -> int:
+        """Seed for game `game_number` (1-7) of a series."""
+        return derive_seed(self.seed, GAME_STREAM, zlib.crc32(series.series_id.encode()), game_number)
+    
+    def simulate_game(self, home_team: str, away_team: str, seed: Optional[int] = None) -> Dict:
         """Simulate a single playoff game."""
-        game = self.game_simulator.simulate_game(away_team, home_team)
-        winner = game.get_winner()
+        result = self.game_simulator.simulate_result(home_team, away_team, seed=seed)
         
         return {
             "home_team": home_team,
             "away_team": away_team,
-            "home_score": game.home_team.score,
-            "away_score": game.away_team.score,
-            "winner": winner.code if winner else home_team,
-            "overtime": game.period.value > 3
+            "home_score": result.home_team.score,
+            "away_score": result.away_team.score,
+            "winner": result.get_winner().code,
+            "overtime": result.overtime
         }
     
+    def default_win_probability(self) -> GameWinProbability:
+        """
+        Per-game win probabilities behind the analytic odds: the batch engine
+        on this simulator's settings, ODDS_GAMES_PER_MATCHUP games per
+        matchup, seeded from self.seed and memoized so later refreshes only
+        rerun the series DP. Rebuilt once any team's ratings are invalidated
+        (roster or rating edits).
+        """
+        ratings = tuple((id(team), team.ratings_version) for team in NHL_TEAMS.values())
+        if ratings != self._odds_ratings:
+            self.invalidate_odds()
+        if self._odds_win_prob is None:
+            self._odds_win_prob = batch_win_probability(
+                BatchSimulator(self.game_simulator), ODDS_GAMES_PER_MATCHUP, seed=self.seed
+            )
+            self._odds_ratings = ratings
+        return self._odds_win_prob
+    
+    def invalidate_odds(self):
+        """Drop memoized per-game probabilities and series odds so the next odds call recomputes them."""
+        self._odds_win_prob = None
+        self._odds_ratings = None
+        self._winners_cache.clear()
+        self._series_win_cache.clear()
+    
+    def series_odds(
+        self,
+        higher_seed: str,
+        lower_seed: str,
+        win_prob: Optional[GameWinProbability] = None,
+        higher_seed_wins: int = 0,
+        lower_seed_wins: int = 0
+    ) -> Dict[Tuple[int, int], float]:
+        """
+        Exact distribution of series results for a matchup.
+        
+        Args:
+            higher_seed: Team with home ice (games 1, 2, 5, 7)
+            lower_seed: Other team
+            win_prob: P(home team wins) for one game (default: default_win_probability())
+            higher_seed_wins: Games already won by the higher seed
+            lower_seed_wins: Games already won by the lower seed
+            
+        Returns:
+            {(higher_seed_wins, lower_seed_wins): probability} for each final result
+        """
+        win_prob = win_prob or self.default_win_probability()
+        return series_outcome_probabilities(
+            win_prob(higher_seed, lower_seed),
+            1.0 - win_prob(lower_seed, higher_seed),
+            higher_seed_wins,
+            lower_seed_wins
+        )
+    
+    def _series_winners(
+        self,
+        series_id: str,
+        series: Optional[PlayoffSeries],
+        top: Tuple[Tuple, WinnerDistribution],
+        bottom: Tuple[Tuple, WinnerDistribution],
+        win_prob: GameWinProbability
+    ) -> Tuple[Tuple, WinnerDistribution]:
+        """
+        Distribution of a series winner, with the key of the state it came from.
+        
+        A series already in the bracket is played on from its current
+        score; otherwise its teams come from the feeder distributions, with
+        home ice to the team from `top` (as _advance_winners seeds it).
+        Results are cached by the state of the series and everything that
+        feeds it, so a refresh only recomputes series whose subtree changed.
+        """
+        if series is not None:
+            key = (series_id, series.higher_seed, series.lower_seed, series.higher_seed_wins, series.lower_seed_wins)
+        else:
+            key = (series_id, top[0], bottom[0])
+        
+        cached = self._winners_cache.get((win_prob, key))
+        if cached is not None:
+            return key, cached
+        
+        if series is not None and series.winner:
+            winners: WinnerDistribution = {series.winner: 1.0}
+        else:
+            top_teams, bottom_teams = top[1], bottom[1]
+            if series is not None:
+                top_teams = {series.higher_seed: 1.0}
+                bottom_teams = {series.lower_seed: 1.0}
+            
+            score = (series.higher_seed_wins, series.lower_seed_wins) if series else (0, 0)
+            winners = defaultdict(float)
+            for higher, p_higher in top_teams.items():
+                for lower, p_lower in bottom_teams.items():
+                    p_win = self._series_win_probability(higher, lower, win_prob, *score)
+                    winners[higher] += p_higher * p_lower * p_win
+                    winners[lower] += p_higher * p_lower * (1.0 - p_win)
+            winners = dict(winners)
+        
+        if len(self._winners_cache) >= ODDS_CACHE_SIZE:
+            self._winners_cache.clear()
+        self._winners_cache[(win_prob, key)] = winners
+        return key, winners
+    
+    def _series_win_probability(
+        self,
+        higher_seed: str,
+        lower_seed: str,
+        win_prob: GameWinProbability,
+        higher_seed_wins: int,
+        lower_seed_wins: int
+    ) -> float:
+        """P(higher seed wins the series) from a score, cached per matchup."""
+        key = (win_prob, higher_seed, lower_seed, higher_seed_wins, lower_seed_wins)
+        p_win = self._series_win_cache.get(key)
+        if p_win is None:
+            odds = self.series_odds(higher_seed, lower_seed, win_prob, higher_seed_wins, lower_seed_wins)
+            p_win = sum(prob for (h, _), prob in odds.items() if h == 4)
+            if len(self._series_win_cache) >= ODDS_CACHE_SIZE:
+                self._series_win_cache.clear()
+            self._series_win_cache[key] = p_win
+        return p_win
+    
+    def advancement_odds(self, win_prob: Optional[GameWinProbability] = None) -> List[AdvancementOdds]:
+        """
+        Exact probability that each team wins each round.
+        
+        Series already played or in progress count as they stand, so the
+        odds can be refreshed at any point of the playoffs.
+        
+        Args:
+            win_prob: P(home team wins) for one game (default: default_win_probability())
+                
+        Returns:
+            AdvancementOdds for all 16 teams, most likely champion first
+        """
+        if not self.bracket:
+            raise ValueError("No bracket generated. Call generate_bracket() first.")
+        return self._advancement_odds(self.bracket, win_prob or self.default_win_probability())
+    
+    def what_if(
+        self,
+        results: Sequence[Tuple[str, str]],
+        win_prob: Optional[GameWinProbability] = None
+    ) -> List[AdvancementOdds]:
+        """
+        Advancement odds if the next games go a given way.
+        
+        The results are played on a clone, so the bracket is unchanged.
+        Series-winner distributions are shared with advancement_odds, so
+        only the series on the path from a changed series to the Final are
+        recomputed.
+        
+        Args:
+            results: (series_id, winner) of each hypothetical game, in order;
+                a series decided here advances its winner, so later results
+                can name the next round's series
+            win_prob: P(home team wins) for one game (default: default_win_probability())
+        
+        Returns:
+            AdvancementOdds for all 16 teams, most likely champion first
+        """
+        if not self.bracket:
+            raise ValueError("No bracket generated. Call generate_bracket() first.")
+        bracket = self.bracket.clone()
+        for series_id, winner in results:
+            self._record_game(bracket, series_id, winner)
+        return self._advancement_odds(bracket, win_prob or self.default_win_probability())
+    
+    def _advancement_odds(self, bracket: PlayoffBracket, win_prob: GameWinProbability) -> List[AdvancementOdds]:
+        """Fold series-winner distributions up `bracket`."""
+        by_id = {s.series_id: s for s in bracket.get_all_series()}
+        no_feeder = ((), {})
+        
+        odds: Dict[str, AdvancementOdds] = {}
+        conference_champions = []
+        for prefix, conference, first_round in (
+            ("E", "Eastern", bracket.eastern_conference[:4]),
+            ("W", "Western", bracket.western_conference[:4]),
+        ):
+            for position, series in enumerate(first_round):
+                for team, seed in ((series.higher_seed, position + 1), (series.lower_seed, 8 - position)):
+                    odds[team] = AdvancementOdds(team, conference, seed, 0.0, 0.0, 0.0, 0.0)
+            
+            r1 = [self._series_winners(s.series_id, s, no_feeder, no_feeder, win_prob) for s in first_round]
+            r2 = [
+                self._series_winners(f"{prefix}-R2-1", by_id.get(f"{prefix}-R2-1"), r1[0], r1[3], win_prob),
+                self._series_winners(f"{prefix}-R2-2", by_id.get(f"{prefix}-R2-2"), r1[1], r1[2], win_prob),
+            ]
+            cf = self._series_winners(f"{prefix}-CF", by_id.get(f"{prefix}-CF"), r2[0], r2[1], win_prob)
+            conference_champions.append(cf)
+            
+            for winners, attr in ((r1, "second_round_prob"), (r2, "conference_finals_prob"), ([cf], "cup_finals_prob")):
+                for _, distribution in winners:
+                    for team, prob in distribution.items():
+                        setattr(odds[team], attr, prob)
+        
+        _, champion = self._series_winners("SCF", bracket.stanley_cup_finals, *conference_champions, win_prob)
+        for team, prob in champion.items():
+            odds[team].cup_prob = prob
+        
+        return sorted(odds.values(), key=lambda o: o.cup_prob, reverse=True)
+    
+    def load_bracket(self, bracket: Union[PlayoffBracket, Dict]) -> PlayoffBracket:
+        """
+        Continue from a bracket in any state.
+        
+        Series may be partly played and rounds already decided; the next
+        round is created for any round that is complete. Remaining games
+        keep their seeds (series id and game number), so a bracket saved
+        mid-run and reloaded with the same seed finishes the same way.
+        
+        Args:
+            bracket: PlayoffBracket (copied) or its to_dict() form
+            
+        Returns:
+            The loaded bracket
+        """
+        if isinstance(bracket, PlayoffBracket):
+            bracket = bracket.clone()
+        else:
+            bracket = PlayoffBracket.from_dict(bracket)
+        for round_num in Round:
+            self._advance_winners(round_num, bracket)
+        self.bracket = bracket
+        return bracket
+    
+    def record_game(
+        self,
+        series_id: str,
+        winner: str,
+        home_score: Optional[int] = None,
+        away_score: Optional[int] = None,
+        overtime: bool = False
+    ) -> PlayoffSeries:
+        """
+        Record the next game of a series played outside the simulator.
+        
+        Args:
+            series_id: Series the game belongs to (e.g. "E-R1-4")
+            winner: Team that won the game
+            home_score: Final score (default: 1-0 to the winner)
+            away_score: Final score
+            overtime: Whether the game went past regulation
+            
+        Returns:
+            The updated series (the next round is created if it completes one)
+        """
+        if not self.bracket:
+            raise ValueError("No bracket generated. Call generate_bracket() first.")
+        return self._record_game(self.bracket, series_id, winner, home_score, away_score, overtime)
+    
+    def _record_game(
+        self,
+        bracket: PlayoffBracket,
+        series_id: str,
+        winner: str,
+        home_score: Optional[int] = None,
+        away_score: Optional[int] = None,
+        overtime: bool = False
+    ) -> PlayoffSeries:
+        """Add a game result to a series of `bracket` and advance winners if that ends its round."""
+        series = next((s for s in bracket.get_all_series() if s.series_id == series_id), None)
+        if series is None:
+            raise ValueError(f"Series {series_id} is not in the bracket")
+        if series.is_complete:
+            raise ValueError(f"Series {series_id} is already decided")
+        if winner not in (series.higher_seed, series.lower_seed):
+            raise ValueError(f"{winner} is not playing in series {series_id}")
+        
+        home_team = series.get_next_home_team()
+        away_team = series.lower_seed if home_team == series.higher_seed else series.higher_seed
+        if home_score is None or away_score is None:
+            home_score, away_score = (1, 0) if winner == home_team else (0, 1)
+        if (home_score > away_score) != (winner == home_team):
+            raise ValueError(f"Score {home_score}-{away_score} does not match winner {winner}")
+        
+        series.add_game_result(winner, home_score, away_score, home_team, away_team, overtime)
+        if series.is_complete:
+            self._advance_winners(series.round, bracket)
+        return series
+    
     def simulate_series(self, series: PlayoffSeries) -> PlayoffSeries:
         """
         Simulate an entire best-of-7 series.
@@ -272,7 +813,9 @@ class PlayoffSimulator:
             away_team = series.lower_seed if home_team == series.higher_seed else series.higher_seed
             
             # Simulate game
-            result = self.simulate_game(home_team, away_team)
+            result = self.simulate_game(
+                home_team, away_team, seed=self.game_seed(series, series.games_played + 1)
+            )
             
             # Add result to series
             series.add_game_result(
@@ -296,10 +839,18 @@ class PlayoffSimulator:
         
         return series
     
-    def simulate_round(self, round_num: Round) -> bool:
+    def simulate_round(
+        self,
+        round_num: Round,
+        on_series_complete: Optional[Callable[[PlayoffSeries], None]] = None
+    ) -> bool:
         """
         Simulate all series in a specific round.
         
+        Args:
+            round_num: Round to simulate
+            on_series_complete: Optional callback after each series finishes
+        
         Returns:
             True if round completed successfully, False if no series to simulate
         """
@@ -310,6 +861,8 @@ class PlayoffSimulator:
         round_series = [s for s in self.bracket.get_all_series() if s.round == round_num and s.status != SeriesStatus.COMPLETED]
         
         if not round_series:
+            # The round may have been finished outside simulate_round (loaded or recorded games)
+            self._advance_winners(round_num)
             return False
         
         if self.verbose:
@@ -321,72 +874,128 @@ class PlayoffSimulator:
         # Simulate all series in this round
         for series in round_series:
             self.simulate_series(series)
+            if on_series_complete:
+                on_series_complete(series)
         
         # Advance winners to next round
         self._advance_winners(round_num)
         
         return True
     
-    def _advance_winners(self, completed_round: Round):
-        """Advance series winners to the next round."""
+    def _advance_winners(self, completed_round: Round, bracket: Optional[PlayoffBracket] = None):
+        """
+        Advance series winners to the next round once every series in the round is decided.
+        
+        Safe to call again: a round that already exists is left alone.
+        Works on self.bracket unless another bracket (e.g. a what-if clone) is given.
+        """
+        bracket = bracket or self.bracket
         if completed_round == Round.FIRST_ROUND:
             # Advance to Second Round
-            eastern_winners = [s.winner for s in self.bracket.eastern_conference[:4] if s.winner]
-            western_winners = [s.winner for s in self.bracket.western_conference[:4] if s.winner]
+            eastern_winners = [s.winner for s in bracket.eastern_conference[:4] if s.winner]
+            western_winners = [s.winner for s in bracket.western_conference[:4] if s.winner]
             
-            if len(eastern_winners) == 4:
-                self.bracket.eastern_conference.extend([
+            if len(eastern_winners) == 4 and len(bracket.eastern_conference) == 4:
+                bracket.eastern_conference.extend([
                     self._create_series("E-R2-1", Round.SECOND_ROUND, eastern_winners[0], eastern_winners[3]),
                     self._create_series("E-R2-2", Round.SECOND_ROUND, eastern_winners[1], eastern_winners[2]),
                 ])
             
-            if len(western_winners) == 4:
-                self.bracket.western_conference.extend([
+            if len(western_winners) == 4 and len(bracket.western_conference) == 4:
+                bracket.western_conference.extend([
                     self._create_series("W-R2-1", Round.SECOND_ROUND, western_winners[0], western_winners[3]),
                     self._create_series("W-R2-2", Round.SECOND_ROUND, western_winners[1], western_winners[2]),
                 ])
         
         elif completed_round == Round.SECOND_ROUND:
             # Advance to Conference Finals
-            eastern_winners = [s.winner for s in self.bracket.eastern_conference[4:6] if s.winner]
-            western_winners = [s.winner for s in self.bracket.western_conference[4:6] if s.winner]
+            eastern_winners = [s.winner for s in bracket.eastern_conference[4:6] if s.winner]
+            western_winners = [s.winner for s in bracket.western_conference[4:6] if s.winner]
             
-            if len(eastern_winners) == 2:
-                self.bracket.eastern_conference.append(
+            if len(eastern_winners) == 2 and len(bracket.eastern_conference) == 6:
+                bracket.eastern_conference.append(
                     self._create_series("E-CF", Round.CONFERENCE_FINALS, eastern_winners[0], eastern_winners[1])
                 )
             
-            if len(western_winners) == 2:
-                self.bracket.western_conference.append(
+            if len(western_winners) == 2 and len(bracket.western_conference) == 6:
+                bracket.western_conference.append(
                     self._create_series("W-CF", Round.CONFERENCE_FINALS, western_winners[0], western_winners[1])
                 )
         
         elif completed_round == Round.CONFERENCE_FINALS:
             # Advance to Stanley Cup Finals
-            eastern_champ = self.bracket.eastern_conference[-1].winner if len(self.bracket.eastern_conference) >= 7 else None
-            western_champ = self.bracket.western_conference[-1].winner if len(self.bracket.western_conference) >= 7 else None
+            eastern_champ = bracket.eastern_conference[-1].winner if len(bracket.eastern_conference) >= 7 else None
+            western_champ = bracket.western_conference[-1].winner if len(bracket.western_conference) >= 7 else None
             
-            if eastern_champ and western_champ:
-                self.bracket.stanley_cup_finals = self._create_series(
+            if eastern_champ and western_champ and not bracket.stanley_cup_finals:
+                bracket.stanley_cup_finals = self._create_series(
                     "SCF", Round.STANLEY_CUP_FINALS, eastern_champ, western_champ
                 )
         
         elif completed_round == Round.STANLEY_CUP_FINALS:
             # Set champion
-            if self.bracket.stanley_cup_finals and self.bracket.stanley_cup_finals.winner:
-                self.bracket.champion = self.bracket.stanley_cup_finals.winner
-                if self.verbose:
-                    print(f"\n🏆 STANLEY CUP CHAMPION: {self.bracket.champion} 🏆\n")
+            if bracket.stanley_cup_finals and bracket.stanley_cup_finals.winner and not bracket.champion:
+                bracket.champion = bracket.stanley_cup_finals.winner
+                if self.verbose and bracket is self.bracket:
+                    print(f"\n🏆 STANLEY CUP CHAMPION: {bracket.champion} 🏆\n")
     
-    def simulate_playoffs(self) -> PlayoffBracket:
-        """Simulate entire playoffs from start to finish."""
+    def simulate_playoffs(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> PlayoffBracket:
+        """
+        Simulate entire playoffs from start to finish.
+        
+        Only what is left is played: decided series are kept and series in
+        progress continue from their current score.
+        
+        Args:
+            progress_callback: Called with (series_completed, 15) after each series;
+                an exception raised from it stops the run (resumable later)
+        """
         if not self.bracket:
             raise ValueError("No bracket generated. Call generate_bracket() first.")
         
+        on_series_complete = None
+        if progress_callback:
+            def on_series_complete(series: PlayoffSeries):
+                completed = sum(1 for s in self.bracket.get_all_series() if s.status == SeriesStatus.COMPLETED)
+                progress_callback(completed, TOTAL_SERIES)
+        
         # Simulate all four rounds
         for round_num in [Round.FIRST_ROUND, Round.SECOND_ROUND, Round.CONFERENCE_FINALS, Round.STANLEY_CUP_FINALS]:
-            self.simulate_round(round_num)
+            self.simulate_round(round_num, on_series_complete)
         
         return self.bracket
 
 
+# Plays one game: (home, away) -> (home_score, away_score, overtime)
+GameFunction = Callable[[str, str], Tuple[int, int, bool]]
+
+
+class MonteCarloPlayoffs(PlayoffSimulator):
+    """
+    PlayoffSimulator that plays each game through a supplied function.
+    
+    Used by the Monte Carlo drivers to replay brackets with the batch
+    engine's scalar loop; games draw from the caller's stream, so no
+    per-game seeds are derived.
+    """
+    
+    def __init__(self, season_year: str, game_fn: GameFunction):
+        super().__init__(season_year=season_year, verbose=False)
+        self._game_fn = game_fn
+    
+    def game_seed(self, series: PlayoffSeries, game_number: int) -> None:
+        return None
+    
+    def simulate_game(self, home_team: str, away_team: str, seed: Optional[int] = None) -> Dict:
+        home_score, away_score, overtime = self._game_fn(home_team, away_team)
+        return {
+            "home_team": home_team,
+            "away_team": away_team,
+            "home_score": home_score,
+            "away_score": away_score,
+            "winner": home_team if home_score > away_score else away_team,
+            "overtime": overtime
+        }
@@ -0,0 +1,115 @@
+"""
+Prediction Cache
+
+Shared LRU/TTL cache for pre-game ML predictions.
+
+A prediction depends only on the request payload (team codes and the
+TeamStats fields sent), so the key includes a hash of that payload:
+stat edits made through GM mode produce a new key instead of a stale hit.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class PredictionCache:
+    """Thread-safe LRU cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl: Optional[float] = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of predictions kept (least recently used evicted)
+            ttl: Seconds before an entry expires (None = never)
+            clock: Time source (monotonic seconds)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(api_url: str, payload: Dict) -> Tuple[str, str]:
+        """Cache key for a /predict-game payload: API URL plus a hash of the payload."""
+        digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        return api_url, digest
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Return the cached prediction, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, prediction = entry
+                if self.ttl is None or self._clock() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return prediction
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether a live entry exists (doesn't touch counters or LRU order)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (self.ttl is None or self._clock() - entry[0] < self.ttl)
+
+    def put(self, key: Hashable, prediction: Dict):
+        """Store a prediction, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (self._clock(), prediction)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict:
+        """Counters for monitoring."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4)
+        }
+
+
+# Shared instance
+_shared_cache = None
+
+def get_prediction_cache() -> PredictionCache:
+    """Get or create the process-wide prediction cache."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = PredictionCache()
+    return _shared_cache
@@ -0,0 +1,206 @@
+"""
+Player Sampling Tables
+
+Per-team tables for picking shooters and assisters without rebuilding
+player lists or weights on every shot.
+
+Each team compiles once into cumulative weights (forwards and defense,
+even strength and power play, plus assists). A pick is one uniform draw
+and a bisect, the same draw `random.choices` makes, so seeded games use
+the random stream exactly as before. Tables are cached by team code and
+rebuilt only when the roster or the weighted ratings change.
+"""
+
+import threading
+from bisect import bisect
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from nhl_data import NHLTeam, Player
+
+# Share of shots taken by forwards (the rest by defensemen)
+FORWARD_SHOT_SHARE = 0.75
+# Chance a goal is assisted, and that an assisted goal has a secondary assist
+ASSIST_PROB = 0.70
+SECONDARY_ASSIST_PROB = 0.60
+
+
+def shooter_weight(player: Player, is_power_play: bool = False) -> float:
+    """Shot-selection weight for a skater (rating plus shot volume)."""
+    # Base weight on rating (0-100)
+    weight = player.rating
+
+    # Bonus for shot-takers
+    if player.shots_per_60 > 0:
+        weight += player.shots_per_60 * 5  # Multiply by 5 to boost high-volume shooters
+
+    # On PP, heavily favor top players
+    if is_power_play:
+        weight = weight * 1.5 if player.rating > 80 else weight * 0.7
+
+    return max(weight, 10)  # Minimum weight of 10
+
+
+def assist_weight(player: Player) -> float:
+    """Assist-selection weight for a skater (rating plus playmaking)."""
+    weight = player.rating
+    if player.assists_per_60 > 0:
+        weight += player.assists_per_60 * 8  # Playmakers get bonus
+    return max(weight, 10)
+
+
+def _pick_index(cum: Sequence[float], rand: Callable[[], float]) -> int:
+    """Weighted index from cumulative weights (same draw as random.choices)."""
+    return bisect(cum, rand() * cum[-1], 0, len(cum) - 1)
+
+
+def _pick_index_excluding(cum: Sequence[float], skip: int, rand: Callable[[], float]) -> int:
+    """Weighted index with entry `skip` left out, without building a new table."""
+    start = cum[skip - 1] if skip else 0.0
+    skipped = cum[skip] - start
+    target = rand() * (cum[-1] - skipped)
+    if target >= start:
+        target += skipped
+    index = bisect(cum, target, 0, len(cum) - 1)
+    if index == skip:  # only reachable through rounding at the boundary
+        index = skip + 1 if skip + 1 < len(cum) else skip - 1
+    return index
+
+
+@dataclass(frozen=True)
+class TeamSamplingTables:
+    """Immutable shooter and assist tables for one team."""
+    forwards: Tuple[Player, ...]
+    defensemen: Tuple[Player, ...]
+    forward_cum_even: Tuple[float, ...]
+    forward_cum_pp: Tuple[float, ...]
+    defense_cum_even: Tuple[float, ...]
+    defense_cum_pp: Tuple[float, ...]
+    # Assists: every skater, plus a table per scorer with that skater left out
+    skaters: Tuple[Player, ...]
+    assist_cum: Tuple[float, ...]
+    assist_pools: Dict[int, Tuple[Tuple[Player, ...], Tuple[float, ...]]]
+
+    @classmethod
+    def from_team(cls, team: Optional[NHLTeam]) -> Optional["TeamSamplingTables"]:
+        """Compile a team roster (None if there are no skaters)."""
+        if not team or not team.roster:
+            return None
+        forwards = tuple(team.roster.centers + team.roster.left_wings + team.roster.right_wings)
+        defensemen = tuple(team.roster.defensemen)
+        if not forwards and not defensemen:
+            return None
+
+        skaters = forwards + defensemen
+        weights = tuple(assist_weight(p) for p in skaters)
+        pools = {}
+        for i, player in enumerate(skaters):
+            others = skaters[:i] + skaters[i + 1:]
+            pools[player.id] = (others, tuple(accumulate(weights[:i] + weights[i + 1:])))
+
+        return cls(
+            forwards=forwards,
+            defensemen=defensemen,
+            forward_cum_even=tuple(accumulate(shooter_weight(p, False) for p in forwards)),
+            forward_cum_pp=tuple(accumulate(shooter_weight(p, True) for p in forwards)),
+            defense_cum_even=tuple(accumulate(shooter_weight(p, False) for p in defensemen)),
+            defense_cum_pp=tuple(accumulate(shooter_weight(p, True) for p in defensemen)),
+            skaters=skaters,
+            assist_cum=tuple(accumulate(weights)),
+            assist_pools=pools,
+        )
+
+    def select_shooter(self, rand: Callable[[], float], is_power_play: bool = False) -> Player:
+        """Pick a shooter: forwards 75% of the time, weighted by shooter_weight."""
+        if (rand() < FORWARD_SHOT_SHARE and self.forwards) or not self.defensemen:
+            players = self.forwards
+            cum = self.forward_cum_pp if is_power_play else self.forward_cum_even
+        else:
+            players = self.defensemen
+            cum = self.defense_cum_pp if is_power_play else self.defense_cum_even
+        return players[_pick_index(cum, rand)]
+
+    def select_assists(
+        self,
+        rand: Callable[[], float],
+        scorer: Optional[Player]
+    ) -> Tuple[Optional[Player], Optional[Player]]:
+        """Pick (primary, secondary) assists among skaters other than the scorer."""
+        if scorer is not None and scorer.id in self.assist_pools:
+            players, cum = self.assist_pools[scorer.id]
+        else:
+            players, cum = self.skaters, self.assist_cum
+        if not players:
+            return (None, None)
+
+        # 70% chance of assist
+        if rand() > ASSIST_PROB:
+            return (None, None)
+        primary = _pick_index(cum, rand)
+
+        # 60% chance of secondary assist (anyone but the scorer and primary)
+        if rand() > SECONDARY_ASSIST_PROB or len(players) == 1:
+            return (players[primary], None)
+        return (players[primary], players[_pick_index_excluding(cum, primary, rand)])
+
+    def select_shooters(self, rng: np.random.Generator, is_power_play: np.ndarray) -> np.ndarray:
+        """Vectorized select_shooter(): one shooter ID per entry of is_power_play."""
+        k = len(is_power_play)
+        if self.forwards and self.defensemen:
+            from_forwards = rng.random(k) < FORWARD_SHOT_SHARE
+        else:
+            from_forwards = np.full(k, bool(self.forwards))
+
+        ids = np.empty(k, dtype=np.int64)
+        groups = (
+            (True, False, self.forwards, self.forward_cum_even),
+            (True, True, self.forwards, self.forward_cum_pp),
+            (False, False, self.defensemen, self.defense_cum_even),
+            (False, True, self.defensemen, self.defense_cum_pp),
+        )
+        for forwards, power_play, players, cum in groups:
+            mask = (from_forwards == forwards) & (is_power_play == power_play)
+            count = int(mask.sum())
+            if not count:
+                continue
+            cum = np.asarray(cum)
+            picks = np.searchsorted(cum, rng.random(count) * cum[-1], side='right')
+            ids[mask] = np.array([p.id for p in players])[np.minimum(picks, len(players) - 1)]
+        return ids
+
+
+def roster_fingerprint(team: NHLTeam) -> Tuple:
+    """Everything the tables depend on: skaters by group, in order, with weighted ratings."""
+    roster = team.roster
+    return tuple(
+        tuple((p.id, p.rating, p.shots_per_60, p.assists_per_60) for p in group)
+        for group in (roster.centers, roster.left_wings, roster.right_wings, roster.defensemen)
+    )
+
+
+# Compiled tables by team code: (roster fingerprint, tables)
+_tables: Dict[str, Tuple[Tuple, Optional[TeamSamplingTables]]] = {}
+_tables_lock = threading.Lock()
+
+
+def get_sampling_tables(team: Optional[NHLTeam]) -> Optional[TeamSamplingTables]:
+    """Return the team's compiled tables, rebuilding them if the roster or ratings changed."""
+    if not team or not team.roster:
+        return None
+    fingerprint = roster_fingerprint(team)
+    cached = _tables.get(team.code)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    tables = TeamSamplingTables.from_team(team)
+    with _tables_lock:
+        _tables[team.code] = (fingerprint, tables)
+    return tables
+
+
+def clear_sampling_tables():
+    """Drop all compiled tables."""
+    with _tables_lock:
+        _tables.clear()
@@ -0,0 +1,316 @@
+"""
+Season Monte Carlo
+
+Replays the remaining schedule of a season many times to estimate playoff
+odds, division and Presidents' Trophy odds, expected points and Stanley Cup
+odds for every team.
+
+The schedule, team data and per-matchup simulation constants are compiled
+once; each replication only draws new game results.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from batch_simulator import (
+    BatchSimulator, simulate_games_vectorized, OVERTIME
+)
+from nhl_data import NHL_TEAMS
+from playoff_simulator import MonteCarloPlayoffs
+from rng_streams import GameRandom, derive_seed, new_seed, stream_generator
+from season_simulator import SeasonSimulator
+from standings import rank_order
+
+
+# Upper bound on games per vectorized call (bounds memory for big runs)
+MAX_GAMES_PER_CHUNK = 200000
+
+
+class SeasonTotals(NamedTuple):
+    """Final team totals of k simulated seasons; (k, teams) arrays unless noted."""
+    points: np.ndarray
+    regulation_wins: np.ndarray
+    wins: np.ndarray
+    goal_diff: np.ndarray
+    goals_for: np.ndarray
+    h2h_points: np.ndarray  # (k, teams, teams): points team i took from team j
+
+
+@dataclass
+class TeamOdds:
+    """Monte Carlo projections for one team."""
+    team_code: str
+    team_name: str
+    conference: str
+    division: str
+    current_points: int
+    expected_points: float
+    expected_wins: float
+    playoff_prob: float
+    division_prob: float
+    presidents_trophy_prob: float
+    cup_prob: float
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "team_code": self.team_code,
+            "team_name": self.team_name,
+            "conference": self.conference,
+            "division": self.division,
+            "current_points": self.current_points,
+            "expected_points": round(self.expected_points, 1),
+            "expected_wins": round(self.expected_wins, 1),
+            "playoff_prob": round(self.playoff_prob, 4),
+            "division_prob": round(self.division_prob, 4),
+            "presidents_trophy_prob": round(self.presidents_trophy_prob, 4),
+            "cup_prob": round(self.cup_prob, 4)
+        }
+
+
+class SeasonMonteCarlo:
+    """
+    Season-level Monte Carlo driver.
+
+    Built on a SeasonSimulator (for the schedule and current records) and
+    PlayoffSimulator (for the bracket), with game results drawn by the
+    batch engine.
+    """
+
+    def __init__(self, season: SeasonSimulator, batch: Optional[BatchSimulator] = None):
+        """
+        Initialize the driver and compile the remaining schedule.
+
+        Args:
+            season: Season whose unplayed games will be replayed
+            batch: Batch engine to draw results with (defaults to one on season.simulator)
+        """
+        self.season = season
+        self.batch = batch or BatchSimulator(season.simulator)
+
+        self.team_codes: List[str] = list(season.records.keys())
+        self.team_index = {code: i for i, code in enumerate(self.team_codes)}
+
+        self._compile()
+
+    def _compile(self):
+        """Snapshot current records and build per-game arrays for the remaining schedule."""
+        records = [self.season.records[code] for code in self.team_codes]
+        self.base_points = np.array([r.points for r in records])
+        self.base_regulation_wins = np.array([r.regulation_wins for r in records])
+        self.base_wins = np.array([r.wins for r in records])
+        self.base_goal_diff = np.array([r.goal_differential for r in records])
+        self.base_goals_for = np.array([r.goals_for for r in records])
+
+        # Head-to-head points so far, for the standings tiebreakers
+        self.base_h2h = np.zeros((len(self.team_codes), len(self.team_codes)), dtype=np.int64)
+        for (team, opponent), points in self.season.standings.head_to_head_points().items():
+            self.base_h2h[self.team_index[team], self.team_index[opponent]] = points
+
+        teams = [NHL_TEAMS[code] for code in self.team_codes]
+        self.conferences = sorted({t.conference for t in teams})
+        self.divisions = sorted({t.division for t in teams})
+        self.team_conference = np.array([self.conferences.index(t.conference) for t in teams])
+        self.team_division = np.array([self.divisions.index(t.division) for t in teams])
+        self.league_members = np.arange(len(teams))
+        self.conference_members = [np.nonzero(self.team_conference == c)[0] for c in range(len(self.conferences))]
+        self.division_members = [np.nonzero(self.team_division == d)[0] for d in range(len(self.divisions))]
+
+        remaining = [g for g in self.season.schedule if not g.played]
+        self.batch.simulator.prefetch_predictions([(g.home_team, g.away_team) for g in remaining])
+        self.home_idx = np.array([self.team_index[g.home_team] for g in remaining], dtype=np.int64)
+        self.away_idx = np.array([self.team_index[g.away_team] for g in remaining], dtype=np.int64)
+
+        constants = [self.batch.matchup(g.home_team, g.away_team) for g in remaining]
+        self.pull_seconds = self.batch.simulator.decision_provider.pull_thresholds()
+        self.event_prob = np.array([c.home_event_prob for c in constants], dtype=float)
+        self.goal_prob = np.array([c.goal_prob for c in constants], dtype=float).reshape(-1, 2)
+
+    def _simulate_remaining(self, k: int, rng: np.random.Generator) -> SeasonTotals:
+        """Play the remaining schedule k times and return the final totals."""
+        num_teams = len(self.team_codes)
+        num_games = len(self.home_idx)
+
+        points = np.tile(self.base_points, (k, 1))
+        regulation_wins = np.tile(self.base_regulation_wins, (k, 1))
+        wins = np.tile(self.base_wins, (k, 1))
+        goal_diff = np.tile(self.base_goal_diff, (k, 1))
+        goals_for = np.tile(self.base_goals_for, (k, 1))
+        h2h_points = np.tile(self.base_h2h, (k, 1, 1))
+        if num_games == 0:
+            return SeasonTotals(points, regulation_wins, wins, goal_diff, goals_for, h2h_points)
+
+        result = simulate_games_vectorized(
+            np.tile(self.event_prob, k), np.tile(self.goal_prob, (k, 1)), rng, self.pull_seconds
+        )
+        home_score = result.home_score.reshape(k, num_games)
+        away_score = result.away_score.reshape(k, num_games)
+        overtime = result.outcome.reshape(k, num_games) >= OVERTIME
+        home_win = home_score > away_score
+
+        home_points = np.where(home_win, 2, np.where(overtime, 1, 0))
+        away_points = np.where(~home_win, 2, np.where(overtime, 1, 0))
+        margin = home_score - away_score
+
+        # Flattened (replication, team) indices for bincount accumulation
+        offsets = (np.arange(k) * num_teams)[:, None]
+        home_slots = (offsets + self.home_idx).ravel()
+        away_slots = (offsets + self.away_idx).ravel()
+        size = k * num_teams
+
+        def tally(home_values, away_values):
+            total = np.bincount(home_slots, weights=home_values.ravel(), minlength=size)
+            total += np.bincount(away_slots, weights=away_values.ravel(), minlength=size)
+            return total.reshape(k, num_teams).astype(np.int64)
+
+        points += tally(home_points, away_points)
+        regulation_wins += tally(home_win & ~overtime, ~home_win & ~overtime)
+        wins += tally(home_win, ~home_win)
+        goal_diff += tally(margin, -margin)
+        goals_for += tally(home_score, away_score)
+
+        # Flattened (replication, team, opponent) indices for the head-to-head tables
+        pair_offsets = (np.arange(k) * num_teams * num_teams)[:, None]
+        home_pairs = (pair_offsets + self.home_idx * num_teams + self.away_idx).ravel()
+        away_pairs = (pair_offsets + self.away_idx * num_teams + self.home_idx).ravel()
+        pair_size = k * num_teams * num_teams
+        h2h = np.bincount(home_pairs, weights=home_points.ravel(), minlength=pair_size)
+        h2h += np.bincount(away_pairs, weights=away_points.ravel(), minlength=pair_size)
+        h2h_points += h2h.reshape(k, num_teams, num_teams).astype(np.int64)
+
+        return SeasonTotals(points, regulation_wins, wins, goal_diff, goals_for, h2h_points)
+
+    def _table_order(self, totals: SeasonTotals, members: np.ndarray) -> np.ndarray:
+        """(k, len(members)) team indices of a table, best first, with the Standings tiebreakers."""
+        return rank_order(
+            members, self.team_codes, totals.points, totals.regulation_wins, totals.wins,
+            totals.goal_diff, totals.goals_for, totals.h2h_points
+        )
+
+    def run(
+        self,
+        replications: int = 1000,
+        seed: Optional[int] = None,
+        include_playoffs: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TeamOdds]:
+        """
+        Replay the remaining schedule and aggregate per-team odds.
+
+        Args:
+            replications: Number of simulated seasons
+            seed: Optional seed for reproducible runs
+            include_playoffs: Also simulate the bracket for Stanley Cup odds
+            progress_callback: Called with (replications_completed, replications);
+                an exception raised from it stops the run
+
+        Returns:
+            List of TeamOdds sorted by expected points
+        """
+        # Independent streams for the vectorized schedule and the playoff games
+        root = seed if seed is not None else new_seed()
+        rng = stream_generator(root, 0)
+        game_rng = GameRandom(derive_seed(root, 1))
+        num_teams = len(self.team_codes)
+
+        playoff_count = np.zeros(num_teams)
+        division_count = np.zeros(num_teams)
+        presidents_count = np.zeros(num_teams)
+        cup_count = np.zeros(num_teams)
+        points_total = np.zeros(num_teams)
+        wins_total = np.zeros(num_teams)
+
+        def play(home: str, away: str) -> Tuple[int, int, bool]:
+            home_score, away_score, outcome, _, _ = self.batch.play_game(self.batch.matchup(home, away), game_rng)
+            return home_score, away_score, outcome >= OVERTIME
+
+        playoffs = MonteCarloPlayoffs(self.season.season_year, play)
+
+        games_per_season = max(1, len(self.home_idx))
+        chunk = max(1, MAX_GAMES_PER_CHUNK // games_per_season)
+
+        done = 0
+        while done < replications:
+            k = min(chunk, replications - done)
+            totals = self._simulate_remaining(k, rng)
+            points, goal_diff = totals.points, totals.goal_diff
+
+            points_total += points.sum(axis=0)
+            wins_total += totals.wins.sum(axis=0)
+
+            # Presidents' Trophy: best record league-wide
+            presidents_count += np.bincount(
+                self._table_order(totals, self.league_members)[:, 0], minlength=num_teams
+            )
+
+            for members in self.division_members:
+                winners = self._table_order(totals, members)[:, 0]
+                division_count += np.bincount(winners, minlength=num_teams)
+
+            seeds_by_conf = {}
+            for c, members in enumerate(self.conference_members):
+                qualifiers = self._table_order(totals, members)[:, :8]
+                playoff_count += np.bincount(qualifiers.ravel(), minlength=num_teams)
+                seeds_by_conf[c] = qualifiers
+
+            if include_playoffs:
+                for rep in range(k):
+                    standings = [
+                        {
+                            "team_code": self.team_codes[i],
+                            "team_name": self.season.records[self.team_codes[i]].team_name,
+                            "points": int(points[rep, i]),
+                            "goal_differential": int(goal_diff[rep, i]),
+                            "conference": self.conferences[c],
+                            "conference_rank": rank
+                        }
+                        for c, qualifiers in seeds_by_conf.items()
+                        for rank, i in enumerate(qualifiers[rep], 1)
+                    ]
+                    playoffs.generate_bracket(standings)
+                    champion = playoffs.simulate_playoffs().champion
+                    if champion:
+                        cup_count[self.team_index[champion]] += 1
+                    if progress_callback:
+                        progress_callback(done + rep + 1, replications)
+
+            done += k
+            if progress_callback and not include_playoffs:
+                progress_callback(done, replications)
+
+        odds = []
+        for i, code in enumerate(self.team_codes):
+            team = NHL_TEAMS[code]
+            odds.append(TeamOdds(
+                team_code=code,
+                team_name=self.season.records[code].team_name,
+                conference=team.conference,
+                division=team.division,
+                current_points=int(self.base_points[i]),
+                expected_points=points_total[i] / replications,
+                expected_wins=wins_total[i] / replications,
+                playoff_prob=playoff_count[i] / replications,
+                division_prob=division_count[i] / replications,
+                presidents_trophy_prob=presidents_count[i] / replications,
+                cup_prob=cup_count[i] / replications if include_playoffs else 0.0
+            ))
+
+        odds.sort(key=lambda o: o.expected_points, reverse=True)
+        return odds
+
+
+if __name__ == "__main__":
+    """Project the 2024-25 season from opening night."""
+    import time
+
+    season = SeasonSimulator(season_year="2024-25", verbose=False, seed=1)
+    start = time.perf_counter()
+    odds = SeasonMonteCarlo(season).run(replications=200, seed=1)
+    print(f"200 seasons in {time.perf_counter() - start:.1f}s\n")
+
+    print(f"{'Team':<28}{'xPTS':>6}{'PO%':>7}{'DIV%':>7}{'PT%':>7}{'CUP%':>7}")
+    for o in odds:
+        print(f"{o.team_name:<28}{o.expected_points:>6.1f}{o.playoff_prob:>7.1%}"
+              f"{o.division_prob:>7.1%}{o.presidents_trophy_prob:>7.1%}{o.cup_prob:>7.1%}")
@@ -6,48 +6,22 @@ Simulates complete 82-game NHL seasons with standings and playoffs.
 
 import sys
 import io
-from typing import List, Dict, Tuple
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import random
 
 if sys.platform == 'win32' and hasattr(sys.stdout, 'buffer'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 from simulator import NHLSimulator
 from nhl_loader import load_all_teams
-from nhl_data import NHL_TEAMS, NHLTeam
-from game_state import GameState
+from nhl_data import NHL_TEAMS, NHLTeam, Position
+from game_state import GameResult
 from player_stats_tracker import PlayerStatsTracker
-
-
-@dataclass
-class TeamRecord:
-    """Season record for a team."""
-    team_code: str
-    team_name: str
-    games_played: int = 0
-    wins: int = 0
-    losses: int = 0
-    otl: int = 0  # Overtime/shootout losses
-    goals_for: int = 0
-    goals_against: int = 0
-    
-    @property
-    def points(self) -> int:
-        """Calculate points (W=2, OTL=1)."""
-        return self.wins * 2 + self.otl
-    
-    @property
-    def goal_differential(self) -> int:
-        """Goal differential."""
-        return self.goals_for - self.goals_against
-    
-    @property
-    def points_percentage(self) -> float:
-        """Points percentage."""
-        max_points = self.games_played * 2
-        return (self.points / max_points * 100) if max_points > 0 else 0.0
+from standings import Standings, TeamRecord
+from rng_streams import derive_seeds, new_seed, stream_generator, SCHEDULE_STREAM
 
 
 @dataclass
@@ -62,21 +36,61 @@ class Game:
     overtime: bool = False
 
 
+# Compact result of one simulated game:
+# (home_score, away_score, overtime, goals, (home_shots, away_shots)) where goals are GameResult goal dicts
+GameOutcome = Tuple[int, int, bool, List[Dict], Tuple[int, int]]
+
+# Per-process simulator for parallel season workers
+_worker_simulator: Optional[NHLSimulator] = None
+
+
+def _init_season_worker(teams: Dict[str, NHLTeam], api_url: str, home_ice_advantage: float):
+    """Process pool initializer: install the parent's team data and a private simulator."""
+    global _worker_simulator
+    NHL_TEAMS.clear()
+    NHL_TEAMS.update(teams)
+    _worker_simulator = NHLSimulator(
+        api_url=api_url,
+        verbose=False,
+        home_ice_advantage=home_ice_advantage
+    )
+
+
+def _simulate_season_chunk(games: List[Tuple[int, str, str, int]]) -> List[Tuple[int, GameOutcome]]:
+    """Simulate (index, home, away, seed) games in a worker process."""
+    _worker_simulator.prefetch_predictions([(home, away) for _, home, away, _ in games])
+    return [
+        (index, summarize_game(_worker_simulator.simulate_result(home, away, seed=seed)))
+        for index, home, away, seed in games
+    ]
+
+
+def summarize_game(result: GameResult) -> GameOutcome:
+    """Reduce a finished game to the values the season tables need."""
+    return (
+        result.home_team.score, result.away_team.score, result.overtime, result.goals,
+        (result.home_team.shots, result.away_team.shots)
+    )
+
+
 class SeasonSimulator:
     """
     Simulates complete NHL seasons.
     """
     
-    def __init__(self, season_year: str = "2024-25", verbose: bool = True):
+    def __init__(self, season_year: str = "2024-25", verbose: bool = True, seed: Optional[int] = None):
         """
         Initialize season simulator.
         
         Args:
             season_year: Season year (e.g., "2024-25")
             verbose: Print progress
+            seed: Root seed for the schedule and per-game streams (None = fresh
+                entropy, kept in self.seed so the run can be replayed)
         """
         self.season_year = season_year
         self.verbose = verbose
+        self.seed = seed if seed is not None else new_seed()
         self.simulator = NHLSimulator(verbose=False)
         
         # Load teams
@@ -90,6 +104,7 @@ class SeasonSimulator:
                 team_code=code,
                 team_name=team.full_name
             )
+        self.standings = Standings(self.records)
         
         # Initialize player stats tracker
         self.stats_tracker = PlayerStatsTracker(season_year=season_year)
@@ -97,6 +112,9 @@ class SeasonSimulator:
         # Generate schedule
         self.schedule: List[Game] = []
         self._generate_schedule()
+        
+        # One stream per scheduled game so any split of the schedule replays identically
+        self.game_seeds: List[int] = derive_seeds(self.seed, len(self.schedule))
     
     def _generate_schedule(self):
         """Generate an 82-game season schedule."""
@@ -156,18 +174,28 @@ class SeasonSimulator:
                 
                 game_date += timedelta(days=1)
         
-        # Shuffle for variety
-        random.shuffle(self.schedule)
+        # Shuffle for variety (reproducible from the season seed)
+        order = stream_generator(self.seed, SCHEDULE_STREAM).permutation(len(self.schedule))
+        self.schedule = [self.schedule[i] for i in order]
         
         if self.verbose:
             print(f"Generated schedule: {len(self.schedule)} games")
     
-    def simulate_season(self, num_games: int = None) -> Dict[str, TeamRecord]:
+    def simulate_season(
+        self,
+        num_games: int = None,
+        workers: int = 1,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, TeamRecord]:
         """
         Simulate the season.
         
         Args:
             num_games: Number of games to simulate (None = full season)
+            workers: Worker processes to spread games across (1 = serial)
+            progress_callback: Called with (games_completed, games_total) as games
+                finish; an exception raised from it stops the run (games already
+                recorded stay recorded)
         
         Returns:
             Dictionary of team records
@@ -180,53 +208,33 @@ class SeasonSimulator:
             print(f"SIMULATING {self.season_year} SEASON")
             print(f"{'='*70}")
             print(f"Games to simulate: {games_to_sim}")
+            if workers > 1:
+                print(f"Worker processes: {workers}")
             print()
         
-        for i, game in enumerate(self.schedule[:games_to_sim]):
-            if game.played:
-                continue
-            
-            # Simulate game
-            result = self.simulator.simulate_game(game.away_team, game.home_team)
-            
-            # Record results
-            game.played = True
-            game.home_score = result.home_team.score
-            game.away_score = result.away_team.score
-            game.overtime = result.period.value > 3
-            
-            # Track player stats from game
-            self._track_player_stats_from_game(result)
-            
-            # Update records
-            home_record = self.records[game.home_team]
-            away_record = self.records[game.away_team]
-            
-            home_record.games_played += 1
-            away_record.games_played += 1
-            home_record.goals_for += game.home_score
-            home_record.goals_against += game.away_score
-            away_record.goals_for += game.away_score
-            away_record.goals_against += game.home_score
-            
-            if game.home_score > game.away_score:
-                # Home win
-                home_record.wins += 1
-                if game.overtime:
-                    away_record.otl += 1
-                else:
-                    away_record.losses += 1
-            else:
-                # Away win
-                away_record.wins += 1
-                if game.overtime:
-                    home_record.otl += 1
-                else:
-                    home_record.losses += 1
-            
-            # Progress update
-            if self.verbose and (i + 1) % 100 == 0:
-                print(f"  Simulated {i + 1}/{games_to_sim} games...")
+        pending = [i for i in range(games_to_sim) if not self.schedule[i].played]
+        
+        # One round trip for every pre-game prediction the run will need
+        self.simulator.prefetch_predictions(
+            [(self.schedule[i].home_team, self.schedule[i].away_team) for i in pending]
+        )
+        
+        if workers > 1 and len(pending) > 1:
+            self._simulate_parallel(pending, workers, progress_callback)
+        else:
+            for done, i in enumerate(pending, 1):
+                game = self.schedule[i]
+                result = self.simulator.simulate_result(
+                    game.home_team, game.away_team, seed=self.game_seeds[i]
+                )
+                self._record_game(game, summarize_game(result))
+                
+                if progress_callback:
+                    progress_callback(done, len(pending))
+                
+                # Progress update
+                if self.verbose and (i + 1) % 100 == 0:
+                    print(f"  Simulated {i + 1}/{games_to_sim} games...")
         
         if self.verbose:
             print(f"\n✅ Season simulation complete!")
@@ -234,27 +242,108 @@ class SeasonSimulator:
         
         return self.records
     
-    def _track_player_stats_from_game(self, game: GameState):
-        """Extract and track player stats from a completed game."""
-        # Process all goals from period scores
-        for period_num, period_score in game.period_scores.items():
-            for goal in period_score.goals:
-                scorer_id = goal.get('scorer_id')
-                scorer_name = goal.get('scorer')
-                team_code = goal.get('team')
-                
-                if scorer_id and scorer_name and team_code:
-                    # Record goal with assists
-                    self.stats_tracker.record_goal(
-                        scorer_id=scorer_id,
-                        scorer_name=scorer_name,
-                        team_code=team_code,
-                        position="F",  # Default to forward (would need position tracking)
-                        primary_assist_id=goal.get('primary_assist_id') if goal.get('primary_assist') else None,
-                        primary_assist_name=goal.get('primary_assist'),
-                        secondary_assist_id=goal.get('secondary_assist_id') if goal.get('secondary_assist') else None,
-                        secondary_assist_name=goal.get('secondary_assist')
+    def _simulate_parallel(
+        self,
+        pending: List[int],
+        workers: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ):
+        """
+        Simulate scheduled games across a process pool.
+        
+        Each worker gets its own NHLSimulator and a copy of the current team
+        data. Results are applied in schedule order, so records and player
+        stats match a serial run with the same seeds. If the run is stopped
+        early, no games are recorded.
+        """
+        tasks = [
+            (i, self.schedule[i].home_team, self.schedule[i].away_team, self.game_seeds[i])
+            for i in pending
+        ]
+        
+        # A few chunks per worker keeps them busy without much IPC overhead
+        chunk_size = max(1, math.ceil(len(tasks) / (workers * 4)))
+        chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+        
+        outcomes: Dict[int, GameOutcome] = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_season_worker,
+            initargs=(dict(NHL_TEAMS), self.simulator.api_url, self.simulator.home_ice_advantage)
+        ) as pool:
+            try:
+                for chunk_results in pool.map(_simulate_season_chunk, chunks):
+                    outcomes.update(chunk_results)
+                    if progress_callback:
+                        progress_callback(len(outcomes), len(tasks))
+                    if self.verbose:
+                        print(f"  Simulated {len(outcomes)}/{len(tasks)} games...")
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+        
+        for i in pending:
+            self._record_game(self.schedule[i], outcomes[i])
+    
+    def _record_game(self, game: Game, outcome: GameOutcome):
+        """Apply a finished game to the schedule, team records and player stats."""
+        home_score, away_score, overtime, goals, shots = outcome
+        
+        # Record results
+        game.played = True
+        game.home_score = home_score
+        game.away_score = away_score
+        game.overtime = overtime
+        
+        # Track player stats from game
+        self._track_player_games(game, home_score > away_score, goals, shots)
+        self._track_player_goals(goals)
+        
+        # Update records, head-to-head and standings tables
+        self.standings.record_game(game.home_team, game.away_team, home_score, away_score, overtime)
+    
+    def _track_player_games(self, game: Game, home_won: bool, goals: List[Dict], shots: Tuple[int, int]):
+        """Record games played for both rosters and the starting goalies' decisions."""
+        for team_code, opponent, won, opponent_shots in (
+            (game.home_team, game.away_team, home_won, shots[1]),
+            (game.away_team, game.home_team, not home_won, shots[0]),
+        ):
+            roster = NHL_TEAMS[team_code].roster
+            goalie = roster.get_starting_goalie()  # the goalie the game was played with
+            for player in roster.get_all_players():
+                if player.position != Position.GOALIE or player is goalie:
+                    self.stats_tracker.record_game_participation(
+                        player.id, player.name, team_code, player.position.value
                     )
+            
+            if goalie:
+                # Empty-net goals count as shots but not against the goalie
+                allowed = [goal for goal in goals if goal.get('team') == opponent]
+                self.stats_tracker.record_goalie_decision(
+                    goalie.id, goalie.name, team_code, won,
+                    saves=opponent_shots - len(allowed),
+                    goals_against=sum(1 for goal in allowed if not goal.get('is_empty_net'))
+                )
+    
+    def _track_player_goals(self, goals: List[Dict]):
+        """Record goals (GameResult goal dicts) in the player stats tracker."""
+        for goal in goals:
+            scorer_id = goal.get('scorer_id')
+            scorer_name = goal.get('scorer')
+            team_code = goal.get('team')
+            
+            if scorer_id and scorer_name and team_code:
+                # Record goal with assists
+                self.stats_tracker.record_goal(
+                    scorer_id=scorer_id,
+                    scorer_name=scorer_name,
+                    team_code=team_code,
+                    position="F",  # Default to forward (would need position tracking)
+                    primary_assist_id=goal.get('primary_assist_id') if goal.get('primary_assist') else None,
+                    primary_assist_name=goal.get('primary_assist'),
+                    secondary_assist_id=goal.get('secondary_assist_id') if goal.get('secondary_assist') else None,
+                    secondary_assist_name=goal.get('secondary_assist')
+                )
     
     def _print_standings(self):
         """Print current standings."""
@@ -268,46 +357,23 @@ class SeasonSimulator:
             print(f"\n{conference.upper()} CONFERENCE")
             print("-" * 70)
             
-            # Get teams in conference
-            conf_teams = [code for code, team in NHL_TEAMS.items() 
-                         if team.conference == conference]
-            
-            # Sort by points
-            sorted_teams = sorted(
-                [self.records[code] for code in conf_teams],
-                key=lambda r: (r.points, r.wins, r.goal_differential),
-                reverse=True
-            )
+            sorted_teams = self.standings.conference(conference)
             
             # Print header
-            print(f"{'Rank':<6}{'Team':<30}{'GP':<5}{'W':<4}{'L':<4}{'OTL':<5}{'PTS':<5}{'GF':<5}{'GA':<5}{'DIFF':<6}{'P%':<6}")
+            print(f"{'Rank':<6}{'Team':<30}{'GP':<5}{'W':<4}{'L':<4}{'OTL':<5}{'RW':<4}{'PTS':<5}{'GF':<5}{'GA':<5}{'DIFF':<6}{'P%':<6}")
             print("-" * 70)
             
             # Print teams
             for i, record in enumerate(sorted_teams, 1):
                 playoff_marker = "*" if i <= 8 else " "
                 print(f"{playoff_marker}{i:<5}{record.team_name:<30}{record.games_played:<5}"
-                      f"{record.wins:<4}{record.losses:<4}{record.otl:<5}{record.points:<5}"
+                      f"{record.wins:<4}{record.losses:<4}{record.otl:<5}{record.regulation_wins:<4}{record.points:<5}"
                       f"{record.goals_for:<5}{record.goals_against:<5}{record.goal_differential:<+6}"
                       f"{record.points_percentage:<6.1f}")
     
     def get_playoff_teams(self) -> Dict[str, List[TeamRecord]]:
         """Get top 8 teams from each conference."""
-        playoffs = {}
-        
-        for conference in ["Eastern", "Western"]:
-            conf_teams = [code for code, team in NHL_TEAMS.items() 
-                         if team.conference == conference]
-            
-            sorted_teams = sorted(
-                [self.records[code] for code in conf_teams],
-                key=lambda r: (r.points, r.wins, r.goal_differential),
-                reverse=True
-            )
-            
-            playoffs[conference] = sorted_teams[:8]
-        
-        return playoffs
+        return self.standings.playoff_teams(8)
 
 
 if __name__ == "__main__":
@@ -326,9 +392,7 @@ if __name__ == "__main__":
     print("="*70)
     
     # Top 5 teams
-    all_teams = sorted(records.values(), 
-                      key=lambda r: (r.points, r.goal_differential), 
-                      reverse=True)
+    all_teams = season.standings.league()
     
     print("\nTop 5 Teams:")
     for i, record in enumerate(all_teams[:5], 1):
@@ -5,16 +5,71 @@ Simulates hockey games with AI-driven decision making via the Intelligence Servi
 Supports real NHL team data for enhanced realism.
 """
 
-import random
 import time
+from dataclasses import dataclass
+from itertools import accumulate, count
 from typing import Dict, Optional, Callable, Union, List, Tuple
 import httpx
 
 from game_state import (
     GameState, TeamState, EventType, GamePeriod, 
-    StrengthSituation, GameEvent
+    StrengthSituation, GameEvent, GameResult
 )
 from nhl_data import NHLTeam, get_team, Player
+from decision_provider import DecisionProvider, LocalDecisionProvider, MIN_CONFIDENCE
+from prediction_cache import PredictionCache, get_prediction_cache
+from sampling_tables import get_sampling_tables
+from matchup_context import MatchupContext, EMPTY_NET_GOAL_PROB, HOME, AWAY
+from rng_streams import GameRandom, derive_seed, GAME_STREAM
+from event_sinks import EventSink, ConsoleEventSink, SAVE, HIT, SHOOTOUT_GOAL, SHOOTOUT_MISS
+
+
+# Play-by-play event mix at even strength and with a man advantage or pulled goalie
+EVENT_TYPES = ('shot', 'faceoff', 'hit', 'blocked_shot', 'penalty', 'nothing')
+EVEN_EVENT_CUM_WEIGHTS = tuple(accumulate((0.35, 0.20, 0.15, 0.10, 0.03, 0.17)))
+SPECIAL_TEAMS_EVENT_CUM_WEIGHTS = tuple(accumulate((0.35 + 0.10, 0.20, 0.15, 0.10, 0.01, 0.17)))
+
+SHOT_TYPES = ('wrist', 'slap', 'snap', 'backhand', 'tip', 'deflection')
+SHOT_TYPE_CUM_WEIGHTS = tuple(accumulate((0.40, 0.15, 0.25, 0.10, 0.07, 0.03)))
+
+PENALTIES = (
+    ("Tripping", 2),
+    ("Hooking", 2),
+    ("Slashing", 2),
+    ("High-sticking", 2),
+    ("Interference", 2),
+    ("Roughing", 2),
+    ("Cross-checking", 2),
+    ("Holding", 2),
+)
+
+
+def realtime_pacer(speed: float, wait: Callable[[float], object] = time.sleep) -> Callable[[GameState, int], None]:
+    """
+    Tick callback that plays `speed` game seconds per wall-clock second
+    (1.0 = real time, 60.0 = a 20-minute period in 20 seconds).
+    """
+    def pace(game: GameState, seconds: int):
+        wait(seconds / speed)
+    return pace
+
+
+@dataclass
+class GameContext:
+    """
+    Per-call state for one game: random stream, team data, pre-game
+    prediction and compiled matchup. Each simulate call builds its own, so
+    one NHLSimulator can play many games at once from different threads.
+    """
+    rng: GameRandom
+    home_team_name: str
+    away_team_name: str
+    home_nhl_team: Optional[NHLTeam] = None
+    away_nhl_team: Optional[NHLTeam] = None
+    ml_prediction: Optional[Dict] = None
+    matchup: Optional[MatchupContext] = None
+    tick_callback: Optional[Callable[[GameState, int], None]] = None
+    play_sink: Optional[EventSink] = None  # sink for unlogged plays, if it wants them
 
 
 class NHLSimulator:
@@ -25,6 +80,9 @@ class NHLSimulator:
     creating a "living game" that improves as the ML model improves.
     
     Now supports real NHL team data for enhanced realism!
+    
+    Reentrant: per-game state lives in a GameContext created for each call,
+    so a single instance can be shared across threads (e.g. API workers).
     """
     
     def __init__(
@@ -32,35 +90,50 @@ class NHLSimulator:
         api_url: str = "http://localhost:8000",
         verbose: bool = True,
         event_callback: Optional[Callable] = None,
-        home_ice_advantage: float = 1.10
+        home_ice_advantage: float = 1.10,
+        decision_provider: Optional[DecisionProvider] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        seed: Optional[int] = None,
+        sink: Optional[EventSink] = None
     ):
         """
         Initialize simulator.
         
         Args:
             api_url: URL of the Intelligence Service API
-            verbose: Print events to console
-            event_callback: Optional callback function for events
+            verbose: Print play-by-play to the console (a ConsoleEventSink, unless
+                `sink` is given) and ML service diagnostics
+            event_callback: Default callback for every GameEvent as it is logged
+                (simulate_game can override it per call)
             home_ice_advantage: Multiplier for home team (default 1.10 = 10% boost)
+            decision_provider: Source of in-game decisions (default: in-process
+                LocalDecisionProvider; pass a RemoteDecisionProvider to use the API)
+            prediction_cache: Cache for pre-game predictions (default: shared process-wide cache)
+            seed: Optional root seed; games simulated without their own seed use
+                streams derived from it in call order (see rng_streams)
+            sink: Where simulate_game sends play-by-play (see event_sinks); sinks
+                never affect results
         """
         self.api_url = api_url
         self.verbose = verbose
+        self.sink = sink if sink is not None else (ConsoleEventSink() if verbose else None)
         self.event_callback = event_callback
         self.home_ice_advantage = home_ice_advantage
         self.client = httpx.Client(timeout=10.0)
-        
-        # Track real team data if available
-        self.home_nhl_team: Optional[NHLTeam] = None
-        self.away_nhl_team: Optional[NHLTeam] = None
-        
-        # Store ML predictions for this game
-        self.ml_prediction: Optional[Dict] = None
+        self.decision_provider = decision_provider or LocalDecisionProvider()
+        self.prediction_cache = prediction_cache if prediction_cache is not None else get_prediction_cache()
+        self.seed = seed
+        self._game_numbers = count()
+
+        # Per-game state (random stream, team data, ML prediction, matchup)
+        # lives in a GameContext built by _prepare_matchup for each call
     
-    def _select_shooter(self, team: NHLTeam, is_power_play: bool = False) -> Optional[Player]:
+    def _select_shooter(self, ctx: GameContext, team: NHLTeam, is_power_play: bool = False) -> Optional[Player]:
         """
         Select a player to take a shot, weighted by offensive ability.
         
         Args:
+            ctx: Game context (random stream)
             team: NHL team
             is_power_play: If True, bias toward top players
             
@@ -70,44 +143,12 @@ class NHLSimulator:
         if not team or not team.roster:
             return None
         
-        # Get all forwards and defensemen
-        forwards = team.roster.centers + team.roster.left_wings + team.roster.right_wings
-        defensemen = team.roster.defensemen
-        
-        if not forwards and not defensemen:
-            return None
-        
-        # On power play or generally, forwards shoot 75% of the time
-        shoot_from_forwards = random.random() < 0.75
-        
-        if shoot_from_forwards and forwards:
-            players = forwards
-        elif defensemen:
-            players = defensemen
-        else:
-            players = forwards
-        
-        # Weight by offensive rating and shots_per_60
-        # Higher rating = higher chance to shoot
-        weights = []
-        for player in players:
-            # Base weight on rating (0-100)
-            weight = player.rating
-            
-            # Bonus for shot-takers
-            if player.shots_per_60 > 0:
-                weight += player.shots_per_60 * 5  # Multiply by 5 to boost high-volume shooters
-            
-            # On PP, heavily favor top players
-            if is_power_play:
-                weight = weight * 1.5 if player.rating > 80 else weight * 0.7
-            
-            weights.append(max(weight, 10))  # Minimum weight of 10
-        
-        return random.choices(players, weights=weights)[0]
+        tables = get_sampling_tables(team)
+        return tables.select_shooter(ctx.rng.random, is_power_play) if tables else None
     
     def _select_assists(
         self, 
+        ctx: GameContext,
         team: NHLTeam, 
         scorer: Optional[Player]
     ) -> Tuple[Optional[Player], Optional[Player]]:
@@ -115,6 +156,7 @@ class NHLSimulator:
         Select players for primary and secondary assists.
         
         Args:
+            ctx: Game context (random stream)
             team: NHL team
             scorer: Player who scored (to exclude from assists)
             
@@ -124,55 +166,8 @@ class NHLSimulator:
         if not team or not team.roster:
             return (None, None)
         
-        # Get all skaters except the scorer
-        all_skaters = (
-            team.roster.centers + 
-            team.roster.left_wings + 
-            team.roster.right_wings + 
-            team.roster.defensemen
-        )
-        
-        if scorer:
-            all_skaters = [p for p in all_skaters if p.id != scorer.id]
-        
-        if not all_skaters:
-            return (None, None)
-        
-        # 70% chance of assist
-        if random.random() > 0.70:
-            return (None, None)
-        
-        # Weight by playmaking ability (assists_per_60 and rating)
-        weights = []
-        for player in all_skaters:
-            weight = player.rating
-            if player.assists_per_60 > 0:
-                weight += player.assists_per_60 * 8  # Playmakers get bonus
-            weights.append(max(weight, 10))
-        
-        # Select primary assist
-        primary = random.choices(all_skaters, weights=weights)[0]
-        
-        # 60% chance of secondary assist
-        if random.random() > 0.60:
-            return (primary, None)
-        
-        # Remove primary from pool
-        remaining = [p for p in all_skaters if p.id != primary.id]
-        if not remaining:
-            return (primary, None)
-        
-        # Recalculate weights for remaining players
-        secondary_weights = []
-        for player in remaining:
-            weight = player.rating
-            if player.assists_per_60 > 0:
-                weight += player.assists_per_60 * 8
-            secondary_weights.append(max(weight, 10))
-        
-        secondary = random.choices(remaining, weights=secondary_weights)[0]
-        
-        return (primary, secondary)
+        tables = get_sampling_tables(team)
+        return tables.select_assists(ctx.rng.random, scorer) if tables else (None, None)
     
     def _get_starting_goalie(self, team: NHLTeam) -> Optional[Player]:
         """Get the starting goalie for a team."""
@@ -180,27 +175,19 @@ class NHLSimulator:
             return None
         return team.roster.get_starting_goalie()
     
-    def _select_shot_type(self) -> str:
+    def _select_shot_type(self, ctx: GameContext) -> str:
         """Randomly select a shot type."""
-        shot_types = {
-            "wrist": 0.40,
-            "slap": 0.15,
-            "snap": 0.25,
-            "backhand": 0.10,
-            "tip": 0.07,
-            "deflection": 0.03
-        }
-        return random.choices(
-            list(shot_types.keys()),
-            weights=list(shot_types.values())
-        )[0]
+        return ctx.rng.choices(SHOT_TYPES, cum_weights=SHOT_TYPE_CUM_WEIGHTS)[0]
     
     def simulate_game(
         self, 
         home_team_code: str,
         home_team_name: Optional[str] = None,
         away_team_code: Optional[str] = None,
-        away_team_name: Optional[str] = None
+        away_team_name: Optional[str] = None,
+        seed: Optional[int] = None,
+        event_callback: Optional[Callable[[GameEvent], None]] = None,
+        tick_callback: Optional[Callable[[GameState, int], None]] = None
     ) -> GameState:
         """
         Simulate a complete game.
@@ -210,6 +197,11 @@ class NHLSimulator:
             home_team_name: Home team full name (optional if using NHL data)
             away_team_code: Away team abbreviation (optional for backwards compat)
             away_team_name: Away team full name (optional if using NHL data)
+            seed: Optional seed; the same seed replays the same game
+            event_callback: Called with every GameEvent as it is logged
+                (default: the simulator's event_callback)
+            tick_callback: Called with (game, seconds) after each play advances
+                the clock; use it to pace the game in real time
             
         Returns:
             Final game state
@@ -222,163 +214,294 @@ class NHLSimulator:
             home_team_name = None
             away_team_name = None
         
-        # Try to load NHL team data
-        self.home_nhl_team = get_team(home_team_code)
-        if away_team_code:
-            self.away_nhl_team = get_team(away_team_code)
-        
-        # Use NHL data names if available
-        if self.home_nhl_team and not home_team_name:
-            home_team_name = self.home_nhl_team.full_name
-        elif not home_team_name:
-            home_team_name = home_team_code
-            
-        if self.away_nhl_team and not away_team_name:
-            away_team_name = self.away_nhl_team.full_name
-        elif not away_team_name:
-            away_team_name = away_team_code
-        
-        # Query ML model for pre-game prediction
-        self.ml_prediction = self._get_pregame_prediction()
+        ctx = self._prepare_matchup(
+            home_team_code, away_team_code, home_team_name, away_team_name, seed=self._game_seed(seed)
+        )
         
         # Initialize game
         game_id = f"{away_team_code}@{home_team_code}-{int(time.time())}"
+        sink = self.sink
+        if sink is not None:
+            sink.game_start(self._game_preview(ctx, game_id, home_team_code, away_team_code))
+        
         game = GameState(
             game_id=game_id,
-            home_team=TeamState(code=home_team_code, name=home_team_name),
-            away_team=TeamState(code=away_team_code, name=away_team_name)
+            home_team=TeamState(code=home_team_code, name=ctx.home_team_name),
+            away_team=TeamState(code=away_team_code, name=ctx.away_team_name),
+            event_listener=self._event_listener(sink, event_callback or self.event_callback)
         )
+        ctx.tick_callback = tick_callback
+        if sink is not None and sink.wants_plays:
+            ctx.play_sink = sink
         
-        if self.verbose:
-            print(f"\n{'='*70}")
-            print(f"SIMULATING: {away_team_name} @ {home_team_name}")
-            if self.home_nhl_team and self.away_nhl_team:
-                print(f"Home Strength: {self.home_nhl_team.overall_strength:.1f}/100")
-                print(f"Away Strength: {self.away_nhl_team.overall_strength:.1f}/100")
-                print(f"Home Ice Advantage: {(self.home_ice_advantage - 1) * 100:.0f}%")
-            
-            # Show ML predictions
-            if self.ml_prediction:
-                print(f"\n🤖 ML PREDICTION:")
-                print(f"   Home Win: {self.ml_prediction['home_win_prob']*100:.1f}%")
-                print(f"   Expected Score: {self.ml_prediction['expected_goals_home']:.1f} - {self.ml_prediction['expected_goals_away']:.1f}")
-                print(f"   Confidence: {self.ml_prediction['confidence']*100:.0f}%")
-            
-            print(f"{'='*70}\n")
+        self._play(game, ctx)
+        
+        if sink is not None:
+            sink.game_end(game)
+        
+        return game
+    
+    def _game_preview(self, ctx: GameContext, game_id: str, home_team_code: str, away_team_code: str) -> Dict:
+        """Pre-game summary for the sink."""
+        has_teams = ctx.home_nhl_team is not None and ctx.away_nhl_team is not None
+        return {
+            "game_id": game_id,
+            "home_team": home_team_code,
+            "away_team": away_team_code,
+            "home_name": ctx.home_team_name,
+            "away_name": ctx.away_team_name,
+            "home_strength": ctx.home_nhl_team.overall_strength if has_teams else None,
+            "away_strength": ctx.away_nhl_team.overall_strength if has_teams else None,
+            "home_ice_advantage": self.home_ice_advantage,
+            "ml_prediction": ctx.ml_prediction
+        }
+    
+    @staticmethod
+    def _event_listener(
+        sink: Optional[EventSink],
+        event_callback: Optional[Callable[[GameEvent], None]]
+    ) -> Optional[Callable[[GameState, GameEvent], None]]:
+        """Fan each logged event out to the sink and the event callback."""
+        if sink is None and event_callback is None:
+            return None
         
-        # Simulate each period
+        def on_event(game: GameState, event: GameEvent):
+            if sink is not None:
+                sink.event(game, event)
+            if event_callback is not None:
+                event_callback(event)
+        return on_event
+    
+    def simulate_result(
+        self,
+        home_team_code: str,
+        away_team_code: str,
+        seed: Optional[int] = None
+    ) -> GameResult:
+        """
+        Simulate a game in results-only mode.
+        
+        Plays exactly like simulate_game (same seed, same result) but builds
+        no event log, descriptions or period scores; use it for bulk runs that
+        only need the score, the OT/SO flag, team totals and goal scorers.
+        The event callback is not called, and decision providers that ask
+        for recent events get an empty window.
+        
+        Args:
+            home_team_code: Home team abbreviation (e.g., "TOR")
+            away_team_code: Away team abbreviation (e.g., "MTL")
+            seed: Optional seed; the same seed replays the same game
+            
+        Returns:
+            Final result with team totals and goal attributions
+        """
+        ctx = self._prepare_matchup(home_team_code, away_team_code, seed=self._game_seed(seed))
+        game = GameState(
+            game_id=f"{away_team_code}@{home_team_code}",
+            home_team=TeamState(code=home_team_code, name=ctx.home_team_name),
+            away_team=TeamState(code=away_team_code, name=ctx.away_team_name),
+            record_events=False
+        )
+        self._play(game, ctx)
+        return GameResult.from_game(game)
+    
+    def _game_seed(self, seed: Optional[int]) -> Optional[int]:
+        """Seed for the next game: the caller's, else the next stream under the root seed."""
+        if seed is None and self.seed is not None:
+            return derive_seed(self.seed, GAME_STREAM, next(self._game_numbers))
+        return seed
+    
+    def _play(self, game: GameState, ctx: GameContext):
+        """Play periods until the game is over."""
         while not game.is_game_over():
-            self._simulate_period(game)
+            self._simulate_period(game, ctx)
             
             if game.time_remaining == 0 and not game.is_game_over():
                 game_continues = game.advance_period()
                 if not game_continues:
                     break
+    
+    def _prepare_matchup(
+        self,
+        home_team_code: str,
+        away_team_code: Optional[str],
+        home_team_name: Optional[str] = None,
+        away_team_name: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> GameContext:
+        """
+        Resolve NHL team data and the pre-game ML prediction for a matchup.
         
-        # Print final summary
-        if self.verbose:
-            self._print_final_summary(game)
+        Args:
+            seed: Seed for the game's random stream (None = fresh entropy)
         
-        return game
+        Returns:
+            New GameContext with display names and the compiled matchup
+        """
+        # Try to load NHL team data
+        home_nhl_team = get_team(home_team_code)
+        away_nhl_team = get_team(away_team_code) if away_team_code else None
+        
+        # Use NHL data names if available
+        if home_nhl_team and not home_team_name:
+            home_team_name = home_nhl_team.full_name
+        elif not home_team_name:
+            home_team_name = home_team_code
+            
+        if away_nhl_team and not away_team_name:
+            away_team_name = away_nhl_team.full_name
+        elif not away_team_name:
+            away_team_name = away_team_code
+        
+        ctx = GameContext(
+            rng=GameRandom(seed),
+            home_team_name=home_team_name,
+            away_team_name=away_team_name,
+            home_nhl_team=home_nhl_team,
+            away_nhl_team=away_nhl_team,
+            # Query ML model for pre-game prediction
+            ml_prediction=self._get_pregame_prediction(home_nhl_team, away_nhl_team)
+        )
+        ctx.matchup = self._build_matchup_context(ctx, home_team_code, away_team_code)
+        return ctx
     
-    def _simulate_period(self, game: GameState):
-        """Simulate a single period."""
-        if self.verbose:
-            print(f"\n--- Period {game.period.value} ---\n")
+    def _build_matchup_context(self, ctx: GameContext, home_team_code: str, away_team_code: str) -> MatchupContext:
+        """Compile the per-game constants for the prepared matchup."""
+        home_state = TeamState(code=home_team_code, name=home_team_code)
+        away_state = TeamState(code=away_team_code, name=away_team_code)
+        
+        return MatchupContext.build(
+            home_code=home_team_code,
+            away_code=away_team_code,
+            teams=(ctx.home_nhl_team, ctx.away_nhl_team),
+            home_event_prob=self._calculate_event_probability(ctx, is_home=True),
+            goal_prob=(
+                self._calculate_ml_guided_goal_probability(ctx, home_state, away_state),
+                self._calculate_ml_guided_goal_probability(ctx, away_state, home_state),
+            ),
+            shooters=(
+                get_sampling_tables(ctx.home_nhl_team),
+                get_sampling_tables(ctx.away_nhl_team),
+            ),
+            pull_seconds=self.decision_provider.pull_thresholds(),
+        )
+    
+    def simulate_many(
+        self,
+        home_team_code: str,
+        away_team_code: str,
+        n: int = 10000,
+        seed: Optional[int] = None
+    ) -> "MatchupSummary":
+        """
+        Simulate N replications of one matchup in a single call.
+        
+        Skips the per-game event log, team lookups and prediction requests;
+        see batch_simulator.BatchSimulator for details.
         
+        Args:
+            home_team_code: Home team abbreviation (e.g., "TOR")
+            away_team_code: Away team abbreviation (e.g., "MTL")
+            n: Number of replications
+            seed: Optional seed for reproducible runs
+            
+        Returns:
+            MatchupSummary with win/OT/shootout probabilities and score distributions
+        """
+        from batch_simulator import BatchSimulator
+        return BatchSimulator(self).simulate_matchup(home_team_code, away_team_code, n, seed=seed)
+    
+    def _simulate_period(self, game: GameState, ctx: GameContext):
+        """Simulate a single period."""
         # Special handling for shootout
         if game.period == GamePeriod.SHOOTOUT:
-            self._simulate_shootout(game)
+            self._simulate_shootout(game, ctx)
             return
         
         while game.time_remaining > 0:
             # Simulate time passage (10-60 seconds per "play")
-            time_delta = random.randint(10, 60)
+            time_delta = ctx.rng.randint(10, 60)
             game.advance_time(time_delta)
             
             # Check for AI decision points
             self._check_ai_decisions(game)
             
             # Generate random event
-            self._generate_event(game)
+            self._generate_event(game, ctx)
             
-            # Small delay for readability (optional)
-            if self.verbose:
-                time.sleep(0.05)
+            # Pacing / live hooks
+            if ctx.tick_callback:
+                ctx.tick_callback(game, time_delta)
     
-    def _generate_event(self, game: GameState):
+    def _generate_event(self, game: GameState, ctx: GameContext):
         """Generate a random game event based on probabilities."""
-        # Event probabilities (adjusted based on situation)
-        event_weights = {
-            'shot': 0.35,
-            'faceoff': 0.20,
-            'hit': 0.15,
-            'blocked_shot': 0.10,
-            'penalty': 0.03,
-            'nothing': 0.17
-        }
+        # Event probabilities (more shots and fewer penalties off even strength)
+        if game.strength_situation == StrengthSituation.EVEN:
+            cum_weights = EVEN_EVENT_CUM_WEIGHTS
+        else:
+            cum_weights = SPECIAL_TEAMS_EVENT_CUM_WEIGHTS
+        event_type = ctx.rng.choices(EVENT_TYPES, cum_weights=cum_weights)[0]
         
-        # Adjust for strength situation
-        if game.strength_situation != StrengthSituation.EVEN:
-            event_weights['shot'] += 0.10  # More shots on power play
-            event_weights['penalty'] = 0.01  # Fewer penalties
-        
-        # Choose event
-        event_type = random.choices(
-            list(event_weights.keys()),
-            weights=list(event_weights.values())
-        )[0]
-        
-        # Determine which team
-        # Calculate home advantage based on team strength and home ice
-        home_prob = self._calculate_event_probability(is_home=True)
-        is_home_event = random.random() < home_prob
+        # Determine which team (home share from team strength and home ice)
+        is_home_event = ctx.rng.random() < ctx.matchup.home_event_prob
         team = game.home_team if is_home_event else game.away_team
         opponent = game.away_team if is_home_event else game.home_team
         
         # Process event
         if event_type == 'shot':
-            self._process_shot(game, team, opponent)
+            self._process_shot(game, ctx, team, opponent)
         elif event_type == 'faceoff':
-            self._process_faceoff(game, team, opponent)
+            self._process_faceoff(game, ctx, team, opponent)
         elif event_type == 'hit':
-            self._process_hit(game, team)
+            self._process_hit(game, ctx, team)
         elif event_type == 'blocked_shot':
             self._process_blocked_shot(game, team, opponent)
         elif event_type == 'penalty':
-            self._process_penalty(game, team)
+            self._process_penalty(game, ctx, team)
     
-    def _get_pregame_prediction(self) -> Optional[Dict]:
+    @staticmethod
+    def _prediction_payload(home_team: NHLTeam, away_team: NHLTeam) -> Dict:
+        """Build the /predict-game request for a matchup."""
+        return {
+            "home_team_id": home_team.code,
+            "away_team_id": away_team.code,
+            "period": 1,
+            "time_remaining": 60.0,
+            "score_home": 0,
+            "score_away": 0,
+            "home_stats": {
+                "goals_per_game": home_team.stats.goals_per_game,
+                "goals_against_per_game": home_team.stats.goals_against_per_game,
+                "xGF_pct": home_team.stats.xGF_pct,
+                "corsi_for_pct": home_team.stats.corsi_for_pct,
+            },
+            "away_stats": {
+                "goals_per_game": away_team.stats.goals_per_game,
+                "goals_against_per_game": away_team.stats.goals_against_per_game,
+                "xGF_pct": away_team.stats.xGF_pct,
+                "corsi_for_pct": away_team.stats.corsi_for_pct,
+            }
+        }
+    
+    def _get_pregame_prediction(
+        self,
+        home_team: Optional[NHLTeam],
+        away_team: Optional[NHLTeam]
+    ) -> Optional[Dict]:
         """
         Query ML model for pre-game prediction.
         Uses team stats to get expected outcome.
         """
-        if not self.home_nhl_team or not self.away_nhl_team:
+        if not home_team or not away_team:
             return None
         
+        payload = self._prediction_payload(home_team, away_team)
+        cache_key = PredictionCache.make_key(self.api_url, payload)
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Prepare request payload
-            payload = {
-                "home_team_id": self.home_nhl_team.code,
-                "away_team_id": self.away_nhl_team.code,
-                "period": 1,
-                "time_remaining": 60.0,
-                "score_home": 0,
-                "score_away": 0,
-                "home_stats": {
-                    "goals_per_game": self.home_nhl_team.stats.goals_per_game,
-                    "goals_against_per_game": self.home_nhl_team.stats.goals_against_per_game,
-                    "xGF_pct": self.home_nhl_team.stats.xGF_pct,
-                    "corsi_for_pct": self.home_nhl_team.stats.corsi_for_pct,
-                },
-                "away_stats": {
-                    "goals_per_game": self.away_nhl_team.stats.goals_per_game,
-                    "goals_against_per_game": self.away_nhl_team.stats.goals_against_per_game,
-                    "xGF_pct": self.away_nhl_team.stats.xGF_pct,
-                    "corsi_for_pct": self.away_nhl_team.stats.corsi_for_pct,
-                }
-            }
-            
             # Query API
             response = self.client.post(
                 f"{self.api_url}/predict-game",
@@ -390,6 +513,7 @@ class NHLSimulator:
                 prediction = response.json()
                 if self.verbose:
                     print(f"[ML] Pre-game prediction received (confidence: {prediction.get('confidence', 0)*100:.0f}%)")
+                self.prediction_cache.put(cache_key, prediction)
                 return prediction
             else:
                 if self.verbose:
@@ -401,18 +525,65 @@ class NHLSimulator:
                 print(f"[ML] Could not get prediction: {e}")
             return None
     
-    def _calculate_event_probability(self, is_home: bool) -> float:
+    def prefetch_predictions(self, matchups: List[Tuple[str, str]]) -> int:
+        """
+        Fetch pre-game predictions for many (home, away) matchups in one
+        /predict-games round trip and store them in the prediction cache.
+        
+        Matchups already cached are skipped. If the batch endpoint is
+        unavailable, games fall back to per-game /predict-game requests.
+        
+        Returns:
+            Number of predictions fetched
+        """
+        payloads = {}
+        for home_code, away_code in matchups:
+            home_team, away_team = get_team(home_code), get_team(away_code)
+            if not home_team or not away_team:
+                continue
+            payload = self._prediction_payload(home_team, away_team)
+            key = PredictionCache.make_key(self.api_url, payload)
+            if key not in payloads and key not in self.prediction_cache:
+                payloads[key] = payload
+        
+        if not payloads:
+            return 0
+        
+        try:
+            response = self.client.post(
+                f"{self.api_url}/predict-games",
+                json=list(payloads.values()),
+                timeout=10.0
+            )
+            if response.status_code != 200:
+                if self.verbose:
+                    print(f"[ML] Batch prediction API returned {response.status_code}, fetching per game")
+                return 0
+            
+            for key, prediction in zip(payloads, response.json()):
+                self.prediction_cache.put(key, prediction)
+            
+            if self.verbose:
+                print(f"[ML] Prefetched {len(payloads)} pre-game predictions")
+            return len(payloads)
+            
+        except Exception as e:
+            if self.verbose:
+                print(f"[ML] Could not prefetch predictions: {e}")
+            return 0
+    
+    def _calculate_event_probability(self, ctx: GameContext, is_home: bool) -> float:
         """
         Calculate probability of home team having possession/event.
         Factors in team strength and home ice advantage.
         """
-        if not self.home_nhl_team or not self.away_nhl_team:
+        if not ctx.home_nhl_team or not ctx.away_nhl_team:
             # No team data - use default with home ice
             return 0.50 * self.home_ice_advantage if is_home else 0.50
         
         # Get team strengths (0-100)
-        home_strength = self.home_nhl_team.overall_strength
-        away_strength = self.away_nhl_team.overall_strength
+        home_strength = ctx.home_nhl_team.overall_strength
+        away_strength = ctx.away_nhl_team.overall_strength
         
         # Apply home ice advantage
         home_strength *= self.home_ice_advantage
@@ -423,7 +594,12 @@ class NHLSimulator:
         
         return home_prob if is_home else (1 - home_prob)
     
-    def _calculate_goal_probability_modifier(self, shooting_team: TeamState, defending_team: TeamState) -> float:
+    def _calculate_goal_probability_modifier(
+        self,
+        ctx: GameContext,
+        shooting_team: TeamState,
+        defending_team: TeamState
+    ) -> float:
         """
         Calculate goal probability modifier based on team strengths.
         Returns a multiplier (1.0 = average, >1.0 = better offense/worse defense).
@@ -431,14 +607,14 @@ class NHLSimulator:
         modifier = 1.0
         
         # Check if we have NHL team data
-        is_home_shooting = (shooting_team.code == self.home_nhl_team.code if self.home_nhl_team else True)
-        
-        if is_home_shooting and self.home_nhl_team:
-            shooting_nhl = self.home_nhl_team
-            defending_nhl = self.away_nhl_team
-        elif not is_home_shooting and self.away_nhl_team:
-            shooting_nhl = self.away_nhl_team
-            defending_nhl = self.home_nhl_team
+        is_home_shooting = (shooting_team.code == ctx.home_nhl_team.code if ctx.home_nhl_team else True)
+        
+        if is_home_shooting and ctx.home_nhl_team:
+            shooting_nhl = ctx.home_nhl_team
+            defending_nhl = ctx.away_nhl_team
+        elif not is_home_shooting and ctx.away_nhl_team:
+            shooting_nhl = ctx.away_nhl_team
+            defending_nhl = ctx.home_nhl_team
         else:
             return modifier  # No data, use default
         
@@ -454,21 +630,26 @@ class NHLSimulator:
         
         return modifier
     
-    def _calculate_ml_guided_goal_probability(self, shooting_team: TeamState, defending_team: TeamState) -> float:
+    def _calculate_ml_guided_goal_probability(
+        self,
+        ctx: GameContext,
+        shooting_team: TeamState,
+        defending_team: TeamState
+    ) -> float:
         """
         Calculate goal probability guided by ML predictions.
         This is the KEY innovation - simulation conforms to ML model expectations.
         """
         # If we have ML predictions, use them to set realistic probabilities
-        if self.ml_prediction:
+        if ctx.ml_prediction:
             # Determine which team is shooting
-            is_home_shooting = (shooting_team.code == self.home_nhl_team.code if self.home_nhl_team else True)
+            is_home_shooting = (shooting_team.code == ctx.home_nhl_team.code if ctx.home_nhl_team else True)
             
             # Get expected goals for this team
             if is_home_shooting:
-                expected_goals = self.ml_prediction['expected_goals_home']
+                expected_goals = ctx.ml_prediction['expected_goals_home']
             else:
-                expected_goals = self.ml_prediction['expected_goals_away']
+                expected_goals = ctx.ml_prediction['expected_goals_away']
             
             # Expected shots per game (roughly 30 per team)
             expected_shots = 30.0
@@ -485,50 +666,45 @@ class NHLSimulator:
         
         # Fallback to team strength if no ML prediction
         base_goal_prob = 0.12  # Increased from 0.10 for more scoring
-        strength_modifier = self._calculate_goal_probability_modifier(shooting_team, defending_team)
+        strength_modifier = self._calculate_goal_probability_modifier(ctx, shooting_team, defending_team)
         return base_goal_prob * strength_modifier
     
-    def _process_shot(self, game: GameState, shooting_team: TeamState, defending_team: TeamState):
+    def _process_shot(self, game: GameState, ctx: GameContext, shooting_team: TeamState, defending_team: TeamState):
         """Process a shot on goal with player attribution."""
         shooting_team.shots += 1
         shooting_team.shot_attempts += 1
         shooting_team.corsi_for += 1
         defending_team.corsi_against += 1
         
-        # Determine which NHL team is shooting
-        is_home_shooting = (shooting_team.code == self.home_nhl_team.code if self.home_nhl_team else True)
-        shooting_nhl_team = self.home_nhl_team if is_home_shooting else self.away_nhl_team
-        defending_nhl_team = self.away_nhl_team if is_home_shooting else self.home_nhl_team
+        m = ctx.matchup
+        side = HOME if shooting_team is game.home_team else AWAY
         
         # Select shooter and goalie
         is_pp = game.strength_situation in [StrengthSituation.PP_MAJOR, StrengthSituation.PP_MINOR]
-        shooter = self._select_shooter(shooting_nhl_team, is_power_play=is_pp) if shooting_nhl_team else None
-        goalie = self._get_starting_goalie(defending_nhl_team) if defending_nhl_team else None
-        shot_type = self._select_shot_type()
-        
-        # Goal probability - use ML prediction if available
-        base_goal_prob = self._calculate_ml_guided_goal_probability(shooting_team, defending_team)
-        
-        # Adjust for power play
-        if game.strength_situation == StrengthSituation.PP_MAJOR:
-            if game.active_penalties[0]['team'] != shooting_team.code:
-                base_goal_prob *= 1.8  # 80% boost on power play
+        shooters = m.shooters[side]
+        shooter = shooters.select_shooter(ctx.rng.random, is_pp) if shooters else None
+        goalie = m.goalies[1 - side]
+        shot_type = self._select_shot_type(ctx)
         
-        # Adjust for empty net
+        # Goal probability (ML-guided, compiled per game); empty net overrides
+        # everything, a major power play boosts the team not serving the penalty
         is_empty_net = defending_team.goalie_pulled
         if is_empty_net:
-            base_goal_prob = 0.35  # 35% on empty net (overrides other factors)
+            base_goal_prob = EMPTY_NET_GOAL_PROB
+        elif (game.strength_situation == StrengthSituation.PP_MAJOR
+                and game.oldest_penalty_team() != shooting_team.code):
+            base_goal_prob = m.power_play_goal_prob[side]
+        else:
+            base_goal_prob = m.goal_prob[side]
         
         # Check if goal
-        if random.random() < base_goal_prob:
+        if ctx.rng.random() < base_goal_prob:
             # GOAL! Select assists
             primary_assist = None
             secondary_assist = None
             
-            if shooting_nhl_team:
-                primary, secondary = self._select_assists(shooting_nhl_team, shooter)
-                primary_assist = primary
-                secondary_assist = secondary
+            if shooters:
+                primary_assist, secondary_assist = shooters.select_assists(ctx.rng.random, shooter)
             
             # Record goal with full attribution
             game.score_goal(
@@ -546,60 +722,24 @@ class NHLSimulator:
             
             # Update xG
             shooting_team.expected_goals += base_goal_prob
-            
-            if self.verbose:
-                mins = game.time_remaining // 60
-                secs = game.time_remaining % 60
-                goal_desc = f"[{game.period.value}P {mins:02d}:{secs:02d}] GOAL! "
-                if shooter:
-                    goal_desc += f"{shooter.name}"
-                    if primary_assist or secondary_assist:
-                        assists = []
-                        if primary_assist:
-                            assists.append(primary_assist.name)
-                        if secondary_assist:
-                            assists.append(secondary_assist.name)
-                        goal_desc += f" ({', '.join(assists)})"
-                else:
-                    goal_desc += f"{shooting_team.name}"
-                goal_desc += f"! ({game.home_team.score}-{game.away_team.score})"
-                if is_pp:
-                    goal_desc += " - PP"
-                if is_empty_net:
-                    goal_desc += " - EN"
-                print(goal_desc)
-            
-            if self.event_callback:
-                self.event_callback(game.events[-1])
-        else:
-            # Save
-            if self.verbose and random.random() < 0.15:  # Only print 15% of saves
-                mins = game.time_remaining // 60
-                secs = game.time_remaining % 60
-                save_desc = f"[{game.period.value}P {mins:02d}:{secs:02d}] "
-                if goalie:
-                    save_desc += f"Save by {goalie.name}"
-                else:
-                    save_desc += f"Save by {defending_team.name}"
-                print(save_desc)
-    
-    def _process_faceoff(self, game: GameState, team: TeamState, opponent: TeamState):
+        elif ctx.play_sink is not None:  # Save
+            ctx.play_sink.play(game, SAVE, defending_team.code, goalie.name if goalie else "")
+    
+    def _process_faceoff(self, game: GameState, ctx: GameContext, team: TeamState, opponent: TeamState):
         """Process a faceoff."""
-        if random.random() < 0.5:
+        if ctx.rng.random() < 0.5:
             team.faceoffs_won += 1
             opponent.faceoffs_lost += 1
         else:
             team.faceoffs_lost += 1
             opponent.faceoffs_won += 1
     
-    def _process_hit(self, game: GameState, team: TeamState):
+    def _process_hit(self, game: GameState, ctx: GameContext, team: TeamState):
         """Process a hit."""
         team.hits += 1
         
-        if self.verbose and random.random() < 0.1:  # Print 10% of hits
-            mins = game.time_remaining // 60
-            secs = game.time_remaining % 60
-            print(f"[{game.period.value}P {mins:02d}:{secs:02d}] Big hit by {team.name}!")
+        if ctx.play_sink is not None:
+            ctx.play_sink.play(game, HIT, team.code)
     
     def _process_blocked_shot(self, game: GameState, blocking_team: TeamState, shooting_team: TeamState):
         """Process a blocked shot."""
@@ -608,29 +748,13 @@ class NHLSimulator:
         shooting_team.corsi_for += 1
         blocking_team.corsi_against += 1
     
-    def _process_penalty(self, game: GameState, team: TeamState):
+    def _process_penalty(self, game: GameState, ctx: GameContext, team: TeamState):
         """Process a penalty."""
-        penalties = [
-            ("Tripping", 2),
-            ("Hooking", 2),
-            ("Slashing", 2),
-            ("High-sticking", 2),
-            ("Interference", 2),
-            ("Roughing", 2),
-            ("Cross-checking", 2),
-            ("Holding", 2),
-        ]
-        
-        penalty_name, minutes = random.choice(penalties)
+        penalty_name, minutes = ctx.rng.choice(PENALTIES)
         game.add_penalty(team.code, minutes, f"{penalty_name} - {minutes} minutes")
         
         opponent = game.away_team if team == game.home_team else game.home_team
         opponent.power_play_opportunities += 1
-        
-        if self.verbose:
-            mins = game.time_remaining // 60
-            secs = game.time_remaining % 60
-            print(f"[{game.period.value}P {mins:02d}:{secs:02d}] PENALTY: {team.name} - {penalty_name} ({minutes} min)")
     
     def _check_ai_decisions(self, game: GameState):
         """Check if AI should make any strategic decisions."""
@@ -642,7 +766,7 @@ class NHLSimulator:
         self._check_goalie_pull(game)
     
     def _check_goalie_pull(self, game: GameState):
-        """Query Intelligence Service for goalie pull decision."""
+        """Check both teams for a goalie pull decision."""
         # Only for regulation or OT
         if game.period not in [GamePeriod.THIRD, GamePeriod.OVERTIME]:
             return
@@ -652,105 +776,60 @@ class NHLSimulator:
             if self._should_pull_goalie(game, game.home_team, game.away_team):
                 game.home_team.goalie_pulled = True
                 game.add_event(EventType.GOALIE_PULL, game.home_team.code, f"{game.home_team.name} pulls goalie")
-                if self.verbose:
-                    mins = game.time_remaining // 60
-                    secs = game.time_remaining % 60
-                    print(f"\n[{game.period.value}P {mins:02d}:{secs:02d}] ** AI DECISION: {game.home_team.name} pulls goalie! **\n")
         
         # Check if away team should pull goalie
         if game.away_team.score < game.home_team.score and not game.away_team.goalie_pulled:
             if self._should_pull_goalie(game, game.away_team, game.home_team):
                 game.away_team.goalie_pulled = True
                 game.add_event(EventType.GOALIE_PULL, game.away_team.code, f"{game.away_team.name} pulls goalie")
-                if self.verbose:
-                    mins = game.time_remaining // 60
-                    secs = game.time_remaining % 60
-                    print(f"\n[{game.period.value}P {mins:02d}:{secs:02d}] ** AI DECISION: {game.away_team.name} pulls goalie! **\n")
     
     def _should_pull_goalie(self, game: GameState, trailing_team: TeamState, leading_team: TeamState) -> bool:
         """
-        Query Intelligence Service to decide if goalie should be pulled.
+        Ask the decision provider whether the trailing team should pull its goalie.
         
         This is where the "living game" magic happens!
         """
-        try:
-            response = self.client.post(
-                f"{self.api_url}/recommend-decision",
-                json={
-                    "game_state": game.to_dict(),
-                    "decision_type": "pull_goalie",
-                    "context": {
-                        "score_diff": trailing_team.score - leading_team.score,
-                        "time_remaining": game.time_remaining,
-                        "period": game.period.value
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                should_pull = data.get('recommendation') == 'pull_goalie'
-                confidence = data.get('confidence', 0)
-                
-                # Only pull if AI is confident
-                return should_pull and confidence > 0.5
-            
-        except Exception as e:
-            # Fallback to simple rule if API fails
-            if self.verbose:
-                print(f"[AI] API unavailable, using fallback logic: {e}")
-            pass
+        context = game.decision_context(trailing_team, self.decision_provider.recent_events)
+        data = self.decision_provider.recommend_decision('pull_goalie', context)
+        should_pull = data.get('recommendation') == 'pull_goalie'
+        confidence = data.get('confidence', 0)
         
-        # Fallback logic: pull goalie if down 1 with < 2 min left, or down 2+ with < 3 min
-        score_diff = abs(trailing_team.score - leading_team.score)
-        if score_diff == 1 and game.time_remaining < 120:
-            return True
-        if score_diff >= 2 and game.time_remaining < 180:
-            return True
-        
-        return False
+        # Only pull if AI is confident
+        return should_pull and confidence > MIN_CONFIDENCE
     
-    def _simulate_shootout(self, game: GameState):
+    def _simulate_shootout(self, game: GameState, ctx: GameContext):
         """Simulate a shootout."""
-        if self.verbose:
-            print("\n--- SHOOTOUT ---\n")
-        
+        sink = ctx.play_sink
         home_goals = 0
         away_goals = 0
         
         # 3 rounds minimum
         for round_num in range(1, 4):
             # Away team shoots first
-            if random.random() < 0.33:  # 33% shootout goal rate
-                away_goals += 1
-                if self.verbose:
-                    print(f"Round {round_num}: {game.away_team.name} SCORES!")
-            else:
-                if self.verbose:
-                    print(f"Round {round_num}: {game.away_team.name} - Save")
+            scored = ctx.rng.random() < 0.33  # 33% shootout goal rate
+            away_goals += scored
+            if sink is not None:
+                sink.play(game, SHOOTOUT_GOAL if scored else SHOOTOUT_MISS, game.away_team.code, f"Round {round_num}")
             
             # Home team shoots
-            if random.random() < 0.33:
-                home_goals += 1
-                if self.verbose:
-                    print(f"Round {round_num}: {game.home_team.name} SCORES!")
-            else:
-                if self.verbose:
-                    print(f"Round {round_num}: {game.home_team.name} - Save")
+            scored = ctx.rng.random() < 0.33
+            home_goals += scored
+            if sink is not None:
+                sink.play(game, SHOOTOUT_GOAL if scored else SHOOTOUT_MISS, game.home_team.code, f"Round {round_num}")
         
         # Sudden death if tied after 3
         round_num = 4
         while home_goals == away_goals:
-            if random.random() < 0.33:
+            if ctx.rng.random() < 0.33:
                 away_goals += 1
-                if self.verbose:
-                    print(f"Round {round_num}: {game.away_team.name} SCORES!")
+                if sink is not None:
+                    sink.play(game, SHOOTOUT_GOAL, game.away_team.code, f"Round {round_num}")
             
             if home_goals == away_goals:  # Still tied, home shoots
-                if random.random() < 0.33:
+                if ctx.rng.random() < 0.33:
                     home_goals += 1
-                    if self.verbose:
-                        print(f"Round {round_num}: {game.home_team.name} SCORES!")
+                    if sink is not None:
+                        sink.play(game, SHOOTOUT_GOAL, game.home_team.code, f"Round {round_num}")
             
             round_num += 1
         
@@ -761,35 +840,3 @@ class NHLSimulator:
             game.away_team.score += 1
         
         game._end_game()
-    
-    def _print_final_summary(self, game: GameState):
-        """Print final game summary."""
-        winner = game.get_winner()
-        
-        print(f"\n{'='*70}")
-        print(f"FINAL SCORE")
-        print(f"{'='*70}")
-        print(f"{game.away_team.name}: {game.away_team.score}")
-        print(f"{game.home_team.name}: {game.home_team.score}")
-        print(f"\nWinner: {winner.name}")
-        print(f"{'='*70}\n")
-        
-        # Stats
-        print("GAME STATS")
-        print(f"{'='*70}")
-        print(f"{'Stat':<25} {game.away_team.code:>10} {game.home_team.code:>10}")
-        print(f"{'-'*70}")
-        print(f"{'Shots':<25} {game.away_team.shots:>10} {game.home_team.shots:>10}")
-        print(f"{'Shot Attempts':<25} {game.away_team.shot_attempts:>10} {game.home_team.shot_attempts:>10}")
-        print(f"{'Hits':<25} {game.away_team.hits:>10} {game.home_team.hits:>10}")
-        print(f"{'Blocked Shots':<25} {game.away_team.blocked_shots:>10} {game.home_team.blocked_shots:>10}")
-        print(f"{'Faceoff Wins':<25} {game.away_team.faceoffs_won:>10} {game.home_team.faceoffs_won:>10}")
-        print(f"{'Penalties':<25} {game.away_team.penalties:>10} {game.home_team.penalties:>10}")
-        print(f"{'PP Goals/Opps':<25} {game.away_team.power_play_goals}/{game.away_team.power_play_opportunities:>9} {game.home_team.power_play_goals}/{game.home_team.power_play_opportunities:>9}")
-        print(f"{'Expected Goals':<25} {game.away_team.expected_goals:>10.2f} {game.home_team.expected_goals:>10.2f}")
-        print(f"{'='*70}\n")
-        
-        print(f"Total Events: {len(game.events)}")
-        print(f"Game Duration: {game.period.value} period(s)")
-        print()
-
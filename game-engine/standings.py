@@ -0,0 +1,290 @@
+"""
+NHL Standings
+
+League, conference and division standings kept in order as results are
+recorded, with head-to-head records alongside.
+
+Teams are ranked by the NHL tiebreakers: points, regulation wins, wins,
+points in head-to-head games among the tied teams, goal differential and
+goals for (team code last, so the order is total). Overtime and shootout
+wins are not told apart in a result, so there is no separate
+regulation-plus-overtime-wins step.
+
+A recorded game re-sorts only the slice of each table between the two
+teams' old and new places, and the tables are published as tuples, so
+reads during a running season are O(1). rank_order applies the same
+rules to many simulated seasons at once for the Monte Carlo driver.
+"""
+
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from nhl_data import NHL_TEAMS, NHLTeam
+
+
+# Table holding every team
+LEAGUE = "League"
+
+
+@dataclass
+class TeamRecord:
+    """Season record for a team."""
+    team_code: str
+    team_name: str
+    games_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    otl: int = 0  # Overtime/shootout losses
+    goals_for: int = 0
+    goals_against: int = 0
+    regulation_wins: int = 0
+
+    @property
+    def points(self) -> int:
+        """Calculate points (W=2, OTL=1)."""
+        return self.wins * 2 + self.otl
+
+    @property
+    def goal_differential(self) -> int:
+        """Goal differential."""
+        return self.goals_for - self.goals_against
+
+    @property
+    def points_percentage(self) -> float:
+        """Points percentage."""
+        max_points = self.games_played * 2
+        return (self.points / max_points * 100) if max_points > 0 else 0.0
+
+
+@dataclass
+class HeadToHead:
+    """A team's record against one opponent."""
+    games: int = 0
+    wins: int = 0
+    points: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "points": self.points,
+            "goals_for": self.goals_for,
+            "goals_against": self.goals_against
+        }
+
+
+class Standings:
+    """
+    Ordered standings over a set of team records.
+
+    Records are updated through record_game, which keeps the league,
+    conference and division tables and the head-to-head records current.
+    """
+
+    def __init__(self, records: Dict[str, TeamRecord], teams: Optional[Dict[str, NHLTeam]] = None):
+        """
+        Initialize standings and sort the current records.
+
+        Args:
+            records: Team records by code (updated in place by record_game)
+            teams: Team data for conference/division membership (default: NHL_TEAMS)
+        """
+        teams = teams if teams is not None else NHL_TEAMS
+        self.records = records
+        self._head_to_head: Dict[Tuple[str, str], HeadToHead] = {}
+
+        # Tables each team appears in, and the teams in each table
+        self._tables_of: Dict[str, Tuple[str, ...]] = {
+            code: (LEAGUE, teams[code].conference, teams[code].division) for code in records
+        }
+        members: Dict[str, List[str]] = {}
+        for code, tables in self._tables_of.items():
+            for table in tables:
+                members.setdefault(table, []).append(code)
+        self.conferences = sorted({teams[code].conference for code in records})
+        self.divisions = sorted({teams[code].division for code in records})
+
+        self._order: Dict[str, List[str]] = {}
+        self._keys: Dict[str, List[Tuple[int, int, int]]] = {}  # primary keys, aligned with _order
+        self._tables: Dict[str, Tuple[TeamRecord, ...]] = {}
+        self._ranks: Dict[str, Dict[str, int]] = {}
+        for table, codes in members.items():
+            self._order[table] = self._sorted(codes)
+            self._keys[table] = [self._primary_key(code) for code in self._order[table]]
+            self._ranks[table] = {}
+            self._publish(table, 0, len(codes))
+
+    def record_game(self, home_team: str, away_team: str, home_score: int, away_score: int, overtime: bool = False):
+        """
+        Apply a final score to both records, the head-to-head records and the tables.
+
+        Args:
+            home_team: Home team code
+            away_team: Away team code
+            home_score: Final score (the winner's includes a shootout goal)
+            away_score: Final score
+            overtime: Decided in overtime or a shootout
+        """
+        home, away = self.records[home_team], self.records[away_team]
+        old_keys = {home_team: self._primary_key(home_team), away_team: self._primary_key(away_team)}
+
+        home.games_played += 1
+        away.games_played += 1
+        home.goals_for += home_score
+        home.goals_against += away_score
+        away.goals_for += away_score
+        away.goals_against += home_score
+
+        winner, loser = (home, away) if home_score > away_score else (away, home)
+        winner.wins += 1
+        if overtime:
+            loser.otl += 1
+        else:
+            loser.losses += 1
+            winner.regulation_wins += 1
+
+        for team, opponent, goals_for, goals_against in (
+            (home_team, away_team, home_score, away_score),
+            (away_team, home_team, away_score, home_score),
+        ):
+            h2h = self._head_to_head.get((team, opponent))
+            if h2h is None:
+                h2h = self._head_to_head[(team, opponent)] = HeadToHead()
+            won = goals_for > goals_against
+            h2h.games += 1
+            h2h.wins += won
+            h2h.points += 2 if won else int(overtime)
+            h2h.goals_for += goals_for
+            h2h.goals_against += goals_against
+
+        for table in set(self._tables_of[home_team] + self._tables_of[away_team]):
+            moved = [code for code in old_keys if table in self._tables_of[code]]
+            self._reorder(table, moved, old_keys)
+
+    def league(self) -> Tuple[TeamRecord, ...]:
+        """All teams, best first."""
+        return self._tables[LEAGUE]
+
+    def conference(self, conference: str) -> Tuple[TeamRecord, ...]:
+        """Teams in a conference, best first (empty for an unknown conference)."""
+        return self._tables[conference] if conference in self.conferences else ()
+
+    def division(self, division: str) -> Tuple[TeamRecord, ...]:
+        """Teams in a division, best first (empty for an unknown division)."""
+        return self._tables[division] if division in self.divisions else ()
+
+    def rank(self, team_code: str, table: str = LEAGUE) -> int:
+        """1-based place of a team in the league or in a conference/division table."""
+        return self._ranks[table][team_code]
+
+    def head_to_head(self, team_code: str, opponent: str) -> HeadToHead:
+        """A team's record against one opponent (all zeros if they have not met)."""
+        return self._head_to_head.get((team_code, opponent)) or HeadToHead()
+
+    def head_to_head_points(self) -> Dict[Tuple[str, str], int]:
+        """Points each team has taken from each opponent, by (team, opponent)."""
+        return {pair: h2h.points for pair, h2h in self._head_to_head.items()}
+
+    def playoff_teams(self, spots: int = 8) -> Dict[str, List[TeamRecord]]:
+        """Top `spots` teams of each conference."""
+        return {conference: list(self._tables[conference][:spots]) for conference in self.conferences}
+
+    def _primary_key(self, code: str) -> Tuple[int, int, int]:
+        """Tiebreakers that depend on the team alone: (points, regulation wins, wins)."""
+        record = self.records[code]
+        return (record.points, record.regulation_wins, record.wins)
+
+    def _sorted(self, codes: Iterable[str]) -> List[str]:
+        """Fully order teams with the tiebreakers."""
+        ordered: List[str] = []
+        for _, block in groupby(sorted(codes, key=self._primary_key, reverse=True), key=self._primary_key):
+            block = list(block)
+            ordered.extend(self._break_tie(block) if len(block) > 1 else block)
+        return ordered
+
+    def _break_tie(self, tied: List[str]) -> List[str]:
+        """Order teams level on points, regulation wins and wins."""
+        h2h_points = {
+            code: sum(self._head_to_head[(code, other)].points for other in tied
+                      if (code, other) in self._head_to_head)
+            for code in tied
+        }
+        records = self.records
+        return sorted(
+            sorted(tied),
+            key=lambda code: (h2h_points[code], records[code].goal_differential, records[code].goals_for),
+            reverse=True
+        )
+
+    def _reorder(self, table: str, moved: List[str], old_keys: Dict[str, Tuple[int, int, int]]):
+        """
+        Re-sort the slice of a table the moved teams can affect.
+
+        Keys only go up, so teams above the best new key and below the
+        worst old key keep their places; everything between (whole tie
+        blocks included) is re-sorted.
+        """
+        order, keys = self._order[table], self._keys[table]
+        top = max(self._primary_key(code) for code in moved)
+        bottom = min(old_keys[code] for code in moved)
+
+        start = 0
+        while keys[start] > top:
+            start += 1
+        end = len(keys)
+        while keys[end - 1] < bottom:
+            end -= 1
+
+        order[start:end] = self._sorted(order[start:end])
+        keys[start:end] = [self._primary_key(code) for code in order[start:end]]
+        self._publish(table, start, end)
+
+    def _publish(self, table: str, start: int, end: int):
+        """Refresh the published tuple and the ranks of places start..end-1."""
+        order = self._order[table]
+        self._tables[table] = tuple(self.records[code] for code in order)
+        ranks = self._ranks[table]
+        for place in range(start, end):
+            ranks[order[place]] = place + 1
+
+
+def rank_order(
+    members: np.ndarray,
+    codes: List[str],
+    points: np.ndarray,
+    regulation_wins: np.ndarray,
+    wins: np.ndarray,
+    goal_diff: np.ndarray,
+    goals_for: np.ndarray,
+    h2h_points: np.ndarray
+) -> np.ndarray:
+    """
+    Order a table in many simulated seasons at once, with the Standings tiebreakers.
+
+    Args:
+        members: Team indices in the table
+        codes: Team code for each index
+        points, regulation_wins, wins, goal_diff, goals_for: (seasons, teams) totals
+        h2h_points: (seasons, teams, teams) points team i took from team j
+
+    Returns:
+        (seasons, len(members)) team indices, best first
+    """
+    p, rw, w = points[:, members], regulation_wins[:, members], wins[:, members]
+
+    # Head-to-head points against the other teams level on the primary key
+    level = (p[:, :, None] == p[:, None, :]) & (rw[:, :, None] == rw[:, None, :]) & (w[:, :, None] == w[:, None, :])
+    h2h = (h2h_points[:, members][:, :, members] * level).sum(axis=2)  # i vs i is always 0
+
+    code_order = np.argsort(np.argsort([codes[i] for i in members]))
+    keys = (
+        np.broadcast_to(code_order, p.shape), -goals_for[:, members], -goal_diff[:, members],
+        -h2h, -w, -rw, -p
+    )
+    return members[np.lexsort(keys, axis=-1)]
@@ -0,0 +1,141 @@
+"""
+Test Batch Monte Carlo Simulation
+
+Checks that simulate_many matches repeated simulate_game calls and
+that it runs fast enough for 10k-replication matchup pricing.
+"""
+
+import sys
+import io
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator
+from batch_simulator import BatchSimulator
+from game_state import GameSnapshot
+from nhl_loader import load_all_teams
+
+
+def test_batch_matches_scalar():
+    """Batch results should be statistically equivalent to the scalar engine."""
+    print("=" * 70)
+    print("BATCH vs SCALAR: MTL @ TOR")
+    print("=" * 70)
+
+    load_all_teams()
+    sim = NHLSimulator(verbose=False)
+
+    batch = sim.simulate_many("TOR", "MTL", n=20000, seed=7)
+
+    games = 1000
+    home_wins = home_goals = away_goals = 0
+    for _ in range(games):
+        game = sim.simulate_game("MTL", "TOR")
+        home_wins += game.home_team.score > game.away_team.score
+        home_goals += game.home_team.score
+        away_goals += game.away_team.score
+
+    print(f"{'':<20}{'Batch':>10}{'Scalar':>10}")
+    print(f"{'Home win %':<20}{batch.home_win_prob:>10.3f}{home_wins / games:>10.3f}")
+    print(f"{'Home goals/game':<20}{batch.avg_home_goals:>10.2f}{home_goals / games:>10.2f}")
+    print(f"{'Away goals/game':<20}{batch.avg_away_goals:>10.2f}{away_goals / games:>10.2f}")
+
+    # ~4 standard errors of the 1000-game scalar sample
+    assert abs(batch.home_win_prob - home_wins / games) < 0.06
+    assert abs(batch.avg_home_goals - home_goals / games) < 0.25
+    assert abs(batch.avg_away_goals - away_goals / games) < 0.25
+
+    total = batch.regulation_games + batch.overtime_games + batch.shootout_games
+    assert total == batch.games == batch.home_wins + batch.away_wins
+    assert abs(sum(batch.score_distribution().values()) - 1.0) < 1e-9
+
+    scorer_goals = sum(batch.player_goals.values())
+    assert scorer_goals <= batch.home_goals_total + batch.away_goals_total
+    print("\n✅ Batch engine matches scalar engine")
+    return True
+
+
+def test_vectorized_matches_scalar():
+    """The NumPy lockstep engine should agree with the scalar batch loop."""
+    print("\n" + "=" * 70)
+    print("VECTORIZED vs SCALAR BATCH ENGINE: BOS @ FLA")
+    print("=" * 70)
+
+    load_all_teams()
+    batch = BatchSimulator(NHLSimulator(verbose=False))
+
+    vec = batch.simulate_matchup("FLA", "BOS", n=40000, seed=11, vectorized=True)
+    ref = batch.simulate_matchup("FLA", "BOS", n=10000, seed=11, vectorized=False)
+
+    rows = [
+        ("Home win %", vec.home_win_prob, ref.home_win_prob, 0.02),
+        ("OT %", vec.overtime_prob, ref.overtime_prob, 0.012),
+        ("Shootout %", vec.shootout_prob, ref.shootout_prob, 0.015),
+        ("Home goals/game", vec.avg_home_goals, ref.avg_home_goals, 0.08),
+        ("Away goals/game", vec.avg_away_goals, ref.avg_away_goals, 0.08),
+        ("Home shots/game", vec.avg_home_shots, ref.avg_home_shots, 0.3),
+        ("Away shots/game", vec.avg_away_shots, ref.avg_away_shots, 0.3),
+    ]
+    print(f"{'':<20}{'NumPy':>10}{'Scalar':>10}")
+    for label, a, b, tolerance in rows:
+        print(f"{label:<20}{a:>10.3f}{b:>10.3f}")
+        assert abs(a - b) < tolerance, f"{label}: {a:.3f} vs {b:.3f}"
+
+    # Per-player goal rates for the top scorer should line up too
+    top_id = ref.player_goals.most_common(1)[0][0]
+    assert abs(vec.goal_rates()[top_id] - ref.goal_rates()[top_id]) < 0.03
+
+    print("\n✅ Vectorized engine matches scalar engine")
+    return True
+
+
+def test_stacked_penalties_match():
+    """Both engines queue stacked penalties the same way when continuing a game."""
+    load_all_teams()
+    batch = BatchSimulator(NHLSimulator(verbose=False))
+    start = GameSnapshot(
+        home_team="TOR", away_team="MTL", period=2, time_remaining=300,
+        score=(1, 1), shots=(12, 12), goalie_pulled=(False, False),
+        penalties=((0, 40), (1, 60), (0, 100)), queued_penalties=((0, 120), (0, 120), (1, 120))
+    )
+
+    vec = batch.simulate_from(start, n=40000, seed=5, vectorized=True)
+    ref = batch.simulate_from(start, n=10000, seed=5, vectorized=False)
+    for label, a, b, tolerance in (
+        ("Home win %", vec.home_win_prob, ref.home_win_prob, 0.02),
+        ("Home goals/game", vec.avg_home_goals, ref.avg_home_goals, 0.06),
+        ("Away goals/game", vec.avg_away_goals, ref.avg_away_goals, 0.06),
+    ):
+        assert abs(a - b) < tolerance, f"{label}: {a:.3f} vs {b:.3f}"
+    print(f"✅ Stacked penalties: NumPy {vec.home_win_prob:.3f} vs scalar {ref.home_win_prob:.3f} home win")
+    return True
+
+
+def test_batch_speed():
+    """10k replications of one matchup should run well under a second."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False)
+
+    start = time.perf_counter()
+    summary = sim.simulate_many("EDM", "COL", n=10000)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n10,000 replications in {elapsed:.2f}s")
+    assert elapsed < 1.0
+    print(f"EDM win: {summary.home_win_prob:.1%}  OT: {summary.overtime_prob:.1%}  SO: {summary.shootout_prob:.1%}")
+    top = summary.to_dict(top_players=3)["player_goal_rates"]
+    for player in top:
+        print(f"  {player['player_name']:<25} {player['goals_per_game']:.3f} goals/game")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (test_batch_matches_scalar() and test_vectorized_matches_scalar()
+          and test_stacked_penalties_match() and test_batch_speed())
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,152 @@
+"""
+Test Bracket Monte Carlo
+
+Checks that brackets clone and reset cleanly, that the Monte Carlo agrees
+with the exact advancement odds for the same per-game probabilities, that
+a run gives the same odds in one process or across a pool, and that
+series already decided or in progress (with or without game logs) count
+as they stand.
+"""
+
+import sys
+import io
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bracket_monte_carlo import BracketMonteCarlo
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+from playoff_simulator import PlayoffSimulator, Round, SeriesStatus
+
+
+def _playoffs(seed: int) -> PlayoffSimulator:
+    load_all_teams()
+    standings = [
+        {"team_code": code, "team_name": team.full_name, "points": 100 - i,
+         "goal_differential": 0, "conference": team.conference}
+        for i, (code, team) in enumerate(sorted(NHL_TEAMS.items()))
+    ]
+    playoffs = PlayoffSimulator(verbose=False, seed=seed)
+    playoffs.generate_bracket(standings)
+    return playoffs
+
+
+def _strength_win_prob(home: str, away: str) -> float:
+    """Per-game home win probability from team strength (a fast stand-in input)."""
+    diff = NHL_TEAMS[home].overall_strength - NHL_TEAMS[away].overall_strength
+    return min(0.85, max(0.15, 0.54 + diff / 60))
+
+
+def test_clone_and_reset():
+    """Clones are independent and reset returns to the unplayed first round."""
+    playoffs = _playoffs(seed=3)
+    fresh = playoffs.bracket.clone()
+    playoffs.simulate_playoffs()
+    played = playoffs.bracket
+
+    assert played.champion and len(played.get_all_series()) == 15
+    assert fresh.champion is None and len(fresh.get_all_series()) == 8
+    assert all(s.status == SeriesStatus.NOT_STARTED and not s.games for s in fresh.get_all_series())
+
+    copy = played.clone()
+    assert copy.to_dict() == played.to_dict()
+    copy.reset()
+    assert copy.to_dict() == fresh.to_dict()
+    assert played.champion and len(played.get_all_series()) == 15
+    print("✅ Brackets clone independently and reset to the first round")
+    return True
+
+
+def test_matches_exact_odds():
+    """Monte Carlo with the same per-game probabilities matches advancement_odds."""
+    playoffs = _playoffs(seed=11)
+    exact = {o.team_code: o for o in playoffs.advancement_odds(_strength_win_prob)}
+
+    brackets = 20000
+    started = time.perf_counter()
+    odds = BracketMonteCarlo(playoffs, win_prob=_strength_win_prob).run(brackets, seed=7)
+    elapsed = time.perf_counter() - started
+
+    assert len(odds) == 16
+    assert abs(sum(o.cup_prob for o in odds) - 1) < 1e-9
+    for o in odds:
+        e = exact[o.team_code]
+        assert (o.conference, o.seed) == (e.conference, e.seed)
+        for attr in ("second_round_prob", "conference_finals_prob", "cup_finals_prob", "cup_prob"):
+            assert abs(getattr(o, attr) - getattr(e, attr)) < 0.015
+    print(f"✅ {brackets:,} brackets in {elapsed:.1f}s match the exact odds")
+    return True
+
+
+def test_pool_matches_serial():
+    """The same seed gives the same odds in one process or across a pool."""
+    playoffs = _playoffs(seed=5)
+    monte_carlo = BracketMonteCarlo(playoffs)
+
+    progress = []
+    serial = monte_carlo.run(600, seed=2, progress_callback=lambda done, total: progress.append(done))
+    pooled = monte_carlo.run(600, seed=2, workers=2)
+    assert [o.to_dict() for o in serial] == [o.to_dict() for o in pooled]
+    assert progress[-1] == 600
+
+    assert abs(sum(o.second_round_prob for o in serial) - 8) < 1e-9
+    assert abs(sum(o.cup_finals_prob for o in serial) - 2) < 1e-9
+    assert all(o.second_round_prob >= o.conference_finals_prob >= o.cup_finals_prob >= o.cup_prob for o in serial)
+    print(f"✅ Serial and 2-worker runs agree ({serial[0].team_code} Cup {serial[0].cup_prob:.3f})")
+    return True
+
+
+def test_played_series_stand():
+    """Decided series count as they stand and the simulator's bracket is untouched."""
+    playoffs = _playoffs(seed=9)
+    playoffs.simulate_round(Round.FIRST_ROUND)
+    before = playoffs.bracket.to_dict()
+
+    odds = {o.team_code: o for o in BracketMonteCarlo(playoffs, win_prob=_strength_win_prob).run(1000, seed=4)}
+    assert playoffs.bracket.to_dict() == before
+    for series in playoffs.bracket.get_all_series():
+        if series.round == Round.FIRST_ROUND:
+            loser = series.lower_seed if series.winner == series.higher_seed else series.higher_seed
+            assert odds[series.winner].second_round_prob == 1.0
+            assert odds[loser].second_round_prob == 0.0 and odds[loser].cup_prob == 0.0
+    print("✅ Decided series count as they stand")
+    return True
+
+
+def test_loaded_scores_without_logs():
+    """A bracket loaded with series scores but no game logs plays on from those scores."""
+    playoffs = _playoffs(seed=13)
+    data = playoffs.bracket.to_dict()
+    for series in data["eastern_conference"] + data["western_conference"]:
+        del series["games"]
+    data["eastern_conference"][0]["lower_seed_wins"] = 3
+
+    loaded = PlayoffSimulator(verbose=False, seed=13)
+    loaded.load_bracket(data)
+    even = lambda home, away: 0.5
+    exact = {o.team_code: o for o in loaded.advancement_odds(even)}
+    odds = BracketMonteCarlo(loaded, win_prob=even).run(4000, seed=1)
+
+    underdog = loaded.bracket.eastern_conference[0].lower_seed
+    assert exact[underdog].second_round_prob == 0.9375
+    assert loaded.bracket.eastern_conference[0].lower_seed_wins == 3
+    for o in odds:
+        e = exact[o.team_code]
+        for attr in ("second_round_prob", "conference_finals_prob", "cup_finals_prob", "cup_prob"):
+            assert abs(getattr(o, attr) - getattr(e, attr)) < 0.03, (o.team_code, attr)
+    print(f"✅ Loaded scores without game logs stand ({underdog} round 2 "
+          f"{next(o for o in odds if o.team_code == underdog).second_round_prob:.3f})")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (test_clone_and_reset() and test_matches_exact_odds()
+          and test_pool_matches_serial() and test_played_series_stand()
+          and test_loaded_scores_without_logs())
+    sys.exit(0 if ok else 1)
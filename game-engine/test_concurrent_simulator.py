@@ -0,0 +1,86 @@
+"""
+Test Concurrent Simulation
+
+Stress test for a single shared NHLSimulator: many threads play different
+matchups at once, and every game must match the same seed played alone.
+"""
+
+import sys
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+
+
+def _fingerprint(game):
+    """Everything matchup-dependent in a finished game (no wall-clock fields)."""
+    state = game.to_dict()
+    state.pop("game_id")
+    events = [(e.event_type, e.period, e.time_remaining, e.team, e.description) for e in game.events]
+    return state, events
+
+
+def test_shared_simulator_threads():
+    """Concurrent games on one instance equal the same games played serially."""
+    load_all_teams()
+    codes = sorted(NHL_TEAMS)
+    picker = random.Random(42)
+    jobs = []
+    for seed in range(400):
+        home, away = picker.sample(codes, 2)
+        jobs.append((seed, home, away, seed % 3 == 0))
+
+    def play(simulator, job):
+        seed, home, away, results_only = job
+        if results_only:
+            return simulator.simulate_result(home, away, seed=seed).to_dict()
+        return _fingerprint(simulator.simulate_game(away, home, seed=seed))
+
+    serial = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9")
+    expected = [play(serial, job) for job in jobs]
+
+    shared = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9")
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        actual = list(pool.map(lambda job: play(shared, job), jobs))
+
+    mismatches = [job for job, a, b in zip(jobs, actual, expected) if a != b]
+    assert not mismatches, f"{len(mismatches)} games differ, e.g. {mismatches[0]}"
+    print(f"✅ {len(jobs)} games on 16 threads match serial replays")
+    return True
+
+
+def test_event_callback_per_game():
+    """Callbacks from concurrent games only ever see their own game's events."""
+    load_all_teams()
+    seen = {}
+
+    def on_event(event):
+        seen.setdefault(event.team, set()).add(event.event_type)
+
+    simulator = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9", event_callback=on_event)
+    matchups = [("TOR", "MTL"), ("EDM", "CGY"), ("NYR", "NYI"), ("BOS", "FLA")]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        games = list(pool.map(lambda m: simulator.simulate_game(m[1], m[0], seed=7), matchups))
+
+    for (home, away), game in zip(matchups, games):
+        assert (game.home_team.code, game.away_team.code) == (home, away)
+        scorers = {g["team"] for g in game.goals}
+        assert scorers <= {home, away}
+    assert set(seen) <= {code for pair in matchups for code in pair}
+    print("✅ Concurrent games keep their own teams and events")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_shared_simulator_threads() and test_event_callback_per_game()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,123 @@
+"""
+Test Decision Providers
+
+Checks the in-process goalie pull rule against the Intelligence Service
+heuristic, and that simulations make no decision round trips unless a
+remote provider is passed in.
+"""
+
+import sys
+import io
+import json
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator
+from decision_provider import DecisionProvider, LocalDecisionProvider, RemoteDecisionProvider
+from game_state import GameState, TeamState, GamePeriod
+from nhl_loader import load_all_teams
+
+
+def test_local_matches_service_rule():
+    """Local provider should agree with PuckcastClient._recommend_pull_goalie."""
+    provider = LocalDecisionProvider()
+    game = GameState(
+        game_id="test",
+        home_team=TeamState(code="TOR", name="Toronto"),
+        away_team=TeamState(code="MTL", name="Montreal"),
+        period=GamePeriod.THIRD
+    )
+
+    for home_score in range(5):
+        for away_score in range(5):
+            for clock in range(0, 301, 5):
+                game.home_team.score, game.away_team.score = home_score, away_score
+                game.time_remaining = clock
+                result = provider.recommend_decision('pull_goalie', game.decision_context(game.away_team))
+
+                # Service heuristic, from the deciding team's side and in minutes
+                score_diff = away_score - home_score
+                minutes = clock / 60
+                should_pull = score_diff in [-1, -2] and minutes < 2.0
+                confidence = 0.9 if abs(score_diff) == 1 and minutes < 1.5 else 0.6
+
+                assert result['recommendation'] == ('pull_goalie' if should_pull else 'keep_goalie')
+                assert result['confidence'] == confidence
+
+    print("✅ Local provider matches the service heuristic")
+    return True
+
+
+def test_no_remote_calls_by_default():
+    """Default simulator decides in-process; a remote provider is opt-in."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False)
+    assert isinstance(sim.decision_provider, LocalDecisionProvider)
+
+    posted = []
+    original_post = sim.client.post
+    sim.client.post = lambda url, **kwargs: posted.append(url) or original_post(url, **kwargs)
+
+    pulls = 0
+    for seed in range(50):
+        game = sim.simulate_game("MTL", "TOR", seed=seed)
+        pulls += sum(1 for e in game.events if e.event_type.value == "goalie_pull")
+
+    assert not any(url.endswith("/recommend-decision") for url in posted)
+    assert pulls > 0
+
+    # Unreachable service falls back to the local rule
+    remote = RemoteDecisionProvider(api_url="http://127.0.0.1:9", timeout=0.2)
+    game = GameState(
+        game_id="test",
+        home_team=TeamState(code="TOR", name="Toronto", score=1),
+        away_team=TeamState(code="MTL", name="Montreal"),
+        period=GamePeriod.THIRD,
+        time_remaining=60
+    )
+    result = remote.recommend_decision('pull_goalie', game.decision_context(game.away_team))
+    assert result['recommendation'] == 'pull_goalie'
+    remote.close()
+
+    # A provider that doesn't implement recommend_decision can't be built
+    class Incomplete(DecisionProvider):
+        pass
+    for cls in (DecisionProvider, Incomplete):
+        try:
+            cls()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f"{cls.__name__} instantiated without recommend_decision")
+
+    print(f"✅ No decision round trips in 50 games ({pulls} goalie pulls)")
+    return True
+
+
+def test_context_size_is_fixed():
+    """Decision context payload shouldn't grow with the game."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False)
+    game = sim.simulate_game("BOS", "FLA", seed=3)
+
+    full = len(json.dumps(game.to_dict()))
+    compact = len(json.dumps(game.decision_context(game.home_team).to_dict()))
+    windowed = game.decision_context(game.away_team, recent_events=10)
+
+    assert compact < 300
+    assert len(windowed.recent_events) == 10
+    assert windowed.recent_events[-1]["event_type"] == game.events[-1].event_type.value
+    assert "timestamp" not in windowed.recent_events[0]
+
+    print(f"✅ Decision payload {compact} bytes vs {full} bytes for the full game state")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_local_matches_service_rule() and test_no_remote_calls_by_default() and test_context_size_is_fixed()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,67 @@
+"""
+Test Event and Tick Hooks
+
+Checks that the event callback sees every logged event in order, that
+per-call callbacks override the simulator's default, and that the tick
+callback covers the whole game clock (the hook live pacing is built on).
+"""
+
+import sys
+import io
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator, realtime_pacer
+from game_state import EventType, GamePeriod
+from nhl_loader import load_all_teams
+
+
+def test_callback_sees_every_event():
+    """Every logged event reaches the callback, in log order."""
+    load_all_teams()
+    default_seen, call_seen = [], []
+    simulator = NHLSimulator(verbose=False, event_callback=default_seen.append)
+
+    game = simulator.simulate_game("MTL", "TOR", seed=21)
+    assert [e.to_dict() for e in default_seen] == [e.to_dict() for e in game.events]
+    assert default_seen[0].event_type == EventType.PERIOD_START
+    assert default_seen[-1].event_type == EventType.GAME_END
+
+    default_seen.clear()
+    game = simulator.simulate_game("MTL", "TOR", seed=21, event_callback=call_seen.append)
+    assert not default_seen and len(call_seen) == game.event_count
+
+    simulator.simulate_result("TOR", "MTL", seed=21)
+    assert not default_seen  # results-only games log nothing
+    print(f"✅ Callback received all {game.event_count} events")
+    return True
+
+
+def test_ticks_cover_clock():
+    """Ticks add up to the game clock played; pacing waits seconds / speed."""
+    load_all_teams()
+    simulator = NHLSimulator(verbose=False)
+    for seed in range(30):
+        ticks = []
+        game = simulator.simulate_game("MTL", "TOR", seed=seed, tick_callback=lambda g, s: ticks.append(s))
+        regulation = 3 * 1200
+        if game.period == GamePeriod.THIRD:
+            assert sum(ticks) >= regulation and sum(ticks) < regulation + 60 * 3
+        assert all(10 <= s <= 60 for s in ticks)
+
+    waits = []
+    pace = realtime_pacer(60.0, wait=waits.append)
+    pace(None, 30)
+    assert waits == [0.5]
+    print("✅ Tick callback covers the clock; pacer scales by speed")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_callback_sees_every_event() and test_ticks_cover_clock()
+    sys.exit(0 if ok else 1)
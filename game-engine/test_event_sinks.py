@@ -0,0 +1,95 @@
+"""
+Test Event Sinks
+
+Checks that a seed plays the same game whatever sink is attached, and
+that the console and JSONL sinks render the whole game.
+"""
+
+import sys
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from event_sinks import ConsoleEventSink, JsonlEventSink, NullEventSink, _BufferedSink
+from game_state import EventType
+from nhl_loader import load_all_teams
+from simulator import NHLSimulator
+
+SEEDS = range(12)
+
+
+def _play(simulator: NHLSimulator):
+    games = [simulator.simulate_game("MTL", "TOR", seed=seed) for seed in SEEDS]
+    # Everything but the wall-clock game ids and timestamps
+    return [({**g.to_dict(), "game_id": None}, [{**e.to_dict(), "timestamp": None} for e in g.events])
+            for g in games]
+
+
+def test_sinks_dont_change_results():
+    """Same seeds, same games with no sink, a null sink, console or JSONL."""
+    load_all_teams()
+    baseline = _play(NHLSimulator(verbose=False))
+
+    console = ConsoleEventSink(stream=io.StringIO())
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = JsonlEventSink(os.path.join(tmp, "games.jsonl"))
+        for sink in (NullEventSink(), console, jsonl):
+            assert _play(NHLSimulator(verbose=False, sink=sink)) == baseline
+        jsonl.close()
+    assert _play(NHLSimulator(verbose=True, sink=ConsoleEventSink(stream=io.StringIO()))) == baseline
+    print(f"✅ {len(SEEDS)} seeded games identical across sinks")
+    return True
+
+
+def test_console_sink():
+    """Console sink renders the preview, periods, goals and final summary."""
+    load_all_teams()
+    out = io.StringIO()
+    game = NHLSimulator(sink=ConsoleEventSink(stream=out, buffer_size=1000)).simulate_game("MTL", "TOR", seed=3)
+    text = out.getvalue()
+    assert "SIMULATING: Montreal Canadiens @ Toronto Maple Leafs" in text
+    assert "--- Period 1 ---" in text and "FINAL SCORE" in text
+    assert text.count(" GOAL! ") == sum(e.event_type == EventType.GOAL for e in game.events)
+    print(f"✅ Console sink rendered {len(text.splitlines())} lines")
+    return True
+
+
+def test_jsonl_sink():
+    """JSONL sink writes one record per event and play, bracketed by start and end."""
+    load_all_teams()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.jsonl")
+        sink = JsonlEventSink(path, buffer_size=8)
+        game = NHLSimulator(verbose=False, sink=sink).simulate_game("MTL", "TOR", seed=5)
+        sink.close()
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+
+    assert records[0]["type"] == "game_start" and records[-1]["type"] == "game_end"
+    assert records[-1]["home_team"]["score"] == game.home_team.score
+    events = [r for r in records if r["type"] == "event"]
+    plays = [r for r in records if r["type"] == "play"]
+    assert len(events) == game.event_count and plays
+    assert all(r["game_id"] == game.game_id for r in events + plays)
+
+    try:
+        _BufferedSink(8)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("buffered sink instantiated without _write")
+    print(f"✅ JSONL sink wrote {len(events)} events and {len(plays)} plays")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_sinks_dont_change_results() and test_console_sink() and test_jsonl_sink()
+    sys.exit(0 if ok else 1)
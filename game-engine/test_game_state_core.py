@@ -0,0 +1,155 @@
+"""
+Test Compact GameState Core
+
+Checks that the integer-coded event log and fixed penalty slots produce
+the same views as the old list-of-dataclasses state, that the strength
+lookup table matches the skater-count rules, and reports the memory the
+compact log saves over materialized events.
+"""
+
+import sys
+import io
+import tracemalloc
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from game_state import (
+    GameState, TeamState, EventType, StrengthSituation, STRENGTH_TABLE,
+    MAX_ACTIVE_PENALTIES, AWAY_SIDE
+)
+from nhl_loader import load_all_teams
+from simulator import NHLSimulator
+
+
+def _new_game() -> GameState:
+    return GameState(
+        game_id="TST",
+        home_team=TeamState(code="TOR", name="Toronto Maple Leafs"),
+        away_team=TeamState(code="MTL", name="Montreal Canadiens")
+    )
+
+
+def test_strength_table():
+    """Lookup table agrees with the skater-count rules."""
+    expected = {
+        (5, 5): StrengthSituation.EVEN,
+        (5, 4): StrengthSituation.PP_MAJOR,
+        (4, 5): StrengthSituation.SH_MAJOR,
+        (4, 4): StrengthSituation.FOUR_ON_FOUR,
+        (3, 3): StrengthSituation.THREE_ON_THREE,
+    }
+    for hp in range(MAX_ACTIVE_PENALTIES + 1):
+        for ap in range(MAX_ACTIVE_PENALTIES + 1):
+            for h_pull in (0, 1):
+                for a_pull in (0, 1):
+                    skaters = (5 - hp + h_pull, 5 - ap + a_pull)
+                    assert STRENGTH_TABLE[hp][ap][h_pull][a_pull] == expected.get(skaters, StrengthSituation.EVEN)
+    print("✅ Strength table matches skater-count rules")
+    return True
+
+
+def test_penalty_slots():
+    """Penalties expire in order and drive the strength situation."""
+    game = _new_game()
+    game.add_penalty("MTL", 2, "Tripping")
+    assert game.strength_situation == StrengthSituation.PP_MAJOR
+    game.advance_time(30)
+    game.add_penalty("TOR", 2, "Hooking")
+    assert game.strength_situation == StrengthSituation.FOUR_ON_FOUR
+    assert game.oldest_penalty_team() == "MTL"
+    assert game.active_penalties == [
+        {'team': "MTL", 'time_remaining': 90, 'description': "Tripping"},
+        {'team': "TOR", 'time_remaining': 120, 'description': "Hooking"},
+    ]
+
+    game.advance_time(90)  # MTL penalty expires exactly
+    assert game.oldest_penalty_team() == "TOR"
+    assert game.strength_situation == StrengthSituation.SH_MAJOR
+
+    game.advance_time(30)
+    assert game.active_penalties == [] and game.oldest_penalty_team() is None
+    assert game.strength_situation == StrengthSituation.EVEN
+    assert game.away_team.penalty_minutes == 2 and game.home_team.penalties == 1
+    print("✅ Penalty slots expire in order and update strength")
+    return True
+
+
+def test_stacked_penalties():
+    """A third penalty on one team waits for a slot instead of being dropped."""
+    game = _new_game()
+    game.add_penalty("MTL", 2, "Tripping")
+    game.advance_time(20)
+    game.add_penalty("MTL", 2, "Hooking")
+    game.add_penalty("MTL", 2, "Slashing")
+    assert [p['description'] for p in game.active_penalties] == ["Tripping", "Hooking"]
+    assert game.snapshot().queued_penalties == ((AWAY_SIDE, 120),)
+    assert game.away_team.penalties == 3
+
+    game.advance_time(100)  # Tripping expires, Slashing starts in full
+    assert game.active_penalties == [
+        {'team': "MTL", 'time_remaining': 20, 'description': "Hooking"},
+        {'team': "MTL", 'time_remaining': 120, 'description': "Slashing"},
+    ]
+    assert game.snapshot().queued_penalties == ()
+
+    game.advance_time(120)
+    assert game.active_penalties == [] and game.strength_situation == StrengthSituation.EVEN
+    print("✅ Stacked penalties start when a slot frees")
+    return True
+
+
+def test_event_views():
+    """Event views carry the same fields and descriptions as logged events."""
+    game = _new_game()
+    game.add_event(EventType.SHOT, "TOR", "Shot by Matthews", player_name="Auston Matthews", shot_type="wrist")
+    game.score_goal("MTL", is_power_play=True, scorer_name="Cole Caufield",
+                    primary_assist="Nick Suzuki", is_empty_net=True)
+    game.score_goal("TOR")
+    game.add_event(EventType.FACEOFF, "NHL", "Video review")
+
+    events = game.events
+    assert [e.event_type for e in events] == [
+        EventType.PERIOD_START, EventType.SHOT, EventType.GOAL, EventType.GOAL, EventType.FACEOFF
+    ]
+    assert events[0].description == "Period 1 begins"
+    assert events[1].player_name == "Auston Matthews" and events[1].shot_type == "wrist"
+    assert events[2].description == "GOAL! Cole Caufield (Nick Suzuki) - PP - EN"
+    assert (events[2].home_score, events[2].away_score) == (0, 1)
+    assert events[3].description == "GOAL! Toronto Maple Leafs scores"
+    assert events[4].team == "NHL"
+    assert game.last_event() is events[-1] and game.events is events
+
+    context = game.decision_context(game.home_team, recent_events=2)
+    assert [e["team"] for e in context.recent_events] == ["TOR", "NHL"]
+    print("✅ Event views rebuild types, attribution and descriptions")
+    return True
+
+
+def test_log_memory():
+    """Compact log is smaller than the materialized GameEvent list."""
+    load_all_teams()
+    simulator = NHLSimulator(verbose=False)
+    game = simulator.simulate_game("MTL", "TOR", seed=11)
+    assert game.is_game_over() and game.to_dict()["total_events"] == game.event_count
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    game.events
+    views = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    compact = game._log.itemsize * len(game._log) + game._log_times.itemsize * len(game._log_times)
+    assert compact < views
+    print(f"✅ {game.event_count} events: {compact:,} bytes compact vs {views:,} bytes as GameEvent views")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (test_strength_table() and test_penalty_slots() and test_stacked_penalties()
+          and test_event_views() and test_log_memory())
+    sys.exit(0 if ok else 1)
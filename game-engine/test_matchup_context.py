@@ -0,0 +1,63 @@
+"""
+Test Matchup Context
+
+Checks that per-game constants are compiled once at puck drop and match
+the values the simulator derives from team ratings.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator
+from game_state import TeamState
+from matchup_context import HOME, AWAY, POWER_PLAY_BOOST
+from nhl_loader import load_all_teams
+
+
+def test_context_values():
+    """Context holds the event share, goal probabilities by strength and goalies."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9")
+    ctx = sim._prepare_matchup("TOR", "MTL")
+    m = ctx.matchup
+
+    tor, mtl = TeamState(code="TOR", name="TOR"), TeamState(code="MTL", name="MTL")
+    assert m.home_event_prob == sim._calculate_event_probability(ctx, is_home=True)
+    assert m.goal_prob == (
+        sim._calculate_ml_guided_goal_probability(ctx, tor, mtl),
+        sim._calculate_ml_guided_goal_probability(ctx, mtl, tor),
+    )
+    assert m.power_play_goal_prob[AWAY] == m.goal_prob[AWAY] * POWER_PLAY_BOOST
+    assert m.goalies == (ctx.home_nhl_team.roster.get_starting_goalie(),
+                         ctx.away_nhl_team.roster.get_starting_goalie())
+    assert m.side("TOR") == HOME and m.side("MTL") == AWAY
+    print("✅ Matchup context matches the simulator's derived values")
+    return True
+
+
+def test_compiled_once_per_game():
+    """Ratings-based probabilities are derived at puck drop, not per play."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9")
+
+    calls = []
+    original = sim._calculate_ml_guided_goal_probability
+    sim._calculate_ml_guided_goal_probability = lambda *args: calls.append(args) or original(*args)
+
+    game = sim.simulate_game("MTL", "TOR", seed=4)
+    assert game.home_team.shots + game.away_team.shots > 20
+    assert len(calls) == 2  # home and away, once each
+    print("✅ Goal probabilities compiled once per game")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_context_values() and test_compiled_once_per_game()
+    sys.exit(0 if ok else 1)
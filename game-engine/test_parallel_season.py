@@ -0,0 +1,65 @@
+"""
+Test Parallel Season Simulation
+
+Verifies that a season simulated across worker processes produces the
+same standings and player stats as a serial run with the same seed.
+"""
+
+import sys
+import io
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from season_simulator import SeasonSimulator
+
+
+def _standings(season: SeasonSimulator):
+    return {
+        code: (r.games_played, r.wins, r.losses, r.otl, r.goals_for, r.goals_against)
+        for code, r in season.records.items()
+    }
+
+
+def test_parallel_matches_serial(num_games: int = 300, workers: int = 4):
+    """Serial and process-pool runs with the same seed must agree exactly."""
+    print("=" * 70)
+    print(f"SERIAL vs PARALLEL SEASON ({num_games} games, {workers} workers)")
+    print("=" * 70)
+
+    serial = SeasonSimulator(verbose=False, seed=2024)
+    parallel = SeasonSimulator(verbose=False, seed=2024)
+
+    start = time.perf_counter()
+    serial.simulate_season(num_games=num_games)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel.simulate_season(num_games=num_games, workers=workers)
+    parallel_time = time.perf_counter() - start
+
+    print(f"Serial:   {serial_time:.2f}s")
+    print(f"Parallel: {parallel_time:.2f}s")
+
+    assert [(g.home_team, g.away_team) for g in serial.schedule] == \
+        [(g.home_team, g.away_team) for g in parallel.schedule]
+    assert [(g.home_score, g.away_score, g.overtime) for g in serial.schedule] == \
+        [(g.home_score, g.away_score, g.overtime) for g in parallel.schedule]
+    assert _standings(serial) == _standings(parallel)
+
+    serial_players = {pid: (p.goals, p.assists, p.points) for pid, p in serial.stats_tracker.player_stats.items()}
+    parallel_players = {pid: (p.goals, p.assists, p.points) for pid, p in parallel.stats_tracker.player_stats.items()}
+    assert serial_players == parallel_players
+
+    print(f"\n✅ Standings and player stats identical ({len(serial_players)} players)")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_parallel_matches_serial()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,122 @@
+"""
+Test League Leader Indexes
+
+Checks that the leader indexes kept up to date as stats are recorded give
+the same leaders as filtering and sorting every player, that players enter
+an index as they cross its games-played threshold, and that leader queries
+don't grow with the number of players tracked.
+"""
+
+import sys
+import io
+import random
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from player_stats_tracker import LEADER_INDEX_LIMIT, LEADER_STATS, PlayerStatsTracker
+
+
+def _full_sort(tracker: PlayerStatsTracker, stat: str, limit: int, min_games: int):
+    """Leaders by filtering and sorting every tracked player."""
+    key, goalies_only = LEADER_STATS[stat]
+    qualified = [
+        p for p in tracker.player_stats.values()
+        if p.games_played >= min_games and (not goalies_only or p.position == "G")
+    ]
+    qualified.sort(key=key, reverse=True)
+    return [p.player_id for p in qualified[:limit]]
+
+
+def _random_game(tracker: PlayerStatsTracker, rng: random.Random, players: int):
+    """One game: a random lineup plays, a few goals are scored, a goalie gets a decision."""
+    skaters = rng.sample(range(1, players + 1), 18)
+    for player_id in skaters:
+        tracker.record_game_participation(player_id, f"Skater {player_id}", "TOR", "C")
+    for _ in range(rng.randint(0, 6)):
+        scorer, primary, secondary = rng.sample(skaters, 3)
+        tracker.record_goal(
+            scorer, f"Skater {scorer}", "TOR", "C",
+            primary_assist_id=primary if rng.random() < 0.7 else None, primary_assist_name=f"Skater {primary}",
+            secondary_assist_id=secondary if rng.random() < 0.5 else None, secondary_assist_name=f"Skater {secondary}"
+        )
+    goalie = players + rng.randint(1, 8)
+    shots = rng.randint(20, 40)
+    allowed = rng.randint(0, 5)
+    tracker.record_game_participation(goalie, f"Goalie {goalie}", "TOR", "G")
+    tracker.record_goalie_decision(goalie, f"Goalie {goalie}", "TOR", rng.random() < 0.5, shots - allowed, allowed)
+
+
+def test_matches_full_sort():
+    """Indexes built early and updated game by game match a full sort every time."""
+    rng = random.Random(3)
+    tracker = PlayerStatsTracker()
+    queries = [(stat, min_games) for stat in LEADER_STATS for min_games in (0, 3, 10)]
+
+    for game in range(150):
+        _random_game(tracker, rng, players=60)
+        for stat, min_games in queries:
+            leaders = [p.player_id for p in tracker.get_league_leaders(stat, limit=10, min_games=min_games)]
+            assert leaders == _full_sort(tracker, stat, 10, min_games), (game, stat, min_games)
+
+    # Thresholds are crossed as games are played: every qualified player is in the index
+    everyone = tracker.get_league_leaders("points", limit=1000, min_games=10)
+    assert sorted(p.player_id for p in everyone) == sorted(
+        p.player_id for p in tracker.player_stats.values() if p.games_played >= 10
+    )
+    assert all(p.position == "G" for p in tracker.get_league_leaders("wins", limit=100, min_games=0))
+    assert tracker.get_league_leaders("unknown", limit=5, min_games=3) == tracker.get_league_leaders("points", 5, 3)
+    print(f"✅ Leader indexes match a full sort after every game ({len(queries)} stat/threshold indexes)")
+    return True
+
+
+def test_index_limit():
+    """Least recently queried indexes are dropped; a dropped index is rebuilt on demand."""
+    rng = random.Random(5)
+    tracker = PlayerStatsTracker()
+    for _ in range(20):
+        _random_game(tracker, rng, players=40)
+
+    for min_games in range(LEADER_INDEX_LIMIT + 5):
+        tracker.get_league_leaders("goals", limit=5, min_games=min_games)
+    assert len(tracker._leader_indexes) == LEADER_INDEX_LIMIT
+    assert ("goals", 0) not in tracker._leader_indexes
+
+    _random_game(tracker, rng, players=40)
+    leaders = [p.player_id for p in tracker.get_league_leaders("goals", limit=5, min_games=0)]
+    assert leaders == _full_sort(tracker, "goals", 5, 0)
+    print(f"✅ At most {LEADER_INDEX_LIMIT} leader indexes are kept")
+    return True
+
+
+def test_query_cost():
+    """Leader queries read the top of an index, however many players are tracked."""
+    rng = random.Random(7)
+    costs = {}
+    for players in (200, 5000):
+        tracker = PlayerStatsTracker()
+        for player_id in range(1, players + 1):
+            for _ in range(rng.randint(0, 3)):
+                tracker.record_game_participation(player_id, f"Skater {player_id}", "TOR", "C")
+            if rng.random() < 0.5:
+                tracker.record_goal(player_id, f"Skater {player_id}", "TOR", "C")
+        tracker.get_league_leaders("points", limit=10, min_games=1)
+
+        started = time.perf_counter()
+        for _ in range(2000):
+            tracker.get_league_leaders("points", limit=10, min_games=1)
+        costs[players] = (time.perf_counter() - started) / 2000 * 1e6
+
+    assert costs[5000] < costs[200] * 5
+    print(f"✅ Leader query {costs[200]:.1f} µs with 200 players, {costs[5000]:.1f} µs with 5,000")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_matches_full_sort() and test_index_limit() and test_query_cost()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,182 @@
+"""
+Test Playoff Resume and What-If
+
+Checks that a bracket saved mid-run and reloaded finishes exactly as the
+uninterrupted run, that loaded rounds advance, and that what-if odds match
+recording the game for real while recomputing only the changed subtree,
+and that memoized odds follow later rating edits.
+"""
+
+import sys
+import io
+import copy
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gm_career import GMCareerManager
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+from playoff_simulator import PlayoffSimulator, PlayoffBracket, Round, SeriesStatus
+
+
+def _standings():
+    return [
+        {"team_code": code, "team_name": team.full_name, "points": 100 - i,
+         "goal_differential": 0, "conference": team.conference}
+        for i, (code, team) in enumerate(sorted(NHL_TEAMS.items()))
+    ]
+
+
+def _strength_win_prob(home: str, away: str) -> float:
+    """Per-game home win probability from team strength (a fast stand-in input)."""
+    diff = NHL_TEAMS[home].overall_strength - NHL_TEAMS[away].overall_strength
+    return min(0.85, max(0.15, 0.54 + diff / 60))
+
+
+def _playoffs(seed: int) -> PlayoffSimulator:
+    load_all_teams()
+    playoffs = PlayoffSimulator(verbose=False, seed=seed)
+    playoffs.generate_bracket(_standings())
+    return playoffs
+
+
+def test_resume_matches_full_run():
+    """A bracket saved mid-series and reloaded finishes like the uninterrupted run."""
+    full = _playoffs(seed=4).simulate_playoffs().to_dict()
+    assert PlayoffBracket.from_dict(full).to_dict() == full
+
+    # First round done, one second-round series three games in, the rest to play
+    saved = copy.deepcopy(full)
+    for conference in ("eastern_conference", "western_conference"):
+        saved[conference] = saved[conference][:6]
+        for series in saved[conference][4:]:
+            series.update(higher_seed_wins=0, lower_seed_wins=0, games=[])
+    saved["stanley_cup_finals"] = saved["champion"] = None
+    midway = saved["eastern_conference"][4]
+    midway["games"] = full["eastern_conference"][4]["games"][:3]
+    midway["higher_seed_wins"] = sum(g["winner"] == midway["higher_seed"] for g in midway["games"])
+    midway["lower_seed_wins"] = 3 - midway["higher_seed_wins"]
+
+    resumed = PlayoffSimulator(verbose=False, seed=4)
+    resumed.load_bracket(saved)
+    assert resumed.bracket.eastern_conference[4].status == SeriesStatus.IN_PROGRESS
+    assert resumed.simulate_playoffs().to_dict() == full
+    print(f"✅ Reloaded mid-run bracket finishes identically (champion {full['champion']})")
+    return True
+
+
+def test_load_advances_rounds():
+    """Loading a finished round creates the next one; scores without game logs are enough."""
+    full = _playoffs(seed=8).simulate_playoffs().to_dict()
+    saved = {
+        "season_year": full["season_year"],
+        "eastern_conference": [
+            {k: v for k, v in s.items() if k != "games"} for s in full["eastern_conference"][:4]
+        ],
+        "western_conference": full["western_conference"][:4],
+    }
+    top = saved["eastern_conference"][0]
+    top.update(higher_seed_wins=2, lower_seed_wins=1)
+
+    playoffs = PlayoffSimulator(verbose=False, seed=8)
+    bracket = playoffs.load_bracket(saved)
+    assert len(bracket.eastern_conference) == 4 and len(bracket.western_conference) == 6
+    assert bracket.eastern_conference[0].games_played == 3
+    assert bracket.eastern_conference[0].get_next_home_team() == top["lower_seed"]  # game 4
+
+    playoffs.record_game("E-R1-1", top["higher_seed"], 2, 3, overtime=True)  # on the road
+    playoffs.record_game("E-R1-1", top["higher_seed"], 4, 1)
+    assert len(bracket.eastern_conference) == 6
+    assert bracket.eastern_conference[4].higher_seed == top["higher_seed"]
+
+    for bad in ({"series_id": "E-R1-1", "winner": top["lower_seed"]}, {"series_id": "E-CF", "winner": "TOR"},
+                {"series_id": "E-R2-1", "winner": "XXX"}):
+        try:
+            playoffs.record_game(bad["series_id"], bad["winner"])
+        except ValueError:
+            continue
+        raise AssertionError(f"record_game accepted {bad}")
+    print("✅ Loaded rounds advance and recorded games follow the 2-2-1-1-1 format")
+    return True
+
+
+def test_what_if():
+    """What-if odds match a recorded game and only recompute the changed subtree."""
+    playoffs = _playoffs(seed=6)
+    playoffs.simulate_round(Round.FIRST_ROUND)
+    series = playoffs.bracket.eastern_conference[4]
+    before = playoffs.bracket.to_dict()
+
+    baseline = playoffs.advancement_odds(_strength_win_prob)
+    cached = len(playoffs._winners_cache)
+
+    started = time.perf_counter()
+    scenario = playoffs.what_if([(series.series_id, series.lower_seed)], _strength_win_prob)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    assert playoffs.bracket.to_dict() == before
+    assert len(playoffs._winners_cache) - cached == 3  # the series, its conference final and the Final
+
+    recorded = PlayoffSimulator(verbose=False, seed=6)
+    recorded.load_bracket(before)
+    recorded.record_game(series.series_id, series.lower_seed)
+    expected = recorded.advancement_odds(_strength_win_prob)
+    assert [o.to_dict() for o in scenario] == [o.to_dict() for o in expected]
+
+    old = {o.team_code: o for o in baseline}
+    new = {o.team_code: o for o in scenario}
+    assert new[series.lower_seed].conference_finals_prob > old[series.lower_seed].conference_finals_prob
+
+    # Sweeps decide the round, so the next result can name the conference final
+    other = playoffs.bracket.eastern_conference[5]
+    sweeps = [(series.series_id, series.lower_seed)] * 4 + [(other.series_id, other.higher_seed)] * 4
+    swept = {o.team_code: o for o in playoffs.what_if(sweeps + [("E-CF", series.lower_seed)], _strength_win_prob)}
+    assert swept[series.lower_seed].conference_finals_prob == 1.0
+    assert swept[series.higher_seed].conference_finals_prob == 0.0
+    assert swept[series.lower_seed].cup_finals_prob > new[series.lower_seed].cup_finals_prob
+    assert playoffs.bracket.to_dict() == before
+
+    print(f"✅ What-if for {series.series_id} in {elapsed_ms:.2f} ms: {series.lower_seed} to the conference final "
+          f"{old[series.lower_seed].conference_finals_prob:.3f} -> {new[series.lower_seed].conference_finals_prob:.3f}")
+    return True
+
+
+def test_odds_follow_rating_edits():
+    """Default odds are rebuilt after a GM rating edit, and match again once it is undone."""
+    playoffs = _playoffs(seed=12)
+    team_code = playoffs.bracket.eastern_conference[0].higher_seed
+    team = NHL_TEAMS[team_code]
+
+    started = time.perf_counter()
+    before = {o.team_code: o.to_dict() for o in playoffs.advancement_odds()}
+    elapsed = time.perf_counter() - started
+    assert playoffs.advancement_odds()[0].to_dict() == max(before.values(), key=lambda o: o["cup_prob"])
+
+    gm = GMCareerManager()
+    originals = {p.id: p.rating for p in team.roster.get_all_players()}
+    try:
+        for player_id in originals:
+            gm.update_player_rating(team_code, player_id, overall=30)
+        weakened = {o.team_code: o.to_dict() for o in playoffs.advancement_odds()}
+        assert weakened[team_code]["cup_prob"] < before[team_code]["cup_prob"]
+        assert weakened[team_code]["second_round_prob"] < before[team_code]["second_round_prob"]
+    finally:
+        for player_id, rating in originals.items():
+            gm.update_player_rating(team_code, player_id, overall=rating)
+
+    assert {o.team_code: o.to_dict() for o in playoffs.advancement_odds()} == before
+    print(f"✅ Odds follow rating edits ({team_code} Cup {before[team_code]['cup_prob']:.3f} → "
+          f"{weakened[team_code]['cup_prob']:.3f}, {elapsed:.1f}s per rebuild)")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (test_resume_matches_full_run() and test_load_advances_rounds() and test_what_if()
+          and test_odds_follow_rating_edits())
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,123 @@
+"""
+Test Prediction Cache
+
+Checks LRU eviction, TTL expiry, stat-fingerprint keys and that repeated
+matchups reuse the cached /predict-game response.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator
+from prediction_cache import PredictionCache
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+
+
+class FakeResponse:
+    """Stand-in for an httpx response from /predict-game."""
+    status_code = 200
+
+    def json(self):
+        return {
+            "home_win_prob": 0.6, "away_win_prob": 0.4,
+            "expected_goals_home": 3.2, "expected_goals_away": 2.6,
+            "confidence": 0.2, "model_version": "test"
+        }
+
+
+def test_lru_and_ttl():
+    """Entries expire after the TTL and the least recently used one is evicted."""
+    now = [0.0]
+    cache = PredictionCache(max_size=2, ttl=10.0, clock=lambda: now[0])
+
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}  # "a" is now most recent
+    cache.put("c", {"v": 3})           # evicts "b"
+    assert cache.get("b") is None
+    assert cache.get("c") == {"v": 3}
+
+    now[0] = 10.0
+    assert cache.get("a") is None      # expired
+    assert cache.stats() == {
+        "size": 1, "max_size": 2, "hits": 2, "misses": 2, "evictions": 1, "hit_rate": 0.5
+    }
+    print("✅ LRU eviction and TTL expiry")
+    return True
+
+
+def test_simulator_reuses_predictions():
+    """Same matchup hits the cache; a GM stat edit changes the key."""
+    load_all_teams()
+    cache = PredictionCache()
+    sim = NHLSimulator(verbose=False, prediction_cache=cache)
+
+    calls = []
+    sim.client.post = lambda url, **kwargs: calls.append(url) or FakeResponse()
+
+    for seed in range(5):
+        sim.simulate_game("MTL", "TOR", seed=seed)
+    assert len(calls) == 1
+    assert cache.hits == 4 and cache.misses == 1
+
+    original = NHL_TEAMS["TOR"].stats.xGF_pct
+    NHL_TEAMS["TOR"].stats.xGF_pct = original + 1.0
+    try:
+        sim.simulate_game("MTL", "TOR", seed=9)
+    finally:
+        NHL_TEAMS["TOR"].stats.xGF_pct = original
+    assert len(calls) == 2
+
+    sim.simulate_game("MTL", "TOR", seed=10)
+    assert len(calls) == 2
+    print(f"✅ Prediction cache: {cache.stats()}")
+    return True
+
+
+class FakeBatchResponse:
+    """Stand-in for an httpx response from /predict-games."""
+    status_code = 200
+
+    def __init__(self, size):
+        self.size = size
+
+    def json(self):
+        return [FakeResponse().json() for _ in range(self.size)]
+
+
+def test_prefetch_fills_cache():
+    """One /predict-games call covers every distinct matchup; games then hit the cache."""
+    load_all_teams()
+    cache = PredictionCache()
+    sim = NHLSimulator(verbose=False, prediction_cache=cache)
+
+    calls = []
+    def fake_post(url, json=None, **kwargs):
+        calls.append(url)
+        return FakeBatchResponse(len(json)) if url.endswith("/predict-games") else FakeResponse()
+    sim.client.post = fake_post
+
+    matchups = [("TOR", "MTL"), ("BOS", "FLA"), ("TOR", "MTL"), ("XXX", "MTL")]
+    assert sim.prefetch_predictions(matchups) == 2
+    assert sim.prefetch_predictions(matchups) == 0
+    assert len(cache) == 2
+
+    sim.simulate_game("MTL", "TOR", seed=1)
+    sim.simulate_game("FLA", "BOS", seed=1)
+    assert calls == [calls[0]] and calls[0].endswith("/predict-games")
+    assert cache.hits == 2 and cache.misses == 0
+    print("✅ Batch prefetch fills the prediction cache")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_lru_and_ttl() and test_simulator_reuses_predictions() and test_prefetch_fills_cache()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,75 @@
+"""
+Test Results-Only Mode
+
+Checks that simulate_result plays the same game as simulate_game for a
+given seed while building no event log or period scores.
+"""
+
+import sys
+import io
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from simulator import NHLSimulator
+from nhl_loader import load_all_teams
+
+
+def test_results_match_full_games():
+    """Same seed, same score, totals and goal attributions; nothing else built."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9")
+
+    overtime_games = 0
+    for seed in range(300):
+        game = sim.simulate_game("MTL", "TOR", seed=seed)
+        result = sim.simulate_result("TOR", "MTL", seed=seed)
+
+        assert result.home_team.to_dict() == game.home_team.to_dict()
+        assert result.away_team.to_dict() == game.away_team.to_dict()
+        assert result.overtime == (game.period.value > 3)
+        assert result.get_winner().code == game.get_winner().code
+        assert result.goals == game.goals
+        assert len(result.goals) == sum(
+            1 for e in game.events if e.event_type.value == "goal"
+        )
+        overtime_games += result.overtime
+
+    assert overtime_games > 0
+    print(f"✅ 300 results match full games ({overtime_games} past regulation)")
+    return True
+
+
+def test_no_event_log():
+    """Results-only games allocate no events or period scores."""
+    load_all_teams()
+    sim = NHLSimulator(verbose=False, api_url="http://127.0.0.1:9")
+    seen = []
+    sim.event_callback = seen.append
+
+    start = time.perf_counter()
+    for seed in range(300):
+        sim.simulate_game("MTL", "TOR", seed=seed)
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for seed in range(300):
+        sim.simulate_result("TOR", "MTL", seed=seed)
+    results_only = time.perf_counter() - start
+
+    callbacks = len(seen)
+    assert callbacks > 0
+    sim.simulate_result("TOR", "MTL", seed=1)
+    assert len(seen) == callbacks
+    print(f"✅ Full: {full * 1000 / 300:.2f} ms/game, results only: {results_only * 1000 / 300:.2f} ms/game")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_results_match_full_games() and test_no_event_log()
+    sys.exit(0 if ok else 1)
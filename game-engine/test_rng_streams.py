@@ -0,0 +1,106 @@
+"""
+Test Random Streams
+
+Checks that per-game streams are independent of block size and call
+order, that root seeds replay simulators exactly, and that unseeded runs
+record a seed that replays them.
+"""
+
+import sys
+import io
+from collections import Counter
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rng_streams import GameRandom, derive_seed, derive_seeds, GAME_STREAM
+from simulator import NHLSimulator
+from season_simulator import SeasonSimulator
+from playoff_simulator import PlayoffSimulator, Round
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+
+
+def test_game_random():
+    """Block size doesn't change the stream; helper draws cover their ranges."""
+    small, large = GameRandom(11, block_size=7), GameRandom(11)
+    assert [small.random() for _ in range(5000)] == [large.random() for _ in range(5000)]
+
+    rng = GameRandom(3)
+    ints = Counter(rng.randint(10, 60) for _ in range(51000))
+    assert min(ints) == 10 and max(ints) == 60 and len(ints) == 51
+    picks = Counter(rng.choices("abc", cum_weights=(0.5, 0.75, 1.0))[0] for _ in range(40000))
+    assert abs(picks["a"] / 40000 - 0.5) < 0.01 and abs(picks["c"] / 40000 - 0.25) < 0.01
+
+    assert derive_seeds(7, 3) == [derive_seed(7, GAME_STREAM, i) for i in range(3)]
+    assert len(set(derive_seeds(7, 1000))) == 1000
+    print("✅ Game streams are block-size invariant and well spread")
+    return True
+
+
+def test_simulator_root_seed():
+    """A root seed replays the sequence of games; explicit seeds still win."""
+    load_all_teams()
+    first = NHLSimulator(verbose=False, seed=99)
+    second = NHLSimulator(verbose=False, seed=99)
+    a = [first.simulate_result("TOR", "MTL").to_dict() for _ in range(20)]
+    b = [second.simulate_result("TOR", "MTL").to_dict() for _ in range(20)]
+    assert a == b and len({str(r) for r in a}) > 1
+
+    explicit = second.simulate_result("TOR", "MTL", seed=5).to_dict()
+    assert explicit == NHLSimulator(verbose=False).simulate_result("TOR", "MTL", seed=5).to_dict()
+    print("✅ Root seed replays the game sequence")
+    return True
+
+
+def _standings():
+    return [
+        {"team_code": code, "team_name": team.full_name, "points": 100 - i,
+         "goal_differential": 0, "conference": team.conference}
+        for i, (code, team) in enumerate(sorted(NHL_TEAMS.items()))
+    ]
+
+
+def test_playoff_order_independent():
+    """Series replay identically whatever order they are simulated in."""
+    load_all_teams()
+    forward = PlayoffSimulator(verbose=False, seed=2025)
+    forward.generate_bracket(_standings())
+    forward.simulate_playoffs()
+
+    backward = PlayoffSimulator(verbose=False, seed=forward.seed)
+    backward.generate_bracket(_standings())
+    for series in reversed(backward.bracket.get_all_series()):
+        backward.simulate_series(series)
+    backward._advance_winners(Round.FIRST_ROUND)
+    backward.simulate_playoffs()
+
+    assert forward.bracket.to_dict() == backward.bracket.to_dict()
+    print(f"✅ Playoffs replay in any series order (champion {forward.bracket.champion})")
+    return True
+
+
+def test_unseeded_season_replays():
+    """An unseeded season records the seed that replays its schedule and games."""
+    original = SeasonSimulator(verbose=False)
+    replay = SeasonSimulator(verbose=False, seed=original.seed)
+    assert [(g.home_team, g.away_team) for g in original.schedule] == \
+        [(g.home_team, g.away_team) for g in replay.schedule]
+    assert original.game_seeds == replay.game_seeds
+
+    original.simulate_season(num_games=40)
+    replay.simulate_season(num_games=40)
+    assert [(g.home_score, g.away_score, g.overtime) for g in original.schedule] == \
+        [(g.home_score, g.away_score, g.overtime) for g in replay.schedule]
+    print("✅ Unseeded season replays from its recorded seed")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (test_game_random() and test_simulator_root_seed()
+          and test_playoff_order_independent() and test_unseeded_season_replays())
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,106 @@
+"""
+Test Player Sampling Tables
+
+Checks that compiled tables pick the same shooters as weighted
+random.choices over the roster, that assists skip the scorer, and that
+tables are reused until the roster or ratings change.
+"""
+
+import sys
+import io
+import random
+from collections import Counter
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sampling_tables import get_sampling_tables, shooter_weight, assist_weight
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+
+
+def test_shooters_match_weighted_choice():
+    """Same seed, same shooters as random.choices over the roster lists."""
+    load_all_teams()
+    team = NHL_TEAMS["TOR"]
+    tables = get_sampling_tables(team)
+    forwards = team.roster.centers + team.roster.left_wings + team.roster.right_wings
+
+    for is_pp in (False, True):
+        fast, slow = random.Random(7), random.Random(7)
+        for _ in range(2000):
+            players = forwards if slow.random() < 0.75 else team.roster.defensemen
+            weights = [shooter_weight(p, is_pp) for p in players]
+            expected = slow.choices(players, weights=weights)[0]
+            assert tables.select_shooter(fast.random, is_pp) is expected
+    print("✅ Shooter picks match random.choices draw for draw")
+    return True
+
+
+def test_assists():
+    """Assists never go to the scorer, primary differs from secondary, frequencies follow weights."""
+    load_all_teams()
+    team = NHL_TEAMS["BOS"]
+    tables = get_sampling_tables(team)
+    rng = random.Random(3)
+    scorer = tables.forwards[0]
+
+    primaries = Counter()
+    secondaries = Counter()
+    trials = 40000
+    for _ in range(trials):
+        primary, secondary = tables.select_assists(rng.random, scorer)
+        assert primary is not scorer and secondary is not scorer
+        if secondary:
+            assert primary is not None and secondary is not primary
+        primaries[primary.id if primary else None] += 1
+        secondaries[secondary.id if secondary else None] += 1
+
+    assert abs(1 - primaries[None] / trials - 0.70) < 0.01
+    assert abs(1 - secondaries[None] / trials - 0.70 * 0.60) < 0.01
+
+    # Primary assist share tracks assist_weight among the other skaters
+    others = [p for p in tables.skaters if p is not scorer]
+    total = sum(assist_weight(p) for p in others)
+    assisted = trials - primaries[None]
+    for player in others:
+        expected = assist_weight(player) / total
+        assert abs(primaries[player.id] / assisted - expected) < 0.015
+    print("✅ Assists skip the scorer and follow playmaking weights")
+    return True
+
+
+def test_rebuild_on_change():
+    """Tables are reused until a rating or the roster changes."""
+    load_all_teams()
+    team = NHL_TEAMS["EDM"]
+    tables = get_sampling_tables(team)
+    assert get_sampling_tables(team) is tables
+
+    player = team.roster.centers[0]
+    original = player.rating
+    player.rating = original + 5
+    try:
+        rebuilt = get_sampling_tables(team)
+        assert rebuilt is not tables
+        assert rebuilt.forward_cum_even[0] == shooter_weight(player, False)
+    finally:
+        player.rating = original
+
+    traded = team.roster.defensemen.pop()
+    try:
+        assert len(get_sampling_tables(team).defensemen) == len(tables.defensemen) - 1
+    finally:
+        team.roster.defensemen.append(traded)
+    assert get_sampling_tables(team).defense_cum_pp == tables.defense_cum_pp
+    print("✅ Tables rebuild only when the roster or ratings change")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_shooters_match_weighted_choice() and test_assists() and test_rebuild_on_change()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,78 @@
+"""
+Test Season Monte Carlo
+
+Checks that projected odds are internally consistent, reproducible with
+a seed, and collapse to the actual standings once the season is over.
+"""
+
+import sys
+import io
+import time
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from season_simulator import SeasonSimulator
+from season_monte_carlo import SeasonMonteCarlo
+
+
+def test_odds_are_consistent():
+    """Odds should sum to the number of available spots and respect current points."""
+    print("=" * 70)
+    print("SEASON MONTE CARLO: 400 GAMES PLAYED, 300 REPLICATIONS")
+    print("=" * 70)
+
+    season = SeasonSimulator(season_year="2024-25", verbose=False, seed=5)
+    season.simulate_season(num_games=400)
+
+    driver = SeasonMonteCarlo(season)
+    start = time.perf_counter()
+    odds = driver.run(replications=300, seed=3)
+    print(f"300 seasons in {time.perf_counter() - start:.1f}s")
+
+    assert abs(sum(o.playoff_prob for o in odds) - 16) < 1e-9
+    assert abs(sum(o.division_prob for o in odds) - len(driver.divisions)) < 1e-9
+    assert abs(sum(o.presidents_trophy_prob for o in odds) - 1) < 1e-9
+    assert abs(sum(o.cup_prob for o in odds) - 1) < 1e-9
+
+    for o in odds:
+        assert o.expected_points >= o.current_points
+        assert o.division_prob <= o.playoff_prob + 1e-9
+        assert o.cup_prob <= o.playoff_prob + 1e-9
+
+    again = driver.run(replications=300, seed=3)
+    assert [o.to_dict() for o in odds] == [o.to_dict() for o in again]
+
+    for o in odds[:5]:
+        print(f"  {o.team_code}  xPTS {o.expected_points:5.1f}  PO {o.playoff_prob:6.1%}  CUP {o.cup_prob:5.1%}")
+    print("\n✅ Odds are consistent and reproducible")
+    return True
+
+
+def test_finished_season_is_certain():
+    """With nothing left to play, playoff odds are 0 or 1 and match the standings."""
+    season = SeasonSimulator(season_year="2024-25", verbose=False, seed=9)
+    season.simulate_season()
+
+    odds = SeasonMonteCarlo(season).run(replications=5, seed=1, include_playoffs=False)
+    qualified = {o.team_code for o in odds if o.playoff_prob == 1.0}
+
+    expected = {
+        record.team_code
+        for teams in season.get_playoff_teams().values()
+        for record in teams
+    }
+    assert qualified == expected
+    assert all(o.playoff_prob in (0.0, 1.0) for o in odds)
+    assert all(o.expected_points == o.current_points for o in odds)
+    print("✅ Finished season matches final standings")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_odds_are_consistent() and test_finished_season_is_certain()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,176 @@
+"""
+Test Exact Series and Bracket Odds
+
+Checks the best-of-7 dynamic program against brute-force enumeration and
+the closed form, and the bracket advancement odds against a Monte Carlo
+run of the same bracket with the same per-game probabilities.
+"""
+
+import sys
+import io
+import random
+import time
+from collections import Counter
+from itertools import product
+from math import comb
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+from playoff_simulator import (
+    PlayoffSimulator, Round, HIGHER_SEED_HOME,
+    series_outcome_probabilities, series_win_probability
+)
+
+
+def _brute_force(p_home: float, p_away: float, higher_wins: int = 0, lower_wins: int = 0):
+    """Enumerate every way the remaining games could go (all played; the series ends at 4 wins)."""
+    outcomes = Counter()
+    start = higher_wins + lower_wins
+    for results in product((True, False), repeat=7 - start):
+        higher, lower, prob, final = higher_wins, lower_wins, 1.0, None
+        for game, won in enumerate(results, start):
+            p = p_home if HIGHER_SEED_HOME[game] else p_away
+            prob *= p if won else 1 - p
+            higher, lower = higher + won, lower + (not won)
+            if final is None and (higher == 4 or lower == 4):
+                final = (higher, lower)
+        outcomes[final or (higher_wins, lower_wins)] += prob
+    return outcomes
+
+
+def test_series_dp():
+    """DP matches enumeration, the closed form and in-progress series."""
+    for p_home, p_away in ((0.5, 0.5), (0.62, 0.48), (0.9, 0.2)):
+        for higher_wins, lower_wins in ((0, 0), (2, 1), (1, 3), (3, 3)):
+            dp = series_outcome_probabilities(p_home, p_away, higher_wins, lower_wins)
+            brute = _brute_force(p_home, p_away, higher_wins, lower_wins)
+            assert dp.keys() == brute.keys()
+            assert all(abs(dp[k] - brute[k]) < 1e-12 for k in dp)
+            assert abs(sum(dp.values()) - 1.0) < 1e-12
+
+    p = 0.56
+    closed_form = sum(comb(3 + k, k) * p ** 4 * (1 - p) ** k for k in range(4))
+    assert abs(series_win_probability(p, p) - closed_form) < 1e-12
+    assert series_win_probability(0.5, 0.5) == 0.5
+    assert series_outcome_probabilities(0.6, 0.5, 4, 2) == {(4, 2): 1.0}
+
+    started = time.perf_counter()
+    for _ in range(1000):
+        series_outcome_probabilities(0.58, 0.47)
+    per_series = (time.perf_counter() - started) * 1000
+    print(f"✅ Series DP matches enumeration ({per_series:.1f} µs per series)")
+    return True
+
+
+def _standings():
+    return [
+        {"team_code": code, "team_name": team.full_name, "points": 100 - i,
+         "goal_differential": 0, "conference": team.conference}
+        for i, (code, team) in enumerate(sorted(NHL_TEAMS.items()))
+    ]
+
+
+def _strength_win_prob(home: str, away: str) -> float:
+    """Per-game home win probability from team strength (a fast stand-in input)."""
+    diff = NHL_TEAMS[home].overall_strength - NHL_TEAMS[away].overall_strength
+    return min(0.85, max(0.15, 0.54 + diff / 60))
+
+
+def _monte_carlo_bracket(playoffs: PlayoffSimulator, replications: int, rng: random.Random):
+    """Play the bracket series by series with the same per-game probabilities."""
+    reached = Counter()
+
+    def play(higher, lower):
+        wins = [0, 0]
+        game = 0
+        while 4 not in wins:
+            p = _strength_win_prob(higher, lower) if HIGHER_SEED_HOME[game] else 1 - _strength_win_prob(lower, higher)
+            wins[rng.random() >= p] += 1
+            game += 1
+        return higher if wins[0] == 4 else lower
+
+    for _ in range(replications):
+        champions = []
+        for first_round in (playoffs.bracket.eastern_conference[:4], playoffs.bracket.western_conference[:4]):
+            r1 = [play(s.higher_seed, s.lower_seed) for s in first_round]
+            r2 = [play(r1[0], r1[3]), play(r1[1], r1[2])]
+            cf = play(*r2)
+            for team in r1:
+                reached[(team, 2)] += 1
+            for team in r2:
+                reached[(team, 3)] += 1
+            reached[(cf, 4)] += 1
+            champions.append(cf)
+        reached[(play(*champions), 5)] += 1
+    return reached
+
+
+def test_bracket_odds():
+    """Exact advancement odds agree with a Monte Carlo bracket and stay consistent."""
+    load_all_teams()
+    playoffs = PlayoffSimulator(verbose=False, seed=11)
+    playoffs.generate_bracket(_standings())
+
+    started = time.perf_counter()
+    odds = playoffs.advancement_odds(_strength_win_prob)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    assert len(odds) == 16
+    assert abs(sum(o.second_round_prob for o in odds) - 8) < 1e-9
+    assert abs(sum(o.conference_finals_prob for o in odds) - 4) < 1e-9
+    assert abs(sum(o.cup_finals_prob for o in odds) - 2) < 1e-9
+    assert abs(sum(o.cup_prob for o in odds) - 1) < 1e-9
+    assert all(o.second_round_prob >= o.conference_finals_prob >= o.cup_finals_prob >= o.cup_prob for o in odds)
+
+    replications = 20000
+    reached = _monte_carlo_bracket(playoffs, replications, random.Random(3))
+    for o in odds:
+        for round_index, prob in enumerate(
+            (o.second_round_prob, o.conference_finals_prob, o.cup_finals_prob, o.cup_prob), start=2
+        ):
+            assert abs(reached[(o.team_code, round_index)] / replications - prob) < 0.015
+
+    print(f"✅ Bracket odds for 16 teams in {elapsed_ms:.1f} ms match {replications:,} Monte Carlo brackets")
+    for o in odds[:4]:
+        print(f"   {o.team_code} ({o.conference[0]}{o.seed}): R2 {o.second_round_prob:.3f}  "
+              f"CF {o.conference_finals_prob:.3f}  SCF {o.cup_finals_prob:.3f}  Cup {o.cup_prob:.3f}")
+    return True
+
+
+def test_odds_follow_bracket():
+    """Played series count as they stand."""
+    load_all_teams()
+    playoffs = PlayoffSimulator(verbose=False, seed=5)
+    playoffs.generate_bracket(_standings())
+    playoffs.simulate_round(Round.FIRST_ROUND)
+
+    odds = {o.team_code: o for o in playoffs.advancement_odds(_strength_win_prob)}
+    for series in playoffs.bracket.get_all_series():
+        if series.round == Round.FIRST_ROUND:
+            loser = series.lower_seed if series.winner == series.higher_seed else series.higher_seed
+            assert odds[series.winner].second_round_prob == 1.0
+            assert odds[loser].second_round_prob == 0.0 and odds[loser].cup_prob == 0.0
+
+    # A series in progress is played on from its current score
+    series = playoffs.bracket.eastern_conference[4]
+    series.add_game_result(series.higher_seed, 3, 2, series.higher_seed, series.lower_seed)
+    p = series_win_probability(
+        _strength_win_prob(series.higher_seed, series.lower_seed),
+        1 - _strength_win_prob(series.lower_seed, series.higher_seed), 1, 0
+    )
+    refreshed = {o.team_code: o for o in playoffs.advancement_odds(_strength_win_prob)}
+    assert abs(refreshed[series.higher_seed].conference_finals_prob - p) < 1e-12
+    print("✅ Advancement odds follow completed and in-progress series")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_series_dp() and test_bracket_odds() and test_odds_follow_bracket()
+    sys.exit(0 if ok else 1)
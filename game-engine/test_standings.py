@@ -0,0 +1,142 @@
+"""
+Test Standings
+
+Checks the NHL tiebreaker order, that tables kept up to date game by game
+match a full re-sort, and that the vectorized ranking used by the season
+Monte Carlo orders teams exactly like the Standings tables.
+"""
+
+import sys
+import io
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from nhl_data import NHL_TEAMS
+from nhl_loader import load_all_teams
+from standings import LEAGUE, Standings, TeamRecord, rank_order
+
+
+def _standings() -> Standings:
+    load_all_teams()
+    return Standings({code: TeamRecord(code, team.full_name) for code, team in NHL_TEAMS.items()})
+
+
+def _random_games(standings: Standings, games: int, seed: int):
+    """Low-scoring random results, so points ties are common."""
+    rng = random.Random(seed)
+    codes = sorted(standings.records)
+    for _ in range(games):
+        home, away = rng.sample(codes, 2)
+        winner_score = rng.randint(1, 3)
+        home_won = rng.random() < 0.5
+        standings.record_game(
+            home, away,
+            winner_score if home_won else winner_score - 1,
+            winner_score - 1 if home_won else winner_score,
+            overtime=rng.random() < 0.25
+        )
+
+
+def test_tiebreakers():
+    """Points, then regulation wins, wins, head-to-head, goal differential."""
+    load_all_teams()
+    teams = {code: NHL_TEAMS[code] for code in ("BOS", "TOR", "MTL", "OTT")}
+    standings = Standings({code: TeamRecord(code, code) for code in teams}, teams)
+
+    # BOS: regulation win; TOR: overtime win (same points, fewer regulation wins)
+    standings.record_game("BOS", "MTL", 3, 1)
+    standings.record_game("TOR", "OTT", 2, 1, overtime=True)
+    assert [r.team_code for r in standings.league()][:2] == ["BOS", "TOR"]
+
+    # MTL has the better goal differential, but OTT won their meeting
+    standings.record_game("OTT", "MTL", 2, 1)
+    standings.record_game("MTL", "TOR", 6, 0)
+    standings.record_game("BOS", "MTL", 1, 0, overtime=True)
+    mtl, ott = standings.records["MTL"], standings.records["OTT"]
+    assert (mtl.points, mtl.regulation_wins, mtl.wins) == (ott.points, ott.regulation_wins, ott.wins)
+    assert mtl.goal_differential > ott.goal_differential
+    assert standings.rank("OTT") < standings.rank("MTL")
+    assert standings.head_to_head("OTT", "MTL").points == 2 and standings.head_to_head("MTL", "OTT").points == 0
+    assert standings.head_to_head("TOR", "BOS").games == 0
+
+    # Level and never met: goal differential
+    standings = Standings({code: TeamRecord(code, code) for code in teams}, teams)
+    standings.record_game("TOR", "OTT", 5, 0)
+    standings.record_game("BOS", "MTL", 1, 0)
+    assert [r.team_code for r in standings.league()][:2] == ["TOR", "BOS"]
+    assert standings.rank("BOS", "Atlantic") == 2
+    print("✅ Tiebreakers: points, regulation wins, head-to-head, goal differential")
+    return True
+
+
+def test_incremental_matches_full_sort():
+    """Tables kept up to date game by game equal a full re-sort after every game."""
+    standings = _standings()
+    tables = list(standings._order)
+
+    started = time.perf_counter()
+    _random_games(standings, 1312, seed=1)
+    per_game = (time.perf_counter() - started) / 1312 * 1e6
+
+    checked = _standings()
+    for i in range(300):
+        _random_games(checked, 1, seed=100 + i)
+        for table in tables:
+            full = checked._sorted(checked._ranks[table])
+            assert [r.team_code for r in checked._tables[table]] == full
+            assert all(checked.rank(code, table) == place for place, code in enumerate(full, 1))
+
+    started = time.perf_counter()
+    for _ in range(10000):
+        standings.conference("Eastern")
+        standings.rank("TOR", "Atlantic")
+    read_us = (time.perf_counter() - started) / 20000 * 1e6
+
+    assert len(standings.league()) == len(NHL_TEAMS)
+    assert sum(len(standings.division(d)) for d in standings.divisions) == len(NHL_TEAMS)
+    print(f"✅ Incremental tables match a full sort ({per_game:.0f} µs per game, {read_us:.2f} µs per read)")
+    return True
+
+
+def test_vectorized_order_matches():
+    """rank_order orders every table like the Standings tables."""
+    standings = _standings()
+    _random_games(standings, 1312, seed=7)
+
+    codes = list(standings.records)
+    index = {code: i for i, code in enumerate(codes)}
+    records = [standings.records[code] for code in codes]
+
+    def column(attr):
+        return np.array([[getattr(r, attr) for r in records]])
+
+    h2h = np.zeros((1, len(codes), len(codes)), dtype=np.int64)
+    for (team, opponent), points in standings.head_to_head_points().items():
+        h2h[0, index[team], index[opponent]] = points
+
+    for table in [LEAGUE] + standings.conferences + standings.divisions:
+        members = np.array(sorted(index[code] for code in standings._ranks[table]))
+        order = rank_order(
+            members, codes, column("points"), column("regulation_wins"), column("wins"),
+            column("goal_differential"), column("goals_for"), h2h
+        )[0]
+        expected = standings.league() if table == LEAGUE else (
+            standings.conference(table) or standings.division(table)
+        )
+        assert [codes[i] for i in order] == [r.team_code for r in expected]
+    print("✅ Vectorized ranking matches the Standings tables")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_tiebreakers() and test_incremental_matches_full_sort() and test_vectorized_order_matches()
+    sys.exit(0 if ok else 1)
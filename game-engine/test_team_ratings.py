@@ -0,0 +1,65 @@
+"""
+Test Cached Team Ratings
+
+Checks that cached strength ratings match a fresh computation, are reused
+between reads and are recomputed after a GM rating edit.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gm_career import GMCareerManager
+from nhl_data import NHL_TEAMS, TeamRatings
+from nhl_loader import load_all_teams
+
+
+def test_cached_ratings():
+    """Ratings are computed once, match the formula and refresh after a rating edit."""
+    load_all_teams()
+    for team in NHL_TEAMS.values():
+        assert team.ratings == TeamRatings.from_team(team)
+        assert team.overall_strength == (team.offensive_strength + team.defensive_strength) * 0.5
+
+    team = NHL_TEAMS["TOR"]
+    snapshot = team.ratings
+    assert team.ratings is snapshot
+
+    # A GM rating edit refreshes the cached ratings
+    gm = GMCareerManager()
+    star = max(team.roster.centers, key=lambda p: p.rating)
+    original = star.rating
+    try:
+        updated = gm.update_player_rating("TOR", star.id, overall=int(original) - 20)
+        assert updated["player_id"] == star.id and updated["overall_rating"] == star.rating
+        assert team.overall_strength < snapshot.overall
+        assert team.offensive_strength < snapshot.offensive
+        assert team.defensive_strength == snapshot.defensive
+
+        goalie = team.roster.get_starting_goalie()
+        gm.update_player_rating("TOR", goalie.id, offensive=99, defensive=int(goalie.rating) - 10)
+        assert team.defensive_strength < snapshot.defensive
+        gm.update_player_rating("TOR", goalie.id, overall=goalie.rating + 10)
+    finally:
+        gm.update_player_rating("TOR", star.id, overall=original)
+    assert team.ratings == snapshot
+
+    try:
+        gm.update_player_rating("TOR", -1, overall=90)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("update_player_rating accepted an unknown player")
+    print("✅ Cached ratings match and refresh after a GM rating edit")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_cached_ratings()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,120 @@
+"""
+Test In-Game Win Probability
+
+Checks that continuations forked from a snapshot agree between the scalar
+and NumPy engines, that period-end and finished states resolve correctly,
+and that the tracker re-estimates after goals and penalties without
+changing the game it watches.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_simulator import BatchSimulator
+from game_state import GameSnapshot, EventType
+from nhl_loader import load_all_teams
+from simulator import NHLSimulator
+from win_probability import WinProbabilityTracker, estimate_win_probability
+
+
+def _snapshot(period=3, time_remaining=300, score=(2, 2), penalties=(), pulled=(False, False), finished=False):
+    return GameSnapshot(
+        home_team="TOR", away_team="MTL", period=period, time_remaining=time_remaining,
+        score=score, shots=(25, 25), goalie_pulled=pulled, penalties=penalties, finished=finished
+    )
+
+
+def test_engines_agree_from_snapshot():
+    """Scalar and vectorized continuations of the same state agree."""
+    load_all_teams()
+    batch = BatchSimulator()
+    for start in (_snapshot(), _snapshot(period=2, time_remaining=600, score=(0, 1), penalties=((1, 90),)),
+                  _snapshot(time_remaining=90, score=(1, 2), pulled=(True, False))):
+        scalar = batch.simulate_from(start, 4000, seed=1, vectorized=False)
+        vector = batch.simulate_from(start, 4000, seed=2, vectorized=True)
+        assert abs(scalar.home_win_prob - vector.home_win_prob) < 0.05
+        assert abs(scalar.overtime_prob + scalar.shootout_prob
+                   - vector.overtime_prob - vector.shootout_prob) < 0.05
+        finals = set(scalar.score_counts) | set(vector.score_counts)
+        assert all(h >= start.score[0] and a >= start.score[1] for h, a in finals)
+        print(f"   P{start.period} {start.time_remaining}s {start.score}: "
+              f"home win {scalar.home_win_prob:.3f} scalar / {vector.home_win_prob:.3f} vectorized")
+    print("✅ Scalar and vectorized forks agree")
+    return True
+
+
+def test_boundary_states():
+    """Clock-zero, shootout-only and finished snapshots resolve without extra play."""
+    load_all_teams()
+    batch = BatchSimulator()
+    for vectorized in (False, True):
+        decided = batch.simulate_from(_snapshot(time_remaining=0, score=(3, 1)), 500, vectorized=vectorized)
+        assert decided.home_wins == decided.regulation_games == 500
+
+        to_overtime = batch.simulate_from(_snapshot(time_remaining=0), 500, vectorized=vectorized)
+        assert to_overtime.regulation_games == 0 and to_overtime.overtime_games > 0
+
+        shootout = batch.simulate_from(_snapshot(period=5, time_remaining=0), 500, vectorized=vectorized)
+        assert shootout.shootout_games == 500 and set(shootout.score_counts) == {(3, 2), (2, 3)}
+
+    final = batch.simulate_from(_snapshot(period=4, time_remaining=0, score=(2, 3), finished=True), 100)
+    assert final.away_wins == final.overtime_games == 100 and final.score_counts == {(2, 3): 100}
+    print("✅ Period-end, shootout and finished states resolve correctly")
+    return True
+
+
+def test_puck_drop_matches_matchup():
+    """Forking from puck drop prices the game like a fresh batch run."""
+    load_all_teams()
+    batch = BatchSimulator()
+    estimate = estimate_win_probability(_snapshot(period=1, time_remaining=1200, score=(0, 0)), 20000,
+                                        seed=3, batch=batch)
+    fresh = batch.simulate_matchup("TOR", "MTL", 20000, seed=4)
+    assert abs(estimate.home_win_prob - fresh.home_win_prob) < 0.02
+    assert abs(estimate.home_win_prob + estimate.away_win_prob - 1.0) < 1e-9
+    print(f"✅ Puck drop estimate {estimate.home_win_prob:.3f} vs fresh matchup {fresh.home_win_prob:.3f}")
+    return True
+
+
+def test_tracker():
+    """Tracker estimates after goals and penalties and leaves the game unchanged."""
+    load_all_teams()
+    batch = BatchSimulator()
+    updates = []
+    tracker = WinProbabilityTracker(batch=batch, seed=5, on_update=lambda game, estimate: updates.append(estimate))
+    game = NHLSimulator(verbose=False, sink=tracker).simulate_game("MTL", "TOR", seed=3)
+    plain = NHLSimulator(verbose=False).simulate_game("MTL", "TOR", seed=3)
+    assert {**game.to_dict(), "game_id": None} == {**plain.to_dict(), "game_id": None}
+
+    history = tracker.history[game.game_id]
+    triggers = [e for e in game.events if e.event_type in (EventType.GOAL, EventType.PENALTY)]
+    assert history == updates and tracker.latest(game.game_id) is history[-1]
+    assert len([e for e in history if e.event_type in ("goal", "penalty")]) == len(triggers)
+
+    winner_home = game.home_team.score > game.away_team.score
+    assert (history[-1].home_win_prob > 0.5) == winner_home
+
+    replay = WinProbabilityTracker(batch=batch, seed=5)
+    NHLSimulator(verbose=False, sink=replay).simulate_game("MTL", "TOR", seed=3)
+    assert [e.to_dict()["home_win_prob"] for e in next(iter(replay.history.values()))] == \
+        [e.to_dict()["home_win_prob"] for e in history]
+
+    slowest = max(e.elapsed_ms for e in history[1:])
+    print(f"✅ {len(history)} estimates of {tracker.forks} forks (slowest {slowest:.0f} ms)")
+    for e in history:
+        print(f"   P{e.period} {e.time_remaining // 60:02d}:{e.time_remaining % 60:02d} "
+              f"{e.event_type:<13}{e.home_score}-{e.away_score}  home win {e.home_win_prob:.3f}")
+    return True
+
+
+if __name__ == "__main__":
+    ok = (test_engines_agree_from_snapshot() and test_boundary_states()
+          and test_puck_drop_matches_matchup() and test_tracker())
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,176 @@
+"""
+In-Game Win Probability
+
+Live win, overtime and final-score probabilities for a game in progress.
+
+A GameSnapshot (score, clock, shots, penalties and pulled goalies, a few
+dozen bytes) is forked into a few thousand continuations that the batch
+engine plays out in lockstep, so an estimate costs milliseconds and never
+copies the event log. WinProbabilityTracker is an event sink that
+re-estimates after every goal and penalty.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from batch_simulator import BatchSimulator
+from event_sinks import EventSink
+from game_state import GameState, GameEvent, GameSnapshot, EventType
+from rng_streams import derive_seed
+
+
+# Continuations per estimate
+DEFAULT_FORKS = 2000
+
+# Events that trigger a new estimate
+UPDATE_EVENTS = (EventType.PERIOD_START, EventType.GOAL, EventType.PENALTY)
+
+
+@dataclass
+class WinProbability:
+    """Outcome probabilities from one game state."""
+    home_team: str
+    away_team: str
+    period: int
+    time_remaining: int
+    home_score: int
+    away_score: int
+    forks: int
+    home_win_prob: float
+    away_win_prob: float
+    overtime_prob: float  # decided in overtime
+    shootout_prob: float
+    expected_home_goals: float  # final score, including goals already scored
+    expected_away_goals: float
+    final_scores: List[Tuple[Tuple[int, int], float]] = field(default_factory=list)  # most likely first
+    event_type: Optional[str] = None  # event that triggered the estimate
+    elapsed_ms: float = 0.0
+
+    @property
+    def beyond_regulation_prob(self) -> float:
+        """Probability the game needs overtime (decided in OT or a shootout)."""
+        return self.overtime_prob + self.shootout_prob
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "period": self.period,
+            "time_remaining": self.time_remaining,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "event_type": self.event_type,
+            "forks": self.forks,
+            "home_win_prob": round(self.home_win_prob, 4),
+            "away_win_prob": round(self.away_win_prob, 4),
+            "overtime_prob": round(self.overtime_prob, 4),
+            "shootout_prob": round(self.shootout_prob, 4),
+            "expected_home_goals": round(self.expected_home_goals, 3),
+            "expected_away_goals": round(self.expected_away_goals, 3),
+            "final_scores": [
+                {"home_score": h, "away_score": a, "probability": round(p, 4)}
+                for (h, a), p in self.final_scores
+            ],
+            "elapsed_ms": round(self.elapsed_ms, 2)
+        }
+
+
+def estimate_win_probability(
+    state: Union[GameState, GameSnapshot],
+    forks: int = DEFAULT_FORKS,
+    seed: Optional[int] = None,
+    batch: Optional[BatchSimulator] = None,
+    top_scores: int = 10
+) -> WinProbability:
+    """
+    Estimate outcome probabilities by playing `forks` continuations of a game.
+
+    Args:
+        state: Game in progress, or a snapshot of one
+        forks: Number of continuations
+        seed: Optional seed for reproducible estimates
+        batch: Batch engine to play them with (reuse one to keep compiled matchups)
+        top_scores: Number of most likely final scores to return
+
+    Returns:
+        WinProbability for the state
+    """
+    snapshot = state.snapshot() if isinstance(state, GameState) else state
+    batch = batch or BatchSimulator()
+
+    started = time.perf_counter()
+    summary = batch.simulate_from(snapshot, forks, seed=seed)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    return WinProbability(
+        home_team=snapshot.home_team,
+        away_team=snapshot.away_team,
+        period=snapshot.period,
+        time_remaining=snapshot.time_remaining,
+        home_score=snapshot.score[0],
+        away_score=snapshot.score[1],
+        forks=summary.games,
+        home_win_prob=summary.home_win_prob,
+        away_win_prob=summary.away_win_prob,
+        overtime_prob=summary.overtime_prob,
+        shootout_prob=summary.shootout_prob,
+        expected_home_goals=summary.avg_home_goals,
+        expected_away_goals=summary.avg_away_goals,
+        final_scores=list(summary.score_distribution().items())[:top_scores],
+        elapsed_ms=elapsed_ms
+    )
+
+
+class WinProbabilityTracker(EventSink):
+    """
+    Event sink that re-estimates win probability as a game unfolds.
+
+    Attach it as a simulator's sink (NHLSimulator(sink=...)); after each
+    event in `update_on` it forks the current state and appends the
+    estimate to history[game_id], then calls on_update(game, estimate).
+    """
+
+    wants_plays = False
+
+    def __init__(
+        self,
+        forks: int = DEFAULT_FORKS,
+        batch: Optional[BatchSimulator] = None,
+        seed: Optional[int] = None,
+        update_on: Sequence[EventType] = UPDATE_EVENTS,
+        on_update: Optional[Callable[[GameState, WinProbability], None]] = None
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            forks: Continuations per estimate
+            batch: Batch engine to play them with (default: a quiet one)
+            seed: Optional root seed; each estimate uses a seed derived from
+                it and the event index, so a replayed game replays its estimates
+            update_on: Event types that trigger an estimate
+            on_update: Called with (game, estimate) after each estimate
+        """
+        self.forks = forks
+        self.batch = batch or BatchSimulator()
+        self.seed = seed
+        self.update_on = frozenset(update_on)
+        self.on_update = on_update
+        self.history: Dict[str, List[WinProbability]] = {}
+
+    def event(self, game: GameState, event: GameEvent) -> None:
+        if event.event_type not in self.update_on or game.finished:
+            return
+        seed = None if self.seed is None else derive_seed(self.seed, game.event_count)
+        estimate = estimate_win_probability(game, self.forks, seed=seed, batch=self.batch)
+        estimate.event_type = event.event_type.value
+        self.history.setdefault(game.game_id, []).append(estimate)
+        if self.on_update is not None:
+            self.on_update(game, estimate)
+
+    def latest(self, game_id: str) -> Optional[WinProbability]:
+        """Most recent estimate for a game."""
+        estimates = self.history.get(game_id)
+        return estimates[-1] if estimates else None
@@ -11,6 +11,9 @@ from datetime import datetime
 
 from model_client.puckcast_client import get_puckcast_client
 
+# Largest batch accepted by /predict-games (a full 32-team schedule is 1,312 games)
+MAX_BATCH_PREDICTIONS = 5000
+
 
 # Pydantic models for request/response
 class GameStateRequest(BaseModel):
@@ -46,11 +49,51 @@ class PredictionResponse(BaseModel):
     model_version: str = Field(..., description="Model version used")
 
 
+class RecentEvent(BaseModel):
+    """Compact game event for decision context."""
+    event_type: str = Field(..., description="Event type (goal, shot, penalty, etc.)")
+    period: int = Field(..., ge=1, description="Period number")
+    time_remaining: int = Field(..., ge=0, description="Seconds remaining in period")
+    team: str = Field(..., description="Team code")
+
+
+class DecisionContextRequest(BaseModel):
+    """Compact, fixed-size game context for decision requests."""
+    team: str = Field(..., description="Deciding team code")
+    is_home: bool = Field(..., description="Is the deciding team at home")
+    period: int = Field(..., ge=1, le=5, description="Period number (4 = OT, 5 = shootout)")
+    time_remaining: int = Field(..., ge=0, description="Seconds remaining in period")
+    home_score: int = Field(0, ge=0, description="Home team score")
+    away_score: int = Field(0, ge=0, description="Away team score")
+    strength: str = Field("5v5", description="Strength situation (5v5, 5v4, ...)")
+    home_goalie_pulled: bool = Field(False, description="Home goalie pulled")
+    away_goalie_pulled: bool = Field(False, description="Away goalie pulled")
+    recent_events: List[RecentEvent] = Field(
+        default_factory=list, max_length=50, description="Optional window of recent events"
+    )
+
+    def to_game_state(self) -> Dict[str, Any]:
+        """Convert to the game_state dictionary used by the model client."""
+        regulation_left = max(0, 3 - self.period) * 20
+        return {
+            "period": self.period,
+            "time_remaining": regulation_left + self.time_remaining / 60,
+            "score_home": self.home_score,
+            "score_away": self.away_score,
+            "team": "home" if self.is_home else "away",
+            "strength": self.strength,
+            "home_goalie_pulled": self.home_goalie_pulled,
+            "away_goalie_pulled": self.away_goalie_pulled,
+            "recent_events": [e.dict() for e in self.recent_events]
+        }
+
+
 class DecisionRequest(BaseModel):
-    """Request model for decision recommendation."""
+    """Request model for decision recommendation (send context or game_state)."""
     decision_type: str = Field(..., description="Type of decision (line_change, pull_goalie, etc.)")
     options: List[str] = Field(default_factory=list, description="Available options")
-    game_state: GameStateRequest = Field(..., description="Current game state")
+    context: Optional[DecisionContextRequest] = Field(None, description="Compact decision context (preferred)")
+    game_state: Optional[GameStateRequest] = Field(None, description="Current game state")
 
 
 class DecisionResponse(BaseModel):
@@ -140,6 +183,29 @@ async def predict_game(request: GameStateRequest):
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
 
+@app.post("/predict-games", response_model=List[PredictionResponse])
+async def predict_games(requests: List[GameStateRequest]):
+    """
+    Predict many games in one request.
+    
+    Accepts a list of game states (e.g. every pre-game matchup in a season)
+    and returns predictions in the same order, computed together as arrays.
+    """
+    if len(requests) > MAX_BATCH_PREDICTIONS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_BATCH_PREDICTIONS} games per request"
+        )
+    
+    try:
+        client = get_puckcast_client()
+        results = client.predict_games([request.dict() for request in requests])
+        return [PredictionResponse(**result) for result in results]
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
+
+
 @app.post("/recommend-decision", response_model=DecisionResponse)
 async def recommend_decision(request: DecisionRequest):
     """
@@ -147,7 +213,15 @@ async def recommend_decision(request: DecisionRequest):
     
     This endpoint uses the Puckcast model to recommend the optimal
     decision (line change, pull goalie, etc.) given the current game state.
+    Accepts either the compact `context` or a full `game_state`.
     """
+    if request.context is not None:
+        game_state = request.context.to_game_state()
+    elif request.game_state is not None:
+        game_state = request.game_state.dict()
+    else:
+        raise HTTPException(status_code=422, detail="Provide context or game_state")
+    
     try:
         client = get_puckcast_client()
         
@@ -155,7 +229,7 @@ async def recommend_decision(request: DecisionRequest):
         result = client.recommend_decision(
             decision_type=request.decision_type,
             options=request.options,
-            game_state=request.game_state.dict()
+            game_state=game_state
         )
         
         # Add model version
@@ -5,20 +5,56 @@ This module connects to the Puckcast prediction model WITHOUT modifying it.
 It acts as a bridge between the game and the ML model.
 """
 
+import os
 import sys
+import hashlib
+import pickle
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import numpy as np
 
 # Add puckcast to path (adjust path as needed)
 # Puckcast is in C:\Users\rhine\New folder (2)\puckcast
+# Only needed for training; a saved artifact loads without it.
 PUCKCAST_PATH = Path(r'C:\Users\rhine\New folder (2)\puckcast')
-if not PUCKCAST_PATH.exists():
-    raise RuntimeError(f"Puckcast not found at {PUCKCAST_PATH}")
-sys.path.insert(0, str(PUCKCAST_PATH / 'src'))
 
-from nhl_prediction.pipeline import build_dataset, Dataset
-from nhl_prediction.model import create_baseline_model, fit_model, predict_probabilities
+# Seasons the model is trained on (part of the artifact check)
+TRAINING_SEASONS = ['20212022', '20222023', '20232024']
+
+# Saved model artifact: bump when the artifact layout changes
+ARTIFACT_FORMAT_VERSION = 2
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parents[2] / 'models' / 'puckcast_model.pkl'
+
+
+class StaleArtifactError(RuntimeError):
+    """Saved model artifact doesn't match this client (version, seasons, pipeline or checksum)."""
+
+
+def pipeline_fingerprint(puckcast_path: Path = PUCKCAST_PATH) -> Optional[str]:
+    """
+    SHA-256 of the Puckcast pipeline sources and the training seasons.
+    
+    Changes whenever the feature/model code or the seasons change, so an
+    artifact trained before the change is rejected. Returns None when the
+    Puckcast checkout isn't available (the artifact can't be checked, or
+    retrained, on this host).
+    """
+    package = Path(puckcast_path) / 'src' / 'nhl_prediction'
+    if not package.is_dir():
+        return None
+    
+    digest = hashlib.sha256()
+    for source in sorted(package.glob('*.py')):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    digest.update(','.join(TRAINING_SEASONS).encode())
+    return digest.hexdigest()
+
+
+def feature_columns_sha256(feature_columns: List[str]) -> str:
+    """SHA-256 of the ordered feature column names."""
+    return hashlib.sha256('\n'.join(feature_columns).encode()).hexdigest()
 
 
 class PuckcastClient:
@@ -29,33 +65,60 @@ class PuckcastClient:
     for the game to query predictions without modifying the original model.
     """
     
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, puckcast_path: Path = PUCKCAST_PATH):
         """
         Initialize Puckcast client.
         
         Args:
-            model_path: Optional path to saved model. If None, trains new model.
+            model_path: Optional path to saved model artifact. If None, missing
+                or stale, trains a new model.
+            puckcast_path: Puckcast checkout (for training and the pipeline fingerprint)
         """
         self.model_path = model_path
+        self.puckcast_path = Path(puckcast_path)
         self.model = None
+        self.scaler = None
         self.dataset = None
         self.version = "1.0.0"
+        self.feature_columns: List[str] = []
+        self.training_games = 0
         
         # Load or train model
         self._initialize_model()
     
     def _initialize_model(self):
-        """Load or train the prediction model."""
+        """Load the saved model artifact, or train the prediction model."""
+        if self.model_path and Path(self.model_path).exists():
+            try:
+                self.load_artifact(self.model_path)
+                print(f"[OK] Puckcast model loaded from {self.model_path}")
+                return
+            except StaleArtifactError as e:
+                print(f"[WARN] Rejected model artifact: {e}")
+        
+        self._train_model()
+    
+    def _train_model(self):
+        """Build the dataset and train the model (slow: several seconds)."""
         print("Loading Puckcast model...")
         
         try:
+            if not self.puckcast_path.exists():
+                raise RuntimeError(f"Puckcast not found at {self.puckcast_path}")
+            sys.path.insert(0, str(self.puckcast_path / 'src'))
+            from nhl_prediction.pipeline import build_dataset
+            from nhl_prediction.model import create_baseline_model, fit_model
+            
             # Build dataset (using existing seasons)
-            self.dataset = build_dataset(['20212022', '20222023', '20232024'])
+            self.dataset = build_dataset(TRAINING_SEASONS)
             
             # Train model
-            train_mask = self.dataset.games['seasonId'].isin(['20212022', '20222023', '20232024'])
+            train_mask = self.dataset.games['seasonId'].isin(TRAINING_SEASONS)
             self.model = create_baseline_model(C=1.0)
             self.model = fit_model(self.model, self.dataset.features, self.dataset.target, train_mask)
+            self.scaler = getattr(self.model, 'named_steps', {}).get('scaler')
+            self.feature_columns = list(self.dataset.features.columns)
+            self.training_games = len(self.dataset.games)
             
             print("[OK] Puckcast model loaded successfully")
             
@@ -63,6 +126,90 @@ class PuckcastClient:
             print(f"[ERROR] Error loading model: {e}")
             raise
     
+    def save_artifact(self, path: str) -> Dict[str, Any]:
+        """
+        Serialize the trained model and feature scaler to disk.
+        
+        The file holds metadata (format/model version, training seasons,
+        pipeline fingerprint, features) and a SHA-256 checksum of the
+        pickled model payload.
+        
+        Returns:
+            Artifact metadata
+        """
+        payload = pickle.dumps({'model': self.model, 'scaler': self.scaler})
+        metadata = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'model_version': self.version,
+            'training_seasons': TRAINING_SEASONS,
+            'pipeline_fingerprint': pipeline_fingerprint(self.puckcast_path),
+            'feature_columns': self.feature_columns,
+            'feature_columns_sha256': feature_columns_sha256(self.feature_columns),
+            'training_games': self.training_games,
+            'created_at': datetime.now().isoformat(),
+            'sha256': hashlib.sha256(payload).hexdigest()
+        }
+        
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'metadata': metadata, 'payload': payload}, f)
+        os.replace(tmp_path, path)
+        
+        return metadata
+    
+    def load_artifact(self, path: str) -> Dict[str, Any]:
+        """
+        Load a model artifact written by save_artifact.
+        
+        The pipeline fingerprint is checked whenever the Puckcast checkout
+        is available; the checksum only guards against a corrupted payload.
+        
+        Raises:
+            StaleArtifactError: If the artifact's format/model version,
+                training seasons or pipeline fingerprint don't match, or its
+                checksum is wrong
+        """
+        try:
+            with open(path, 'rb') as f:
+                artifact = pickle.load(f)
+            metadata = artifact['metadata']
+            payload = artifact['payload']
+        except Exception as e:
+            raise StaleArtifactError(f"unreadable artifact ({e})")
+        
+        expected = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'model_version': self.version,
+            'training_seasons': TRAINING_SEASONS
+        }
+        fingerprint = pipeline_fingerprint(self.puckcast_path)
+        if fingerprint is not None:
+            expected['pipeline_fingerprint'] = fingerprint
+        for key, value in expected.items():
+            if metadata.get(key) != value:
+                raise StaleArtifactError(f"{key} is {metadata.get(key)!r}, expected {value!r}")
+        
+        if hashlib.sha256(payload).hexdigest() != metadata.get('sha256'):
+            raise StaleArtifactError("checksum mismatch")
+        
+        feature_columns = list(metadata.get('feature_columns', []))
+        if feature_columns_sha256(feature_columns) != metadata.get('feature_columns_sha256'):
+            raise StaleArtifactError("feature columns don't match their checksum")
+        
+        objects = pickle.loads(payload)
+        n_features = getattr(objects['model'], 'n_features_in_', None)
+        if n_features is not None and n_features != len(feature_columns):
+            raise StaleArtifactError(f"model expects {n_features} features, artifact lists {len(feature_columns)}")
+        
+        self.model = objects['model']
+        self.scaler = objects['scaler']
+        self.feature_columns = feature_columns
+        self.training_games = metadata.get('training_games', 0)
+        
+        return metadata
+    
     def predict_game_outcome(self, game_state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Predict outcome of a game given current state.
@@ -89,7 +236,7 @@ class PuckcastClient:
         """
         try:
             # Use team stats if provided (preferred)
-            if 'home_stats' in game_state and 'away_stats' in game_state:
+            if game_state.get('home_stats') is not None and game_state.get('away_stats') is not None:
                 return self._predict_from_team_stats(game_state)
             
             # Otherwise use simpler in-game prediction
@@ -117,24 +264,72 @@ class PuckcastClient:
                 'error': str(e)
             }
     
+    def predict_games(self, game_states: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Predict many games in one call.
+        
+        Games that carry team stats are computed together as NumPy arrays;
+        any others fall back to predict_game_outcome one at a time.
+        
+        Args:
+            game_states: List of game state dictionaries (see predict_game_outcome)
+        
+        Returns:
+            List of prediction dictionaries, in the same order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(game_states)
+        
+        batch = [
+            i for i, state in enumerate(game_states)
+            if state.get('home_stats') is not None and state.get('away_stats') is not None
+        ]
+        if batch:
+            predictions = self._predict_from_team_stats_arrays(
+                [game_states[i]['home_stats'] for i in batch],
+                [game_states[i]['away_stats'] for i in batch]
+            )
+            for row, i in enumerate(batch):
+                results[i] = {key: values[row] for key, values in predictions.items()}
+        
+        for i, state in enumerate(game_states):
+            if results[i] is None:
+                results[i] = self.predict_game_outcome(state)
+        
+        return results
+    
     def _predict_from_team_stats(self, game_state: Dict[str, Any]) -> Dict[str, Any]:
         """
         Predict game outcome using team season statistics.
         This creates a realistic pre-game prediction.
         """
-        home_stats = game_state['home_stats']
-        away_stats = game_state['away_stats']
+        predictions = self._predict_from_team_stats_arrays(
+            [game_state['home_stats']], [game_state['away_stats']]
+        )
+        return {key: values[0] for key, values in predictions.items()}
+    
+    def _predict_from_team_stats_arrays(
+        self,
+        home_stats: List[Dict[str, float]],
+        away_stats: List[Dict[str, float]]
+    ) -> Dict[str, list]:
+        """
+        Vectorized team-stats prediction for many games.
+        
+        Returns a dictionary of per-game lists (one entry per game).
+        """
+        def column(stats: List[Dict[str, float]], key: str, default: float) -> np.ndarray:
+            return np.array([s.get(key, default) for s in stats], dtype=float)
         
         # Extract key stats
-        home_gf = home_stats.get('goals_per_game', 3.0)
-        home_ga = home_stats.get('goals_against_per_game', 3.0)
-        home_xgf_pct = home_stats.get('xGF_pct', 50.0) / 100.0
-        home_corsi = home_stats.get('corsi_for_pct', 50.0) / 100.0
+        home_gf = column(home_stats, 'goals_per_game', 3.0)
+        home_ga = column(home_stats, 'goals_against_per_game', 3.0)
+        home_xgf_pct = column(home_stats, 'xGF_pct', 50.0) / 100.0
+        home_corsi = column(home_stats, 'corsi_for_pct', 50.0) / 100.0
         
-        away_gf = away_stats.get('goals_per_game', 3.0)
-        away_ga = away_stats.get('goals_against_per_game', 3.0)
-        away_xgf_pct = away_stats.get('xGF_pct', 50.0) / 100.0
-        away_corsi = away_stats.get('corsi_for_pct', 50.0) / 100.0
+        away_gf = column(away_stats, 'goals_per_game', 3.0)
+        away_ga = column(away_stats, 'goals_against_per_game', 3.0)
+        away_xgf_pct = column(away_stats, 'xGF_pct', 50.0) / 100.0
+        away_corsi = column(away_stats, 'corsi_for_pct', 50.0) / 100.0
         
         # Calculate expected goals (average of offense vs defense)
         # Home expected: (Home GF + Away GA) / 2, adjusted for home ice
@@ -164,20 +359,20 @@ class PuckcastClient:
         home_win_prob += possession_diff * 0.1
         
         # Clip to valid range but allow for lopsided games
-        home_win_prob = float(np.clip(home_win_prob, 0.15, 0.85))
+        home_win_prob = np.clip(home_win_prob, 0.15, 0.85)
         
         # Calculate confidence based on stat differential
-        stat_diff = abs(home_quality - away_quality)
+        stat_diff = np.abs(home_quality - away_quality)
         confidence = 0.65 + (stat_diff * 0.35)  # 0.65-1.0
-        confidence = float(np.clip(confidence, 0.5, 0.95))
+        confidence = np.clip(confidence, 0.5, 0.95)
         
         return {
-            'home_win_prob': home_win_prob,
-            'away_win_prob': 1 - home_win_prob,
-            'expected_goals_home': float(np.clip(expected_home, 1.5, 5.0)),
-            'expected_goals_away': float(np.clip(expected_away, 1.5, 5.0)),
-            'confidence': confidence,
-            'model_version': self.version
+            'home_win_prob': home_win_prob.tolist(),
+            'away_win_prob': (1 - home_win_prob).tolist(),
+            'expected_goals_home': np.clip(expected_home, 1.5, 5.0).tolist(),
+            'expected_goals_away': np.clip(expected_away, 1.5, 5.0).tolist(),
+            'confidence': confidence.tolist(),
+            'model_version': [self.version] * len(home_win_prob)
         }
     
     def _simple_prediction(self, game_state: Dict[str, Any]) -> float:
@@ -247,8 +442,10 @@ class PuckcastClient:
         }
     
     def _recommend_pull_goalie(self, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Recommend whether to pull goalie."""
+        """Recommend whether to pull goalie (for the home team unless game_state['team'] is 'away')."""
         score_diff = game_state.get('score_home', 0) - game_state.get('score_away', 0)
+        if game_state.get('team') == 'away':
+            score_diff = -score_diff
         time_remaining = game_state.get('time_remaining', 60)
         
         # Trailing by 1-2, less than 2 minutes left
@@ -269,8 +466,8 @@ class PuckcastClient:
         return {
             'version': self.version,
             'model_type': 'LogisticRegression',
-            'features_count': len(self.dataset.features.columns) if self.dataset else 0,
-            'training_games': len(self.dataset.games) if self.dataset else 0,
+            'features_count': len(self.feature_columns),
+            'training_games': self.training_games,
             'status': 'ready'
         }
 
@@ -279,9 +476,10 @@ class PuckcastClient:
 _client_instance = None
 
 def get_puckcast_client() -> PuckcastClient:
-    """Get or create singleton Puckcast client."""
+    """Get or create singleton Puckcast client (artifact from PUCKCAST_MODEL_PATH if set)."""
     global _client_instance
     if _client_instance is None:
-        _client_instance = PuckcastClient()
+        model_path = os.environ.get('PUCKCAST_MODEL_PATH', str(DEFAULT_MODEL_PATH))
+        _client_instance = PuckcastClient(model_path=model_path)
     return _client_instance
 
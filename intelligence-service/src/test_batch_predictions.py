@@ -0,0 +1,146 @@
+"""
+Test Batch Predictions
+
+Checks that the vectorized team-stats prediction matches the per-game path,
+that mixed batches keep their order, and that /predict-games enforces
+MAX_BATCH_PREDICTIONS. The team-stats formula doesn't use the trained model,
+so no Puckcast checkout is needed.
+"""
+
+import sys
+import io
+from pathlib import Path
+
+import numpy as np
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from model_client import puckcast_client
+from model_client.puckcast_client import PuckcastClient
+
+STAT_KEYS = ['goals_per_game', 'goals_against_per_game', 'xGF_pct', 'corsi_for_pct']
+
+
+class UntrainedClient(PuckcastClient):
+    """PuckcastClient that skips training (team-stats predictions only)."""
+
+    def _train_model(self):
+        pass
+
+
+def _random_stats(rng: np.random.Generator) -> dict:
+    """Plausible season stats, sometimes missing a key (the formula's defaults apply)."""
+    stats = {
+        'goals_per_game': rng.uniform(2.0, 4.2),
+        'goals_against_per_game': rng.uniform(2.0, 4.2),
+        'xGF_pct': rng.uniform(40.0, 60.0),
+        'corsi_for_pct': rng.uniform(40.0, 60.0)
+    }
+    if rng.random() < 0.2:
+        del stats[STAT_KEYS[rng.integers(len(STAT_KEYS))]]
+    return stats
+
+
+def _assert_same(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys(), (actual.keys(), expected.keys())
+    for key, value in expected.items():
+        if isinstance(value, str):
+            assert actual[key] == value, key
+        else:
+            assert np.isclose(actual[key], value, rtol=0, atol=1e-12), (key, actual[key], value)
+
+
+def test_array_parity():
+    """_predict_from_team_stats_arrays matches _predict_from_team_stats game by game."""
+    client = UntrainedClient()
+    rng = np.random.default_rng(2024)
+    home = [_random_stats(rng) for _ in range(500)]
+    away = [_random_stats(rng) for _ in range(500)]
+
+    arrays = client._predict_from_team_stats_arrays(home, away)
+    assert all(len(values) == 500 for values in arrays.values())
+    for i in range(500):
+        row = {key: values[i] for key, values in arrays.items()}
+        _assert_same(row, client._predict_from_team_stats({'home_stats': home[i], 'away_stats': away[i]}))
+        assert 0.15 <= row['home_win_prob'] <= 0.85
+        assert np.isclose(row['home_win_prob'] + row['away_win_prob'], 1.0)
+    print("✅ Vectorized team-stats predictions match the per-game path")
+    return True
+
+
+def _mixed_batch(rng: np.random.Generator, n: int) -> list:
+    """Games with stats, without, and with only one side's stats, interleaved."""
+    states = []
+    for i in range(n):
+        state = {
+            'home_team_id': 'TOR', 'away_team_id': 'MTL',
+            'period': 1 + i % 3, 'time_remaining': float(60 - i % 60),
+            'score_home': i % 4, 'score_away': i % 3,
+            'home_stats': None, 'away_stats': None
+        }
+        kind = i % 3
+        if kind == 0:
+            state['home_stats'] = _random_stats(rng)
+            state['away_stats'] = _random_stats(rng)
+        elif kind == 1:
+            state['home_stats'] = _random_stats(rng)
+        states.append(state)
+    return states
+
+
+def test_mixed_batch_order():
+    """predict_games keeps input order when only some games carry stats."""
+    client = UntrainedClient()
+    states = _mixed_batch(np.random.default_rng(7), 60)
+
+    results = client.predict_games(states)
+    assert len(results) == len(states)
+    for state, result in zip(states, results):
+        assert 'error' not in result, result['error']
+        if state['home_stats'] is not None and state['away_stats'] is not None:
+            expected = client._predict_from_team_stats(state)
+        else:
+            expected = client._simple_prediction(state)
+            expected = {'home_win_prob': float(expected)}
+        _assert_same({key: result[key] for key in expected}, expected)
+    assert client.predict_games([]) == []
+    print("✅ Mixed batches keep their order")
+    return True
+
+
+def test_predict_games_endpoint():
+    """/predict-games answers in order and rejects batches over MAX_BATCH_PREDICTIONS."""
+    from fastapi.testclient import TestClient
+    from api import endpoints
+
+    client = UntrainedClient()
+    puckcast_client._client_instance = client
+    try:
+        http = TestClient(endpoints.app)
+        states = _mixed_batch(np.random.default_rng(11), 30)
+        response = http.post('/predict-games', json=states)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert len(body) == len(states)
+        for state, result in zip(states, body):
+            _assert_same(result, client.predict_games([state])[0])
+
+        game = {'home_team_id': 'TOR', 'away_team_id': 'MTL'}
+        limit = endpoints.MAX_BATCH_PREDICTIONS
+        assert http.post('/predict-games', json=[game] * limit).status_code == 200
+        response = http.post('/predict-games', json=[game] * (limit + 1))
+        assert response.status_code == 422
+        assert str(limit) in response.json()['detail']
+    finally:
+        puckcast_client._client_instance = None
+    print("✅ /predict-games keeps order and enforces the batch limit")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_array_parity() and test_mixed_batch_order() and test_predict_games_endpoint()
+    sys.exit(0 if ok else 1)
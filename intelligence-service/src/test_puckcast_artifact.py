@@ -0,0 +1,147 @@
+"""
+Test Puckcast Model Artifacts
+
+Checks that a saved artifact loads back without retraining, and that
+tampered payloads, version or season mismatches and pipeline changes are
+rejected (and retrained). Uses a stand-in model and pipeline checkout, so
+neither Puckcast nor scikit-learn is needed.
+"""
+
+import sys
+import io
+import pickle
+import tempfile
+from pathlib import Path
+
+# Fix Windows encoding
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from model_client import puckcast_client
+from model_client.puckcast_client import PuckcastClient, StaleArtifactError, pipeline_fingerprint
+
+
+class MeanModel:
+    """Small picklable stand-in for the trained classifier."""
+
+    def __init__(self, n_features: int):
+        self.n_features_in_ = n_features
+        self.coef_ = [0.1 * i for i in range(n_features)]
+
+
+class FakeTrainingClient(PuckcastClient):
+    """PuckcastClient whose training step builds a MeanModel and counts calls."""
+
+    def __init__(self, *args, **kwargs):
+        self.trained = 0
+        super().__init__(*args, **kwargs)
+
+    def _train_model(self):
+        self.trained += 1
+        self.feature_columns = ['home_xgf_pct', 'away_xgf_pct', 'home_rest_days']
+        self.model = MeanModel(len(self.feature_columns))
+        self.scaler = None
+        self.training_games = 3936
+
+
+def _checkout(root: Path) -> Path:
+    """Minimal Puckcast layout with pipeline sources to fingerprint."""
+    package = root / 'puckcast' / 'src' / 'nhl_prediction'
+    package.mkdir(parents=True)
+    (package / 'pipeline.py').write_text("def build_dataset(seasons):\n    return None\n")
+    (package / 'model.py').write_text("def create_baseline_model(C=1.0):\n    return None\n")
+    return root / 'puckcast'
+
+
+def _rewrite(path: Path, edit):
+    """Apply edit(artifact) to a saved artifact in place."""
+    with open(path, 'rb') as f:
+        artifact = pickle.load(f)
+    edit(artifact)
+    with open(path, 'wb') as f:
+        pickle.dump(artifact, f)
+
+
+def _assert_rejected(client: PuckcastClient, path: Path, reason: str):
+    try:
+        client.load_artifact(path)
+    except StaleArtifactError as e:
+        assert reason in str(e), str(e)
+    else:
+        raise AssertionError(f"artifact with bad {reason} was accepted")
+
+
+def test_round_trip():
+    """save → load restores model and metadata without retraining."""
+    with tempfile.TemporaryDirectory() as tmp:
+        puckcast = _checkout(Path(tmp))
+        path = Path(tmp) / 'models' / 'puckcast_model.pkl'
+
+        trained = FakeTrainingClient(model_path=str(path), puckcast_path=puckcast)
+        assert trained.trained == 1
+        metadata = trained.save_artifact(str(path))
+        assert metadata['pipeline_fingerprint'] == pipeline_fingerprint(puckcast)
+
+        loaded = FakeTrainingClient(model_path=str(path), puckcast_path=puckcast)
+        assert loaded.trained == 0
+        assert loaded.model.coef_ == trained.model.coef_
+        assert loaded.feature_columns == trained.feature_columns
+        assert loaded.training_games == 3936
+    print("✅ Saved artifact loads back without retraining")
+    return True
+
+
+def test_rejections():
+    """Tampered payloads and version, season, feature or pipeline mismatches are rejected."""
+    with tempfile.TemporaryDirectory() as tmp:
+        puckcast = _checkout(Path(tmp))
+        path = Path(tmp) / 'puckcast_model.pkl'
+        client = FakeTrainingClient(puckcast_path=puckcast)
+        client.save_artifact(str(path))
+        good = path.read_bytes()
+
+        cases = [
+            ("checksum", lambda a: a.update(payload=pickle.dumps({'model': MeanModel(3), 'scaler': 'x'}))),
+            ("model_version", lambda a: a['metadata'].update(model_version='0.9.0')),
+            ("format_version", lambda a: a['metadata'].update(format_version=1)),
+            ("training_seasons", lambda a: a['metadata'].update(training_seasons=['20202021'])),
+            ("feature columns", lambda a: a['metadata']['feature_columns'].append('extra')),
+        ]
+        for reason, edit in cases:
+            path.write_bytes(good)
+            _rewrite(path, edit)
+            _assert_rejected(client, path, reason)
+
+        path.write_bytes(b"not a pickle")
+        _assert_rejected(client, path, "unreadable")
+
+        # Seasons changed in code after the artifact was written
+        path.write_bytes(good)
+        seasons = puckcast_client.TRAINING_SEASONS
+        puckcast_client.TRAINING_SEASONS = seasons + ['20242025']
+        try:
+            _assert_rejected(client, path, "training_seasons")
+        finally:
+            puckcast_client.TRAINING_SEASONS = seasons
+
+        # Feature code changed in the Puckcast checkout: stale, so retrain
+        client.load_artifact(path)
+        (puckcast / 'src' / 'nhl_prediction' / 'pipeline.py').write_text(
+            "def build_dataset(seasons):\n    return 'new features'\n"
+        )
+        _assert_rejected(client, path, "pipeline_fingerprint")
+        retrained = FakeTrainingClient(model_path=str(path), puckcast_path=puckcast)
+        assert retrained.trained == 1
+
+        # Without a checkout the pipeline can't be checked; the other checks still apply
+        serving = FakeTrainingClient(model_path=str(path), puckcast_path=Path(tmp) / 'missing')
+        assert serving.trained == 0
+    print("✅ Stale or tampered artifacts are rejected")
+    return True
+
+
+if __name__ == "__main__":
+    ok = test_round_trip() and test_rejections()
+    sys.exit(0 if ok else 1)
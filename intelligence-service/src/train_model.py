@@ -0,0 +1,39 @@
+"""
+Intelligence Service - Model Training
+
+Trains the Puckcast model and writes the artifact the service loads at
+startup, so the service doesn't retrain on every restart.
+
+Usage:
+    python train_model.py [--output PATH]
+"""
+
+import argparse
+
+from model_client.puckcast_client import PuckcastClient, DEFAULT_MODEL_PATH
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the Puckcast model and save it to disk")
+    parser.add_argument(
+        "--output",
+        default=str(DEFAULT_MODEL_PATH),
+        help=f"Artifact path (default: {DEFAULT_MODEL_PATH})"
+    )
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Training Puckcast model")
+    print("=" * 70)
+
+    client = PuckcastClient(model_path=None)
+    metadata = client.save_artifact(args.output)
+
+    print(f"\nSaved model artifact: {args.output}")
+    print(f"  Model version:  {metadata['model_version']}")
+    print(f"  Seasons:        {', '.join(metadata['training_seasons'])}")
+    print(f"  Pipeline:       {metadata['pipeline_fingerprint']}")
+    print(f"  Features:       {len(metadata['feature_columns'])}")
+    print(f"  Training games: {metadata['training_games']}")
+    print(f"  SHA-256:        {metadata['sha256']}")
+    print("\nSet PUCKCAST_MODEL_PATH to load it from another location.")
@@ -8,12 +8,6 @@ interface StandingsTableProps {
 }
 
 export default function StandingsTable({ standings, title }: StandingsTableProps) {
-  // Sort by points (descending), then by points percentage
-  const sortedStandings = [...standings].sort((a, b) => {
-    if (b.points !== a.points) return b.points - a.points;
-    return b.points_percentage - a.points_percentage;
-  });
-
   return (
     <div className="glass rounded-xl overflow-hidden">
       {title && (
@@ -40,7 +34,8 @@ export default function StandingsTable({ standings, title }: StandingsTableProps
             </tr>
           </thead>
           <tbody className="divide-y divide-nhl-blue/20">
-            {sortedStandings.map((team, idx) => {
+            {/* The API returns standings in order, with the NHL tiebreakers applied */}
+            {standings.map((team, idx) => {
               const isPlayoffSpot = idx < 8;
               const isWildcard = idx >= 8 && idx < 10;
               
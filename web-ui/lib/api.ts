@@ -55,6 +55,7 @@ export interface SeasonStandings {
   wins: number;
   losses: number;
   otl: number;
+  regulation_wins: number;
   points: number;
   goals_for: number;
   goals_against: number;